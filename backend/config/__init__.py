@@ -8,14 +8,88 @@ from .config import (
     MODEL_NAME,
     TEMPERATURE,
     EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_DB_PATH,
+    EMBEDDING_CACHE_MAX_MEMORY_ENTRIES,
+    EMBEDDING_CACHE_MAX_DB_ENTRIES,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_DB_PATH,
+    LLM_CACHE_TTL,
+    LLM_CACHE_MAX_MEMORY_ENTRIES,
+    LLM_CACHE_MAX_DB_ENTRIES,
+    LLM_CACHE_BYPASS,
     LANGSMITH_API_KEY,
     TAVILY_API_KEY,
+    TAVILY_API_BASE,
+    SEARCH_POOL_SIZE,
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_DB_PATH,
+    SEARCH_CACHE_TTL,
+    SEARCH_CACHE_MAX_MEMORY_ENTRIES,
+    SEARCH_CACHE_MAX_DB_ENTRIES,
+    SEARCH_MAX_ATTEMPTS,
+    SEARCH_RETRY_BASE_DELAY,
+    SEARCH_RETRY_MAX_DELAY,
+    SEARCH_DEADLINE,
+    SEARCH_BREAKER_FAILURE_THRESHOLD,
+    SEARCH_BREAKER_RESET_TIMEOUT,
+    KB_RETRIEVAL_MODE,
+    KB_VECTOR_BACKEND,
+    KB_TOP_K,
+    KB_VECTOR_K,
+    KB_VECTOR_THRESHOLD,
+    KB_LEXICAL_K,
+    KB_LEXICAL_MIN_COVERAGE,
+    KB_RRF_K,
+    CONSULTANT_FAST_PATH_ENABLED,
+    CONSULTANT_FAST_PATH_MAX_DISTANCE,
+    CONSULTANT_FAST_PATH_MIN_COVERAGE,
+    ANSWER_CACHE_ENABLED,
+    ANSWER_CACHE_DB_PATH,
+    ANSWER_CACHE_SIMILARITY_THRESHOLD,
+    ANSWER_CACHE_TTL,
+    ANSWER_CACHE_MAX_ENTRIES,
+    CONSULTANT_MEMORY_TOKEN_BUDGET,
+    CONSULTANT_MEMORY_SUMMARY_ENABLED,
+    CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS,
+    QUESTION_BANK_ENABLED,
+    QUESTION_BANK_DISTANCE_THRESHOLD,
+    QUESTION_BANK_TOP_K,
+    QUESTION_BANK_LEARN,
+    QUESTION_BANK_LEARN_TTL,
     DATABASE_URL,
     DB_HOST,
     DB_PORT,
     DB_USER,
     DB_PASSWORD,
-    DB_NAME
+    DB_NAME,
+    INTERVIEW_EXECUTION_MODE,
+    SPECULATIVE_SEARCH_ENABLED,
+    SPECULATIVE_SEARCH_WORKERS,
+    SPECULATIVE_SEARCH_MAX_PENDING,
+    SPECULATIVE_SEARCH_TTL,
+    SPECULATIVE_SEARCH_WAIT,
+    FEEDBACK_MODE,
+    FEEDBACK_MAX_TOPICS,
+    FEEDBACK_SEARCH_CONCURRENCY,
+    FEEDBACK_SEARCH_TIMEOUT,
+    PDF_PARSE_WORKERS,
+    PDF_PARSE_TIMEOUT,
+    PDF_MAX_BYTES,
+    PDF_MAX_PAGES,
+    PDF_MAX_CHARS,
+    CHECKPOINT_DB_PATH,
+    CHECKPOINTER_BACKEND,
+    ASYNC_CHECKPOINTER_BACKEND,
+    CHECKPOINT_POOL_SIZE,
+    CHECKPOINT_CACHE_SIZE_KB,
+    CHECKPOINT_COMPACTION_MODE,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_COMPACTION_INTERVAL,
+    CHECKPOINT_GC_INTERVAL,
+    CHECKPOINT_GC_BATCH_SIZE,
+    CHECKPOINT_GC_MIN_AGE
 )
 from .database import Base, SessionLocal, init_db
 
@@ -25,14 +99,88 @@ __all__ = [
     "MODEL_NAME",
     "TEMPERATURE",
     "EMBEDDING_MODEL",
+    "EMBEDDING_BATCH_SIZE",
+    "EMBEDDING_CACHE_ENABLED",
+    "EMBEDDING_CACHE_DB_PATH",
+    "EMBEDDING_CACHE_MAX_MEMORY_ENTRIES",
+    "EMBEDDING_CACHE_MAX_DB_ENTRIES",
+    "LLM_CACHE_ENABLED",
+    "LLM_CACHE_DB_PATH",
+    "LLM_CACHE_TTL",
+    "LLM_CACHE_MAX_MEMORY_ENTRIES",
+    "LLM_CACHE_MAX_DB_ENTRIES",
+    "LLM_CACHE_BYPASS",
     "LANGSMITH_API_KEY",
     "TAVILY_API_KEY",
+    "TAVILY_API_BASE",
+    "SEARCH_POOL_SIZE",
+    "SEARCH_CACHE_ENABLED",
+    "SEARCH_CACHE_DB_PATH",
+    "SEARCH_CACHE_TTL",
+    "SEARCH_CACHE_MAX_MEMORY_ENTRIES",
+    "SEARCH_CACHE_MAX_DB_ENTRIES",
+    "SEARCH_MAX_ATTEMPTS",
+    "SEARCH_RETRY_BASE_DELAY",
+    "SEARCH_RETRY_MAX_DELAY",
+    "SEARCH_DEADLINE",
+    "SEARCH_BREAKER_FAILURE_THRESHOLD",
+    "SEARCH_BREAKER_RESET_TIMEOUT",
+    "KB_RETRIEVAL_MODE",
+    "KB_VECTOR_BACKEND",
+    "KB_TOP_K",
+    "KB_VECTOR_K",
+    "KB_VECTOR_THRESHOLD",
+    "KB_LEXICAL_K",
+    "KB_LEXICAL_MIN_COVERAGE",
+    "KB_RRF_K",
+    "CONSULTANT_FAST_PATH_ENABLED",
+    "CONSULTANT_FAST_PATH_MAX_DISTANCE",
+    "CONSULTANT_FAST_PATH_MIN_COVERAGE",
+    "ANSWER_CACHE_ENABLED",
+    "ANSWER_CACHE_DB_PATH",
+    "ANSWER_CACHE_SIMILARITY_THRESHOLD",
+    "ANSWER_CACHE_TTL",
+    "ANSWER_CACHE_MAX_ENTRIES",
+    "CONSULTANT_MEMORY_TOKEN_BUDGET",
+    "CONSULTANT_MEMORY_SUMMARY_ENABLED",
+    "CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS",
+    "QUESTION_BANK_ENABLED",
+    "QUESTION_BANK_DISTANCE_THRESHOLD",
+    "QUESTION_BANK_TOP_K",
+    "QUESTION_BANK_LEARN",
+    "QUESTION_BANK_LEARN_TTL",
     "DATABASE_URL",
     "DB_HOST",
     "DB_PORT",
     "DB_USER",
     "DB_PASSWORD",
     "DB_NAME",
+    "INTERVIEW_EXECUTION_MODE",
+    "SPECULATIVE_SEARCH_ENABLED",
+    "SPECULATIVE_SEARCH_WORKERS",
+    "SPECULATIVE_SEARCH_MAX_PENDING",
+    "SPECULATIVE_SEARCH_TTL",
+    "SPECULATIVE_SEARCH_WAIT",
+    "FEEDBACK_MODE",
+    "FEEDBACK_MAX_TOPICS",
+    "FEEDBACK_SEARCH_CONCURRENCY",
+    "FEEDBACK_SEARCH_TIMEOUT",
+    "PDF_PARSE_WORKERS",
+    "PDF_PARSE_TIMEOUT",
+    "PDF_MAX_BYTES",
+    "PDF_MAX_PAGES",
+    "PDF_MAX_CHARS",
+    "CHECKPOINT_DB_PATH",
+    "CHECKPOINTER_BACKEND",
+    "ASYNC_CHECKPOINTER_BACKEND",
+    "CHECKPOINT_POOL_SIZE",
+    "CHECKPOINT_CACHE_SIZE_KB",
+    "CHECKPOINT_COMPACTION_MODE",
+    "CHECKPOINT_KEEP_LAST",
+    "CHECKPOINT_COMPACTION_INTERVAL",
+    "CHECKPOINT_GC_INTERVAL",
+    "CHECKPOINT_GC_BATCH_SIZE",
+    "CHECKPOINT_GC_MIN_AGE",
     "Base",
     "SessionLocal",
     "init_db"
@@ -7,8 +7,11 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+# 项目根目录
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
 # 加载 .env 文件（从项目根目录）
-env_path = Path(__file__).parent.parent.parent / '.env'
+env_path = PROJECT_ROOT / '.env'
 load_dotenv(dotenv_path=env_path)
 
 
@@ -20,6 +23,14 @@ def get_required_env(key: str) -> str:
     return value
 
 
+def get_path_env(key: str, default: str) -> str:
+    """获取文件路径配置：相对路径按项目根目录解析（与启动目录无关），留空则返回空字符串"""
+    value = os.getenv(key, default)
+    if not value:
+        return ""
+    return str(PROJECT_ROOT / value)
+
+
 # ========== LLM 配置 ==========
 # OpenAI API 密钥
 OPENAI_API_KEY = get_required_env("OPENAI_API_KEY")
@@ -36,6 +47,37 @@ TEMPERATURE = float(get_required_env("TEMPERATURE"))
 # Embedding 模型名称
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "BAAI/bge-m3")
 
+# 知识库索引时每批向量化的文档块数量（一次 Embedding 请求）
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+
+# ========== Embedding 缓存配置 ==========
+# 是否启用 Embedding 缓存（知识库索引、知识库检索、题库检索共用，相同文本只调用一次 Embedding 接口）
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+
+# SQLite 缓存文件路径（相对于项目根目录），留空则只使用内存缓存
+EMBEDDING_CACHE_DB_PATH = get_path_env("EMBEDDING_CACHE_DB_PATH", "embedding-cache/embedding_cache.sqlite")
+
+# 内存缓存 / SQLite 缓存的最大条目数（超出后按最近访问时间淘汰）
+EMBEDDING_CACHE_MAX_MEMORY_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_MEMORY_ENTRIES", "2048"))
+EMBEDDING_CACHE_MAX_DB_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_DB_ENTRIES", "100000"))
+
+# ========== LLM 响应缓存配置 ==========
+# 是否启用 LLM 响应缓存（仅用于简历提取、搜索结果提炼、报告生成等输入确定的调用）
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+# SQLite 缓存文件路径（相对于项目根目录），留空则只使用内存缓存
+LLM_CACHE_DB_PATH = get_path_env("LLM_CACHE_DB_PATH", "llm-cache/llm_cache.sqlite")
+
+# 缓存有效期（秒），0 表示永不过期
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+
+# 内存缓存 / SQLite 缓存的最大条目数
+LLM_CACHE_MAX_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MAX_MEMORY_ENTRIES", "256"))
+LLM_CACHE_MAX_DB_ENTRIES = int(os.getenv("LLM_CACHE_MAX_DB_ENTRIES", "10000"))
+
+# 不使用缓存的调用点（逗号分隔）：resume_extract / question_distill / weak_topics / report
+LLM_CACHE_BYPASS = [s.strip() for s in os.getenv("LLM_CACHE_BYPASS", "").split(",") if s.strip()]
+
 # ========== LangSmith 配置 ==========
 # LangSmith API 密钥（用于追踪和调试）
 LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY", "")
@@ -44,6 +86,108 @@ LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY", "")
 # Tavily API 密钥
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
 
+# Tavily 服务地址，留空使用官方地址（压测时可指向本地假搜索服务）
+TAVILY_API_BASE = os.getenv("TAVILY_API_BASE", "")
+
+# 搜索连接池大小（所有搜索工具共用一个 TavilyClient）
+SEARCH_POOL_SIZE = int(os.getenv("SEARCH_POOL_SIZE", "10"))
+
+# 是否启用搜索结果缓存（相同的规范化查询在有效期内直接复用结果）
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+
+# SQLite 缓存文件路径（相对于项目根目录），留空则只使用内存缓存
+SEARCH_CACHE_DB_PATH = get_path_env("SEARCH_CACHE_DB_PATH", "search-cache/search_cache.sqlite")
+
+# 搜索结果有效期（秒），0 表示永不过期
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(6 * 3600)))
+
+# 内存缓存 / SQLite 缓存的最大条目数
+SEARCH_CACHE_MAX_MEMORY_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_MEMORY_ENTRIES", "512"))
+SEARCH_CACHE_MAX_DB_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_DB_ENTRIES", "10000"))
+
+# 搜索失败重试：最多尝试次数、指数退避的初始 / 最大间隔（秒，实际间隔带随机抖动）
+SEARCH_MAX_ATTEMPTS = int(os.getenv("SEARCH_MAX_ATTEMPTS", "3"))
+SEARCH_RETRY_BASE_DELAY = float(os.getenv("SEARCH_RETRY_BASE_DELAY", "0.5"))
+SEARCH_RETRY_MAX_DELAY = float(os.getenv("SEARCH_RETRY_MAX_DELAY", "4"))
+
+# 单次搜索（含重试）的总截止时间（秒）
+SEARCH_DEADLINE = float(os.getenv("SEARCH_DEADLINE", "15"))
+
+# 熔断器：连续失败多少次后熔断，熔断多少秒后放行一次探测请求
+SEARCH_BREAKER_FAILURE_THRESHOLD = int(os.getenv("SEARCH_BREAKER_FAILURE_THRESHOLD", "5"))
+SEARCH_BREAKER_RESET_TIMEOUT = float(os.getenv("SEARCH_BREAKER_RESET_TIMEOUT", "30"))
+
+# ========== 知识库检索配置 ==========
+# 检索方式：hybrid（关键词 + 向量混合检索，倒数排名融合）/ vector（只用向量检索，旧实现）
+KB_RETRIEVAL_MODE = os.getenv("KB_RETRIEVAL_MODE", "hybrid").lower()
+
+# 向量检索后端：chroma（Chroma 持久化客户端）/ numpy（内存映射的 NumPy 矩阵，init_vectorstore.py 同步后导出）
+KB_VECTOR_BACKEND = os.getenv("KB_VECTOR_BACKEND", "chroma").lower()
+
+# 返回给顾问 Agent 的文档块数量
+KB_TOP_K = int(os.getenv("KB_TOP_K", "2"))
+
+# 向量召回的候选数量和最大向量距离（越小越严格）
+KB_VECTOR_K = int(os.getenv("KB_VECTOR_K", "8"))
+KB_VECTOR_THRESHOLD = float(os.getenv("KB_VECTOR_THRESHOLD", "0.6"))
+
+# 关键词召回的候选数量和最小 IDF 加权覆盖率（0-1，查询词在文档块中出现的比例）
+KB_LEXICAL_K = int(os.getenv("KB_LEXICAL_K", "8"))
+KB_LEXICAL_MIN_COVERAGE = float(os.getenv("KB_LEXICAL_MIN_COVERAGE", "0.5"))
+
+# 倒数排名融合（RRF）的平滑参数
+KB_RRF_K = int(os.getenv("KB_RRF_K", "60"))
+
+# ========== 顾问快速路径配置 ==========
+# 对话前先直接检索知识库，最佳结果足够可信时只调用一次 LLM 基于知识库生成回答，否则走完整的 Agent（工具调用 + 回答）
+CONSULTANT_FAST_PATH_ENABLED = os.getenv("CONSULTANT_FAST_PATH_ENABLED", "true").lower() == "true"
+
+# 可信阈值（比 KB_VECTOR_THRESHOLD / KB_LEXICAL_MIN_COVERAGE 更严格）：最佳文档块的向量距离不超过该值，或关键词覆盖率不低于该值
+CONSULTANT_FAST_PATH_MAX_DISTANCE = float(os.getenv("CONSULTANT_FAST_PATH_MAX_DISTANCE", "0.45"))
+CONSULTANT_FAST_PATH_MIN_COVERAGE = float(os.getenv("CONSULTANT_FAST_PATH_MIN_COVERAGE", "0.75"))
+
+# ========== 顾问答案缓存配置 ==========
+# 是否启用语义答案缓存（新会话的第一个问题与已回答过的问题足够相似时直接回放缓存的答案）
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+
+# SQLite 缓存文件路径（相对于项目根目录），留空则只使用内存缓存
+ANSWER_CACHE_DB_PATH = get_path_env("ANSWER_CACHE_DB_PATH", "answer-cache/answer_cache.sqlite")
+
+# 命中的最小余弦相似度（0-1，越大越严格）
+ANSWER_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", "0.95"))
+
+# 缓存答案有效期（秒），默认 1 天；知识库重新索引后立即失效
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", str(24 * 3600)))
+
+# 最大缓存答案数（超出后淘汰最久未命中的答案）
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1000"))
+
+# ========== 顾问对话记忆配置 ==========
+# 每次对话注入的历史上下文的 token 预算（较早对话的滚动摘要 + 按预算从新到旧选取的最近消息）
+CONSULTANT_MEMORY_TOKEN_BUDGET = int(os.getenv("CONSULTANT_MEMORY_TOKEN_BUDGET", "2000"))
+
+# 是否在每轮对话后台更新滚动摘要（关闭后只保留预算内的最近消息，更早的对话不再进入上下文）
+CONSULTANT_MEMORY_SUMMARY_ENABLED = os.getenv("CONSULTANT_MEMORY_SUMMARY_ENABLED", "true").lower() == "true"
+
+# 滚动摘要的最大 token 数（从预算中预留，其余给最近消息）
+CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS = int(os.getenv("CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS", "500"))
+
+# ========== 面试题库配置 ==========
+# 是否启用本地面试题库（出题时先检索题库，没有足够接近的题目再联网搜索）
+QUESTION_BANK_ENABLED = os.getenv("QUESTION_BANK_ENABLED", "true").lower() == "true"
+
+# 题库命中的最大向量距离（越小越严格）
+QUESTION_BANK_DISTANCE_THRESHOLD = float(os.getenv("QUESTION_BANK_DISTANCE_THRESHOLD", "0.5"))
+
+# 每次检索返回的话题数（合并各话题的题目）
+QUESTION_BANK_TOP_K = int(os.getenv("QUESTION_BANK_TOP_K", "2"))
+
+# 是否把联网搜索提炼出的题目写入题库
+QUESTION_BANK_LEARN = os.getenv("QUESTION_BANK_LEARN", "true").lower() == "true"
+
+# 联网补充题目的有效期（秒），默认 7 天；过期后视为未命中，重新联网搜索并刷新题目，0 表示永不过期
+QUESTION_BANK_LEARN_TTL = int(os.getenv("QUESTION_BANK_LEARN_TTL", str(7 * 24 * 3600)))
+
 # ========== 数据库配置 ==========
 DB_HOST = get_required_env("DB_HOST")
 DB_PORT = int(get_required_env("DB_PORT"))
@@ -53,3 +197,96 @@ DB_NAME = get_required_env("DB_NAME")
 
 # 数据库连接 URL
 DATABASE_URL = get_required_env("DATABASE_URL")
+
+# ========== 面试工作流配置 ==========
+# 工作流执行模式：async（ainvoke + 异步 checkpointer，不阻塞事件循环）/ sync（同步 invoke，放到线程池执行）
+INTERVIEW_EXECUTION_MODE = os.getenv("INTERVIEW_EXECUTION_MODE", "async").lower()
+
+# 预取下一轮搜索：出题后在后台提前执行下一轮的面试题搜索，候选人提交回答后只剩最终出题的 LLM 调用
+SPECULATIVE_SEARCH_ENABLED = os.getenv("SPECULATIVE_SEARCH_ENABLED", "false").lower() == "true"
+
+# 预取任务的线程数
+SPECULATIVE_SEARCH_WORKERS = int(os.getenv("SPECULATIVE_SEARCH_WORKERS", "2"))
+
+# 同时保留的预取任务 / 结果上限，超出时取消最早的任务
+SPECULATIVE_SEARCH_MAX_PENDING = int(os.getenv("SPECULATIVE_SEARCH_MAX_PENDING", "64"))
+
+# 预取结果的有效期（秒），候选人超过该时间才回答时丢弃
+SPECULATIVE_SEARCH_TTL = int(os.getenv("SPECULATIVE_SEARCH_TTL", "1800"))
+
+# 出题时等待尚未完成的预取任务的最长时间（秒），超时后走正常的 Agent 搜索
+SPECULATIVE_SEARCH_WAIT = float(os.getenv("SPECULATIVE_SEARCH_WAIT", "10"))
+
+# 反馈阶段模式：parallel（一次 LLM 调用提取薄弱点，并发搜索学习资源）/ agent（Feedback Agent 逐个调用搜索工具，旧实现）
+FEEDBACK_MODE = os.getenv("FEEDBACK_MODE", "parallel").lower()
+
+# 最多提取的薄弱技术点数量
+FEEDBACK_MAX_TOPICS = int(os.getenv("FEEDBACK_MAX_TOPICS", "3"))
+
+# 学习资源搜索的并发上限
+FEEDBACK_SEARCH_CONCURRENCY = int(os.getenv("FEEDBACK_SEARCH_CONCURRENCY", "3"))
+
+# 单个学习资源搜索的超时（秒），超时的话题不等待结果
+FEEDBACK_SEARCH_TIMEOUT = float(os.getenv("FEEDBACK_SEARCH_TIMEOUT", "20"))
+
+# ========== 简历 PDF 解析配置 ==========
+# PDF 解析进程池大小
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", "2"))
+
+# 单个 PDF 的解析超时（秒）
+PDF_PARSE_TIMEOUT = float(os.getenv("PDF_PARSE_TIMEOUT", "20"))
+
+# PDF 文件大小上限（字节）
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# 最多解析的页数
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))
+
+# 提取到该长度的文本后提前结束（足够生成简历摘要）
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "20000"))
+
+# ========== Checkpoint 存储配置 ==========
+# SQLite checkpoint 数据库文件路径（相对于项目根目录）
+CHECKPOINT_DB_PATH = get_path_env("CHECKPOINT_DB_PATH", "checkpoints-sqlite/checkpoints.sqlite")
+
+# 同步 checkpointer 后端：sqlite_pool（连接池 + WAL）/ sqlite（单连接，旧实现）/ mysql（DATABASE_URL 数据库，多 worker 共享）
+CHECKPOINTER_BACKEND = os.getenv("CHECKPOINTER_BACKEND", "sqlite_pool").lower()
+
+# 异步 checkpointer 后端：aiosqlite（异步驱动）/ sqlite_pool（连接池，线程中执行）/ mysql（与同步后端共用实例）
+# 未设置时：同步后端为 sqlite_pool / mysql 则与同步后端相同（共用实例），否则为 aiosqlite
+ASYNC_CHECKPOINTER_BACKEND = os.getenv(
+    "ASYNC_CHECKPOINTER_BACKEND",
+    CHECKPOINTER_BACKEND if CHECKPOINTER_BACKEND in ("sqlite_pool", "mysql") else "aiosqlite"
+).lower()
+
+# 同步 / 异步 checkpointer 必须使用同一个存储（SQLite 文件或 MySQL），
+# 否则通过一条路径创建的面试在另一条路径上"不存在"（如删除面试时找不到 checkpoint）
+if (CHECKPOINTER_BACKEND == "mysql") != (ASYNC_CHECKPOINTER_BACKEND == "mysql"):
+    raise ValueError(
+        f"CHECKPOINTER_BACKEND={CHECKPOINTER_BACKEND} 与 ASYNC_CHECKPOINTER_BACKEND={ASYNC_CHECKPOINTER_BACKEND} "
+        "使用不同的 checkpoint 存储，请同时设置为 mysql，或同时使用 SQLite 后端（sqlite_pool / sqlite / aiosqlite）"
+    )
+
+# SQLite 连接池大小
+CHECKPOINT_POOL_SIZE = int(os.getenv("CHECKPOINT_POOL_SIZE", "8"))
+
+# 每个 SQLite 连接的页缓存大小（KB）
+CHECKPOINT_CACHE_SIZE_KB = int(os.getenv("CHECKPOINT_CACHE_SIZE_KB", "16384"))
+
+# Checkpoint 压缩模式：off（不压缩）/ inline（每次执行工作流后压缩当前会话）/ background（后台定时压缩所有会话）
+CHECKPOINT_COMPACTION_MODE = os.getenv("CHECKPOINT_COMPACTION_MODE", "off").lower()
+
+# 压缩时每个会话保留的最新 checkpoint 数量
+CHECKPOINT_KEEP_LAST = int(os.getenv("CHECKPOINT_KEEP_LAST", "1"))
+
+# 后台压缩的执行间隔（秒）
+CHECKPOINT_COMPACTION_INTERVAL = int(os.getenv("CHECKPOINT_COMPACTION_INTERVAL", "600"))
+
+# 孤儿 checkpoint 后台回收间隔（秒），0 表示不在应用内运行
+CHECKPOINT_GC_INTERVAL = int(os.getenv("CHECKPOINT_GC_INTERVAL", "0"))
+
+# 孤儿回收每批扫描的会话数量
+CHECKPOINT_GC_BATCH_SIZE = int(os.getenv("CHECKPOINT_GC_BATCH_SIZE", "500"))
+
+# 最新 checkpoint 距今不足该秒数的会话不回收（避免误删刚开始、尚未写入 MySQL 记录的面试）
+CHECKPOINT_GC_MIN_AGE = int(os.getenv("CHECKPOINT_GC_MIN_AGE", "3600"))
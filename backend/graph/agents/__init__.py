@@ -5,7 +5,8 @@ Agent 模块
 from backend.graph.agents.interviewer_agent import (
     create_interviewer_agent,
     interviewer_agent,
-    INTERVIEWER_AGENT_PROMPT
+    INTERVIEWER_AGENT_PROMPT,
+    INTERVIEWER_TAILOR_PROMPT
 )
 from backend.graph.agents.feedback_agent import (
     create_feedback_agent,
@@ -17,6 +18,7 @@ __all__ = [
     "create_interviewer_agent",
     "interviewer_agent",
     "INTERVIEWER_AGENT_PROMPT",
+    "INTERVIEWER_TAILOR_PROMPT",
     "create_feedback_agent",
     "feedback_agent",
     "FEEDBACK_AGENT_PROMPT"
@@ -3,10 +3,17 @@
 面试顾问 Agent - 负责回答用户关于面试的咨询
 采用"优先私有知识库 + 兜底联网搜索"的双工具策略
 支持对话记忆功能
+快速路径：知识库高置信命中时跳过 Agent，只调用一次 LLM 基于检索内容生成回答
+语义答案缓存：与已回答过的问题足够相似时直接返回缓存的答案
 """
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from langchain_core.messages import BaseMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
 from backend.graph.llm import openai_llm
-from backend.graph.tools.consultant_tools import consultant_tools
+from backend.graph.tools.consultant_tools import consultant_tools, retrieve_knowledge, get_answer_cache
+from backend.config import CONSULTANT_FAST_PATH_MAX_DISTANCE, CONSULTANT_FAST_PATH_MIN_COVERAGE
 
 
 # Agent 系统提示词
@@ -86,4 +93,106 @@ async def get_consultant_agent():
             prompt=CONSULTANT_AGENT_PROMPT
             # 不使用 checkpointer，每次对话都是全新的
         )
-    return _consultant_agent
\ No newline at end of file
+    return _consultant_agent
+
+
+# 快速路径系统提示词（知识库内容已经检索好，直接回答，不调用工具）
+CONSULTANT_GROUNDED_PROMPT = """你是一位专业的面试顾问。你的职责是回答用户关于面试流程、面试技巧、简历优化等问题，提供专业、友好的建议。
+
+以下是从私有知识库中检索到的与用户问题相关的内容：
+
+{context}
+
+## 📝 回答要求
+- **必须生成完整的文字回答**，以上面的知识库内容为主要依据，可以补充合理的专业建议，不要编造具体数据
+- 专业但不生硬，像一位经验丰富的职场导师，给出具体的例子和可操作的建议
+- 使用 Markdown 格式组织答案，提高可读性
+- **直接输出答案，不要说"根据知识库..."这类废话**
+- 对话历史只用来理解上下文（比如"它"指代什么），每条新消息都要重新生成完整回答"""
+
+
+def is_confident_match(info: dict) -> bool:
+    """
+    检索结果是否足够可信：向量距离不超过 CONSULTANT_FAST_PATH_MAX_DISTANCE，
+    或关键词覆盖率不低于 CONSULTANT_FAST_PATH_MIN_COVERAGE（都比 Agent 工具的召回阈值更严格）
+    """
+    distance = info.get("vector_distance")
+    coverage = info.get("coverage")
+    return (
+        (distance is not None and distance <= CONSULTANT_FAST_PATH_MAX_DISTANCE)
+        or (coverage is not None and coverage >= CONSULTANT_FAST_PATH_MIN_COVERAGE)
+    )
+
+
+async def retrieve_fast_path_context(query: str) -> Optional[str]:
+    """
+    快速路径检索：直接检索知识库，最佳结果足够可信时返回拼接好的知识库内容
+
+    Returns:
+        知识库内容；未命中、不够可信或检索失败时返回 None（使用完整 Agent）
+    """
+    try:
+        # 向量检索需要调用 Embedding 接口，放到线程池执行
+        results = await asyncio.to_thread(retrieve_knowledge, query)
+    except Exception as e:
+        print(f"[Consultant] ⚠️ 快速路径检索失败，使用完整 Agent: {e}")
+        return None
+
+    if not results or not is_confident_match(results[0][1]):
+        return None
+
+    best = results[0][1]
+    print(
+        f"[Consultant] ⚡ 知识库高置信命中（向量距离: {best.get('vector_distance')}, "
+        f"关键词覆盖率: {best.get('coverage')}），跳过 Agent"
+    )
+    return "\n\n".join(doc.page_content for doc, _ in results)
+
+
+async def astream_grounded_answer(messages: List[BaseMessage], context: str) -> AsyncIterator[str]:
+    """
+    基于知识库内容流式生成回答（一次 LLM 调用）
+
+    Args:
+        messages: 历史消息 + 当前用户消息
+        context: retrieve_fast_path_context 返回的知识库内容
+    """
+    prompt = [SystemMessage(content=CONSULTANT_GROUNDED_PROMPT.format(context=context))] + messages
+    async for chunk in openai_llm.astream(prompt):
+        if chunk.content:
+            yield chunk.content
+
+
+async def lookup_cached_answer(query: str) -> Optional[dict]:
+    """
+    查找语义答案缓存
+
+    Returns:
+        {"question", "answer", "tools_used", "similarity", "hit_count"}；未启用、未命中或查找失败时返回 None
+    """
+    cache = get_answer_cache()
+    if cache is None:
+        return None
+    try:
+        # 计算问题向量需要调用 Embedding 接口，放到线程池执行
+        cached = await asyncio.to_thread(cache.lookup, query)
+    except Exception as e:
+        print(f"[Consultant] ⚠️ 答案缓存查找失败: {e}")
+        return None
+    if cached is not None:
+        print(
+            f"[Consultant] 💾 答案缓存命中（相似问题: {cached['question']}，相似度: {cached['similarity']:.3f}，"
+            f"第 {cached['hit_count']} 次命中）"
+        )
+    return cached
+
+
+async def store_cached_answer(query: str, answer: str, tools_used: List[str]) -> None:
+    """把回答写入语义答案缓存（写入失败不影响对话）"""
+    cache = get_answer_cache()
+    if cache is None:
+        return
+    try:
+        await asyncio.to_thread(cache.put, query, answer, tools_used)
+    except Exception as e:
+        print(f"[Consultant] ⚠️ 答案缓存写入失败: {e}")
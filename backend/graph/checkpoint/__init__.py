@@ -0,0 +1,55 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Checkpoint 存储模块
+"""
+from .sqlite_pool import (
+    SqliteConnectionPool,
+    PooledSqliteSaver,
+    TunedAsyncSqliteSaver
+)
+from .sql_saver import SQLAlchemyCheckpointSaver
+from .factory import (
+    create_checkpointer,
+    create_async_checkpointer,
+    get_checkpointer,
+    get_async_checkpointer,
+    aclose_async_checkpointer
+)
+from .compaction import (
+    compact_thread,
+    compact_all,
+    list_compactable_threads,
+    vacuum,
+    acompact_thread,
+    start_background_compaction,
+    stop_background_compaction
+)
+from .orphan_gc import (
+    collect_orphan_checkpoints,
+    get_gc_metrics,
+    start_background_gc,
+    stop_background_gc
+)
+
+__all__ = [
+    "SqliteConnectionPool",
+    "PooledSqliteSaver",
+    "TunedAsyncSqliteSaver",
+    "SQLAlchemyCheckpointSaver",
+    "create_checkpointer",
+    "create_async_checkpointer",
+    "get_checkpointer",
+    "get_async_checkpointer",
+    "aclose_async_checkpointer",
+    "compact_thread",
+    "compact_all",
+    "list_compactable_threads",
+    "vacuum",
+    "acompact_thread",
+    "start_background_compaction",
+    "stop_background_compaction",
+    "collect_orphan_checkpoints",
+    "get_gc_metrics",
+    "start_background_gc",
+    "stop_background_gc"
+]
@@ -0,0 +1,268 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Checkpoint 压缩
+每个 superstep 都会保存一份完整的状态快照（包含完整的 resume_text 和 history），
+checkpoint 数据库会随面试轮数近似平方增长。压缩只保留每个会话（每个命名空间）最新的 N 个 checkpoint，
+并删除被淘汰 checkpoint 的 pending writes。
+
+- inline：每次执行工作流后压缩当前会话
+- background：应用内后台任务定时压缩所有会话
+- 命令行工具：backend/utils/compact_checkpoints.py
+
+注意：面试状态只使用普通通道（没有 DeltaChannel），最新 checkpoint 即包含完整状态，可以安全删除更早的快照
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, delete, func
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from backend.config import (
+    CHECKPOINT_COMPACTION_MODE,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_COMPACTION_INTERVAL
+)
+from backend.graph.checkpoint.factory import get_checkpointer
+from backend.graph.checkpoint.sql_saver import SQLAlchemyCheckpointSaver
+from backend.models.checkpoint_record import CheckpointRecord, CheckpointWriteRecord
+
+_checkpoints = CheckpointRecord.__table__
+_writes = CheckpointWriteRecord.__table__
+
+# 后台压缩任务
+_compaction_task: Optional[asyncio.Task] = None
+
+
+def _empty_stats() -> Dict[str, int]:
+    return {"threads": 0, "checkpoints": 0, "writes": 0, "bytes": 0}
+
+
+def _merge_stats(total: Dict[str, int], stats: Dict[str, int]) -> None:
+    for key, value in stats.items():
+        total[key] += value
+
+
+# ---------- SQLite 实现（SqliteSaver / PooledSqliteSaver） ----------
+
+def _compact_sqlite_thread(saver: SqliteSaver, thread_id: str, keep_last: int, dry_run: bool) -> Dict[str, int]:
+    stats = _empty_stats()
+    with saver.cursor() as cur:
+        cur.execute("SELECT DISTINCT checkpoint_ns FROM checkpoints WHERE thread_id = ?", (thread_id,))
+        for (checkpoint_ns,) in cur.fetchall():
+            # 第 N 新的 checkpoint 作为分界点，比它更早的全部删除（checkpoint_id 单调递增）
+            cur.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT 1 OFFSET ?",
+                (thread_id, checkpoint_ns, keep_last - 1)
+            )
+            row = cur.fetchone()
+            if row is None:
+                continue
+            params = (thread_id, checkpoint_ns, row[0])
+
+            cur.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?",
+                params
+            )
+            checkpoint_count, checkpoint_bytes = cur.fetchone()
+            cur.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM writes "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?",
+                params
+            )
+            write_count, write_bytes = cur.fetchone()
+
+            if not dry_run and (checkpoint_count or write_count):
+                cur.execute("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?", params)
+                cur.execute("DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?", params)
+
+            stats["checkpoints"] += checkpoint_count
+            stats["writes"] += write_count
+            stats["bytes"] += checkpoint_bytes + write_bytes
+    return stats
+
+
+def _list_sqlite_threads(saver: SqliteSaver, keep_last: int) -> List[str]:
+    with saver.cursor(transaction=False) as cur:
+        cur.execute(
+            "SELECT DISTINCT thread_id FROM checkpoints GROUP BY thread_id, checkpoint_ns HAVING COUNT(*) > ?",
+            (keep_last,)
+        )
+        return [row[0] for row in cur.fetchall()]
+
+
+# ---------- 数据库实现（SQLAlchemyCheckpointSaver） ----------
+
+def _compact_sql_thread(saver: SQLAlchemyCheckpointSaver, thread_id: str, keep_last: int, dry_run: bool) -> Dict[str, int]:
+    saver.setup()
+    stats = _empty_stats()
+    with saver.engine.begin() as conn:
+        namespaces = conn.execute(
+            select(_checkpoints.c.checkpoint_ns).where(_checkpoints.c.thread_id == thread_id).distinct()
+        ).scalars().all()
+        for checkpoint_ns in namespaces:
+            cutoff = conn.execute(
+                select(_checkpoints.c.checkpoint_id)
+                .where(_checkpoints.c.thread_id == thread_id, _checkpoints.c.checkpoint_ns == checkpoint_ns)
+                .order_by(_checkpoints.c.checkpoint_id.desc())
+                .limit(1)
+                .offset(keep_last - 1)
+            ).scalar()
+            if cutoff is None:
+                continue
+
+            checkpoint_cond = (
+                (_checkpoints.c.thread_id == thread_id)
+                & (_checkpoints.c.checkpoint_ns == checkpoint_ns)
+                & (_checkpoints.c.checkpoint_id < cutoff)
+            )
+            write_cond = (
+                (_writes.c.thread_id == thread_id)
+                & (_writes.c.checkpoint_ns == checkpoint_ns)
+                & (_writes.c.checkpoint_id < cutoff)
+            )
+            checkpoint_count, checkpoint_bytes = conn.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(func.length(_checkpoints.c.checkpoint) + func.length(_checkpoints.c.metadata)), 0)
+                ).where(checkpoint_cond)
+            ).one()
+            write_count, write_bytes = conn.execute(
+                select(func.count(), func.coalesce(func.sum(func.length(_writes.c.value)), 0)).where(write_cond)
+            ).one()
+
+            if not dry_run and (checkpoint_count or write_count):
+                conn.execute(delete(_checkpoints).where(checkpoint_cond))
+                conn.execute(delete(_writes).where(write_cond))
+
+            stats["checkpoints"] += checkpoint_count
+            stats["writes"] += write_count
+            stats["bytes"] += int(checkpoint_bytes) + int(write_bytes)
+    return stats
+
+
+def _list_sql_threads(saver: SQLAlchemyCheckpointSaver, keep_last: int) -> List[str]:
+    saver.setup()
+    stmt = (
+        select(_checkpoints.c.thread_id)
+        .group_by(_checkpoints.c.thread_id, _checkpoints.c.checkpoint_ns)
+        .having(func.count() > keep_last)
+    )
+    with saver.engine.connect() as conn:
+        return sorted(set(conn.execute(stmt).scalars().all()))
+
+
+# ---------- 对外接口 ----------
+
+def compact_thread(saver, thread_id: str, keep_last: int = CHECKPOINT_KEEP_LAST, dry_run: bool = False) -> Dict[str, int]:
+    """
+    压缩单个会话的 checkpoint，只保留最新的 keep_last 个
+
+    Args:
+        saver: 同步 checkpointer（SqliteSaver / PooledSqliteSaver / SQLAlchemyCheckpointSaver）
+        thread_id: 会话ID
+        keep_last: 每个命名空间保留的 checkpoint 数量（至少为 1）
+        dry_run: 只统计，不删除
+
+    Returns:
+        统计信息：threads / checkpoints / writes / bytes（被删除的记录数和序列化数据字节数）
+    """
+    if keep_last < 1:
+        raise ValueError("keep_last 至少为 1，否则会丢失会话的当前状态")
+
+    if isinstance(saver, SQLAlchemyCheckpointSaver):
+        stats = _compact_sql_thread(saver, str(thread_id), keep_last, dry_run)
+    elif isinstance(saver, SqliteSaver):
+        stats = _compact_sqlite_thread(saver, str(thread_id), keep_last, dry_run)
+    else:
+        raise TypeError(f"不支持压缩的 checkpointer: {type(saver).__name__}")
+
+    if stats["checkpoints"] or stats["writes"]:
+        stats["threads"] = 1
+    return stats
+
+
+def list_compactable_threads(saver, keep_last: int = CHECKPOINT_KEEP_LAST) -> List[str]:
+    """
+    列出 checkpoint 数量超过 keep_last 的会话ID
+    """
+    if isinstance(saver, SQLAlchemyCheckpointSaver):
+        return _list_sql_threads(saver, keep_last)
+    if isinstance(saver, SqliteSaver):
+        saver.setup()
+        return _list_sqlite_threads(saver, keep_last)
+    raise TypeError(f"不支持压缩的 checkpointer: {type(saver).__name__}")
+
+
+def compact_all(saver, keep_last: int = CHECKPOINT_KEEP_LAST, dry_run: bool = False) -> Dict[str, int]:
+    """
+    压缩所有 checkpoint 数量超过 keep_last 的会话（每个会话单独一个事务，避免长时间持有写锁）
+    """
+    total = _empty_stats()
+    for thread_id in list_compactable_threads(saver, keep_last):
+        _merge_stats(total, compact_thread(saver, thread_id, keep_last, dry_run))
+    return total
+
+
+def vacuum(saver) -> bool:
+    """
+    回收 SQLite 数据库文件空间（删除记录后文件不会自动变小）
+    MySQL（InnoDB）会在内部复用空闲页，这里不处理
+
+    Returns:
+        是否执行了 VACUUM
+    """
+    if not isinstance(saver, SqliteSaver):
+        return False
+    with saver.cursor(transaction=False) as cur:
+        cur.execute("VACUUM")
+        # WAL 模式下 VACUUM 的结果先写入 WAL，需要 checkpoint 回主文件并截断 WAL
+        cur.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return True
+
+
+async def acompact_thread(thread_id: str) -> Dict[str, int]:
+    """
+    在线程池中压缩单个会话（使用全局同步 checkpointer，与异步 checkpointer 指向同一存储）
+    """
+    return await asyncio.to_thread(compact_thread, get_checkpointer(), thread_id, CHECKPOINT_KEEP_LAST)
+
+
+async def _compaction_loop(interval: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            stats = await asyncio.to_thread(compact_all, get_checkpointer(), CHECKPOINT_KEEP_LAST)
+            if stats["checkpoints"]:
+                print(
+                    f"[checkpoint] 后台压缩: {stats['threads']} 个会话, 删除 {stats['checkpoints']} 个 checkpoint / "
+                    f"{stats['writes']} 条 writes, 释放 {stats['bytes'] / 1024:.1f} KB"
+                )
+        except Exception as e:
+            print(f"[checkpoint] 后台压缩失败: {e}")
+
+
+def start_background_compaction() -> None:
+    """
+    启动后台压缩任务（仅 CHECKPOINT_COMPACTION_MODE=background 时生效，必须在事件循环中调用）
+    """
+    global _compaction_task
+    if CHECKPOINT_COMPACTION_MODE != "background" or _compaction_task is not None:
+        return
+    _compaction_task = asyncio.create_task(_compaction_loop(CHECKPOINT_COMPACTION_INTERVAL))
+
+
+async def stop_background_compaction() -> None:
+    """
+    停止后台压缩任务（在应用关闭时调用）
+    """
+    global _compaction_task
+    if _compaction_task is None:
+        return
+    _compaction_task.cancel()
+    try:
+        await _compaction_task
+    except asyncio.CancelledError:
+        pass
+    _compaction_task = None
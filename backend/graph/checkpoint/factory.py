@@ -0,0 +1,123 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Checkpointer 工厂
+根据配置创建进程内共享的同步 / 异步 checkpointer 实例
+
+同步后端（CHECKPOINTER_BACKEND）：
+- sqlite_pool：连接池 + WAL（默认）
+- sqlite：单连接 SqliteSaver（旧实现）
+- mysql：SQLAlchemyCheckpointSaver，存储到 DATABASE_URL 数据库，多 worker / 多主机共享
+
+异步后端（ASYNC_CHECKPOINTER_BACKEND，未设置时与 sqlite_pool / mysql 同步后端相同）：
+- aiosqlite：TunedAsyncSqliteSaver（同步后端为 sqlite 时的默认值）
+- sqlite_pool：复用同步连接池，在线程池中执行
+- mysql：SQLAlchemyCheckpointSaver，在线程池中执行
+
+同步与异步后端必须使用同一个存储（都是 SQLite 文件或都是 MySQL），配置不一致时加载配置即报错
+"""
+import sqlite3
+import threading
+
+import aiosqlite
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from backend.config import (
+    CHECKPOINT_DB_PATH,
+    CHECKPOINTER_BACKEND,
+    ASYNC_CHECKPOINTER_BACKEND,
+    CHECKPOINT_POOL_SIZE,
+    CHECKPOINT_CACHE_SIZE_KB
+)
+from backend.graph.checkpoint.sqlite_pool import (
+    SqliteConnectionPool,
+    PooledSqliteSaver,
+    TunedAsyncSqliteSaver,
+    build_pragmas
+)
+from backend.graph.checkpoint.sql_saver import SQLAlchemyCheckpointSaver
+
+# 写锁冲突时的最长等待时间（毫秒）
+BUSY_TIMEOUT_MS = 5000
+
+# 全局实例（懒加载）
+_checkpointer = None
+_async_checkpointer = None
+_factory_lock = threading.Lock()
+
+
+def create_checkpointer(backend: str = CHECKPOINTER_BACKEND, db_path: str = CHECKPOINT_DB_PATH):
+    """
+    创建一个新的同步 checkpointer 实例
+
+    Args:
+        backend: 后端类型（sqlite_pool / sqlite / mysql）
+        db_path: SQLite 数据库文件路径（mysql 后端忽略）
+    """
+    if backend == "sqlite_pool":
+        pool = SqliteConnectionPool(
+            db_path,
+            size=CHECKPOINT_POOL_SIZE,
+            cache_size_kb=CHECKPOINT_CACHE_SIZE_KB,
+            busy_timeout_ms=BUSY_TIMEOUT_MS
+        )
+        return PooledSqliteSaver(pool)
+    if backend == "sqlite":
+        # check_same_thread=False 允许在多线程环境(FastAPI)中使用同一个连接
+        return SqliteSaver(sqlite3.connect(db_path, check_same_thread=False))
+    if backend == "mysql":
+        # 避免循环导入，在函数内部导入数据库引擎
+        from backend.config.database import engine
+        return SQLAlchemyCheckpointSaver(engine)
+    raise ValueError(f"不支持的 checkpointer 后端: {backend}")
+
+
+def create_async_checkpointer(backend: str = ASYNC_CHECKPOINTER_BACKEND, db_path: str = CHECKPOINT_DB_PATH):
+    """
+    创建一个新的异步 checkpointer 实例（aiosqlite 后端必须在事件循环中调用）
+
+    Args:
+        backend: 后端类型（aiosqlite / sqlite_pool / mysql）
+        db_path: SQLite 数据库文件路径（mysql 后端忽略）
+    """
+    if backend == "aiosqlite":
+        conn = aiosqlite.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        return TunedAsyncSqliteSaver(conn, pragmas=build_pragmas(CHECKPOINT_CACHE_SIZE_KB, BUSY_TIMEOUT_MS))
+    if backend in ("sqlite_pool", "mysql"):
+        return create_checkpointer(backend, db_path)
+    raise ValueError(f"不支持的异步 checkpointer 后端: {backend}")
+
+
+def get_checkpointer():
+    """
+    获取全局同步 checkpointer，确保所有请求共享同一个状态存储
+    """
+    global _checkpointer
+    if _checkpointer is None:
+        with _factory_lock:
+            if _checkpointer is None:
+                _checkpointer = create_checkpointer()
+    return _checkpointer
+
+
+def get_async_checkpointer():
+    """
+    获取全局异步 checkpointer（必须在事件循环中调用）
+    同步与异步后端相同（sqlite_pool / mysql）时共用同一个实例
+    """
+    global _async_checkpointer
+    if _async_checkpointer is None:
+        if ASYNC_CHECKPOINTER_BACKEND == CHECKPOINTER_BACKEND and CHECKPOINTER_BACKEND in ("sqlite_pool", "mysql"):
+            _async_checkpointer = get_checkpointer()
+        else:
+            _async_checkpointer = create_async_checkpointer()
+    return _async_checkpointer
+
+
+async def aclose_async_checkpointer() -> None:
+    """
+    关闭异步 checkpointer 的数据库连接（在应用关闭时调用）
+    """
+    global _async_checkpointer
+    if isinstance(_async_checkpointer, TunedAsyncSqliteSaver):
+        await _async_checkpointer.aclose()
+    _async_checkpointer = None
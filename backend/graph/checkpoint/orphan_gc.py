@@ -0,0 +1,247 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+孤儿 Checkpoint 回收
+删除 checkpoint 存储中存在、但 MySQL 中已没有对应面试/顾问记录的会话（"孤儿" checkpoint）
+
+- 按 thread_id 有序分块扫描（keyset 分页），每块只查询 thread_id 列，内存占用与数据总量无关
+- 每块用一次 IN 查询核对 MySQL 中存在的记录，只取主键列
+- 每块的孤儿会话在一个事务中批量删除
+- 最新 checkpoint 不足 min_age 秒的会话跳过：开始面试时先执行工作流、后写入 MySQL 记录，避免误删进行中的会话
+- 支持 dry_run、后台定时执行和运行统计
+"""
+import time
+import uuid
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, delete, func
+
+from backend.config import (
+    SessionLocal,
+    CHECKPOINT_GC_INTERVAL,
+    CHECKPOINT_GC_BATCH_SIZE,
+    CHECKPOINT_GC_MIN_AGE
+)
+from backend.models import InterviewRecord, ConsultantRecord
+from backend.models.checkpoint_record import CheckpointRecord, CheckpointWriteRecord
+from backend.graph.checkpoint.factory import get_checkpointer
+from backend.graph.checkpoint.sql_saver import SQLAlchemyCheckpointSaver
+
+_checkpoints = CheckpointRecord.__table__
+_writes = CheckpointWriteRecord.__table__
+
+# UUID v6 时间戳起点（1582-10-15）与 Unix 纪元的差值，单位 100ns
+_UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+# 后台回收任务
+_gc_task: Optional[asyncio.Task] = None
+
+# 累计运行统计
+_gc_metrics = {
+    "runs": 0,
+    "scanned_threads": 0,
+    "orphan_threads": 0,
+    "deleted_checkpoints": 0,
+    "deleted_writes": 0,
+    "last_run_at": None,
+    "last_run_seconds": None,
+    "last_error": None,
+}
+
+
+def _checkpoint_timestamp(checkpoint_id: str) -> float:
+    """
+    从 checkpoint_id（LangGraph 使用 UUID v6，时间戳在高位）解析出创建时间（Unix 秒）
+    无法解析时返回 0，视为足够旧
+    """
+    try:
+        value = uuid.UUID(checkpoint_id).int
+    except (ValueError, TypeError, AttributeError):
+        return 0.0
+    timestamp = ((value >> 96) << 28) | (((value >> 80) & 0xFFFF) << 12) | ((value >> 64) & 0x0FFF)
+    return (timestamp - _UUID_EPOCH_OFFSET) / 1e7
+
+
+# ---------- checkpoint 存储访问 ----------
+
+def _scan_threads(saver, after: str, limit: int) -> List[Tuple[str, str]]:
+    """
+    按 thread_id 顺序读取 after 之后的一块会话，返回 [(thread_id, 最新 checkpoint_id), ...]
+    thread_id 是主键的第一列，GROUP BY / ORDER BY 直接走主键索引
+    """
+    if isinstance(saver, SQLAlchemyCheckpointSaver):
+        saver.setup()
+        stmt = (
+            select(_checkpoints.c.thread_id, func.max(_checkpoints.c.checkpoint_id))
+            .where(_checkpoints.c.thread_id > after)
+            .group_by(_checkpoints.c.thread_id)
+            .order_by(_checkpoints.c.thread_id)
+            .limit(limit)
+        )
+        with saver.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(stmt)]
+
+    with saver.cursor(transaction=False) as cur:
+        cur.execute(
+            "SELECT thread_id, MAX(checkpoint_id) FROM checkpoints WHERE thread_id > ? "
+            "GROUP BY thread_id ORDER BY thread_id LIMIT ?",
+            (after, limit)
+        )
+        return cur.fetchall()
+
+
+def _delete_threads(saver, thread_ids: List[str]) -> Tuple[int, int]:
+    """
+    在一个事务中批量删除多个会话的 checkpoint 和 writes，返回 (checkpoint 数, writes 数)
+    """
+    if isinstance(saver, SQLAlchemyCheckpointSaver):
+        with saver.engine.begin() as conn:
+            deleted_checkpoints = conn.execute(delete(_checkpoints).where(_checkpoints.c.thread_id.in_(thread_ids))).rowcount
+            deleted_writes = conn.execute(delete(_writes).where(_writes.c.thread_id.in_(thread_ids))).rowcount
+        return deleted_checkpoints, deleted_writes
+
+    placeholders = ",".join("?" * len(thread_ids))
+    with saver.cursor() as cur:
+        cur.execute(f"DELETE FROM checkpoints WHERE thread_id IN ({placeholders})", thread_ids)
+        deleted_checkpoints = cur.rowcount
+        cur.execute(f"DELETE FROM writes WHERE thread_id IN ({placeholders})", thread_ids)
+        deleted_writes = cur.rowcount
+    return deleted_checkpoints, deleted_writes
+
+
+def _existing_record_ids(db, thread_ids: List[str]) -> set:
+    """
+    查询 MySQL 中存在的会话ID（只取主键列，不加载 ORM 对象）
+    """
+    existing = set()
+    for model in (InterviewRecord, ConsultantRecord):
+        rows = db.query(model.thread_id).filter(model.thread_id.in_(thread_ids)).all()
+        existing.update(row[0] for row in rows)
+    return existing
+
+
+# ---------- 对外接口 ----------
+
+def collect_orphan_checkpoints(
+    saver=None,
+    batch_size: int = CHECKPOINT_GC_BATCH_SIZE,
+    min_age: int = CHECKPOINT_GC_MIN_AGE,
+    dry_run: bool = False
+) -> Dict[str, int]:
+    """
+    扫描并删除孤儿 checkpoint
+
+    Args:
+        saver: 同步 checkpointer（默认使用全局 checkpointer）
+        batch_size: 每块扫描的会话数量
+        min_age: 最新 checkpoint 距今不足该秒数的会话跳过
+        dry_run: 只统计，不删除
+
+    Returns:
+        统计信息：batches / scanned_threads / orphan_threads / skipped_recent /
+        deleted_checkpoints / deleted_writes / seconds
+    """
+    saver = saver or get_checkpointer()
+    stats = {
+        "batches": 0,
+        "scanned_threads": 0,
+        "orphan_threads": 0,
+        "skipped_recent": 0,
+        "deleted_checkpoints": 0,
+        "deleted_writes": 0,
+    }
+    start = time.perf_counter()
+    cutoff = time.time() - min_age
+    after = ""
+
+    db = SessionLocal()
+    try:
+        while True:
+            chunk = _scan_threads(saver, after, batch_size)
+            if not chunk:
+                break
+            after = chunk[-1][0]
+            stats["batches"] += 1
+            stats["scanned_threads"] += len(chunk)
+
+            existing = _existing_record_ids(db, [thread_id for thread_id, _ in chunk])
+            orphans = []
+            for thread_id, latest_checkpoint_id in chunk:
+                if thread_id in existing:
+                    continue
+                if _checkpoint_timestamp(latest_checkpoint_id) > cutoff:
+                    stats["skipped_recent"] += 1
+                    continue
+                orphans.append(thread_id)
+
+            stats["orphan_threads"] += len(orphans)
+            if orphans and not dry_run:
+                deleted_checkpoints, deleted_writes = _delete_threads(saver, orphans)
+                stats["deleted_checkpoints"] += deleted_checkpoints
+                stats["deleted_writes"] += deleted_writes
+
+            if len(chunk) < batch_size:
+                break
+    finally:
+        db.close()
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    if not dry_run:
+        _record_metrics(stats)
+    return stats
+
+
+def _record_metrics(stats: Dict[str, int]) -> None:
+    _gc_metrics["runs"] += 1
+    for key in ("scanned_threads", "orphan_threads", "deleted_checkpoints", "deleted_writes"):
+        _gc_metrics[key] += stats[key]
+    _gc_metrics["last_run_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    _gc_metrics["last_run_seconds"] = stats["seconds"]
+
+
+def get_gc_metrics() -> dict:
+    """
+    获取本进程内孤儿 checkpoint 回收的累计统计
+    """
+    return dict(_gc_metrics)
+
+
+async def _gc_loop(interval: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            stats = await asyncio.to_thread(collect_orphan_checkpoints)
+            _gc_metrics["last_error"] = None
+            if stats["orphan_threads"]:
+                print(
+                    f"[checkpoint] 孤儿回收: 扫描 {stats['scanned_threads']} 个会话, 删除 {stats['orphan_threads']} 个孤儿会话 "
+                    f"({stats['deleted_checkpoints']} 个 checkpoint / {stats['deleted_writes']} 条 writes), 耗时 {stats['seconds']}s"
+                )
+        except Exception as e:
+            _gc_metrics["last_error"] = str(e)
+            print(f"[checkpoint] 孤儿回收失败: {e}")
+
+
+def start_background_gc() -> None:
+    """
+    启动后台孤儿回收任务（CHECKPOINT_GC_INTERVAL > 0 时生效，必须在事件循环中调用）
+    """
+    global _gc_task
+    if CHECKPOINT_GC_INTERVAL <= 0 or _gc_task is not None:
+        return
+    _gc_task = asyncio.create_task(_gc_loop(CHECKPOINT_GC_INTERVAL))
+
+
+async def stop_background_gc() -> None:
+    """
+    停止后台孤儿回收任务（在应用关闭时调用）
+    """
+    global _gc_task
+    if _gc_task is None:
+        return
+    _gc_task.cancel()
+    try:
+        await _gc_task
+    except asyncio.CancelledError:
+        pass
+    _gc_task = None
@@ -0,0 +1,295 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+数据库 Checkpointer（SQLAlchemy 实现）
+将 checkpoint 和 pending writes 存储到 DATABASE_URL 指向的数据库（MySQL），
+使多个 uvicorn worker / 多台主机共享同一份面试工作流状态
+
+- 表结构见 backend/models/checkpoint_record.py
+- pending writes 使用批量 INSERT（executemany）写入
+- 列出 checkpoint 时一次性批量加载所有 pending writes，避免 N+1 查询
+- 只使用 SQLAlchemy Core 的通用语法，也可以在 SQLite 上运行
+"""
+import json
+import random
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, insert, delete, and_, tuple_
+from sqlalchemy.engine import Engine
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    CheckpointTuple,
+    get_checkpoint_id
+)
+
+from backend.config import Base
+from backend.models.checkpoint_record import CheckpointRecord, CheckpointWriteRecord
+
+try:
+    from langgraph.checkpoint.base import get_checkpoint_metadata
+except ImportError:  # 旧版本 langgraph 没有该函数，元数据原样保存
+    def get_checkpoint_metadata(config, metadata):
+        return metadata
+
+
+_checkpoints = CheckpointRecord.__table__
+_writes = CheckpointWriteRecord.__table__
+
+
+class SQLAlchemyCheckpointSaver(BaseCheckpointSaver):
+    """
+    基于 SQLAlchemy 的 LangGraph checkpointer
+
+    Args:
+        engine: SQLAlchemy 引擎（默认复用 backend.config.database 中的 MySQL 引擎）
+    """
+
+    def __init__(self, engine: Engine, *, serde: Any = None):
+        super().__init__(serde=serde)
+        self.engine = engine
+        self.is_setup = False
+        self._setup_lock = threading.Lock()
+
+    def setup(self) -> None:
+        """创建 checkpoint 相关的表（已存在时跳过）"""
+        if self.is_setup:
+            return
+        with self._setup_lock:
+            if not self.is_setup:
+                Base.metadata.create_all(bind=self.engine, tables=[_checkpoints, _writes])
+                self.is_setup = True
+
+    # ---------- 序列化 ----------
+
+    def _dump_metadata(self, config, metadata) -> bytes:
+        return json.dumps(
+            get_checkpoint_metadata(config, metadata), ensure_ascii=False, default=str
+        ).encode("utf-8", "ignore")
+
+    @staticmethod
+    def _load_metadata(data: Optional[bytes]) -> dict:
+        return json.loads(data) if data is not None else {}
+
+    def _to_tuple(self, row, pending_writes: List[Tuple[str, str, Any]]) -> CheckpointTuple:
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": row.thread_id,
+                    "checkpoint_ns": row.checkpoint_ns,
+                    "checkpoint_id": row.checkpoint_id,
+                }
+            },
+            self.serde.loads_typed((row.type, row.checkpoint)),
+            self._load_metadata(row.metadata),
+            (
+                {
+                    "configurable": {
+                        "thread_id": row.thread_id,
+                        "checkpoint_ns": row.checkpoint_ns,
+                        "checkpoint_id": row.parent_checkpoint_id,
+                    }
+                }
+                if row.parent_checkpoint_id
+                else None
+            ),
+            pending_writes,
+        )
+
+    def _load_pending_writes(self, conn, keys: Sequence[Tuple[str, str, str]]) -> Dict[tuple, list]:
+        """
+        一次查询批量加载多个 checkpoint 的 pending writes
+        返回 {(thread_id, checkpoint_ns, checkpoint_id): [(task_id, channel, value), ...]}
+        """
+        result: Dict[tuple, list] = defaultdict(list)
+        if not keys:
+            return result
+
+        stmt = (
+            select(
+                _writes.c.thread_id, _writes.c.checkpoint_ns, _writes.c.checkpoint_id,
+                _writes.c.task_id, _writes.c.channel, _writes.c.type, _writes.c.value
+            )
+            .where(tuple_(_writes.c.thread_id, _writes.c.checkpoint_ns, _writes.c.checkpoint_id).in_(list(keys)))
+            .order_by(_writes.c.task_path, _writes.c.task_id, _writes.c.idx)
+        )
+        for row in conn.execute(stmt):
+            key = (row.thread_id, row.checkpoint_ns, row.checkpoint_id)
+            result[key].append((row.task_id, row.channel, self.serde.loads_typed((row.type, row.value))))
+        return result
+
+    # ---------- 同步接口 ----------
+
+    def get_tuple(self, config) -> Optional[CheckpointTuple]:
+        self.setup()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+
+        stmt = select(_checkpoints).where(
+            _checkpoints.c.thread_id == thread_id,
+            _checkpoints.c.checkpoint_ns == checkpoint_ns
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            stmt = stmt.where(_checkpoints.c.checkpoint_id == checkpoint_id)
+        else:
+            stmt = stmt.order_by(_checkpoints.c.checkpoint_id.desc()).limit(1)
+
+        with self.engine.connect() as conn:
+            row = conn.execute(stmt).first()
+            if row is None:
+                return None
+            key = (row.thread_id, row.checkpoint_ns, row.checkpoint_id)
+            writes = self._load_pending_writes(conn, [key])
+        return self._to_tuple(row, writes.get(key, []))
+
+    def list(self, config, *, filter: Optional[Dict[str, Any]] = None, before=None, limit: Optional[int] = None) -> Iterator[CheckpointTuple]:
+        self.setup()
+        conditions = []
+        if config is not None:
+            conditions.append(_checkpoints.c.thread_id == str(config["configurable"]["thread_id"]))
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                conditions.append(_checkpoints.c.checkpoint_ns == checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                conditions.append(_checkpoints.c.checkpoint_id == checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            conditions.append(_checkpoints.c.checkpoint_id < before_id)
+
+        stmt = select(_checkpoints).order_by(_checkpoints.c.checkpoint_id.desc())
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        # 元数据过滤在反序列化后进行，此时不能在 SQL 中截断
+        if limit is not None and not filter:
+            stmt = stmt.limit(limit)
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+            keys = [(r.thread_id, r.checkpoint_ns, r.checkpoint_id) for r in rows]
+            writes = self._load_pending_writes(conn, keys)
+
+        yielded = 0
+        for row, key in zip(rows, keys):
+            if filter:
+                metadata = self._load_metadata(row.metadata)
+                if any(metadata.get(k) != v for k, v in filter.items()):
+                    continue
+            yield self._to_tuple(row, writes.get(key, []))
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                break
+
+    def put(self, config, checkpoint, metadata, new_versions) -> dict:
+        self.setup()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+
+        key = and_(
+            _checkpoints.c.thread_id == thread_id,
+            _checkpoints.c.checkpoint_ns == checkpoint_ns,
+            _checkpoints.c.checkpoint_id == checkpoint["id"]
+        )
+        # 先删后插：与 SqliteSaver 的 INSERT OR REPLACE 语义一致，且各数据库通用
+        with self.engine.begin() as conn:
+            conn.execute(delete(_checkpoints).where(key))
+            conn.execute(insert(_checkpoints).values(
+                thread_id=thread_id,
+                checkpoint_ns=checkpoint_ns,
+                checkpoint_id=checkpoint["id"],
+                parent_checkpoint_id=config["configurable"].get("checkpoint_id"),
+                type=type_,
+                checkpoint=serialized_checkpoint,
+                metadata=self._dump_metadata(config, metadata)
+            ))
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(self, config, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        self.setup()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = str(config["configurable"].get("checkpoint_ns", ""))
+        checkpoint_id = str(config["configurable"]["checkpoint_id"])
+
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized_value = self.serde.dumps_typed(value)
+            rows.append({
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+                "task_id": task_id,
+                "task_path": task_path,
+                "idx": WRITES_IDX_MAP.get(channel, idx),
+                "channel": channel,
+                "type": type_,
+                "value": serialized_value,
+            })
+        if not rows:
+            return
+
+        same_task = and_(
+            _writes.c.thread_id == thread_id,
+            _writes.c.checkpoint_ns == checkpoint_ns,
+            _writes.c.checkpoint_id == checkpoint_id,
+            _writes.c.task_id == task_id,
+            _writes.c.idx.in_([r["idx"] for r in rows])
+        )
+
+        with self.engine.begin() as conn:
+            if all(w[0] in WRITES_IDX_MAP for w in writes):
+                # 特殊写入（错误/中断等）：覆盖已有记录
+                conn.execute(delete(_writes).where(same_task))
+            else:
+                # 普通写入：已存在的记录保持不变
+                existing = {r.idx for r in conn.execute(select(_writes.c.idx).where(same_task))}
+                rows = [r for r in rows if r["idx"] not in existing]
+            if rows:
+                # 批量插入
+                conn.execute(insert(_writes), rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.setup()
+        with self.engine.begin() as conn:
+            conn.execute(delete(_checkpoints).where(_checkpoints.c.thread_id == str(thread_id)))
+            conn.execute(delete(_writes).where(_writes.c.thread_id == str(thread_id)))
+
+    def get_next_version(self, current: Optional[str], channel: Any) -> str:
+        """生成单调递增的通道版本号（格式与 SqliteSaver 一致）"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        next_v = current_v + 1
+        next_h = random.random()
+        return f"{next_v:032}.{next_h:016}"
+
+    # ---------- 异步接口（在线程池中执行同步实现） ----------
+
+    async def aget_tuple(self, config) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions) -> dict:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id: str, task_path: str = "") -> None:
+        return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return await asyncio.to_thread(self.delete_thread, thread_id)
@@ -0,0 +1,208 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+SQLite 连接池 Checkpointer
+替代"全进程共享一个 sqlite3 连接 + 全局锁"的旧实现：
+- 每个线程从连接池借用独立连接，读操作可以并发执行（WAL 模式下读写互不阻塞）
+- 每个连接都设置 WAL / synchronous=NORMAL / 页缓存等 pragma
+- 同时实现异步接口（在线程池中执行），可用于 ainvoke
+
+另提供 TunedAsyncSqliteSaver：基于 aiosqlite 的异步版本，同样应用上述 pragma
+"""
+import queue
+import sqlite3
+import asyncio
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+
+def build_pragmas(cache_size_kb: int, busy_timeout_ms: int) -> List[str]:
+    """
+    生成连接级 pragma 语句
+    - journal_mode=WAL：读写并发，写入只追加 WAL 文件
+    - synchronous=NORMAL：WAL 模式下安全且显著减少 fsync 次数
+    - cache_size：负数表示以 KB 为单位的页缓存大小
+    - temp_store=MEMORY：临时表/排序使用内存
+    - busy_timeout：写锁冲突时等待而不是立即报 database is locked
+    """
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA cache_size=-{cache_size_kb}",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA busy_timeout={busy_timeout_ms}",
+    ]
+
+
+class SqliteConnectionPool:
+    """
+    线程安全的 SQLite 连接池
+
+    连接按需创建，最多 size 个；池耗尽时阻塞等待其他线程归还
+    """
+
+    def __init__(self, db_path: str, size: int = 8, cache_size_kb: int = 16384, busy_timeout_ms: int = 5000):
+        self.db_path = str(db_path)
+        self.size = size
+        self.pragmas = build_pragmas(cache_size_kb, busy_timeout_ms)
+        self._busy_timeout = busy_timeout_ms / 1000
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=self._busy_timeout)
+        for pragma in self.pragmas:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """借出一个连接"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+
+        return self._idle.get(timeout=timeout)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """归还连接"""
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """关闭所有连接"""
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+            self._idle = queue.LifoQueue(maxsize=self.size)
+
+
+class PooledSqliteSaver(SqliteSaver):
+    """
+    基于连接池的 SqliteSaver
+
+    复用 SqliteSaver 的 SQL 与序列化逻辑，只替换连接管理：
+    SqliteSaver 的所有数据库操作都通过 cursor() 进行，这里让 cursor() 从连接池借用连接，
+    并通过线程局部变量让 self.conn 指向当前线程借到的连接。
+    """
+
+    def __init__(self, pool: SqliteConnectionPool, *, serde: Any = None):
+        self._local = threading.local()
+        super().__init__(None, serde=serde)
+        self.pool = pool
+        self._setup_lock = threading.Lock()
+
+    # ---------- 连接管理 ----------
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """当前线程借用的连接（在 cursor() 上下文内有效）"""
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    @conn.setter
+    def conn(self, value) -> None:
+        # 父类 __init__ 会赋值 self.conn，连接由连接池管理，忽略即可
+        pass
+
+    @contextmanager
+    def _borrow(self) -> Iterator[sqlite3.Connection]:
+        conn = self.pool.acquire()
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(conn)
+        try:
+            yield conn
+        finally:
+            stack.pop()
+            self.pool.release(conn)
+
+    def setup(self) -> None:
+        if self.is_setup:
+            return
+        with self._setup_lock:
+            if self.is_setup:
+                return
+            with self._borrow():
+                super().setup()
+
+    @contextmanager
+    def cursor(self, transaction: bool = True) -> Iterator[sqlite3.Cursor]:
+        self.setup()
+        with self._borrow() as conn:
+            cur = conn.cursor()
+            try:
+                yield cur
+            finally:
+                if transaction:
+                    conn.commit()
+                cur.close()
+
+    # ---------- 异步接口（在线程池中执行同步实现） ----------
+
+    async def aget_tuple(self, config):
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None) -> AsyncIterator:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path: str = ""):
+        return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class TunedAsyncSqliteSaver(AsyncSqliteSaver):
+    """
+    基于 aiosqlite 的异步 Checkpointer，初始化时应用与连接池相同的 pragma
+    aiosqlite 在独立线程中执行 SQL，不会阻塞事件循环
+    """
+
+    def __init__(self, conn, *, pragmas: List[str], serde: Any = None):
+        super().__init__(conn, serde=serde)
+        self.pragmas = pragmas
+        self._tuned = False
+
+    async def setup(self) -> None:
+        await super().setup()
+        if self._tuned:
+            return
+        async with self.lock:
+            if not self._tuned:
+                for pragma in self.pragmas:
+                    await self.conn.execute(pragma)
+                self._tuned = True
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        # 父类删除前不会建立连接，这里先确保连接可用
+        await self.setup()
+        await super().adelete_thread(thread_id)
+
+    async def aclose(self) -> None:
+        await self.conn.close()
@@ -1,3 +1,8 @@
-﻿from .llm_helper import openai_llm, openai_embeddings
+﻿from .llm_helper import (
+    openai_llm, openai_embeddings, raw_openai_embeddings, cached_openai_llm, llm_cache, embedding_cache, get_llm
+)
 
-__all__ = ["openai_llm", "openai_embeddings"]
+__all__ = [
+    "openai_llm", "openai_embeddings", "raw_openai_embeddings", "cached_openai_llm",
+    "llm_cache", "embedding_cache", "get_llm"
+]
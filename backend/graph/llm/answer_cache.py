@@ -0,0 +1,283 @@
+# AI智能面试辅助系统V1.0，作者：刘梦畅
+"""
+顾问语义答案缓存
+顾问的大部分问题集中在少数几个（STAR 法则、薪资谈判、面试紧张……），措辞略有不同但答案相同：
+按问题向量的余弦相似度查找已回答过的问题，命中时直接返回缓存的答案，不再检索、调用 Agent 和生成
+
+- 问题向量通过 Embedding 模型（带 Embedding 缓存）计算，命中阈值为余弦相似度 similarity_threshold
+- 每个条目记录写入时的知识库版本（init_vectorstore.py 写入的 chroma_db/kb_version），
+  知识库重新索引后（版本变化）旧条目全部失效
+- 条目超过 ttl 秒后失效；条目数超过 max_entries 时淘汰最久未命中的条目
+- 每个条目记录命中次数，stats() 返回整体命中率和命中最多的问题
+- 两级存储：内存（全部条目和向量矩阵，检索用） + SQLite（重启后仍有效）
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# stats() 中列出的命中最多的问题数量
+_TOP_ENTRIES = 5
+
+
+def make_question_key(question: str) -> str:
+    """问题的缓存键（去掉首尾空白后哈希）"""
+    return hashlib.sha256(question.strip().encode("utf-8")).hexdigest()
+
+
+def _normalize(vector) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+class SemanticAnswerCache:
+    """
+    按问题向量相似度查找的答案缓存
+
+    Args:
+        embeddings: 计算问题向量的 Embedding 模型
+        db_path: SQLite 缓存文件路径，为 None 时只使用内存
+        version_path: 知识库版本文件路径，为 None 时不随知识库失效
+        similarity_threshold: 命中的最小余弦相似度（0-1，越大越严格）
+        ttl: 条目有效期（秒）
+        max_entries: 最大条目数（按最近命中时间淘汰）
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        db_path: Optional[str] = None,
+        version_path: Optional[Path] = None,
+        similarity_threshold: float = 0.95,
+        ttl: float = 86400,
+        max_entries: int = 1000
+    ):
+        self.embeddings = embeddings
+        self.version_path = Path(version_path) if version_path else None
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: List[dict] = []
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._version_mtime_ns = None
+        self._kb_version = ""
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "invalidations": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS answer_cache (
+                    key TEXT PRIMARY KEY,
+                    question TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    answer TEXT NOT NULL,
+                    tools_used TEXT NOT NULL,
+                    kb_version TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0,
+                    last_hit REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+
+        with self._lock:
+            self._refresh_version()
+            self._load()
+
+    # ---------- 知识库版本 ----------
+
+    def _refresh_version(self) -> bool:
+        """读取知识库版本文件，版本变化时返回 True"""
+        if self.version_path is None:
+            return False
+        try:
+            mtime_ns = self.version_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns == self._version_mtime_ns:
+            return False
+        self._version_mtime_ns = mtime_ns
+        version = self.version_path.read_text(encoding="utf-8").strip()
+        if version == self._kb_version:
+            return False
+        self._kb_version = version
+        return True
+
+    def _check_version(self) -> None:
+        """知识库重新索引后丢弃旧版本的条目"""
+        if not self._refresh_version():
+            return
+        stale = [entry for entry in self._entries if entry["kb_version"] != self._kb_version]
+        if not stale:
+            return
+        self._remove([entry["key"] for entry in stale])
+        self._stats["invalidations"] += len(stale)
+        print(f"[answer_cache] 知识库已更新（版本 {self._kb_version}），{len(stale)} 个缓存答案失效")
+
+    # ---------- 存储 ----------
+
+    def _load(self) -> None:
+        """从 SQLite 加载当前知识库版本、未过期的条目，删除其余条目"""
+        if self._conn is None:
+            return
+        expire_before = time.time() - self.ttl
+        self._conn.execute(
+            "DELETE FROM answer_cache WHERE kb_version != ? OR created_at < ?", (self._kb_version, expire_before)
+        )
+        self._conn.commit()
+        rows = self._conn.execute(
+            "SELECT key, question, vector, answer, tools_used, kb_version, created_at, hit_count, last_hit "
+            "FROM answer_cache ORDER BY last_hit DESC LIMIT ?",
+            (self.max_entries,)
+        ).fetchall()
+        for key, question, vector, answer, tools_used, kb_version, created_at, hit_count, last_hit in rows:
+            values = array("f")
+            values.frombytes(vector)
+            self._entries.append({
+                "key": key, "question": question, "vector": np.asarray(values, dtype=np.float32),
+                "answer": answer, "tools_used": json.loads(tools_used), "kb_version": kb_version,
+                "created_at": created_at, "hit_count": hit_count, "last_hit": last_hit
+            })
+        self._rebuild_matrix()
+        if self._entries:
+            print(f"[answer_cache] 已加载 {len(self._entries)} 个缓存答案")
+
+    def _rebuild_matrix(self) -> None:
+        if self._entries:
+            self._matrix = np.stack([entry["vector"] for entry in self._entries])
+        else:
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+
+    def _remove(self, keys: List[str]) -> None:
+        keys = set(keys)
+        self._entries = [entry for entry in self._entries if entry["key"] not in keys]
+        self._rebuild_matrix()
+        if self._conn is not None and keys:
+            self._conn.executemany("DELETE FROM answer_cache WHERE key = ?", [(key,) for key in keys])
+            self._conn.commit()
+
+    # ---------- 读写 ----------
+
+    def lookup(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        查找相似问题的缓存答案
+
+        Returns:
+            {"question", "answer", "tools_used", "similarity", "hit_count"}，未命中时返回 None
+        """
+        vector = _normalize(self.embeddings.embed_query(question))
+        now = time.time()
+        with self._lock:
+            self._check_version()
+            best = None
+            if self._entries:
+                similarities = self._matrix @ vector
+                for i in np.argsort(-similarities):
+                    if similarities[i] < self.similarity_threshold:
+                        break
+                    if now - self._entries[i]["created_at"] <= self.ttl:
+                        best = (self._entries[i], float(similarities[i]))
+                        break
+
+            if best is None:
+                self._stats["misses"] += 1
+                return None
+
+            entry, similarity = best
+            entry["hit_count"] += 1
+            entry["last_hit"] = now
+            self._stats["hits"] += 1
+            if self._conn is not None:
+                self._conn.execute(
+                    "UPDATE answer_cache SET hit_count = ?, last_hit = ? WHERE key = ?",
+                    (entry["hit_count"], now, entry["key"])
+                )
+                self._conn.commit()
+            return {
+                "question": entry["question"],
+                "answer": entry["answer"],
+                "tools_used": list(entry["tools_used"]),
+                "similarity": similarity,
+                "hit_count": entry["hit_count"]
+            }
+
+    def put(self, question: str, answer: str, tools_used: List[str]) -> None:
+        """写入问题的答案（相同问题覆盖旧答案）"""
+        vector = _normalize(self.embeddings.embed_query(question))
+        now = time.time()
+        key = make_question_key(question)
+        with self._lock:
+            self._check_version()
+            entry = {
+                "key": key, "question": question.strip(), "vector": vector, "answer": answer,
+                "tools_used": list(tools_used), "kb_version": self._kb_version,
+                "created_at": now, "hit_count": 0, "last_hit": now
+            }
+            self._entries = [item for item in self._entries if item["key"] != key] + [entry]
+
+            # 淘汰过期和最久未命中的条目
+            alive = sorted(
+                (item for item in self._entries if now - item["created_at"] <= self.ttl),
+                key=lambda item: item["last_hit"], reverse=True
+            )
+            kept = {item["key"] for item in alive[:self.max_entries]}
+            evicted = [item["key"] for item in self._entries if item["key"] not in kept]
+            self._entries = alive[:self.max_entries]
+            self._rebuild_matrix()
+
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO answer_cache "
+                    "(key, question, vector, answer, tools_used, kb_version, created_at, hit_count, last_hit) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)",
+                    (
+                        key, entry["question"], array("f", vector.tolist()).tobytes(), answer,
+                        json.dumps(entry["tools_used"], ensure_ascii=False), self._kb_version, now, now
+                    )
+                )
+                if evicted:
+                    self._conn.executemany("DELETE FROM answer_cache WHERE key = ?", [(k,) for k in evicted])
+                self._conn.commit()
+            self._stats["writes"] += 1
+
+    def invalidate(self) -> int:
+        """清空全部条目，返回清除的条目数"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries = []
+            self._rebuild_matrix()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM answer_cache")
+                self._conn.commit()
+            self._stats["invalidations"] += count
+            return count
+
+    # ---------- 统计 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """命中/未命中计数、命中率和命中最多的问题"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["kb_version"] = self._kb_version
+            top = sorted(self._entries, key=lambda entry: entry["hit_count"], reverse=True)[:_TOP_ENTRIES]
+            stats["top_entries"] = [
+                {"question": entry["question"], "hit_count": entry["hit_count"]} for entry in top
+            ]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
@@ -0,0 +1,244 @@
+# AI智能面试辅助系统V1.0，作者：刘梦畅
+"""
+Embedding 缓存
+知识库索引和知识库检索共用：同一段文本（相同的 Embedding 模型）只调用一次 Embedding 接口，
+重复的问题（如"如何谈薪资"）、全量重建知识库索引时直接复用已有向量
+
+- CachedEmbeddings 实现 LangChain 的 Embeddings 接口，包装 OpenAIEmbeddings，传给 Chroma 即可使用
+- 缓存键：sha256(模型名称 + 文本)，更换模型后自动失效
+- 两级缓存：进程内 LRU（内存） + SQLite（向量按 float32 二进制存储，跨进程、重启后仍有效）
+- 两级各自的条目数上限（按最近访问时间淘汰），命中/未命中按文本计数
+- 异步接口在线程中查询 / 写入缓存（SQLite 读写和淘汰在锁内同步执行），不阻塞事件循环
+"""
+import time
+import asyncio
+import sqlite3
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+# SQLite 层每写入多少次检查一次条目数上限
+_PRUNE_EVERY = 100
+
+# SQLite 单条语句的参数数量上限以内，批量查询时每次查询的键数量
+_QUERY_BATCH = 500
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """根据模型名称和文本生成缓存键"""
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _encode(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode(value: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(value)
+    return vector.tolist()
+
+
+class TieredEmbeddingCache:
+    """
+    内存 + SQLite 两级 Embedding 缓存
+
+    Args:
+        db_path: SQLite 缓存文件路径，为 None 时只使用内存缓存
+        max_memory_entries: 内存缓存最大条目数
+        max_db_entries: SQLite 缓存最大条目数（按最近访问时间淘汰）
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_memory_entries: int = 2048,
+        max_db_entries: int = 100000
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.max_db_entries = max_db_entries
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_access ON embedding_cache(last_access)"
+            )
+            self._conn.commit()
+
+    # ---------- 内存层 ----------
+
+    def _memory_put(self, key: str, vector: List[float]) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # ---------- SQLite 层 ----------
+
+    def _db_get_many(self, keys: List[str], now: float) -> Dict[str, List[float]]:
+        found = {}
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            for key, value in rows:
+                found[key] = _decode(value)
+        if found:
+            self._conn.executemany(
+                "UPDATE embedding_cache SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+            self._conn.commit()
+        return found
+
+    def _db_put_many(self, items: Dict[str, List[float]], now: float) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (key, vector, last_access) VALUES (?, ?, ?)",
+            [(key, _encode(vector), now) for key, vector in items.items()]
+        )
+        self._writes_since_prune += len(items)
+        if self._writes_since_prune >= _PRUNE_EVERY:
+            self._writes_since_prune = 0
+            self._db_prune()
+        self._conn.commit()
+
+    def _db_prune(self) -> None:
+        """按最近访问时间淘汰超出上限的条目"""
+        self._conn.execute(
+            "DELETE FROM embedding_cache WHERE key IN ("
+            "SELECT key FROM embedding_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_db_entries,)
+        )
+
+    # ---------- 读写 ----------
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """批量查询，返回命中的 {key: vector}"""
+        now = time.time()
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                    continue
+                self._memory.move_to_end(key)
+                found[key] = vector
+            self._stats["memory_hits"] += len(found)
+
+            if missing and self._conn is not None:
+                db_found = self._db_get_many(missing, now)
+                for key, vector in db_found.items():
+                    self._memory_put(key, vector)
+                found.update(db_found)
+                self._stats["db_hits"] += len(db_found)
+
+            self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            for key, vector in items.items():
+                self._memory_put(key, vector)
+            if self._conn is not None:
+                self._db_put_many(items, now)
+            self._stats["writes"] += len(items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embedding_cache")
+                self._conn.commit()
+
+    # ---------- 统计 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """命中/未命中计数（按文本）和命中率"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    带缓存的 Embedding 模型：先查缓存，只把未命中的文本（去重后）交给底层模型
+
+    Args:
+        embeddings: 底层 Embedding 模型（如 OpenAIEmbeddings）
+        cache: Embedding 缓存
+        model: 模型名称，参与缓存键
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: TieredEmbeddingCache, model: str):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model
+
+    def _lookup(self, texts: List[str]) -> tuple:
+        keys = [make_embedding_key(self.model, text) for text in texts]
+        found = self.cache.get_many(keys)
+        # 未命中的文本去重，保持原有顺序
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in found))
+        return keys, found, missing
+
+    def _store(self, missing: List[str], vectors: List[List[float]], found: Dict[str, List[float]]) -> None:
+        items = {make_embedding_key(self.model, text): vector for text, vector in zip(missing, vectors)}
+        self.cache.put_many(items)
+        found.update(items)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            self._store(missing, self.embeddings.embed_documents(missing), found)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, found, missing = self._lookup([text])
+        if missing:
+            self._store(missing, [self.embeddings.embed_query(text)], found)
+        return found[keys[0]]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(missing)
+            await asyncio.to_thread(self._store, missing, vectors, found)
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, [text])
+        if missing:
+            vector = await self.embeddings.aembed_query(text)
+            await asyncio.to_thread(self._store, missing, [vector], found)
+        return found[keys[0]]
@@ -0,0 +1,202 @@
+# AI智能面试辅助系统V1.0，作者：刘梦畅
+"""
+LLM 响应缓存
+用于输入确定的 LLM 调用（简历信息提取、搜索结果提炼、报告生成）：
+同一份简历重复上传、同一岗位的相同搜索结果，直接复用上次的 LLM 输出
+
+- 实现 LangChain 的 BaseCache 接口，通过 ChatOpenAI(cache=...) 接入
+- 缓存键：sha256(模型参数 + prompt)，模型参数包含 model / temperature 等
+- 两级缓存：进程内 LRU（内存） + SQLite（跨进程、重启后仍有效）
+- 支持 TTL 过期、两级各自的条目数上限（LRU 淘汰）、命中/未命中计数
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+# SQLite 层每写入多少次检查一次条目数上限
+_PRUNE_EVERY = 100
+
+
+def make_cache_key(prompt: str, llm_string: str) -> str:
+    """根据模型参数和 prompt 生成缓存键"""
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+def _serialize(generations: Sequence[Generation]) -> str:
+    items = []
+    for generation in generations:
+        item = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            item["message"] = message_to_dict(generation.message)
+        items.append(item)
+    return json.dumps(items, ensure_ascii=False, default=str)
+
+
+def _deserialize(value: str) -> list:
+    generations = []
+    for item in json.loads(value):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            generations.append(ChatGeneration(message=message, generation_info=item["generation_info"]))
+        else:
+            generations.append(Generation(text=item["text"], generation_info=item["generation_info"]))
+    return generations
+
+
+class TieredLLMCache(BaseCache):
+    """
+    内存 + SQLite 两级 LLM 缓存
+
+    Args:
+        db_path: SQLite 缓存文件路径，为 None 时只使用内存缓存
+        ttl: 缓存有效期（秒），0 表示永不过期
+        max_memory_entries: 内存缓存最大条目数
+        max_db_entries: SQLite 缓存最大条目数（按最近访问时间淘汰）
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: int = 7 * 24 * 3600,
+        max_memory_entries: int = 256,
+        max_db_entries: int = 10000
+    ):
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_db_entries = max_db_entries
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+            self._conn.commit()
+
+    # ---------- 内存层 ----------
+
+    def _memory_get(self, key: str, now: float) -> Optional[Sequence[Generation]]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, generations = entry
+        if expires_at and expires_at < now:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return generations
+
+    def _memory_put(self, key: str, generations: Sequence[Generation], expires_at: float) -> None:
+        self._memory[key] = (expires_at, generations)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # ---------- SQLite 层 ----------
+
+    def _db_get(self, key: str, now: float) -> Optional[tuple]:
+        row = self._conn.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at and expires_at < now:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return _deserialize(value), expires_at
+
+    def _db_put(self, key: str, generations: Sequence[Generation], expires_at: float, now: float) -> None:
+        value = _serialize(generations)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, now)
+        )
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= _PRUNE_EVERY:
+            self._writes_since_prune = 0
+            self._db_prune(now)
+        self._conn.commit()
+
+    def _db_prune(self, now: float) -> None:
+        """删除过期条目，并按最近访问时间淘汰超出上限的条目"""
+        self._conn.execute("DELETE FROM llm_cache WHERE expires_at > 0 AND expires_at < ?", (now,))
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            "SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_db_entries,)
+        )
+
+    # ---------- BaseCache 接口 ----------
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        key = make_cache_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            generations = self._memory_get(key, now)
+            if generations is not None:
+                self._stats["memory_hits"] += 1
+                return generations
+
+            if self._conn is not None:
+                found = self._db_get(key, now)
+                if found is not None:
+                    generations, expires_at = found
+                    self._memory_put(key, generations, expires_at)
+                    self._stats["db_hits"] += 1
+                    return generations
+
+            self._stats["misses"] += 1
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        key = make_cache_key(prompt, llm_string)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl > 0 else 0
+        with self._lock:
+            self._memory_put(key, return_val, expires_at)
+            if self._conn is not None:
+                self._db_put(key, return_val, expires_at, now)
+            self._stats["writes"] += 1
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_cache")
+                self._conn.commit()
+
+    # ---------- 统计 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """命中/未命中计数和命中率"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
@@ -1,28 +1,63 @@
 # AI智能面试辅助系统V1.0，作者：刘梦畅
 """
 LLM 辅助工具
-提供统一的 LLM 实例和 Embedding 模型
+提供统一的 LLM 实例和 Embedding 模型（Embedding 默认带缓存）
 """
+from typing import Optional
+
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from backend.config import (
-    OPENAI_API_KEY, MODEL_NAME, TEMPERATURE, OPENAI_API_BASE, EMBEDDING_MODEL
+    OPENAI_API_KEY, MODEL_NAME, TEMPERATURE, OPENAI_API_BASE, EMBEDDING_MODEL,
+    LLM_CACHE_ENABLED, LLM_CACHE_DB_PATH, LLM_CACHE_TTL,
+    LLM_CACHE_MAX_MEMORY_ENTRIES, LLM_CACHE_MAX_DB_ENTRIES, LLM_CACHE_BYPASS,
+    EMBEDDING_CACHE_ENABLED, EMBEDDING_CACHE_DB_PATH,
+    EMBEDDING_CACHE_MAX_MEMORY_ENTRIES, EMBEDDING_CACHE_MAX_DB_ENTRIES
 )
+from backend.graph.llm.llm_cache import TieredLLMCache
+from backend.graph.llm.embedding_cache import TieredEmbeddingCache, CachedEmbeddings
 
 # ========== OpenAI LLM ==========
-def get_openai_llm() -> ChatOpenAI:
-    """获取 OpenAI LLM 实例"""
+def get_openai_llm(cache: Optional[TieredLLMCache] = None) -> ChatOpenAI:
+    """获取 OpenAI LLM 实例（cache 为 None 时不使用缓存）"""
     return ChatOpenAI(
         model=MODEL_NAME,
         base_url=OPENAI_API_BASE,
         temperature=TEMPERATURE,
-        api_key=OPENAI_API_KEY
+        api_key=OPENAI_API_KEY,
+        cache=cache
     )
 
 
-# 创建全局单例实例
+# 创建全局单例实例（Agent 等需要多样化输出的场景使用，不缓存）
 openai_llm = get_openai_llm()
 
 
+# ========== 带缓存的 LLM ==========
+# LLM 响应缓存（内存 + SQLite 两级）
+llm_cache = TieredLLMCache(
+    db_path=LLM_CACHE_DB_PATH or None,
+    ttl=LLM_CACHE_TTL,
+    max_memory_entries=LLM_CACHE_MAX_MEMORY_ENTRIES,
+    max_db_entries=LLM_CACHE_MAX_DB_ENTRIES
+) if LLM_CACHE_ENABLED else None
+
+# 输入确定的调用使用的 LLM 实例
+cached_openai_llm = get_openai_llm(cache=llm_cache) if llm_cache is not None else openai_llm
+
+
+def get_llm(call_site: Optional[str] = None) -> ChatOpenAI:
+    """
+    按调用点获取 LLM 实例
+
+    Args:
+        call_site: 调用点名称（resume_extract / question_distill / report），
+                   为 None 或在 LLM_CACHE_BYPASS 中时返回不带缓存的实例
+    """
+    if call_site is None or call_site in LLM_CACHE_BYPASS:
+        return openai_llm
+    return cached_openai_llm
+
+
 # ========== Embedding 模型 ==========
 def get_openai_embeddings() -> OpenAIEmbeddings:
     """获取 OpenAI Embedding 模型实例（使用硅基流动平台）"""
@@ -33,5 +68,18 @@ def get_openai_embeddings() -> OpenAIEmbeddings:
     )
 
 
-# 创建全局单例实例
-openai_embeddings = get_openai_embeddings()
+# 不带缓存的 Embedding 模型实例
+raw_openai_embeddings = get_openai_embeddings()
+
+# Embedding 缓存（内存 + SQLite 两级）
+embedding_cache = TieredEmbeddingCache(
+    db_path=EMBEDDING_CACHE_DB_PATH or None,
+    max_memory_entries=EMBEDDING_CACHE_MAX_MEMORY_ENTRIES,
+    max_db_entries=EMBEDDING_CACHE_MAX_DB_ENTRIES
+) if EMBEDDING_CACHE_ENABLED else None
+
+# 创建全局单例实例（知识库索引、知识库检索、题库检索共用）
+openai_embeddings = (
+    CachedEmbeddings(raw_openai_embeddings, embedding_cache, EMBEDDING_MODEL)
+    if embedding_cache is not None else raw_openai_embeddings
+)
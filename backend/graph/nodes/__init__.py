@@ -1,10 +1,10 @@
-﻿from .parse_resume_node import parse_resume_node
-from .ask_question_node import ask_question_node
+﻿from .parse_resume_node import parse_resume_node, aparse_resume_node
+from .ask_question_node import ask_question_node, aask_question_node
 from .answer_node import answer_node
 
 from .check_finish_node import check_finish_node
-from .feedback_node import feedback_node
-from .generate_report_node import generate_report_node
+from .feedback_node import feedback_node, afeedback_node
+from .generate_report_node import generate_report_node, agenerate_report_node
 
 __all__ = [
     "parse_resume_node",
@@ -13,5 +13,11 @@ __all__ = [
 
     "check_finish_node",
     "feedback_node",
-    "generate_report_node"
+    "generate_report_node",
+
+    # 异步版本（async 执行模式使用）
+    "aparse_resume_node",
+    "aask_question_node",
+    "afeedback_node",
+    "agenerate_report_node"
 ]
@@ -3,14 +3,28 @@
 回答节点
 接收用户答案（中断点）
 """
+from langgraph.types import interrupt
 from backend.graph.state import InterviewState
 
 
 def answer_node(state: InterviewState) -> InterviewState:
     """
-    回答节点：接收用户答案
-    注意：保留是为了中断机制的兼容性
+    回答节点：接收用户答案并写入最后一轮的问答记录
+    
+    工作流在该节点前中断（interrupt_before），提交回答时以 Command(resume=回答) 恢复，
+    interrupt() 直接返回该回答；兼容旧的提交方式：回答已通过 update_state 写入时直接使用
     """
-    print("[answer_node] 收到用户回答：", state.get('answer', ''))
-    # 答案已经在 state 中了，直接返回
-    return state
+    history = state.get('history', [])
+    if history and history[-1].get('answer'):
+        answer = history[-1]['answer']
+    else:
+        answer = interrupt({"question": history[-1].get('question', '') if history else ''})
+    print("[answer_node] 收到用户回答：", answer)
+    
+    new_history = history.copy()
+    if new_history:
+        new_history[-1] = {**new_history[-1], "answer": answer}
+    
+    new_state = state.copy()
+    new_state['history'] = new_history
+    return new_state
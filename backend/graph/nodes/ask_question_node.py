@@ -2,40 +2,41 @@
 """
 出题节点
 使用面试官 Agent（带工具）智能生成问题
+开启 SPECULATIVE_SEARCH_ENABLED 时，出题后在后台预取下一轮的搜索结果；
+下一轮命中预取结果时跳过 Agent 的工具调用，只用一次 LLM 调用结合简历出题
 """
-from langchain_core.messages import HumanMessage
+from typing import Optional
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from backend.graph.state import InterviewState
-from backend.graph.agents import interviewer_agent
+from backend.graph.agents import interviewer_agent, INTERVIEWER_TAILOR_PROMPT
+from backend.graph.llm import openai_llm
+from backend.graph.tools import (
+    schedule_speculative_search,
+    take_speculative_search,
+    atake_speculative_search
+)
 
 
+# 降级处理：Agent 调用失败时使用的简单问题
+FALLBACK_QUESTION = "请介绍一下你最擅长的技术领域，并举例说明在项目中的应用。"
 
 
-def ask_question_node(state: InterviewState) -> InterviewState:
+def _build_agent_message(state: InterviewState, round_num: int) -> str:
     """
-    出题节点：使用面试官 Agent 智能生成问题
-    
-    Agent 会根据情况选择：
-    1. 联网搜索该岗位的面试题
-    2. 根据简历生成针对性问题
+    构建面试官 Agent 的输入消息
     """
     resume_text = state.get('resume_text', '')
     target_position = state.get('target_position', '未知岗位')
     history = state.get('history', [])
-    round_num = state.get('round', 0) + 1
     
-    if not resume_text:
-        print(f"[ask_question_node] 警告: 没有可用的简历文本 (round={round_num})")
-        return state
+    # 构建历史问题文本
+    history_text = "\n".join([
+        f"{i+1}. 问: {h.get('question', '')}\n   答: {h.get('answer', '（未回答）')}"
+        for i, h in enumerate(history)
+    ]) if history else "无"
     
-    try:
-        # 构建历史问题文本
-        history_text = "\n".join([
-            f"{i+1}. 问: {h.get('question', '')}\n   答: {h.get('answer', '（未回答）')}"
-            for i, h in enumerate(history)
-        ]) if history else "无"
-        
-        # 构建 Agent 输入消息
-        user_message = f"""当前面试进展：
+    return f"""当前面试进展：
 
 ## 1. 基础信息
 - **轮次**: 第 {round_num} / 3 轮
@@ -54,64 +55,151 @@ def ask_question_node(state: InterviewState) -> InterviewState:
 
 **注意**：你是面试官，请直接向候选人提问。不要复述简历或历史记录。
 """
+
+
+def _extract_question(result: dict, target_position: str) -> str:
+    """
+    从 Agent 输出中提取最终问题
+    Agent 的输出格式是 {"messages": [...]}
+    """
+    messages = result.get("messages", [])
+    question = ""
+    
+    # 获取最后一条 AI 消息作为问题
+    for msg in reversed(messages):
+        if hasattr(msg, 'content') and msg.content:
+            # 跳过工具调用消息
+            if not hasattr(msg, 'tool_calls') or not msg.tool_calls:
+                question = msg.content.strip()
+                break
+    
+    if not question:
+        # 如果没有获取到问题，使用备用逻辑
+        question = f"请介绍一下你在{target_position}相关领域的工作经验和技能。"
+    
+    return question
+
+
+def _thread_id(config: Optional[RunnableConfig]) -> str:
+    """
+    从运行配置中获取会话 ID
+    """
+    return ((config or {}).get("configurable") or {}).get("thread_id", "")
+
+
+def _build_tailor_messages(user_message: str, speculated: tuple) -> list:
+    """
+    构建使用预取搜索结果出题的消息
+    """
+    topic, search_result = speculated
+    return [
+        SystemMessage(content=INTERVIEWER_TAILOR_PROMPT),
+        HumanMessage(content=f"{user_message}\n## 4. 联网搜索结果（话题：{topic}）\n{search_result}\n")
+    ]
+
+
+def _schedule_next_round(state: InterviewState, config: Optional[RunnableConfig], round_num: int) -> None:
+    """
+    还有下一轮时，后台预取下一轮的搜索结果
+    """
+    if round_num < state.get('max_rounds', 3):
+        schedule_speculative_search(_thread_id(config), round_num + 1, state.get('target_position', ''))
+
+
+def _append_question(state: InterviewState, question: str, round_num: int) -> InterviewState:
+    """
+    将问题添加到历史记录并更新轮次
+    """
+    history_entry = {
+        "question": question,
+        "answer": ""
+    }
+    
+    new_history = state.get('history', []).copy()
+    new_history.append(history_entry)
+    
+    # 更新状态
+    new_state = state.copy()
+    new_state['history'] = new_history
+    new_state['round'] = round_num
+    return new_state
+
+
+def ask_question_node(state: InterviewState, config: Optional[RunnableConfig] = None) -> InterviewState:
+    """
+    出题节点：使用面试官 Agent 智能生成问题
+    
+    Agent 会根据情况选择：
+    1. 联网搜索该岗位的面试题
+    2. 根据简历生成针对性问题
+    """
+    target_position = state.get('target_position', '未知岗位')
+    round_num = state.get('round', 0) + 1
+    
+    if not state.get('resume_text', ''):
+        print(f"[ask_question_node] 警告: 没有可用的简历文本 (round={round_num})")
+        return state
+    
+    try:
+        user_message = _build_agent_message(state, round_num)
         
         print(f"[ask_question_node] 调用面试官 Agent，轮次: {round_num}，岗位: {target_position}")
         
-        # 调用 Agent
-        agent_input = {"messages": [HumanMessage(content=user_message)]}
-        result = interviewer_agent.invoke(agent_input)
-        
-        # 从 Agent 输出中提取最终问题
-        # Agent 的输出格式是 {"messages": [...]}
-        messages = result.get("messages", [])
-        question = ""
-        
-        # 获取最后一条 AI 消息作为问题
-        for msg in reversed(messages):
-            if hasattr(msg, 'content') and msg.content:
-                # 跳过工具调用消息
-                if not hasattr(msg, 'tool_calls') or not msg.tool_calls:
-                    question = msg.content.strip()
-                    break
-        
-        if not question:
-            # 如果没有获取到问题，使用备用逻辑
-            question = f"请介绍一下你在{target_position}相关领域的工作经验和技能。"
-        
+        speculated = take_speculative_search(_thread_id(config), round_num)
+        if speculated:
+            # 命中预取的搜索结果：跳过 Agent 的工具调用，直接出题
+            print(f"[ask_question_node] 使用预取的搜索结果: {speculated[0]}")
+            response = openai_llm.invoke(_build_tailor_messages(user_message, speculated))
+            question = _extract_question({"messages": [response]}, target_position)
+        else:
+            # 调用 Agent
+            agent_input = {"messages": [HumanMessage(content=user_message)]}
+            result = interviewer_agent.invoke(agent_input)
+            question = _extract_question(result, target_position)
         print(f"[ask_question_node] 生成的问题: {question}")
         
-        # 将问题添加到历史记录
-        history_entry = {
-            "question": question,
-            "answer": ""
-        }
-        
-        new_history = state.get('history', []).copy()
-        new_history.append(history_entry)
-        
-        # 更新状态
-        new_state = state.copy()
-        new_state['history'] = new_history
-        new_state['round'] = round_num
-        return new_state
+        _schedule_next_round(state, config, round_num)
+        return _append_question(state, question, round_num)
             
     except Exception as e:
         import traceback
         print(f"[ask_question_node] Agent 调用失败: {e}")
         print(traceback.format_exc())
-        # 降级处理：使用简单问题
-        fallback_question = f"请介绍一下你最擅长的技术领域，并举例说明在项目中的应用。"
+        return _append_question(state, FALLBACK_QUESTION, round_num)
+
+
+async def aask_question_node(state: InterviewState, config: Optional[RunnableConfig] = None) -> InterviewState:
+    """
+    出题节点（异步版本）：使用 ainvoke 调用面试官 Agent，不阻塞事件循环
+    """
+    target_position = state.get('target_position', '未知岗位')
+    round_num = state.get('round', 0) + 1
+    
+    if not state.get('resume_text', ''):
+        print(f"[ask_question_node] 警告: 没有可用的简历文本 (round={round_num})")
+        return state
+    
+    try:
+        user_message = _build_agent_message(state, round_num)
         
-        history_entry = {
-            "question": question,
-            "answer": ""
-        }
+        print(f"[ask_question_node] 调用面试官 Agent，轮次: {round_num}，岗位: {target_position}")
         
-        new_history = state.get('history', []).copy()
-        new_history.append(history_entry)
+        speculated = await atake_speculative_search(_thread_id(config), round_num)
+        if speculated:
+            print(f"[ask_question_node] 使用预取的搜索结果: {speculated[0]}")
+            response = await openai_llm.ainvoke(_build_tailor_messages(user_message, speculated))
+            question = _extract_question({"messages": [response]}, target_position)
+        else:
+            agent_input = {"messages": [HumanMessage(content=user_message)]}
+            result = await interviewer_agent.ainvoke(agent_input)
+            question = _extract_question(result, target_position)
+        print(f"[ask_question_node] 生成的问题: {question}")
         
-        # 更新状态
-        new_state = state.copy()
-        new_state['history'] = new_history
-        new_state['round'] = round_num
-        return new_state
+        _schedule_next_round(state, config, round_num)
+        return _append_question(state, question, round_num)
+            
+    except Exception as e:
+        import traceback
+        print(f"[ask_question_node] Agent 调用失败: {e}")
+        print(traceback.format_exc())
+        return _append_question(state, FALLBACK_QUESTION, round_num)
@@ -1,36 +1,43 @@
 # AI智能面试辅助系统V1.0，作者刘梦畅
 """
 搜索学习资源节点
-调用 Feedback Agent 搜索学习资源
+根据 FEEDBACK_MODE 选择实现：
+- parallel：一次 LLM 调用提取薄弱技术点，再并发搜索每个技术点的学习资源（限制并发数和单次搜索超时），按话题顺序合并
+- agent：调用 Feedback Agent，由 Agent 逐个调用搜索工具（每次搜索前后各一次 LLM 调用）
 """
+import re
+import json
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List
+
 from langchain_core.messages import HumanMessage
+from backend.config import FEEDBACK_MODE, FEEDBACK_MAX_TOPICS, FEEDBACK_SEARCH_CONCURRENCY, FEEDBACK_SEARCH_TIMEOUT
 from backend.graph.state import InterviewState
 from backend.graph.agents import feedback_agent
+from backend.graph.llm import get_llm
+from backend.graph.tools.feedback_tools import search_learning_resources
 
 
-def feedback_node(state: InterviewState) -> InterviewState:
+def _build_qa_summary(history: list) -> str:
     """
-    搜索学习资源节点：
-    1. 分析面试记录，提取候选人的主要不足
-    2. 调用 Feedback Agent 搜索学习资源
+    拼接面试问答记录（只包含问题和回答，不包含反馈）
     """
-    history = state.get('history', [])
-    
-    if not history:
-        print("警告: 历史记录为空，跳过搜索")
-        new_state = state.copy()
-        new_state['learning_resources'] = "无搜索结果"
-        return new_state
-    
-    try:
-        # 构建简短的面试记录摘要（只包含问题和回答，不包含反馈）
-        qa_summary = "\n".join([
-            f"Q{i+1}: {h.get('question', '')}\nA{i+1}: {h.get('answer', '')}"
-            for i, h in enumerate(history)
-        ])
-        
-        # 构建简短清晰的任务提示
-        user_message = f"""请分析以下面试记录，找出候选人的2-3个主要技术不足，并为每个不足搜索学习资源。
+    return "\n".join([
+        f"Q{i+1}: {h.get('question', '')}\nA{i+1}: {h.get('answer', '')}"
+        for i, h in enumerate(history)
+    ])
+
+
+def _build_feedback_message(history: list) -> str:
+    """
+    构建 Feedback Agent 的输入消息
+    只包含问题和回答，不包含反馈，保持输入简短、任务明确
+    """
+    qa_summary = _build_qa_summary(history)
+
+    return f"""请分析以下面试记录，找出候选人的2-3个主要技术不足，并为每个不足搜索学习资源。
 
 ## 面试问答记录
 {qa_summary}
@@ -42,24 +49,211 @@ def feedback_node(state: InterviewState) -> InterviewState:
 
 注意：必须调用工具搜索，不要自己编造资源。
 """
-        
-        print("[search_resources_node] 正在调用 Feedback Agent 搜索学习资源...")
-        
-        # 调用 Agent（输入简短，任务明确）
-        result = feedback_agent.invoke({"messages": [HumanMessage(content=user_message)]})
-        
-        # 提取搜索结果
-        search_results = result["messages"][-1].content
-        
+
+
+def _build_topics_prompt(history: list) -> str:
+    """
+    构建薄弱技术点提取提示词（要求只输出 JSON）
+    """
+    return f"""你是一位面试反馈专家。请阅读以下面试记录，找出候选人回答错误、模糊或承认不会的关键技术点。
+
+## 面试问答记录
+{_build_qa_summary(history)}
+
+## 要求
+1. 最多 {FEEDBACK_MAX_TOPICS} 个技术点，按重要程度排序
+2. 提炼背后的技术点，适合直接作为学习资源的搜索词（如 "Redis 持久化机制"，而不是 "第二题"）
+3. 只输出 JSON，不要输出其他内容，格式：{{"topics": ["技术点1", "技术点2"]}}
+"""
+
+
+def _parse_topics(text: str) -> List[str]:
+    """
+    从 LLM 输出中解析技术点列表
+    优先解析 JSON；模型没有按格式输出时，按行提取（去掉序号和列表符号）
+    """
+    topics = []
+    match = re.search(r"\{.*\}", text, re.S)
+    if match:
+        try:
+            data = json.loads(match.group(0))
+            topics = [str(t) for t in data.get("topics", []) if isinstance(t, (str, int, float))]
+        except (ValueError, AttributeError):
+            topics = []
+    if not topics:
+        for line in text.splitlines():
+            line = re.sub(r"^\s*(?:[-*•]|\d+[.、)）])\s*", "", line).strip().strip('"\'“”`')
+            if line and len(line) <= 40 and not line.startswith(("{", "}", "```")):
+                topics.append(line)
+
+    # 去重并限制数量
+    unique_topics = []
+    for topic in topics:
+        topic = topic.strip()
+        if topic and topic not in unique_topics:
+            unique_topics.append(topic)
+    return unique_topics[:FEEDBACK_MAX_TOPICS]
+
+
+def _merge_results(topics: List[str], results: List[str]) -> str:
+    """
+    按话题顺序合并搜索结果
+    """
+    if not topics:
+        return "无搜索结果"
+    return "\n\n".join(results)
+
+
+def _with_learning_resources(state: InterviewState, learning_resources: str) -> InterviewState:
+    """
+    将学习资源写入状态
+    """
+    new_state = state.copy()
+    new_state['learning_resources'] = learning_resources
+    return new_state
+
+
+def _timeout_result(topic: str) -> str:
+    print(f"[search_resources_node] 搜索超时: {topic}")
+    return f"搜索失败: {topic} 搜索超时（{FEEDBACK_SEARCH_TIMEOUT:g} 秒）"
+
+
+def _search_topics(topics: List[str]) -> List[str]:
+    """
+    并发搜索学习资源（线程池大小即并发上限）
+
+    同步版本无法在线程开始执行时单独计时，按批次计算截止时间：
+    第 k 批（每批 FEEDBACK_SEARCH_CONCURRENCY 个）的截止时间为开始后 k * FEEDBACK_SEARCH_TIMEOUT 秒
+    """
+    if not topics:
+        return []
+    concurrency = max(1, min(FEEDBACK_SEARCH_CONCURRENCY, len(topics)))
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="feedback-search")
+    start = time.monotonic()
+    results = []
+    try:
+        futures = [executor.submit(search_learning_resources.invoke, topic) for topic in topics]
+        for i, (topic, future) in enumerate(zip(topics, futures)):
+            deadline = start + (i // concurrency + 1) * FEEDBACK_SEARCH_TIMEOUT
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                future.cancel()
+                results.append(_timeout_result(topic))
+            except Exception as e:
+                results.append(f"搜索失败: {topic} {e}")
+    finally:
+        # 超时的搜索在后台结束，不等待
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+async def _asearch_topics(topics: List[str]) -> List[str]:
+    """
+    并发搜索学习资源（异步版本）：信号量限制并发数，每个搜索单独计时
+    """
+    semaphore = asyncio.Semaphore(max(1, FEEDBACK_SEARCH_CONCURRENCY))
+
+    async def search(topic: str) -> str:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(search_learning_resources.ainvoke(topic), timeout=FEEDBACK_SEARCH_TIMEOUT)
+            except asyncio.TimeoutError:
+                return _timeout_result(topic)
+            except Exception as e:
+                return f"搜索失败: {topic} {e}"
+
+    return list(await asyncio.gather(*(search(topic) for topic in topics)))
+
+
+def _parallel_feedback(history: list) -> str:
+    """
+    提取薄弱技术点并并发搜索学习资源
+    """
+    response = get_llm("weak_topics").invoke(_build_topics_prompt(history))
+    topics = _parse_topics(response.content)
+    print(f"[search_resources_node] 薄弱技术点: {topics}")
+
+    start = time.perf_counter()
+    results = _search_topics(topics)
+    print(f"[search_resources_node] {len(topics)} 个话题搜索完成，耗时 {time.perf_counter() - start:.2f}s")
+    return _merge_results(topics, results)
+
+
+async def _aparallel_feedback(history: list) -> str:
+    """
+    提取薄弱技术点并并发搜索学习资源（异步版本）
+    """
+    response = await get_llm("weak_topics").ainvoke(_build_topics_prompt(history))
+    topics = _parse_topics(response.content)
+    print(f"[search_resources_node] 薄弱技术点: {topics}")
+
+    start = time.perf_counter()
+    results = await _asearch_topics(topics)
+    print(f"[search_resources_node] {len(topics)} 个话题搜索完成，耗时 {time.perf_counter() - start:.2f}s")
+    return _merge_results(topics, results)
+
+
+def feedback_node(state: InterviewState) -> InterviewState:
+    """
+    搜索学习资源节点：
+    1. 分析面试记录，提取候选人的主要不足
+    2. 搜索每个不足的学习资源（parallel 模式并发搜索，agent 模式由 Feedback Agent 调用工具）
+    """
+    history = state.get('history', [])
+
+    if not history:
+        print("警告: 历史记录为空，跳过搜索")
+        return _with_learning_resources(state, "无搜索结果")
+
+    try:
+        if FEEDBACK_MODE == "parallel":
+            search_results = _parallel_feedback(history)
+        else:
+            user_message = _build_feedback_message(history)
+
+            print("[search_resources_node] 正在调用 Feedback Agent 搜索学习资源...")
+
+            # 调用 Agent（输入简短，任务明确）
+            result = feedback_agent.invoke({"messages": [HumanMessage(content=user_message)]})
+
+            # 提取搜索结果
+            search_results = result["messages"][-1].content
+
         print(f"[search_resources_node] 搜索完成，结果长度: {len(search_results)}")
-        
-        # 更新状态
-        new_state = state.copy()
-        new_state['learning_resources'] = search_results
-        return new_state
-            
+
+        return _with_learning_resources(state, search_results)
+
+    except Exception as e:
+        print(f"[search_resources_node] 搜索失败: {e}")
+        return _with_learning_resources(state, f"搜索失败: {str(e)}")
+
+
+async def afeedback_node(state: InterviewState) -> InterviewState:
+    """
+    搜索学习资源节点（异步版本）：使用 ainvoke 调用 LLM / Feedback Agent
+    """
+    history = state.get('history', [])
+
+    if not history:
+        print("警告: 历史记录为空，跳过搜索")
+        return _with_learning_resources(state, "无搜索结果")
+
+    try:
+        if FEEDBACK_MODE == "parallel":
+            search_results = await _aparallel_feedback(history)
+        else:
+            user_message = _build_feedback_message(history)
+
+            print("[search_resources_node] 正在调用 Feedback Agent 搜索学习资源...")
+
+            result = await feedback_agent.ainvoke({"messages": [HumanMessage(content=user_message)]})
+            search_results = result["messages"][-1].content
+
+        print(f"[search_resources_node] 搜索完成，结果长度: {len(search_results)}")
+
+        return _with_learning_resources(state, search_results)
+
     except Exception as e:
         print(f"[search_resources_node] 搜索失败: {e}")
-        new_state = state.copy()
-        new_state['learning_resources'] = f"搜索失败: {str(e)}"
-        return new_state
\ No newline at end of file
+        return _with_learning_resources(state, f"搜索失败: {str(e)}")
@@ -4,31 +4,20 @@
 整合所有信息生成完整的面试报告
 """
 from backend.graph.state import InterviewState
-from backend.graph.llm import openai_llm  # 报告生成不需要工具调用，用 DeepSeek
+from backend.graph.llm import get_llm  # 报告生成不需要工具调用，用 DeepSeek
 
 
-def generate_report_node(state: InterviewState) -> InterviewState:
+def _build_report_prompt(resume_text: str, history: list, learning_resources: str) -> str:
     """
-    生成最终面试报告：
-    整合简历、面试记录、学习资源，生成完整报告
+    构建报告生成提示词
     """
-    resume_text = state.get('resume_text', '')
-    history = state.get('history', [])
-    learning_resources = state.get('learning_resources', '')
-    
-    if not resume_text or not history:
-        print("警告: 简历文本或历史记录为空，无法生成报告")
-        return state
+    # 准备完整的面试记录
+    history_text = "\n\n".join([
+        f"问题 {i+1}：{h.get('question', '')}\n回答：{h.get('answer', '')}"
+        for i, h in enumerate(history)
+    ])
     
-    try:
-        # 准备完整的面试记录
-        history_text = "\n\n".join([
-            f"问题 {i+1}：{h.get('question', '')}\n回答：{h.get('answer', '')}"
-            for i, h in enumerate(history)
-        ])
-        
-        # 构建报告生成提示词
-        prompt = f"""你是一位资深面试官，请根据以下信息生成一份完整的面试报告。
+    return f"""你是一位资深面试官，请根据以下信息生成一份完整的面试报告。
 
 ## 候选人简历
 {resume_text}
@@ -80,23 +69,80 @@ def generate_report_node(state: InterviewState) -> InterviewState:
 3. 直接复制粘贴学习资源中的链接，不要自己编造
 4. 简历优化要结合面试表现，指出简历与实际能力的差距
 """
+
+
+def _can_generate_report(state: InterviewState) -> bool:
+    """
+    检查生成报告所需的信息是否完整
+    """
+    if not state.get('resume_text', '') or not state.get('history', []):
+        print("警告: 简历文本或历史记录为空，无法生成报告")
+        return False
+    return True
+
+
+def _with_report(state: InterviewState, report: str) -> InterviewState:
+    """
+    将报告写入状态
+    """
+    new_state = state.copy()
+    new_state['report'] = report
+    return new_state
+
+
+def generate_report_node(state: InterviewState) -> InterviewState:
+    """
+    生成最终面试报告：
+    整合简历、面试记录、学习资源，生成完整报告
+    """
+    if not _can_generate_report(state):
+        return state
+    
+    try:
+        prompt = _build_report_prompt(
+            state.get('resume_text', ''),
+            state.get('history', []),
+            state.get('learning_resources', '')
+        )
         
         print("[generate_report_node] 正在生成最终报告...")
         
         # 调用 LLM 生成报告
-        response = openai_llm.invoke(prompt)
+        response = get_llm("report").invoke(prompt)
         full_report = response.content
         
         print(f"[generate_report_node] 报告生成完成，长度: {len(full_report)}")
         
-        # 更新状态
-        new_state = state.copy()
-        new_state['report'] = full_report
-        return new_state
+        return _with_report(state, full_report)
             
     except Exception as e:
         print(f"[generate_report_node] 报告生成失败: {e}")
-        new_state = state.copy()
-        new_state['report'] = f"# 生成报告失败\n\n系统错误: {str(e)}"
-        return new_state
+        return _with_report(state, f"# 生成报告失败\n\n系统错误: {str(e)}")
+
 
+async def agenerate_report_node(state: InterviewState) -> InterviewState:
+    """
+    生成最终面试报告（异步版本）：使用 ainvoke 调用 LLM
+    """
+    if not _can_generate_report(state):
+        return state
+    
+    try:
+        prompt = _build_report_prompt(
+            state.get('resume_text', ''),
+            state.get('history', []),
+            state.get('learning_resources', '')
+        )
+        
+        print("[generate_report_node] 正在生成最终报告...")
+        
+        response = await get_llm("report").ainvoke(prompt)
+        full_report = response.content
+        
+        print(f"[generate_report_node] 报告生成完成，长度: {len(full_report)}")
+        
+        return _with_report(state, full_report)
+            
+    except Exception as e:
+        print(f"[generate_report_node] 报告生成失败: {e}")
+        return _with_report(state, f"# 生成报告失败\n\n系统错误: {str(e)}")
@@ -4,9 +4,11 @@
 使用 PDF 解析提取原始文本，然后用 LLM 提取关键信息和目标岗位
 """
 import os
+import re
 from backend.graph.state import InterviewState
-from backend.utils.pdf_parser import parse_pdf
-from backend.graph.llm import openai_llm  # 简历解析不需要工具调用，用 DeepSeek
+from backend.utils.pdf_service import get_pdf_service
+from backend.utils.resume_store import UNRECOGNIZED_POSITION
+from backend.graph.llm import get_llm  # 简历解析不需要工具调用，用 DeepSeek
 
 
 # LLM 提取简历信息的 Prompt
@@ -60,6 +62,71 @@ RESUME_EXTRACT_PROMPT = """你是一个专业的简历分析助手。请从以
 """
 
 
+def _check_resume_path(state: InterviewState) -> bool:
+    """
+    检查简历文件路径是否可用
+    """
+    resume_path = state.get('resume_path', '')
+    
+    if not resume_path:
+        print("[parse_resume_node] 警告: 没有提供简历文件路径")
+        return False
+    
+    if not os.path.exists(resume_path):
+        print(f"[parse_resume_node] 警告: 简历文件不存在: {resume_path}")
+        return False
+    
+    return True
+
+
+def _is_parse_failed(resume_raw_text: str) -> bool:
+    """
+    判断 PDF 解析结果是否为错误/警告信息
+    """
+    return not resume_raw_text or resume_raw_text.startswith("错误") or resume_raw_text.startswith("警告")
+
+
+def _extract_target_position(extracted_info: str) -> str:
+    """
+    从 LLM 提取结果中解析目标岗位
+    """
+    target_position = UNRECOGNIZED_POSITION
+    
+    # 尝试从 LLM 输出中提取目标岗位
+    if "### 目标岗位" in extracted_info:
+        lines = extracted_info.split("\n")
+        for i, line in enumerate(lines):
+            if "### 目标岗位" in line:
+                # 获取下一行作为目标岗位
+                if i + 1 < len(lines):
+                    position_line = lines[i + 1].strip()
+                    if position_line and not position_line.startswith("#"):
+                        # 移除可能的 Markdown 列表符号（- , * , 数字.）
+                        position_line = position_line.lstrip('- *')  # 移除列表符号
+                        position_line = position_line.strip()  # 再次去除空格
+                        # 移除数字编号
+                        position_line = re.sub(r'^\d+\.\s*', '', position_line)
+                        target_position = position_line
+                break
+    
+    return target_position
+
+
+def _apply_extracted_info(state: InterviewState, extracted_info: str) -> InterviewState:
+    """
+    解析目标岗位并更新状态
+    """
+    print(f"[parse_resume_node] LLM提取完成，信息长度: {len(extracted_info)}")
+    
+    target_position = _extract_target_position(extracted_info)
+    print(f"[parse_resume_node] 提取的目标岗位: {target_position}")
+    
+    new_state = state.copy()
+    new_state['resume_text'] = extracted_info  # LLM 提取的结构化信息
+    new_state['target_position'] = target_position
+    return new_state
+
+
 def parse_resume_node(state: InterviewState) -> InterviewState:
     """
     简历解析节点：
@@ -70,24 +137,19 @@ def parse_resume_node(state: InterviewState) -> InterviewState:
     if state.get('resume_text') and state.get('target_position'):
         return state
     
-    resume_path = state.get('resume_path', '')
-    
-    if not resume_path:
-        print("[parse_resume_node] 警告: 没有提供简历文件路径")
+    if not _check_resume_path(state):
         return state
     
-    if not os.path.exists(resume_path):
-        print(f"[parse_resume_node] 警告: 简历文件不存在: {resume_path}")
-        return state
+    resume_path = state['resume_path']
         
     try:
         # ========== 步骤1：解析 PDF 获取原始文本 ==========
         print(f"[parse_resume_node] 开始解析PDF: {resume_path}")
         
-        resume_raw_text = parse_pdf(resume_path)
+        resume_raw_text = get_pdf_service().parse(resume_path)
         
         # 检查解析结果
-        if not resume_raw_text or resume_raw_text.startswith("错误") or resume_raw_text.startswith("警告"):
+        if _is_parse_failed(resume_raw_text):
             print(f"[parse_resume_node] PDF解析失败: {resume_raw_text}")
             return state
         
@@ -96,44 +158,46 @@ def parse_resume_node(state: InterviewState) -> InterviewState:
         # ========== 步骤2：使用 LLM 提取关键信息 ==========
         print("[parse_resume_node] 正在使用LLM提取简历信息...")
         
-        # 构建 prompt
         prompt = RESUME_EXTRACT_PROMPT.format(resume_raw_text=resume_raw_text)
+        response = get_llm("resume_extract").invoke(prompt)
         
-        # 调用 LLM
-        response = openai_llm.invoke(prompt)
-        extracted_info = response.content
+        # ========== 步骤3：解析目标岗位并更新状态 ==========
+        return _apply_extracted_info(state, response.content)
+            
+    except Exception as e:
+        print(f"[parse_resume_node] 解析简历失败: {e}")
+        raise
+
+
+async def aparse_resume_node(state: InterviewState) -> InterviewState:
+    """
+    简历解析节点（异步版本）：
+    PDF 解析放到进程池执行，LLM 调用使用 ainvoke，不阻塞事件循环
+    """
+    if state.get('resume_text') and state.get('target_position'):
+        return state
+    
+    if not _check_resume_path(state):
+        return state
+    
+    resume_path = state['resume_path']
         
-        print(f"[parse_resume_node] LLM提取完成，信息长度: {len(extracted_info)}")
+    try:
+        print(f"[parse_resume_node] 开始解析PDF: {resume_path}")
         
-        # ========== 步骤3：从提取结果中解析目标岗位 ==========
-        target_position = "未识别"
+        resume_raw_text = await get_pdf_service().aparse(resume_path)
         
-        # 尝试从 LLM 输出中提取目标岗位
-        if "### 目标岗位" in extracted_info:
-            lines = extracted_info.split("\n")
-            for i, line in enumerate(lines):
-                if "### 目标岗位" in line:
-                    # 获取下一行作为目标岗位
-                    if i + 1 < len(lines):
-                        position_line = lines[i + 1].strip()
-                        if position_line and not position_line.startswith("#"):
-                            # 移除可能的 Markdown 列表符号（- , * , 数字.）
-                            position_line = position_line.lstrip('- *')  # 移除列表符号
-                            position_line = position_line.strip()  # 再次去除空格
-                            # 移除数字编号
-                            import re
-                            position_line = re.sub(r'^\d+\.\s*', '', position_line)
-                            target_position = position_line
-                    break
+        if _is_parse_failed(resume_raw_text):
+            print(f"[parse_resume_node] PDF解析失败: {resume_raw_text}")
+            return state
         
-        print(f"[parse_resume_node] 提取的目标岗位: {target_position}")
+        print(f"[parse_resume_node] PDF解析成功，原始文本长度: {len(resume_raw_text)}")
+        print("[parse_resume_node] 正在使用LLM提取简历信息...")
         
-        # ========== 步骤4：更新状态 ==========
-        new_state = state.copy()
-        new_state['resume_text'] = extracted_info  # LLM 提取的结构化信息
-        new_state['target_position'] = target_position
+        prompt = RESUME_EXTRACT_PROMPT.format(resume_raw_text=resume_raw_text)
+        response = await get_llm("resume_extract").ainvoke(prompt)
         
-        return new_state
+        return _apply_extracted_info(state, response.content)
             
     except Exception as e:
         print(f"[parse_resume_node] 解析简历失败: {e}")
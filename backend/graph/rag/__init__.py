@@ -3,5 +3,13 @@
 RAG 模块
 """
 from .init_vectorstore import init_vectorstore
+from .init_question_bank import init_question_bank
+from .question_bank import lookup_questions, learn_questions, get_question_bank_metrics
 
-__all__ = ["init_vectorstore"]
+__all__ = [
+    "init_vectorstore",
+    "init_question_bank",
+    "lookup_questions",
+    "learn_questions",
+    "get_question_bank_metrics"
+]
@@ -0,0 +1,227 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+知识库混合检索（关键词 + 向量）
+中文关键词问题（如"如何谈薪资"、"职业空窗期怎么解释"）向量距离常常超过阈值，导致顾问 Agent 转去联网搜索；
+混合检索同时使用进程内倒排索引（BM25）和 Chroma 向量检索，用倒数排名融合（RRF）合并两路结果：
+
+- 分词：英文 / 数字按单词切分，中文去掉常见疑问词和虚词后按字二元组切分（不依赖第三方分词库）
+- 向量召回：向量距离不超过 vector_threshold 的文档块
+- 关键词召回：命中的查询词 IDF 加权覆盖率不低于 lexical_min_coverage 的文档块
+  （知识库中没有出现过的查询词按已知词的平均 IDF 计入，避免只命中一两个常见词的知识库外问题被召回）
+- 融合：score = Σ 1 / (rrf_k + 排名)，两路都召回的文档块排在前面，返回前 top_k 个
+- 倒排索引从 Chroma collection 中的文档块建立，知识库版本文件（init_vectorstore.py 写入的 chroma_db/kb_version）
+  或 collection 文档数变化（重新索引）后自动重建；增量索引修改文档块时文档数不变，依靠版本文件发现变化
+"""
+import re
+import math
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+# 中文查询中常见、对检索没有帮助的词（按长度从长到短匹配）
+STOP_WORDS = sorted([
+    "为什么", "是不是", "怎么办", "什么", "怎么", "怎样", "如何", "是否", "哪些", "哪个",
+    "可以", "应该", "需要", "一下", "一个", "我们", "你们", "他们", "自己",
+    "的", "了", "吗", "呢", "吧", "啊", "是", "和", "与", "及", "或", "在", "要", "会", "能", "我", "你"
+], key=len, reverse=True)
+
+_STOP_PATTERN = re.compile("|".join(re.escape(word) for word in STOP_WORDS))
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*|[一-鿿]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    分词：英文 / 数字按单词，中文按字二元组（单字片段保留单字）
+    """
+    tokens = []
+    for piece in _TOKEN_PATTERN.findall(text.lower()):
+        if not ("一" <= piece[0] <= "鿿"):
+            tokens.append(piece)
+            continue
+        for run in _STOP_PATTERN.sub(" ", piece).split():
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+class LexicalIndex:
+    """
+    进程内倒排索引（BM25 打分）
+
+    Args:
+        documents: 文档块列表
+        k1 / b: BM25 参数
+    """
+
+    def __init__(self, documents: List[Document], k1: float = 1.5, b: float = 0.75):
+        self.documents = documents
+        self.k1 = k1
+        self.b = b
+
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._lengths = []
+        for i, doc in enumerate(documents):
+            counts = Counter(tokenize(doc.page_content))
+            self._lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings[term][i] = tf
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+        n = len(documents)
+        self._idf = {
+            term: math.log((n - len(postings) + 0.5) / (len(postings) + 0.5) + 1)
+            for term, postings in self._postings.items()
+        }
+
+    def search(self, query: str, k: int) -> List[Tuple[int, float, float]]:
+        """
+        Returns:
+            [(文档下标, BM25 分数, IDF 加权覆盖率)]，按 BM25 分数从高到低
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        terms = [term for term in query_terms if term in self._idf]
+        if not terms:
+            return []
+        known_idf = sum(self._idf[term] for term in terms)
+        total_idf = known_idf + (len(query_terms) - len(terms)) * known_idf / len(terms)
+
+        scores: Dict[int, float] = defaultdict(float)
+        matched_idf: Dict[int, float] = defaultdict(float)
+        for term in terms:
+            idf = self._idf[term]
+            for i, tf in self._postings[term].items():
+                norm = 1 - self.b + self.b * self._lengths[i] / self._avg_length
+                scores[i] += idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+                matched_idf[i] += idf
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(i, score, matched_idf[i] / total_idf) for i, score in ranked]
+
+
+class HybridRetriever:
+    """
+    关键词 + 向量混合检索
+
+    Args:
+        vectorstore: 知识库向量索引（Chroma 或 NumpyVectorIndex）
+        top_k: 返回的文档块数量
+        vector_k: 向量召回的候选数量
+        vector_threshold: 向量召回的最大距离（越小越严格）
+        lexical_k: 关键词召回的候选数量
+        lexical_min_coverage: 关键词召回的最小 IDF 加权覆盖率（0-1）
+        rrf_k: RRF 平滑参数
+        version_path: 知识库版本文件路径（内容变化时重建倒排索引，不传则只按文档数判断）
+    """
+
+    def __init__(
+        self,
+        vectorstore,
+        top_k: int = 2,
+        vector_k: int = 8,
+        vector_threshold: float = 0.6,
+        lexical_k: int = 8,
+        lexical_min_coverage: float = 0.5,
+        rrf_k: int = 60,
+        version_path: Optional[Path] = None
+    ):
+        self.vectorstore = vectorstore
+        self.top_k = top_k
+        self.vector_k = vector_k
+        self.vector_threshold = vector_threshold
+        self.lexical_k = lexical_k
+        self.lexical_min_coverage = lexical_min_coverage
+        self.rrf_k = rrf_k
+        self.version_path = Path(version_path) if version_path else None
+
+        self._index: Optional[LexicalIndex] = None
+        self._indexed_key: Optional[Tuple[str, int]] = None
+        self._version_mtime_ns = None
+        self._kb_version = ""
+        self._lock = threading.Lock()
+
+    def _refresh_version(self) -> str:
+        """读取知识库版本文件（文件修改时间变化时才重新读取）"""
+        if self.version_path is None:
+            return ""
+        try:
+            mtime_ns = self.version_path.stat().st_mtime_ns
+        except OSError:
+            return self._kb_version
+        if mtime_ns != self._version_mtime_ns:
+            self._version_mtime_ns = mtime_ns
+            try:
+                self._kb_version = self.version_path.read_text(encoding="utf-8").strip()
+            except OSError:
+                pass
+        return self._kb_version
+
+    def _get_index(self) -> LexicalIndex:
+        """获取倒排索引，知识库版本或 collection 文档数变化时重建"""
+        collection = getattr(self.vectorstore, "_collection", None)
+        count = collection.count() if collection is not None else self.vectorstore.count()
+        with self._lock:
+            key = (self._refresh_version(), count)
+            if self._index is None or key != self._indexed_key:
+                data = self.vectorstore.get(include=["documents", "metadatas"])
+                documents = [
+                    Document(id=doc_id, page_content=content, metadata=metadata or {})
+                    for doc_id, content, metadata in zip(data["ids"], data["documents"], data["metadatas"])
+                    if content is not None
+                ]
+                self._index = LexicalIndex(documents)
+                self._indexed_key = key
+                print(f"[hybrid_retriever] 倒排索引已建立，共 {len(documents)} 个文档块")
+            return self._index
+
+    def search(self, query: str) -> List[Tuple[Document, dict]]:
+        """
+        混合检索
+
+        Returns:
+            [(文档块, {"score", "vector_distance", "vector_rank", "bm25", "coverage", "lexical_rank"})]，
+            按融合分数从高到低；两路都没有召回时返回空列表
+        """
+        candidates: Dict[str, dict] = {}
+
+        def candidate(doc: Document) -> dict:
+            key = doc.id or doc.page_content
+            if key not in candidates:
+                candidates[key] = {
+                    "doc": doc, "score": 0.0, "vector_distance": None, "vector_rank": None,
+                    "bm25": None, "coverage": None, "lexical_rank": None
+                }
+            return candidates[key]
+
+        # 1. 向量召回
+        vector_results = self.vectorstore.similarity_search_with_score(query, k=self.vector_k)
+        rank = 0
+        for doc, distance in vector_results:
+            if distance > self.vector_threshold:
+                continue
+            rank += 1
+            item = candidate(doc)
+            item["vector_distance"] = distance
+            item["vector_rank"] = rank
+            item["score"] += 1 / (self.rrf_k + rank)
+
+        # 2. 关键词召回
+        index = self._get_index()
+        rank = 0
+        for i, bm25, coverage in index.search(query, self.lexical_k):
+            if coverage < self.lexical_min_coverage:
+                continue
+            rank += 1
+            item = candidate(index.documents[i])
+            item["bm25"] = bm25
+            item["coverage"] = coverage
+            item["lexical_rank"] = rank
+            item["score"] += 1 / (self.rrf_k + rank)
+
+        # 3. 倒数排名融合
+        ranked = sorted(candidates.values(), key=lambda item: item["score"], reverse=True)[:self.top_k]
+        return [(item.pop("doc"), item) for item in ranked]
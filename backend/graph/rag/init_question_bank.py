@@ -0,0 +1,75 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+面试题库索引初始化脚本
+将精选题库 interview_question_bank.md 写入 Chroma 的 interview_questions collection：
+- 文档 id 按内容哈希，未修改的话题不会重新向量化
+- 精选题库中已删除 / 修改的话题从索引中移除
+- 联网补充的题目（source=web）保留
+"""
+import sys
+import time
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.graph.rag.question_bank import (
+    QUESTION_BANK_PATH,
+    CHROMA_DB_PATH,
+    get_question_bank,
+    load_curated_documents
+)
+
+
+def init_question_bank(path: Path = QUESTION_BANK_PATH) -> dict:
+    """
+    初始化 / 更新面试题库索引
+
+    Returns:
+        {"total", "added", "removed", "unchanged", "elapsed"}
+    """
+    print("=" * 60)
+    print("开始更新面试题库索引...")
+    print("=" * 60)
+    start = time.perf_counter()
+
+    # 1. 读取精选题库
+    print(f"\n[1/3] 读取精选题库: {path}")
+    if not path.exists():
+        raise FileNotFoundError(f"题库文件不存在: {path}")
+    documents = load_curated_documents(path)
+    print(f"  ✓ 共 {len(documents)} 个岗位 / 话题")
+
+    # 2. 对比已有索引
+    print(f"\n[2/3] 对比已有索引: {CHROMA_DB_PATH}")
+    bank = get_question_bank()
+    existing = set(bank.get(where={"source": "curated"}, include=[])["ids"])
+    current = {doc.id for doc in documents}
+    new_documents = [doc for doc in documents if doc.id not in existing]
+    stale_ids = sorted(existing - current)
+    print(f"  ✓ 新增 / 修改 {len(new_documents)} 个，删除 {len(stale_ids)} 个，未变化 {len(current & existing)} 个")
+
+    # 3. 写入变化的部分
+    print("\n[3/3] 写入索引...")
+    if stale_ids:
+        bank.delete(ids=stale_ids)
+    if new_documents:
+        bank.add_documents(new_documents)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "=" * 60)
+    print(f"✅ 面试题库索引更新完成，耗时 {elapsed:.2f}s")
+    print("=" * 60)
+
+    return {
+        "total": len(documents),
+        "added": len(new_documents),
+        "removed": len(stale_ids),
+        "unchanged": len(current & existing),
+        "elapsed": elapsed
+    }
+
+
+if __name__ == "__main__":
+    init_question_bank()
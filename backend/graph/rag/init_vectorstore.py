@@ -1,119 +1,282 @@
 # AI智能面试辅助系统V1.0，作者刘梦畅
 """
 向量数据库初始化脚本
-将面试知识库文档向量化并存储到 Chroma
+将知识库目录（knowledge_base/ 下的所有 Markdown 文件）向量化并增量更新到 Chroma：
+- 按 Markdown 标题切分后，每个文档块的 id 由来源文件 + 标题 + 内容哈希得到，
+  内容不变则 id 不变，重建时跳过，不再重复调用 Embedding 接口
+- 只向量化新增 / 修改的文档块，每 EMBEDDING_BATCH_SIZE 个一批
+- 已删除 / 修改的文档块（包括已删除文件中的全部文档块）从索引中移除
+- 向量化通过 Embedding 缓存，全量重建或内容改回旧版本时直接复用已有向量
+- 同步后把 collection 导出为 NumPy 索引（chroma_db/numpy_index/，KB_VECTOR_BACKEND=numpy 时使用）
+- 知识库版本（全部文档块 id 的哈希）写入 chroma_db/kb_version，内容变化后顾问的语义答案缓存随之失效
+- 每次构建的耗时和 Embedding 缓存命中率写入 chroma_db/index_builds.jsonl
+
+用法：
+    python backend/graph/rag/init_vectorstore.py            # 增量更新
+    python backend/graph/rag/init_vectorstore.py --rebuild  # 清空 collection 后全量重建
 """
+import os
 import sys
+import json
+import time
+import hashlib
 from pathlib import Path
+from typing import List
 
 # 添加项目根目录到 Python 路径
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from langchain_community.document_loaders import TextLoader
+from langchain_core.documents import Document
 from langchain_text_splitters import MarkdownHeaderTextSplitter
 from langchain_chroma import Chroma
-from backend.graph.llm import openai_embeddings
-from backend.config import EMBEDDING_MODEL
+from backend.graph.llm import openai_embeddings, embedding_cache
+from backend.graph.rag.numpy_index import export_numpy_index
+from backend.config import EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE
 
-# 知识库文件路径
-KNOWLEDGE_BASE_PATH = Path(__file__).parent / "interview_knowledge_base.md"
+# 知识库目录（目录下所有 .md 文件都会被索引，包括子目录）
+KNOWLEDGE_BASE_DIR = Path(__file__).parent / "knowledge_base"
 # Chroma 数据库存储路径
 CHROMA_DB_PATH = Path(__file__).parent / "chroma_db"
+# 知识库 collection 名称
+COLLECTION_NAME = "interview_knowledge"
+# 构建记录文件名（位于 Chroma 数据库目录下，每行一次构建）
+BUILD_LOG_NAME = "index_builds.jsonl"
+# NumPy 索引目录名（位于 Chroma 数据库目录下）
+NUMPY_INDEX_NAME = "numpy_index"
+# 知识库版本文件名（位于 Chroma 数据库目录下）
+KB_VERSION_NAME = "kb_version"
+
+HEADERS_TO_SPLIT_ON = [
+    ("##", "section"),      # 二级标题（模块）
+    ("###", "subsection"),  # 三级标题（知识点）
+]
+
 
+def chunk_id(source: str, doc: Document) -> str:
+    """文档块 id：来源文件 + 标题 + 内容的哈希"""
+    raw = "\x00".join([
+        source,
+        doc.metadata.get("section", ""),
+        doc.metadata.get("subsection", ""),
+        doc.page_content
+    ])
+    return "kb:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
 
-def init_vectorstore():
+
+def load_knowledge_documents(source_dir: Path = KNOWLEDGE_BASE_DIR) -> List[Document]:
     """
-    初始化向量数据库
-    1. 读取知识库文档
-    2. 按 Markdown 标题切分
-    3. 向量化并存储到 Chroma
+    读取知识库目录下的所有 Markdown 文件并按标题切分
+
+    Returns:
+        文档块列表（metadata 中的 source 为相对知识库目录的文件路径）
     """
-    print("=" * 60)
-    print("开始初始化向量数据库...")
-    print("=" * 60)
-    
-    # 1. 读取知识库文档
-    print(f"\n[1/4] 读取知识库文档: {KNOWLEDGE_BASE_PATH}")
-    if not KNOWLEDGE_BASE_PATH.exists():
-        raise FileNotFoundError(f"知识库文件不存在: {KNOWLEDGE_BASE_PATH}")
-    
-    with open(KNOWLEDGE_BASE_PATH, "r", encoding="utf-8") as f:
-        markdown_text = f.read()
-    
-    print(f"  ✓ 文档大小: {len(markdown_text)} 字符")
-    
-    # 2. 按 Markdown 标题切分文档
-    print("\n[2/4] 切分文档...")
-    headers_to_split_on = [
-        ("##", "section"),      # 二级标题（模块）
-        ("###", "subsection"),  # 三级标题（知识点）
-    ]
-    
-    markdown_splitter = MarkdownHeaderTextSplitter(
-        headers_to_split_on=headers_to_split_on,
+    splitter = MarkdownHeaderTextSplitter(
+        headers_to_split_on=HEADERS_TO_SPLIT_ON,
         strip_headers=False
     )
-    
-    docs = markdown_splitter.split_text(markdown_text)
-    print(f"  ✓ 切分为 {len(docs)} 个文档块")
-    
-    # 3. 使用全局 Embedding 模型
-    print("\n[3/4] 使用 Embedding 模型...")
-    print(f"  ✓ 使用模型: {EMBEDDING_MODEL}")
-    
-    # 4. 创建/更新向量数据库
-    print(f"\n[4/4] 创建向量数据库: {CHROMA_DB_PATH}")
-    
-    if CHROMA_DB_PATH.exists():
-        print("  ✓ 检测到已有数据库，删除旧 collection 并重建")
-        # 先加载现有数据库
-        try:
-            client = Chroma(
-                persist_directory=str(CHROMA_DB_PATH),
-                embedding_function=openai_embeddings
-            )
-            # 删除旧的 collection
-            client.delete_collection()
-            print("  ✓ 旧 collection 已删除")
-        except:
-            # 如果删除失败（可能不存在），忽略错误
-            pass
-    
-    # 创建新数据库
-    vectorstore = Chroma.from_documents(
-        documents=docs,
-        embedding=openai_embeddings,
-        persist_directory=str(CHROMA_DB_PATH),
-        collection_name="interview_knowledge"
+
+    documents = {}
+    for path in sorted(source_dir.rglob("*.md")):
+        source = path.relative_to(source_dir).as_posix()
+        with open(path, "r", encoding="utf-8") as f:
+            markdown_text = f.read()
+
+        chunks = splitter.split_text(markdown_text)
+        for chunk in chunks:
+            chunk.metadata["source"] = source
+            chunk.id = chunk_id(source, chunk)
+            # 同一文件中完全相同的文档块只保留一个
+            documents.setdefault(chunk.id, chunk)
+        print(f"  ✓ {source}: {len(markdown_text)} 字符，{len(chunks)} 个文档块")
+
+    return list(documents.values())
+
+
+def knowledge_base_version(ids) -> str:
+    """知识库版本：全部文档块 id（已包含内容哈希）排序后的哈希"""
+    return hashlib.sha256("\n".join(sorted(ids)).encode("utf-8")).hexdigest()[:16]
+
+
+def _write_kb_version(db_path: Path, version: str) -> None:
+    """版本变化时写入版本文件（先写临时文件再替换）"""
+    path = db_path / KB_VERSION_NAME
+    try:
+        if path.exists() and path.read_text(encoding="utf-8").strip() == version:
+            return
+        tmp = db_path / f"{KB_VERSION_NAME}.tmp"
+        tmp.write_text(version, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"  ⚠ 写入知识库版本失败: {e}")
+
+
+def _append_build_log(db_path: Path, stats: dict) -> None:
+    try:
+        db_path.mkdir(parents=True, exist_ok=True)
+        with open(db_path / BUILD_LOG_NAME, "a", encoding="utf-8") as f:
+            f.write(json.dumps(stats, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"  ⚠ 写入构建记录失败: {e}")
+
+
+def sync_knowledge_base(
+    source_dir: Path = KNOWLEDGE_BASE_DIR,
+    db_path: Path = CHROMA_DB_PATH,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    rebuild: bool = False
+) -> dict:
+    """
+    增量同步知识库索引
+
+    Args:
+        source_dir: 知识库目录
+        db_path: Chroma 数据库目录
+        batch_size: 每批向量化的文档块数量
+        rebuild: 是否先清空 collection 再全量向量化
+
+    Returns:
+        {"files", "total", "added", "removed", "unchanged", "batches", "cache_hits", "cache_hit_rate", "kb_version",
+         "timings": {"load", "diff", "delete", "embed", "export", "total"}}
+    """
+    start = time.perf_counter()
+    timings = {}
+
+    # 1. 读取并切分知识库文档
+    print(f"\n[1/4] 读取知识库目录: {source_dir}")
+    if not source_dir.is_dir():
+        raise FileNotFoundError(f"知识库目录不存在: {source_dir}")
+    documents = load_knowledge_documents(source_dir)
+    files = len({doc.metadata["source"] for doc in documents})
+    timings["load"] = time.perf_counter() - start
+    print(f"  ✓ 共 {files} 个文件，{len(documents)} 个文档块")
+
+    # 2. 对比已有索引
+    step = time.perf_counter()
+    print(f"\n[2/4] 对比已有索引: {db_path}")
+    vectorstore = Chroma(
+        persist_directory=str(db_path),
+        embedding_function=openai_embeddings,
+        collection_name=COLLECTION_NAME
     )
-    
-    print(f"  ✓ 向量数据库创建成功，共 {len(docs)} 个文档")
-    
-    # 5. 测试检索
-    print("\n" + "=" * 60)
-    print("测试向量检索...")
+    if rebuild:
+        vectorstore.reset_collection()
+        print("  ✓ 已清空旧 collection，全量重建")
+    existing = set(vectorstore.get(include=[])["ids"])
+    current = {doc.id for doc in documents}
+    new_documents = [doc for doc in documents if doc.id not in existing]
+    stale_ids = sorted(existing - current)
+    unchanged = len(current & existing)
+    timings["diff"] = time.perf_counter() - step
+    print(f"  ✓ 新增 / 修改 {len(new_documents)} 个，删除 {len(stale_ids)} 个，未变化 {unchanged} 个")
+
+    # 3. 删除过期的文档块
+    step = time.perf_counter()
+    print("\n[3/4] 删除过期文档块...")
+    if stale_ids:
+        vectorstore.delete(ids=stale_ids)
+    timings["delete"] = time.perf_counter() - step
+    print(f"  ✓ 已删除 {len(stale_ids)} 个")
+
+    # 4. 分批向量化新增 / 修改的文档块
+    step = time.perf_counter()
+    cache_before = embedding_cache.stats() if embedding_cache is not None else None
+    batch_size = max(1, batch_size)
+    batches = (len(new_documents) + batch_size - 1) // batch_size
+    print(f"\n[4/4] 向量化 {len(new_documents)} 个文档块（模型: {EMBEDDING_MODEL}，每批 {batch_size} 个）...")
+    for i in range(batches):
+        batch = new_documents[i * batch_size:(i + 1) * batch_size]
+        vectorstore.add_documents(batch)
+        print(f"  ✓ 第 {i + 1}/{batches} 批: {len(batch)} 个")
+    timings["embed"] = time.perf_counter() - step
+
+    # 5. 导出 NumPy 索引（直接读取 collection 中的向量，不调用 Embedding 接口）
+    step = time.perf_counter()
+    exported = export_numpy_index(vectorstore, db_path / NUMPY_INDEX_NAME, EMBEDDING_MODEL)
+    timings["export"] = time.perf_counter() - step
+    timings["total"] = time.perf_counter() - start
+    print(f"  ✓ 已导出 NumPy 索引: {exported} 个文档块")
+    kb_version = knowledge_base_version(current)
+    _write_kb_version(db_path, kb_version)
+
+    # 本次向量化的 Embedding 缓存命中数（命中的文档块不调用 Embedding 接口）
+    cache_hits = 0
+    if cache_before is not None:
+        cache_after = embedding_cache.stats()
+        cache_hits = sum(cache_after[name] - cache_before[name] for name in ("memory_hits", "db_hits"))
+        print(f"  ✓ Embedding 缓存命中 {cache_hits}/{len(new_documents)} 个")
+
+    stats = {
+        "files": files,
+        "total": len(documents),
+        "added": len(new_documents),
+        "removed": len(stale_ids),
+        "unchanged": unchanged,
+        "batches": batches,
+        "cache_hits": cache_hits,
+        "cache_hit_rate": round(cache_hits / len(new_documents), 4) if new_documents else 0.0,
+        "kb_version": kb_version,
+        "timings": {name: round(value, 4) for name, value in timings.items()}
+    }
+    _append_build_log(db_path, {"built_at": time.strftime("%Y-%m-%d %H:%M:%S"), "rebuild": rebuild, **stats})
+    return stats
+
+
+def init_vectorstore(rebuild: bool = False):
+    """
+    初始化 / 增量更新向量数据库
+    1. 读取知识库目录并按 Markdown 标题切分
+    2. 对比已有索引（按文档块 id）
+    3. 删除过期文档块
+    4. 分批向量化新增 / 修改的文档块
+    """
+    print("=" * 60)
+    print("开始更新向量数据库...")
     print("=" * 60)
-    
-    test_queries = [
-        "简历怎么写",
-        "如何谈薪资",
-        "STAR法则是什么",
-        "面试紧张怎么办"
-    ]
-    
-    for query in test_queries:
-        results = vectorstore.similarity_search(query, k=1)
-        if results:
-            print(f"\n查询: {query}")
-            print(f"结果: {results[0].page_content[:100]}...")
-    
+
+    stats = sync_knowledge_base(rebuild=rebuild)
+    timings = stats["timings"]
+
+    vectorstore = Chroma(
+        persist_directory=str(CHROMA_DB_PATH),
+        embedding_function=openai_embeddings,
+        collection_name=COLLECTION_NAME
+    )
+
+    # 6. 测试检索（索引有变化时）
+    if stats["added"] or stats["removed"]:
+        print("\n" + "=" * 60)
+        print("测试向量检索...")
+        print("=" * 60)
+
+        test_queries = [
+            "简历怎么写",
+            "如何谈薪资",
+            "STAR法则是什么",
+            "面试紧张怎么办"
+        ]
+
+        for query in test_queries:
+            results = vectorstore.similarity_search(query, k=1)
+            if results:
+                print(f"\n查询: {query}")
+                print(f"结果: {results[0].page_content[:100]}...")
+
     print("\n" + "=" * 60)
-    print("✅ 向量数据库初始化完成！")
+    print(
+        f"✅ 向量数据库更新完成，共 {stats['total']} 个文档块，"
+        f"耗时 {timings['total']:.2f}s（读取 {timings['load']:.2f}s / 对比 {timings['diff']:.2f}s / "
+        f"删除 {timings['delete']:.2f}s / 向量化 {timings['embed']:.2f}s / 导出 {timings['export']:.2f}s）"
+    )
     print("=" * 60)
-    
+
     return vectorstore
 
 
 if __name__ == "__main__":
-    init_vectorstore()
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild", action="store_true", help="清空 collection 后全量重建")
+    args = parser.parse_args()
+
+    init_vectorstore(rebuild=args.rebuild)
@@ -0,0 +1,149 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+NumPy 向量索引
+知识库只有几十个文档块，不需要完整的 Chroma 客户端：init_vectorstore.py 每次同步后把 collection 中的向量
+导出为 float32 矩阵（vectors.npy）和文档块文本 / 元数据（chunks.json），检索时以内存映射方式加载矩阵，
+一次矩阵向量乘法计算所有文档块的距离。
+
+- KB_VECTOR_BACKEND=numpy 时，consultant_tools.get_vectorstore() 返回 NumpyVectorIndex
+- 提供顾问工具用到的 Chroma 接口子集：similarity_search_with_score / get / count
+- 距离与 Chroma 默认的 L2 距离（平方欧氏距离）一致，KB_VECTOR_THRESHOLD 无需调整
+- 重新导出后（chunks.json 修改时间变化）下一次检索自动重新加载
+"""
+import os
+import json
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+# 索引文件名
+VECTORS_FILE = "vectors.npy"
+CHUNKS_FILE = "chunks.json"
+
+
+def export_numpy_index(vectorstore, index_path: Path, model: str) -> int:
+    """
+    把 Chroma collection 中的向量和文档块导出为 NumPy 索引（先写临时文件再替换，检索中的进程不会读到半个文件）
+
+    Returns:
+        导出的文档块数量
+    """
+    data = vectorstore.get(include=["embeddings", "documents", "metadatas"])
+    if data["ids"]:
+        vectors = np.asarray(data["embeddings"], dtype=np.float32)
+    else:
+        vectors = np.zeros((0, 0), dtype=np.float32)
+
+    index_path.mkdir(parents=True, exist_ok=True)
+    vectors_tmp = index_path / f"{VECTORS_FILE}.tmp"
+    chunks_tmp = index_path / f"{CHUNKS_FILE}.tmp"
+    with open(vectors_tmp, "wb") as f:
+        np.save(f, vectors)
+    with open(chunks_tmp, "w", encoding="utf-8") as f:
+        json.dump({
+            "model": model,
+            "ids": data["ids"],
+            "documents": data["documents"],
+            "metadatas": [metadata or {} for metadata in data["metadatas"]]
+        }, f, ensure_ascii=False)
+    # 先替换矩阵，再替换 chunks.json（检索进程以 chunks.json 的修改时间判断是否需要重新加载）
+    os.replace(vectors_tmp, index_path / VECTORS_FILE)
+    os.replace(chunks_tmp, index_path / CHUNKS_FILE)
+    return len(data["ids"])
+
+
+class NumpyVectorIndex:
+    """
+    内存映射的 NumPy 向量索引
+
+    Args:
+        index_path: 索引目录（包含 vectors.npy 和 chunks.json）
+        embedding_function: 计算查询向量的 Embedding 模型（与导出时的模型一致）
+        model: 当前 Embedding 模型名称，与索引记录的模型不一致时打印警告
+    """
+
+    def __init__(self, index_path: Path, embedding_function: Embeddings, model: Optional[str] = None):
+        self.index_path = Path(index_path)
+        self.embedding_function = embedding_function
+        self.model = model
+
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._load()
+
+    def _load(self) -> None:
+        chunks_path = self.index_path / CHUNKS_FILE
+        if not chunks_path.exists():
+            raise FileNotFoundError(
+                f"NumPy 向量索引不存在: {self.index_path}\n"
+                f"请先运行初始化脚本: python backend/graph/rag/init_vectorstore.py"
+            )
+        mtime_ns = chunks_path.stat().st_mtime_ns
+        with open(chunks_path, "r", encoding="utf-8") as f:
+            chunks = json.load(f)
+        vectors = np.load(self.index_path / VECTORS_FILE, mmap_mode="r")
+
+        if self.model and chunks.get("model") != self.model:
+            print(f"[numpy_index] ⚠ 索引的 Embedding 模型 ({chunks.get('model')}) 与当前模型 ({self.model}) 不一致，请重新运行 init_vectorstore.py")
+
+        # 文档块向量的平方范数（计算 L2 距离用）
+        norms = np.einsum("ij,ij->i", vectors, vectors) if len(vectors) else np.zeros(0, dtype=np.float32)
+        # 整体替换，检索中的线程继续使用旧的索引
+        self._state = (chunks["ids"], chunks["documents"], chunks["metadatas"], vectors, norms)
+        self._mtime_ns = mtime_ns
+        print(f"[numpy_index] 已加载 NumPy 向量索引: {len(chunks['ids'])} 个文档块，维度 {vectors.shape[1] if vectors.ndim == 2 else 0}")
+
+    def _maybe_reload(self) -> None:
+        try:
+            mtime_ns = (self.index_path / CHUNKS_FILE).stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns != self._mtime_ns:
+            with self._lock:
+                if mtime_ns != self._mtime_ns:
+                    self._load()
+
+    def count(self) -> int:
+        self._maybe_reload()
+        return len(self._state[0])
+
+    def get(self, include: Optional[List[str]] = None) -> dict:
+        """返回全部文档块（与 Chroma.get 的返回格式一致）"""
+        self._maybe_reload()
+        ids, documents, metadatas, vectors, _ = self._state
+        include = include if include is not None else ["documents", "metadatas"]
+        result = {"ids": list(ids)}
+        if "documents" in include:
+            result["documents"] = list(documents)
+        if "metadatas" in include:
+            result["metadatas"] = list(metadatas)
+        if "embeddings" in include:
+            result["embeddings"] = np.array(vectors)
+        return result
+
+    def similarity_search_by_vector_with_score(self, embedding: List[float], k: int = 4) -> List[Tuple[Document, float]]:
+        self._maybe_reload()
+        ids, documents, metadatas, vectors, norms = self._state
+        n = len(ids)
+        if n == 0:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        # 平方欧氏距离：|q|^2 + |d|^2 - 2 q·d
+        distances = float(query @ query) + norms - 2 * (vectors @ query)
+        k = min(k, n)
+        top = np.argpartition(distances, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(distances[top])]
+        return [
+            (
+                Document(id=ids[i], page_content=documents[i], metadata=dict(metadatas[i])),
+                max(float(distances[i]), 0.0)
+            )
+            for i in top
+        ]
+
+    def similarity_search_with_score(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(self.embedding_function.embed_query(query), k)
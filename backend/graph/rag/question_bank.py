@@ -0,0 +1,230 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+本地面试题库
+按岗位 + 话题建立向量索引（Chroma 的 interview_questions collection，与知识库共用 chroma_db 目录），
+题目存放在元数据中，检索时只对"岗位 话题"做向量匹配：
+
+- 精选题库：interview_question_bank.md（## 岗位 / ### 话题 / - 题目），运行 init_question_bank.py 建立索引
+- 联网补充：search_interview_questions 联网搜索并提炼出题目后，按搜索话题写入题库（后台线程执行）；
+  超过 QUESTION_BANK_LEARN_TTL 的联网题目视为未命中并删除，重新联网搜索后刷新
+- 两种来源都通过 index_text 生成索引文本，向量距离可以直接比较
+- 出题时先检索题库，向量距离不超过 QUESTION_BANK_DISTANCE_THRESHOLD 的话题视为命中，
+  直接返回题目，省去一次联网搜索和一次提炼 LLM 调用；未命中再联网搜索
+- get_question_bank_metrics() 统计检索次数、命中率、写入次数和过期次数
+"""
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_text_splitters import MarkdownHeaderTextSplitter
+
+from backend.config import (
+    QUESTION_BANK_ENABLED,
+    QUESTION_BANK_DISTANCE_THRESHOLD,
+    QUESTION_BANK_TOP_K,
+    QUESTION_BANK_LEARN,
+    QUESTION_BANK_LEARN_TTL
+)
+from backend.graph.llm import openai_embeddings
+
+# 精选题库文件路径
+QUESTION_BANK_PATH = Path(__file__).parent / "interview_question_bank.md"
+# Chroma 数据库存储路径（与知识库相同）
+CHROMA_DB_PATH = Path(__file__).parent / "chroma_db"
+# 题库 collection 名称
+COLLECTION_NAME = "interview_questions"
+# 不区分岗位的题目，索引文本中不包含岗位
+GENERAL_POSITION = "通用"
+
+# 全局变量：题库实例（懒加载）
+_question_bank = None
+_question_bank_lock = threading.Lock()
+
+# 联网补充的题目在后台线程中写入（需要调用 Embedding 接口）
+_learn_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="question-bank")
+
+_metrics = {"lookups": 0, "hits": 0, "misses": 0, "errors": 0, "learned": 0, "expired": 0}
+_metrics_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _metrics_lock:
+        _metrics[name] += 1
+
+
+def get_question_bank() -> Chroma:
+    """
+    获取题库向量索引（单例模式，collection 不存在时自动创建）
+    """
+    global _question_bank
+
+    if _question_bank is None:
+        with _question_bank_lock:
+            if _question_bank is None:
+                _question_bank = Chroma(
+                    persist_directory=str(CHROMA_DB_PATH),
+                    embedding_function=openai_embeddings,
+                    collection_name=COLLECTION_NAME
+                )
+    return _question_bank
+
+
+INDEX_SUFFIX = "面试题"
+
+
+def index_text(position: str, topic: str) -> str:
+    """参与向量匹配的文本：岗位 + 话题 + "面试题"（联网话题本身已以"面试题"结尾时不重复添加）"""
+    if position == GENERAL_POSITION:
+        position = ""
+    text = f"{position} {topic}".strip()
+    if not text.endswith(INDEX_SUFFIX):
+        text = f"{text} {INDEX_SUFFIX}"
+    return text
+
+
+def is_expired(metadata: dict, now: Optional[float] = None) -> bool:
+    """联网补充的题目是否超过有效期（精选题目不过期）"""
+    if metadata.get("source") != "web" or QUESTION_BANK_LEARN_TTL <= 0:
+        return False
+    created_at = metadata.get("created_at") or 0
+    return (now or time.time()) - created_at > QUESTION_BANK_LEARN_TTL
+
+
+def curated_id(position: str, topic: str, questions: str) -> str:
+    """精选题目的 id：按内容哈希，内容不变则 id 不变，重建索引时跳过"""
+    raw = f"{position}\x00{topic}\x00{questions}"
+    return "curated:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def learned_id(topic: str) -> str:
+    """联网补充题目的 id：同一搜索话题只保留最新一次的结果"""
+    from backend.graph.tools.search_gateway import normalize_query
+    return "web:" + hashlib.sha256(normalize_query(topic).encode("utf-8")).hexdigest()[:32]
+
+
+def load_curated_documents(path: Path = QUESTION_BANK_PATH) -> List[Document]:
+    """
+    读取精选题库，每个"岗位 / 话题"生成一个文档
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        markdown_text = f.read()
+
+    splitter = MarkdownHeaderTextSplitter(
+        headers_to_split_on=[("##", "position"), ("###", "topic")],
+        strip_headers=True
+    )
+
+    documents = []
+    for chunk in splitter.split_text(markdown_text):
+        position = chunk.metadata.get("position", "")
+        topic = chunk.metadata.get("topic", "")
+        questions = "\n".join(
+            line.strip() for line in chunk.page_content.splitlines() if line.strip().startswith("- ")
+        )
+        if not position or not topic or not questions:
+            continue
+        documents.append(Document(
+            id=curated_id(position, topic, questions),
+            page_content=index_text(position, topic),
+            metadata={"position": position, "topic": topic, "questions": questions, "source": "curated"}
+        ))
+    return documents
+
+
+def lookup_questions(topic: str) -> Optional[str]:
+    """
+    检索题库
+
+    Args:
+        topic: 出题话题（与 search_interview_questions 的参数相同，如"Java开发工程师 项目难点 面试题"）
+
+    Returns:
+        命中的题目（多个话题合并去重）；题库关闭、未命中或检索失败时返回 None
+    """
+    if not QUESTION_BANK_ENABLED:
+        return None
+    _count("lookups")
+
+    try:
+        results = get_question_bank().similarity_search_with_score(index_text("", topic), k=QUESTION_BANK_TOP_K)
+    except Exception as e:
+        print(f"[question_bank] 题库检索失败: {e}")
+        _count("errors")
+        return None
+
+    matched = [(doc, score) for doc, score in results if score <= QUESTION_BANK_DISTANCE_THRESHOLD]
+    # 过期的联网题目不再返回，后台删除；未命中后重新联网搜索，learn_questions 按相同 id 写入新题目
+    now = time.time()
+    expired = [doc for doc, _ in matched if is_expired(doc.metadata, now)]
+    if expired:
+        matched = [(doc, score) for doc, score in matched if not is_expired(doc.metadata, now)]
+        for doc in expired:
+            print(f"[question_bank] 联网题目已过期: {doc.metadata.get('topic')}")
+            _count("expired")
+        _learn_executor.submit(_delete_expired, [learned_id(doc.metadata.get("topic", "")) for doc in expired])
+    if not matched:
+        best = f"{results[0][1]:.3f}" if results else "无结果"
+        print(f"[question_bank] 题库未命中: {topic} (最佳距离: {best})")
+        _count("misses")
+        return None
+
+    questions = []
+    for doc, score in matched:
+        print(f"[question_bank] 题库命中: {doc.metadata.get('position')} / {doc.metadata.get('topic')} (距离: {score:.3f})")
+        for line in doc.metadata.get("questions", "").splitlines():
+            if line and line not in questions:
+                questions.append(line)
+    _count("hits")
+    return "\n".join(questions)
+
+
+def _delete_expired(ids: List[str]) -> None:
+    if not ids:
+        return
+    try:
+        get_question_bank().delete(ids=ids)
+    except Exception as e:
+        print(f"[question_bank] 删除过期题目失败: {e}")
+        _count("errors")
+
+
+def _add_learned(topic: str, questions: str) -> None:
+    try:
+        get_question_bank().add_documents(
+            [Document(
+                page_content=index_text("", topic),
+                metadata={"position": "", "topic": topic, "questions": questions, "source": "web", "created_at": time.time()}
+            )],
+            ids=[learned_id(topic)]
+        )
+        _count("learned")
+        print(f"[question_bank] 联网题目已写入题库: {topic}")
+    except Exception as e:
+        print(f"[question_bank] 写入题库失败: {e}")
+        _count("errors")
+
+
+def learn_questions(topic: str, questions: str) -> None:
+    """
+    把联网搜索提炼出的题目写入题库（后台执行，不阻塞出题）
+    """
+    if not QUESTION_BANK_ENABLED or not QUESTION_BANK_LEARN or not questions.strip():
+        return
+    lines = [line.strip() for line in questions.splitlines() if line.strip()]
+    questions = "\n".join(line if line.startswith("- ") else f"- {line}" for line in lines)
+    _learn_executor.submit(_add_learned, topic, questions)
+
+
+def get_question_bank_metrics() -> dict:
+    """
+    题库统计：命中率 = 命中次数 / 检索次数
+    """
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    metrics["hit_rate"] = round(metrics["hits"] / metrics["lookups"], 4) if metrics["lookups"] else 0.0
+    return metrics
@@ -2,18 +2,48 @@
 """
 工具模块
 """
+from backend.graph.tools.search_gateway import (
+    SearchUnavailableError,
+    SearchClientError,
+    normalize_query,
+    search_web,
+    asearch_web,
+    get_search_metrics,
+    close_search_gateway
+)
 from backend.graph.tools.interviewer_tools import (
     search_interview_questions,
     interviewer_tools
 )
+from backend.graph.tools.speculative_search import (
+    schedule_speculative_search,
+    take_speculative_search,
+    atake_speculative_search,
+    cancel_speculative_search,
+    get_speculation_metrics,
+    shutdown_speculative_search
+)
 from backend.graph.tools.feedback_tools import (
     search_learning_resources,
     feedback_tools
 )
 
 __all__ = [
+    "SearchUnavailableError",
+    "SearchClientError",
+    "normalize_query",
+    "search_web",
+    "asearch_web",
+    "get_search_metrics",
+    "close_search_gateway",
     "search_interview_questions",
     "interviewer_tools",
+    "schedule_speculative_search",
+    "take_speculative_search",
+    "atake_speculative_search",
+    "cancel_speculative_search",
+    "get_speculation_metrics",
+    "shutdown_speculative_search",
     "search_learning_resources",
     "feedback_tools"
 ]
@@ -1,24 +1,60 @@
 # AI智能面试辅助系统V1.0，作者刘梦畅
 """
 面试顾问工具 - RAG 版本
-使用 Chroma 向量数据库进行语义检索
+知识库检索默认使用关键词 + 向量混合检索（KB_RETRIEVAL_MODE=hybrid），也可以只用向量检索；
+向量检索后端为 Chroma 或内存映射的 NumPy 索引（KB_VECTOR_BACKEND）；
+顾问的语义答案缓存随知识库版本（chroma_db/kb_version）失效
 """
-from langchain_core.tools import tool
+import asyncio
+import threading
+from typing import List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.tools import tool, StructuredTool
 from langchain_chroma import Chroma
 from pathlib import Path
 from backend.graph.llm import openai_embeddings
-from backend.config import TAVILY_API_KEY
+from backend.graph.llm.answer_cache import SemanticAnswerCache
+from backend.graph.rag.hybrid_retriever import HybridRetriever
+from backend.graph.rag.numpy_index import NumpyVectorIndex
+from backend.config import (
+    TAVILY_API_KEY,
+    EMBEDDING_MODEL,
+    KB_VECTOR_BACKEND,
+    KB_RETRIEVAL_MODE,
+    KB_TOP_K,
+    KB_VECTOR_K,
+    KB_VECTOR_THRESHOLD,
+    KB_LEXICAL_K,
+    KB_LEXICAL_MIN_COVERAGE,
+    KB_RRF_K,
+    ANSWER_CACHE_ENABLED,
+    ANSWER_CACHE_DB_PATH,
+    ANSWER_CACHE_SIMILARITY_THRESHOLD,
+    ANSWER_CACHE_TTL,
+    ANSWER_CACHE_MAX_ENTRIES
+)
+from backend.graph.tools.search_gateway import search_web, asearch_web
 
 # Chroma 数据库路径
 CHROMA_DB_PATH = Path(__file__).parent.parent / "rag" / "chroma_db"
 
-# 全局变量：向量数据库实例（懒加载）
+# 全局变量：向量数据库实例、混合检索器、语义答案缓存（懒加载）
 _vectorstore = None
+_hybrid_retriever = None
+_hybrid_retriever_lock = threading.Lock()
+_answer_cache = None
+_answer_cache_lock = threading.Lock()
+
+# 知识库未命中时返回给 Agent 的提示
+KB_MISS_MESSAGE = "知识库中没有找到相关内容。请立即使用 tavily_search 工具进行联网搜索以获取最新信息。"
 
 
 def get_vectorstore():
     """
     获取向量数据库实例（单例模式）
+    查询向量通过 Embedding 缓存获取，重复的问题不再调用 Embedding 接口；
+    KB_VECTOR_BACKEND=numpy 时返回 NumpyVectorIndex（接口与 Chroma 的检索方法一致）
     """
     global _vectorstore
     
@@ -30,6 +66,14 @@ def get_vectorstore():
                 f"请先运行初始化脚本: python backend/graph/rag/init_vectorstore.py"
             )
         
+        if KB_VECTOR_BACKEND == "numpy":
+            _vectorstore = NumpyVectorIndex(
+                CHROMA_DB_PATH / "numpy_index",
+                embedding_function=openai_embeddings,
+                model=EMBEDDING_MODEL
+            )
+            return _vectorstore
+
         # 加载向量数据库
         _vectorstore = Chroma(
             persist_directory=str(CHROMA_DB_PATH),
@@ -40,6 +84,83 @@ def get_vectorstore():
     return _vectorstore
 
 
+def get_hybrid_retriever() -> HybridRetriever:
+    """
+    获取混合检索器（单例模式，倒排索引在第一次检索时建立）
+    """
+    global _hybrid_retriever
+
+    if _hybrid_retriever is None:
+        with _hybrid_retriever_lock:
+            if _hybrid_retriever is None:
+                _hybrid_retriever = HybridRetriever(
+                    get_vectorstore(),
+                    top_k=KB_TOP_K,
+                    vector_k=KB_VECTOR_K,
+                    vector_threshold=KB_VECTOR_THRESHOLD,
+                    lexical_k=KB_LEXICAL_K,
+                    lexical_min_coverage=KB_LEXICAL_MIN_COVERAGE,
+                    rrf_k=KB_RRF_K,
+                    version_path=CHROMA_DB_PATH / "kb_version"
+                )
+    return _hybrid_retriever
+
+
+def get_answer_cache() -> Optional[SemanticAnswerCache]:
+    """
+    获取顾问语义答案缓存（单例模式），ANSWER_CACHE_ENABLED=false 时返回 None
+    """
+    global _answer_cache
+
+    if not ANSWER_CACHE_ENABLED:
+        return None
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                _answer_cache = SemanticAnswerCache(
+                    openai_embeddings,
+                    db_path=ANSWER_CACHE_DB_PATH or None,
+                    version_path=CHROMA_DB_PATH / "kb_version",
+                    similarity_threshold=ANSWER_CACHE_SIMILARITY_THRESHOLD,
+                    ttl=ANSWER_CACHE_TTL,
+                    max_entries=ANSWER_CACHE_MAX_ENTRIES
+                )
+    return _answer_cache
+
+
+def retrieve_knowledge(query: str, mode: Optional[str] = None) -> List[Tuple[Document, dict]]:
+    """
+    检索知识库，只返回通过阈值的文档块
+
+    Args:
+        query: 检索内容
+        mode: hybrid / vector，为 None 时使用 KB_RETRIEVAL_MODE
+
+    Returns:
+        [(文档块, 检索详情)]，未命中时返回空列表
+    """
+    mode = mode or KB_RETRIEVAL_MODE
+    if mode == "hybrid":
+        return get_hybrid_retriever().search(query)
+
+    # 只用向量检索：过滤相似度过低的结果（score 越小越相似）
+    results = get_vectorstore().similarity_search_with_score(query, k=KB_TOP_K)
+    if results and all(score > KB_VECTOR_THRESHOLD for _, score in results):
+        print(f"[Consultant] 向量检索最佳相似度: {results[0][1]:.3f} > {KB_VECTOR_THRESHOLD}")
+    return [(doc, {"vector_distance": score}) for doc, score in results if score <= KB_VECTOR_THRESHOLD]
+
+
+def _describe_match(info: dict) -> str:
+    parts = []
+    if info.get("vector_distance") is not None:
+        parts.append(f"向量距离: {info['vector_distance']:.3f}")
+    if info.get("coverage") is not None:
+        parts.append(f"关键词覆盖率: {info['coverage']:.2f}")
+    if info.get("score") is not None:
+        parts.append(f"融合分数: {info['score']:.4f}")
+    return ", ".join(parts)
+
+
 @tool("search_knowledge_base")
 def search_knowledge_base(query: str) -> str:
     """
@@ -49,30 +170,18 @@ def search_knowledge_base(query: str) -> str:
     print(f"[Consultant] 📖 知识库检索内容: {query}")
     
     try:
-        # 获取向量数据库
-        vectorstore = get_vectorstore()
-        
-        # 语义检索（返回最相关的 2 个文档块）
-        results = vectorstore.similarity_search_with_score(query, k=2)
-        
-        if not results:
-            print(f"[Consultant] ❌ 知识库未命中 (无结果)")
-            return "知识库中没有找到相关内容。请立即使用 tavily_search 工具进行联网搜索以获取最新信息。"
-        
-        # 过滤相似度过低的结果（score 越小越相似）
-        # 调整阈值：0.8 -> 0.6（更严格，避免匹配到不相关的通用内容）
-        threshold = 0.6
-        relevant_results = [(doc, score) for doc, score in results if score < threshold]
-        
+        # 检索知识库（混合检索：关键词 + 向量，倒数排名融合）
+        relevant_results = retrieve_knowledge(query)
+
         if not relevant_results:
-            print(f"[Consultant] ❌ 知识库未命中 (最佳相似度: {results[0][1]:.3f} > {threshold})")
-            return "知识库中没有找到相关内容。请立即使用 tavily_search 工具进行联网搜索以获取最新信息。"
-        
+            print(f"[Consultant] ❌ 知识库未命中")
+            return KB_MISS_MESSAGE
+
         # 合并检索结果
         matched_content = []
-        for doc, score in relevant_results:
+        for doc, info in relevant_results:
             preview = doc.page_content[:100].replace('\n', ' ') + "..."
-            print(f"[Consultant] ✅ 命中知识片段 (Score: {score:.3f}): {preview}")
+            print(f"[Consultant] ✅ 命中知识片段 ({_describe_match(info)}): {preview}")
             matched_content.append(doc.page_content)
         
         result = "\n\n".join(matched_content)
@@ -85,53 +194,87 @@ def search_knowledge_base(query: str) -> str:
         return "知识库检索失败。请立即使用 tavily_search 工具进行联网搜索以获取最新信息。"
 
 
-@tool("tavily_search")
-def tavily_search(query: str) -> str:
+def _knowledge_base_fallback(query: str) -> str:
+    """
+    联网搜索不可用时的兜底：返回知识库中最接近的内容（不做相似度阈值过滤）
+    """
+    try:
+        results = get_vectorstore().similarity_search_with_score(query, k=2)
+    except Exception as e:
+        print(f"[Consultant] ❌ 知识库兜底检索失败: {e}")
+        results = []
+
+    if not results:
+        return "联网搜索暂时不可用，请根据已有信息直接回答用户，不要再次调用 tavily_search。"
+
+    print(f"[Consultant] 📖 联网搜索不可用，使用知识库兜底（最佳相似度: {results[0][1]:.3f}）")
+    content = "\n\n".join(doc.page_content for doc, _ in results)
+    return f"【知识库参考内容】（联网搜索暂时不可用，请基于以下内容回答，不要再次调用 tavily_search）\n{content}"
+
+
+def _format_search_results(query: str, response: dict) -> str:
+    """
+    整理联网搜索结果
+    """
+    results = response.get("results", [])
+    if not results:
+        print(f"[Consultant] ⚠️ 联网搜索未找到结果")
+        return f"未找到关于 {query} 的相关信息"
+
+    search_results = []
+    print(f"[Consultant] ✅ 联网搜索成功，找到 {len(results)} 条结果:")
+    for res in results:
+        print(f"  - [{res['title']}] {res['url']}")
+        search_results.append(f"- [{res['title']}]({res['url']})\n  {res['content'][:200]}...")
+
+    result_text = "\n\n".join(search_results)
+    return f"【联网搜索结果】\n{result_text}"
+
+
+def _tavily_search(query: str) -> str:
     """
     使用 Tavily 联网搜索最新的面试相关信息（兜底机制）。
     ...
     """
-    from tavily import TavilyClient
-    import time
+    print(f"[Consultant] 🌐 联网搜索内容: {query}")
 
+    if not TAVILY_API_KEY:
+        print("[Consultant] ❌ 未配置 TAVILY_API_KEY")
+        return "搜索失败: 未配置 TAVILY_API_KEY"
+
+    # 重试（指数退避 + 抖动）、截止时间和熔断由搜索网关处理
+    try:
+        response = search_web(query, search_depth="basic", max_results=3)
+    except Exception as e:
+        print(f"[Consultant] ❌ 联网搜索失败: {e}")
+        return _knowledge_base_fallback(query)
+    return _format_search_results(query, response)
+
+
+async def _atavily_search(query: str) -> str:
+    """
+    使用 Tavily 联网搜索（异步版本）：重试等待不阻塞事件循环，搜索服务熔断时立即返回知识库内容
+    """
     print(f"[Consultant] 🌐 联网搜索内容: {query}")
 
     if not TAVILY_API_KEY:
         print("[Consultant] ❌ 未配置 TAVILY_API_KEY")
         return "搜索失败: 未配置 TAVILY_API_KEY"
 
-    # 重试机制
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            tavily = TavilyClient(api_key=TAVILY_API_KEY)
-            
-            # 执行搜索
-            response = tavily.search(query=query, search_depth="basic", max_results=3)
-            results = response.get("results", [])
-            
-            if results:
-                # 整理搜索结果
-                search_results = []
-                print(f"[Consultant] ✅ 联网搜索成功，找到 {len(results)} 条结果:")
-                for res in results:
-                    print(f"  - [{res['title']}] {res['url']}")
-                    search_results.append(f"- [{res['title']}]({res['url']})\n  {res['content'][:200]}...")
-                
-                result_text = "\n\n".join(search_results)
-                return f"【联网搜索结果】\n{result_text}"
-            else:
-                print(f"[Consultant] ⚠️ 联网搜索未找到结果")
-                return f"未找到关于 {query} 的相关信息"
-                
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"[Consultant] ⚠️ 搜索失败（第 {attempt + 1} 次），重试中...")
-                time.sleep(1)  # 等待1秒后重试
-                continue
-            else:
-                print(f"[Consultant] ❌ 搜索失败（已重试 {max_retries} 次）: {e}")
-                return f"联网搜索暂时不可用，请稍后再试"
+    try:
+        response = await asearch_web(query, search_depth="basic", max_results=3)
+    except Exception as e:
+        print(f"[Consultant] ❌ 联网搜索失败: {e}")
+        # 向量检索需要调用 Embedding 接口，放到线程池执行
+        return await asyncio.to_thread(_knowledge_base_fallback, query)
+    return _format_search_results(query, response)
+
+
+tavily_search = StructuredTool.from_function(
+    func=_tavily_search,
+    coroutine=_atavily_search,
+    name="tavily_search"
+)
 
 
 # 导出工具列表（顺序很重要！优先使用知识库）
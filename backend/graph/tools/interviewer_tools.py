@@ -1,51 +1,34 @@
 # AI智能面试辅助系统V1.0，作者刘梦畅
 """
 面试官工具定义
-包含联网搜索和简历出题两个工具
+包含搜索面试题工具（同步 / 异步两种实现，Agent 异步执行时不阻塞事件循环）：
+先检索本地面试题库，没有足够接近的题目时再联网搜索并提炼，提炼结果写入题库
 """
-from langchain_core.tools import tool
-from backend.graph.llm import openai_llm  # 工具内部的文本处理用 DeepSeek
+import asyncio
+from typing import Optional
 
+from langchain_core.tools import StructuredTool
+from backend.graph.rag.question_bank import lookup_questions, learn_questions
+from backend.graph.llm import get_llm  # 工具内部的文本处理用 DeepSeek
+from backend.graph.tools.search_gateway import search_web, asearch_web
 
-@tool
-def search_interview_questions(topic: str) -> str:
+
+def _build_distill_prompt(topic: str, response: dict) -> Optional[str]:
     """
-    联网搜索相关的面试题目。
-    
-    Args:
-        topic: 搜索话题，可以是岗位名称（如"Java后端"），也可以是具体技术点（如"Redis分布式锁"、"Spring循环依赖"）
-    
-    Returns:
-        搜索到的面试题目列表
+    构建搜索结果提炼提示词，没有搜索结果时返回 None
     """
-    from backend.config import TAVILY_API_KEY
-    from tavily import TavilyClient
+    results = response.get("results", [])
+    if not results:
+        return None
 
-    print(f"[search_interview_questions] 收到搜索请求: {topic}")
+    # 提取搜索结果内容
+    context_parts = []
+    for i, res in enumerate(results):
+        context_parts.append(f"来源 {i+1}: {res['title']}\n{res['content']}")
+
+    search_context = "\n\n".join(context_parts)
 
-    # 尝试使用 Tavily 进行真实搜索
-    if TAVILY_API_KEY:
-        try:
-            tavily = TavilyClient(api_key=TAVILY_API_KEY)
-            
-            # 直接使用 Agent 提供的 topic 进行搜索，保持最大灵活性
-            search_query = topic
-            print(f"[search_interview_questions] 执行搜索 Query: {search_query}")
-            
-            # 执行搜索，获取包含内容的上下文
-            response = tavily.search(query=search_query, search_depth="advanced", max_results=3)
-            results = response.get("results", [])
-            
-            if results:
-                # 提取搜索结果内容
-                context_parts = []
-                for i, res in enumerate(results):
-                    context_parts.append(f"来源 {i+1}: {res['title']}\n{res['content']}")
-                
-                search_context = "\n\n".join(context_parts)
-                
-                # 使用 LLM 从搜索结果中提取并整理问题
-                prompt = f"""请根据以下联网搜索到的内容，提炼出 3 个最高质量的面试问题：
+    return f"""请根据以下联网搜索到的内容，提炼出 3 个最高质量的面试问题：
 
 搜索话题：{topic}
 
@@ -58,19 +41,99 @@ def search_interview_questions(topic: str) -> str:
 2. 问题要真实、常见、有深度
 3. 优先选择质量高的问题
 """
-                result = openai_llm.invoke(prompt)
-                questions = result.content.strip()
-                print(f"[search_interview_questions] 搜索并整理的问题:\n{questions}")
-                return f"【{topic} - 搜索结果】\n{questions}"
-                
-        except Exception as e:
-            print(f"[search_interview_questions] Tavily 搜索失败: {e}")
-            return f"搜索失败: {str(e)}"
-    
+
+
+def _format_questions(topic: str, content: str) -> str:
+    questions = content.strip()
+    print(f"[search_interview_questions] 搜索并整理的问题:\n{questions}")
+    learn_questions(topic, questions)
+    return f"【{topic} - 搜索结果】\n{questions}"
+
+
+def _format_bank_questions(topic: str, questions: str) -> str:
+    print(f"[search_interview_questions] 使用题库中的问题:\n{questions}")
+    return f"【{topic} - 题库】\n{questions}"
+
+
+def _search_interview_questions(topic: str) -> str:
+    """
+    搜索相关的面试题目（优先使用本地题库，没有合适的题目时联网搜索）。
+
+    Args:
+        topic: 搜索话题，可以是岗位名称（如"Java后端"），也可以是具体技术点（如"Redis分布式锁"、"Spring循环依赖"）
+
+    Returns:
+        搜索到的面试题目列表
+    """
+    from backend.config import TAVILY_API_KEY
+
+    print(f"[search_interview_questions] 收到搜索请求: {topic}")
+
+    # 优先使用本地题库
+    bank_questions = lookup_questions(topic)
+    if bank_questions:
+        return _format_bank_questions(topic, bank_questions)
+
     # 如果没有配置 Tavily API Key
-    print("[search_interview_questions] 未配置 TAVILY_API_KEY")
-    return "搜索失败: 未配置 TAVILY_API_KEY"
+    if not TAVILY_API_KEY:
+        print("[search_interview_questions] 未配置 TAVILY_API_KEY")
+        return "搜索失败: 未配置 TAVILY_API_KEY"
+
+    try:
+        # 直接使用 Agent 提供的 topic 进行搜索，保持最大灵活性
+        print(f"[search_interview_questions] 执行搜索 Query: {topic}")
+
+        # 执行搜索，获取包含内容的上下文（通过搜索网关，相同查询复用缓存结果，失败自动重试）
+        response = search_web(topic, search_depth="advanced", max_results=3)
+        prompt = _build_distill_prompt(topic, response)
+        if prompt is None:
+            return f"未找到关于 {topic} 的面试题"
+
+        # 使用 LLM 从搜索结果中提取并整理问题
+        result = get_llm("question_distill").invoke(prompt)
+        return _format_questions(topic, result.content)
+
+    except Exception as e:
+        print(f"[search_interview_questions] Tavily 搜索失败: {e}")
+        return f"搜索失败: {str(e)}"
+
+
+async def _asearch_interview_questions(topic: str) -> str:
+    """
+    搜索相关的面试题目（异步版本）
+    """
+    from backend.config import TAVILY_API_KEY
+
+    print(f"[search_interview_questions] 收到搜索请求: {topic}")
+
+    # 题库检索需要调用 Embedding 接口，放到线程池执行
+    bank_questions = await asyncio.to_thread(lookup_questions, topic)
+    if bank_questions:
+        return _format_bank_questions(topic, bank_questions)
+
+    if not TAVILY_API_KEY:
+        print("[search_interview_questions] 未配置 TAVILY_API_KEY")
+        return "搜索失败: 未配置 TAVILY_API_KEY"
+
+    try:
+        response = await asearch_web(topic, search_depth="advanced", max_results=3)
+        prompt = _build_distill_prompt(topic, response)
+        if prompt is None:
+            return f"未找到关于 {topic} 的面试题"
+
+        result = await get_llm("question_distill").ainvoke(prompt)
+        return _format_questions(topic, result.content)
+
+    except Exception as e:
+        print(f"[search_interview_questions] Tavily 搜索失败: {e}")
+        return f"搜索失败: {str(e)}"
+
 
+search_interview_questions = StructuredTool.from_function(
+    func=_search_interview_questions,
+    coroutine=_asearch_interview_questions,
+    name="search_interview_questions"
+)
 
 
 # 导出工具列表
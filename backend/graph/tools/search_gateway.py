@@ -0,0 +1,585 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+联网搜索网关
+search_interview_questions / search_learning_resources / tavily_search 统一通过这里调用 Tavily：
+- 共用一个 TavilyClient（requests.Session 连接池复用 TCP / TLS 连接）
+- 搜索结果缓存：缓存键为规范化查询 + 搜索参数，内存 LRU + SQLite 两级，支持 TTL 过期
+- 请求合并（single-flight）：相同查询同时只有一个请求发往 Tavily，其余调用等待并共用结果
+- 重试：可重试的错误（超时、连接失败、限流、5xx）按指数退避 + 随机抖动重试，整个搜索不超过截止时间
+- 熔断：连续失败达到阈值后熔断，熔断期间直接失败（SearchUnavailableError），到期后放行一次探测请求
+- asearch_web() 为异步版本：等待和退避都不阻塞事件循环
+- get_search_metrics() 统计缓存命中率、合并次数、重试 / 熔断次数和实际请求次数
+
+同一岗位的候选人在几分钟内会触发几乎相同的查询（只有大小写、空格、标点不同），规范化后命中同一条缓存
+"""
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.config import (
+    TAVILY_API_KEY,
+    TAVILY_API_BASE,
+    SEARCH_POOL_SIZE,
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_DB_PATH,
+    SEARCH_CACHE_TTL,
+    SEARCH_CACHE_MAX_MEMORY_ENTRIES,
+    SEARCH_CACHE_MAX_DB_ENTRIES,
+    SEARCH_MAX_ATTEMPTS,
+    SEARCH_RETRY_BASE_DELAY,
+    SEARCH_RETRY_MAX_DELAY,
+    SEARCH_DEADLINE,
+    SEARCH_BREAKER_FAILURE_THRESHOLD,
+    SEARCH_BREAKER_RESET_TIMEOUT
+)
+
+# SQLite 层每写入多少次检查一次条目数上限
+_PRUNE_EVERY = 100
+
+# 规范化时去掉的首尾标点
+_TRIM_CHARS = " \t\r\n?？!！.。,，;；:：\"'“”‘’"
+
+
+class SearchUnavailableError(Exception):
+    """搜索服务不可用：熔断中或超过截止时间"""
+
+
+class SearchClientError(Exception):
+    """无法创建搜索客户端（tavily-python 版本过低或配置错误），重试也不会成功"""
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    是否可以重试：客户端创建失败、调用参数错误（TypeError）、请求参数 / 密钥 / 权限错误重试也不会成功，
+    其余（超时、连接失败、限流、5xx）可以重试
+    """
+    if isinstance(error, (SearchClientError, TypeError)):
+        return False
+    return type(error).__name__ not in ("BadRequestError", "InvalidAPIKeyError", "ForbiddenError", "MissingAPIKeyError")
+
+
+def normalize_query(query: str) -> str:
+    """
+    规范化查询：全角转半角、转小写、合并空白、去掉首尾标点
+    """
+    text = unicodedata.normalize("NFKC", query or "").lower()
+    return " ".join(text.split()).strip(_TRIM_CHARS)
+
+
+def make_search_key(query: str, search_depth: str, max_results: int) -> str:
+    """根据规范化查询和搜索参数生成缓存键"""
+    raw = json.dumps([normalize_query(query), search_depth, max_results], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    内存 + SQLite 两级搜索结果缓存
+
+    Args:
+        db_path: SQLite 缓存文件路径，为 None 时只使用内存缓存
+        ttl: 缓存有效期（秒），0 表示永不过期
+        max_memory_entries: 内存缓存最大条目数
+        max_db_entries: SQLite 缓存最大条目数（按最近访问时间淘汰）
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: int = 6 * 3600,
+        max_memory_entries: int = 512,
+        max_db_entries: int = 10000
+    ):
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_db_entries = max_db_entries
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_last_access ON search_cache(last_access)")
+            self._conn.commit()
+
+    def _memory_get(self, key: str, now: float) -> Optional[dict]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at < now:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_put(self, key: str, value: dict, expires_at: float) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key: str, now: float) -> Optional[tuple]:
+        row = self._conn.execute("SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at and expires_at < now:
+            self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        self._conn.execute("UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return json.loads(value), expires_at
+
+    def _db_put(self, key: str, value: dict, expires_at: float, now: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO search_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False, default=str), expires_at, now)
+        )
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= _PRUNE_EVERY:
+            self._writes_since_prune = 0
+            self._conn.execute("DELETE FROM search_cache WHERE expires_at > 0 AND expires_at < ?", (now,))
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_db_entries,)
+            )
+        self._conn.commit()
+
+    def get(self, key: str, memory_only: bool = False) -> Optional[dict]:
+        """
+        查找缓存；memory_only 为 True 时只查内存且不计入统计（请求合并前的二次确认）
+        """
+        now = time.time()
+        with self._lock:
+            value = self._memory_get(key, now)
+            if memory_only:
+                return value
+            if value is not None:
+                self._stats["memory_hits"] += 1
+                return value
+
+            if self._conn is not None:
+                found = self._db_get(key, now)
+                if found is not None:
+                    value, expires_at = found
+                    self._memory_put(key, value, expires_at)
+                    self._stats["db_hits"] += 1
+                    return value
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key: str, value: dict) -> None:
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl > 0 else 0
+        with self._lock:
+            self._memory_put(key, value, expires_at)
+            if self._conn is not None:
+                self._db_put(key, value, expires_at, now)
+            self._stats["writes"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM search_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CircuitBreaker:
+    """
+    熔断器：closed（正常）-> 连续失败 failure_threshold 次 -> open（直接失败）
+    -> reset_timeout 秒后 half_open（只放行一个探测请求）-> 成功则 closed，失败则重新 open
+
+    Args:
+        failure_threshold: 连续失败多少次后熔断
+        reset_timeout: 熔断持续时间（秒）
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """是否允许发出请求"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probing = False
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"[search_gateway] 搜索服务连续失败 {self._failures} 次，熔断 {self.reset_timeout:g} 秒")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class SearchGateway:
+    """
+    Tavily 搜索网关：共享客户端 + 结果缓存 + 请求合并
+
+    Args:
+        api_key: Tavily API 密钥
+        api_base_url: Tavily 服务地址，为空时使用官方地址
+        pool_size: 连接池大小（同时进行的搜索请求数上限以内复用连接）
+        cache: 搜索结果缓存，为 None 时不缓存（仍然合并同时进行的相同查询）
+        breaker: 熔断器，为 None 时不熔断
+        max_attempts: 最多尝试次数（含第一次）
+        base_delay / max_delay: 指数退避的初始 / 最大间隔（秒）
+        deadline: 单次搜索（含重试）的总截止时间（秒）
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_base_url: Optional[str] = None,
+        pool_size: int = 10,
+        cache: Optional[SearchCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 4,
+        deadline: float = 15
+    ):
+        self.api_key = api_key
+        self.api_base_url = api_base_url or None
+        self.pool_size = pool_size
+        self.cache = cache
+        self.breaker = breaker
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self._client = None
+        self._client_lock = threading.Lock()
+        # {缓存键: 正在进行的请求}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "backend_calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "short_circuited": 0,
+            "deadline_exceeded": 0
+        }
+
+    def _get_client(self):
+        """懒加载共享的 TavilyClient（线程安全）"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from tavily import TavilyClient
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    try:
+                        # api_base_url / session 参数需要 tavily-python>=0.7.23
+                        self._client = TavilyClient(
+                            api_key=self.api_key, api_base_url=self.api_base_url, session=session
+                        )
+                    except Exception as e:
+                        session.close()
+                        raise SearchClientError(f"无法创建 TavilyClient（需要 tavily-python>=0.7.23）: {e}") from e
+        return self._client
+
+    def search(self, query: str, search_depth: str = "basic", max_results: int = 3, timeout: float = 60) -> dict:
+        """
+        执行搜索（优先使用缓存，相同查询同时只请求一次）
+
+        Returns:
+            Tavily 的响应（包含 results 列表）
+
+        Raises:
+            搜索失败时抛出 Tavily 客户端的异常，等待合并请求的调用方收到同一个异常；
+            熔断中抛出 SearchUnavailableError（缓存命中不受熔断影响）
+        """
+        key = make_search_key(query, search_depth, max_results)
+        with self._lock:
+            self._stats["requests"] += 1
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            # 上一个相同请求可能刚写入缓存并结束，再确认一次内存缓存
+            response = self.cache.get(key, memory_only=True) if self.cache is not None else None
+            if response is None:
+                if self.breaker is not None and not self.breaker.allow():
+                    with self._lock:
+                        self._stats["short_circuited"] += 1
+                    raise SearchUnavailableError("搜索服务熔断中")
+                with self._lock:
+                    self._stats["backend_calls"] += 1
+                try:
+                    response = self._get_client().search(
+                        query=query, search_depth=search_depth, max_results=max_results, timeout=timeout
+                    )
+                except Exception as e:
+                    # 参数 / 密钥错误说明服务可达，不计入熔断；客户端创建失败与服务状态无关
+                    if self.breaker is not None and is_retryable_error(e):
+                        self.breaker.record_failure()
+                    elif self.breaker is not None and not isinstance(e, SearchClientError):
+                        self.breaker.record_success()
+                    raise
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                if self.cache is not None:
+                    self.cache.put(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            if not isinstance(e, SearchUnavailableError):
+                with self._lock:
+                    self._stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """第 attempt 次失败后的等待时间：指数退避，乘以 [0.5, 1) 的随机抖动避免多个请求同时重试"""
+        return min(self.max_delay, self.base_delay * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+    def _next_delay(self, error: Exception, attempt: int, deadline_at: float) -> Optional[float]:
+        """
+        失败后是否重试：返回等待时间，不重试时返回 None
+        """
+        if isinstance(error, SearchUnavailableError) or not is_retryable_error(error):
+            return None
+        if attempt + 1 >= self.max_attempts:
+            return None
+        delay = self._backoff_delay(attempt)
+        if time.monotonic() + delay >= deadline_at:
+            return None
+        with self._lock:
+            self._stats["retries"] += 1
+        print(f"[search_gateway] 搜索失败（第 {attempt + 1} 次），{delay:.2f}s 后重试: {error}")
+        return delay
+
+    def _deadline_exceeded(self, query: str) -> SearchUnavailableError:
+        with self._lock:
+            self._stats["deadline_exceeded"] += 1
+        return SearchUnavailableError(f"搜索超过截止时间（{self.deadline:g} 秒）: {query}")
+
+    def search_with_retry(self, query: str, search_depth: str = "basic", max_results: int = 3) -> dict:
+        """
+        执行搜索，失败时按指数退避重试，总耗时不超过 deadline
+
+        Raises:
+            SearchUnavailableError: 熔断中或超过截止时间
+            其他异常：不可重试的错误，或重试次数用完后的最后一个错误
+        """
+        deadline_at = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise self._deadline_exceeded(query)
+            try:
+                return self.search(query, search_depth=search_depth, max_results=max_results, timeout=remaining)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, deadline_at)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def asearch(self, query: str, search_depth: str = "basic", max_results: int = 3) -> dict:
+        """
+        执行搜索（异步版本）：请求在线程池中执行，等待和退避不阻塞事件循环
+        """
+        deadline_at = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise self._deadline_exceeded(query)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(self.search, query, search_depth, max_results, remaining),
+                    timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                # 线程中的请求继续执行，完成后结果仍会写入缓存
+                raise self._deadline_exceeded(query)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, deadline_at)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def metrics(self) -> dict:
+        """
+        搜索统计（搜索次数按单次请求计，重试也计入）：命中率 = 缓存命中次数 / 搜索次数；节省率 = (缓存命中 + 合并) / 搜索次数
+        """
+        with self._lock:
+            metrics = dict(self._stats)
+            metrics["inflight"] = len(self._inflight)
+        cache_stats = self.cache.stats() if self.cache is not None else {}
+        metrics["memory_hits"] = cache_stats.get("memory_hits", 0)
+        metrics["db_hits"] = cache_stats.get("db_hits", 0)
+        metrics["cache_entries"] = cache_stats.get("memory_entries", 0)
+        hits = metrics["memory_hits"] + metrics["db_hits"]
+        requests = metrics["requests"]
+        metrics["hit_rate"] = round(hits / requests, 4) if requests else 0.0
+        metrics["saved_rate"] = round((hits + metrics["coalesced"]) / requests, 4) if requests else 0.0
+        metrics["breaker_state"] = self.breaker.state if self.breaker is not None else "disabled"
+        return metrics
+
+    def close(self) -> None:
+        """关闭连接池和缓存数据库连接"""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+# 全局实例（懒加载）
+_search_gateway: Optional[SearchGateway] = None
+_search_gateway_lock = threading.Lock()
+
+
+def get_search_gateway() -> SearchGateway:
+    """
+    获取全局搜索网关（单例模式）
+    """
+    global _search_gateway
+    if _search_gateway is None:
+        with _search_gateway_lock:
+            if _search_gateway is None:
+                cache = SearchCache(
+                    db_path=SEARCH_CACHE_DB_PATH or None,
+                    ttl=SEARCH_CACHE_TTL,
+                    max_memory_entries=SEARCH_CACHE_MAX_MEMORY_ENTRIES,
+                    max_db_entries=SEARCH_CACHE_MAX_DB_ENTRIES
+                ) if SEARCH_CACHE_ENABLED else None
+                _search_gateway = SearchGateway(
+                    api_key=TAVILY_API_KEY,
+                    api_base_url=TAVILY_API_BASE,
+                    pool_size=SEARCH_POOL_SIZE,
+                    cache=cache,
+                    breaker=CircuitBreaker(
+                        failure_threshold=SEARCH_BREAKER_FAILURE_THRESHOLD,
+                        reset_timeout=SEARCH_BREAKER_RESET_TIMEOUT
+                    ),
+                    max_attempts=SEARCH_MAX_ATTEMPTS,
+                    base_delay=SEARCH_RETRY_BASE_DELAY,
+                    max_delay=SEARCH_RETRY_MAX_DELAY,
+                    deadline=SEARCH_DEADLINE
+                )
+    return _search_gateway
+
+
+def search_web(query: str, search_depth: str = "basic", max_results: int = 3) -> dict:
+    """
+    通过全局搜索网关执行 Tavily 搜索（失败自动重试，熔断中或超过截止时间抛出 SearchUnavailableError）
+    """
+    return get_search_gateway().search_with_retry(query, search_depth=search_depth, max_results=max_results)
+
+
+async def asearch_web(query: str, search_depth: str = "basic", max_results: int = 3) -> dict:
+    """
+    通过全局搜索网关执行 Tavily 搜索（异步版本）
+    """
+    return await get_search_gateway().asearch(query, search_depth=search_depth, max_results=max_results)
+
+
+def get_search_metrics() -> dict:
+    """
+    获取搜索网关统计
+    """
+    return get_search_gateway().metrics()
+
+
+def close_search_gateway() -> None:
+    """
+    关闭搜索网关（在应用关闭时调用）
+    """
+    global _search_gateway
+    with _search_gateway_lock:
+        gateway, _search_gateway = _search_gateway, None
+    if gateway is not None:
+        gateway.close()
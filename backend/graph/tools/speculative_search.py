@@ -0,0 +1,276 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+下一轮面试题搜索预取
+出题节点生成第 N 轮问题后，在后台线程中提前执行第 N+1 轮的 search_interview_questions，
+候选人提交回答时出题节点直接使用预取的搜索结果，只剩最终结合简历出题的 LLM 调用
+
+- 搜索话题按轮次侧重点预测（与面试官 Agent 的提示词一致）
+- 预取任务 / 结果数量有上限，超出时取消最早的任务；结果超过有效期后丢弃
+- 会话删除、开始面试失败、应用关闭时取消对应的任务
+- get_speculation_metrics() 统计预取命中率
+"""
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Tuple
+
+from backend.config import (
+    SPECULATIVE_SEARCH_ENABLED,
+    SPECULATIVE_SEARCH_WORKERS,
+    SPECULATIVE_SEARCH_MAX_PENDING,
+    SPECULATIVE_SEARCH_TTL,
+    SPECULATIVE_SEARCH_WAIT
+)
+from backend.graph.tools.interviewer_tools import search_interview_questions
+
+
+# 各轮次的搜索话题（第 1 轮由开始面试时的 Agent 搜索，超过 3 轮时沿用最后一个）
+ROUND_TOPICS = {
+    2: "{position} 项目难点 面试题",
+    3: "{position} 软技能 HR 面试题"
+}
+
+
+def predict_topic(target_position: str, round_num: int) -> str:
+    """
+    预测第 round_num 轮的搜索话题
+    """
+    template = ROUND_TOPICS.get(round_num) or ROUND_TOPICS[max(ROUND_TOPICS)]
+    return template.format(position=target_position or "技术岗位")
+
+
+def _is_failed(result: str) -> bool:
+    return not result or result.startswith("搜索失败")
+
+
+class SpeculativeSearch:
+    """
+    预取任务管理器
+
+    Args:
+        max_workers: 预取线程数
+        max_pending: 同时保留的任务 / 结果上限
+        ttl: 结果有效期（秒）
+        wait_timeout: 取结果时等待未完成任务的最长时间（秒）
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 64, ttl: float = 1800, wait_timeout: float = 10):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # {(thread_id, round): (创建时间, 话题, Future)}，按创建顺序排列
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, str, Future]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics = {
+            "scheduled": 0,
+            "hits": 0,
+            "hits_waited": 0,
+            "misses": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "expired": 0,
+            "evicted": 0,
+            "cancelled": 0
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="speculative-search")
+        return self._executor
+
+    def _expire(self, now: float) -> None:
+        """丢弃过期的结果（调用方持有锁）"""
+        for key, (created_at, _, future) in list(self._entries.items()):
+            if now - created_at <= self.ttl:
+                break
+            del self._entries[key]
+            future.cancel()
+            self._metrics["expired"] += 1
+
+    def schedule(self, thread_id: str, round_num: int, target_position: str) -> bool:
+        """
+        后台预取第 round_num 轮的搜索结果
+
+        Returns:
+            是否提交了新任务
+        """
+        if not thread_id:
+            return False
+        key = (thread_id, round_num)
+        topic = predict_topic(target_position, round_num)
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            if key in self._entries:
+                return False
+            while len(self._entries) >= self.max_pending:
+                _, (_, _, oldest) = self._entries.popitem(last=False)
+                oldest.cancel()
+                self._metrics["evicted"] += 1
+            future = self._get_executor().submit(search_interview_questions.invoke, topic)
+            self._entries[key] = (now, topic, future)
+            self._metrics["scheduled"] += 1
+
+        print(f"[speculative_search] 预取第 {round_num} 轮搜索: {topic} (thread_id={thread_id})")
+        return True
+
+    def _pop(self, thread_id: str, round_num: int) -> Optional[Tuple[str, Future]]:
+        """取出指定轮次的任务，同一会话更早轮次的任务一并取消"""
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.pop((thread_id, round_num), None)
+            for key in [k for k in self._entries if k[0] == thread_id and k[1] < round_num]:
+                self._entries.pop(key)[2].cancel()
+                self._metrics["cancelled"] += 1
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            return entry[1], entry[2]
+
+    def _record_result(self, topic: str, result: Optional[str], waited: bool) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            if result is None:
+                self._metrics["timeouts"] += 1
+                return None
+            if _is_failed(result):
+                self._metrics["failed"] += 1
+                return None
+            self._metrics["hits"] += 1
+            if waited:
+                self._metrics["hits_waited"] += 1
+        return topic, result
+
+    def take(self, thread_id: str, round_num: int) -> Optional[Tuple[str, str]]:
+        """
+        取出预取的搜索结果（任务未完成时最多等待 wait_timeout 秒）
+
+        Returns:
+            (话题, 搜索结果)；未预取、超时或搜索失败时返回 None
+        """
+        entry = self._pop(thread_id, round_num)
+        if entry is None:
+            return None
+        topic, future = entry
+        waited = not future.done()
+        try:
+            result = future.result(timeout=self.wait_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            result = None
+        except Exception as e:
+            print(f"[speculative_search] 预取任务失败: {e}")
+            result = ""
+        return self._record_result(topic, result, waited)
+
+    async def atake(self, thread_id: str, round_num: int) -> Optional[Tuple[str, str]]:
+        """
+        取出预取的搜索结果（异步版本，等待时不阻塞事件循环）
+        """
+        entry = self._pop(thread_id, round_num)
+        if entry is None:
+            return None
+        topic, future = entry
+        waited = not future.done()
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            result = None
+        except Exception as e:
+            print(f"[speculative_search] 预取任务失败: {e}")
+            result = ""
+        return self._record_result(topic, result, waited)
+
+    def cancel(self, thread_id: str) -> int:
+        """
+        取消会话的所有预取任务，返回取消的数量
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == thread_id]
+            for key in keys:
+                self._entries.pop(key)[2].cancel()
+            self._metrics["cancelled"] += len(keys)
+        return len(keys)
+
+    def metrics(self) -> dict:
+        """
+        预取统计：命中率 = 命中次数 / 出题时查询预取结果的次数
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["pending"] = len(self._entries)
+        lookups = metrics["hits"] + metrics["misses"] + metrics["failed"] + metrics["timeouts"]
+        metrics["hit_rate"] = metrics["hits"] / lookups if lookups else 0.0
+        return metrics
+
+    def shutdown(self) -> None:
+        """取消所有任务并关闭线程池"""
+        with self._lock:
+            for _, _, future in self._entries.values():
+                future.cancel()
+            self._metrics["cancelled"] += len(self._entries)
+            self._entries.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 全局实例（线程池在第一次预取时才创建）
+_speculative_search = SpeculativeSearch(
+    max_workers=SPECULATIVE_SEARCH_WORKERS,
+    max_pending=SPECULATIVE_SEARCH_MAX_PENDING,
+    ttl=SPECULATIVE_SEARCH_TTL,
+    wait_timeout=SPECULATIVE_SEARCH_WAIT
+)
+
+
+def schedule_speculative_search(thread_id: str, round_num: int, target_position: str) -> bool:
+    """
+    预取第 round_num 轮的搜索结果（SPECULATIVE_SEARCH_ENABLED 关闭时不执行）
+    """
+    if not SPECULATIVE_SEARCH_ENABLED:
+        return False
+    return _speculative_search.schedule(thread_id, round_num, target_position)
+
+
+def take_speculative_search(thread_id: str, round_num: int) -> Optional[Tuple[str, str]]:
+    """
+    取出第 round_num 轮预取的 (话题, 搜索结果)，没有可用结果时返回 None
+    """
+    if not SPECULATIVE_SEARCH_ENABLED or not thread_id or round_num < min(ROUND_TOPICS):
+        return None
+    return _speculative_search.take(thread_id, round_num)
+
+
+async def atake_speculative_search(thread_id: str, round_num: int) -> Optional[Tuple[str, str]]:
+    """
+    取出第 round_num 轮预取的搜索结果（异步版本）
+    """
+    if not SPECULATIVE_SEARCH_ENABLED or not thread_id or round_num < min(ROUND_TOPICS):
+        return None
+    return await _speculative_search.atake(thread_id, round_num)
+
+
+def cancel_speculative_search(thread_id: str) -> int:
+    """
+    取消会话的所有预取任务
+    """
+    return _speculative_search.cancel(thread_id)
+
+
+def get_speculation_metrics() -> dict:
+    """
+    获取预取统计
+    """
+    return _speculative_search.metrics()
+
+
+def shutdown_speculative_search() -> None:
+    """
+    关闭预取线程池（在应用关闭时调用）
+    """
+    _speculative_search.shutdown()
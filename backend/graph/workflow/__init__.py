@@ -1,3 +1,33 @@
 ﻿from .interview_workflow import create_interview_graph
+from .graph_registry import (
+    get_interview_graph,
+    get_async_interview_graph,
+    invalidate_compiled_graph,
+    warm_up_graphs,
+    awarm_up_graphs
+)
+from .interview_executor import (
+    ainvoke_interview,
+    aget_interview_state,
+    aupdate_interview_state,
+    astream_interview,
+    ahas_interview_session,
+    answer_command,
+    ainvoke_answer
+)
 
-__all__ = ["create_interview_graph"]
+__all__ = [
+    "create_interview_graph",
+    "get_interview_graph",
+    "get_async_interview_graph",
+    "invalidate_compiled_graph",
+    "warm_up_graphs",
+    "awarm_up_graphs",
+    "ainvoke_interview",
+    "aget_interview_state",
+    "aupdate_interview_state",
+    "astream_interview",
+    "ahas_interview_session",
+    "answer_command",
+    "ainvoke_answer"
+]
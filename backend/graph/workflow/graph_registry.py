@@ -0,0 +1,96 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+编译图注册表 - 进程级缓存已编译的工作流
+避免在每个 HTTP 请求中重复构建 StateGraph 并执行 compile()
+
+缓存键由"工作流定义版本号 + 构建函数 + checkpointer 实例"组成，
+只有当工作流定义或 checkpointer 发生变化时才会重新编译。
+"""
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from backend.config import INTERVIEW_EXECUTION_MODE
+from backend.graph.checkpoint import get_checkpointer, get_async_checkpointer
+from backend.graph.workflow.interview_workflow import (
+    GRAPH_DEFINITION_VERSION,
+    create_interview_graph
+)
+
+# 已编译的图：{名称: (缓存键, 编译图)}
+_compiled_graphs: Dict[str, Tuple[tuple, Any]] = {}
+
+# 编译锁：保证多线程并发请求时同一张图只编译一次
+_registry_lock = threading.Lock()
+
+
+def get_compiled_graph(name: str, builder: Callable[[Any], Any], checkpointer: Any, version: int = GRAPH_DEFINITION_VERSION):
+    """
+    获取缓存的编译图，缓存失效时重新构建（线程安全）
+
+    Args:
+        name: 图名称（注册表中的唯一标识）
+        builder: 构建函数，接收 checkpointer 返回编译后的图
+        checkpointer: 图使用的 checkpointer 实例
+        version: 工作流定义版本号
+    """
+    key = (version, builder, id(checkpointer))
+
+    # 快速路径：命中缓存时无需加锁
+    cached = _compiled_graphs.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _registry_lock:
+        # 双重检查：等待锁期间可能已被其他线程编译
+        cached = _compiled_graphs.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        print(f"[graph_registry] 编译工作流: {name} (version={version})")
+        graph = builder(checkpointer)
+        _compiled_graphs[name] = (key, graph)
+        return graph
+
+
+def invalidate_compiled_graph(name: str = None) -> None:
+    """
+    使缓存的编译图失效，下次获取时重新编译
+
+    Args:
+        name: 图名称，为空时清空所有缓存
+    """
+    with _registry_lock:
+        if name is None:
+            _compiled_graphs.clear()
+        else:
+            _compiled_graphs.pop(name, None)
+
+
+def get_interview_graph():
+    """
+    获取缓存的面试工作流编译图（请求路径上使用）
+    """
+    return get_compiled_graph("interview", create_interview_graph, get_checkpointer())
+
+
+def get_async_interview_graph():
+    """
+    获取使用异步 checkpointer 编译的面试工作流（必须在事件循环中调用）
+    配合 ainvoke / aget_state / aupdate_state 使用
+    """
+    return get_compiled_graph("interview_async", create_interview_graph, get_async_checkpointer())
+
+
+def warm_up_graphs() -> None:
+    """
+    预编译工作流（在应用启动时调用）
+    """
+    get_interview_graph()
+
+
+async def awarm_up_graphs() -> None:
+    """
+    预编译异步工作流（在事件循环启动后调用）
+    """
+    if INTERVIEW_EXECUTION_MODE == "async":
+        get_async_interview_graph()
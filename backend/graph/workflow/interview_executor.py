@@ -0,0 +1,192 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+面试工作流执行层
+为路由层提供统一的异步执行接口，根据 INTERVIEW_EXECUTION_MODE 选择执行方式：
+- async：使用异步 checkpointer 编译的图，调用 ainvoke / aget_state / aupdate_state
+- sync：使用同步图，将 invoke / get_state / update_state 放到线程池执行
+
+两种模式都不会在事件循环中执行阻塞的 LLM / 搜索 / 数据库调用
+CHECKPOINT_COMPACTION_MODE=inline 时，每次执行后压缩当前会话的 checkpoint
+
+提交回答使用 ainvoke_answer：以 Command(resume=回答) 从 answer 中断点恢复，
+一次执行完成"写入回答 -> 检查是否结束 -> 出下一题 / 生成报告"
+
+astream_interview 提供流式执行（供 SSE 接口使用），把 astream_events 转换为
+节点 / 工具状态事件和问题 / 报告的 token 事件
+"""
+import asyncio
+from typing import Any, AsyncIterator, Union
+
+from langgraph.types import Command
+
+from backend.config import INTERVIEW_EXECUTION_MODE, CHECKPOINT_COMPACTION_MODE
+from backend.graph.checkpoint import acompact_thread, get_checkpointer, get_async_checkpointer
+from backend.graph.workflow.graph_registry import get_interview_graph, get_async_interview_graph
+
+
+def _is_async_mode() -> bool:
+    return INTERVIEW_EXECUTION_MODE == "async"
+
+
+async def ainvoke_interview(graph_input: Union[dict, Command, None], config: dict) -> Any:
+    """
+    执行面试工作流直到下一个中断点或结束
+
+    Args:
+        graph_input: 初始状态；为 None 时从上次中断处恢复；为 Command 时携带恢复值
+        config: 包含 thread_id 的运行配置
+    """
+    if _is_async_mode():
+        result = await get_async_interview_graph().ainvoke(graph_input, config)
+    else:
+        result = await asyncio.to_thread(get_interview_graph().invoke, graph_input, config)
+
+    if CHECKPOINT_COMPACTION_MODE == "inline":
+        await acompact_thread(config["configurable"]["thread_id"])
+    return result
+
+
+async def aget_interview_state(config: dict) -> Any:
+    """
+    获取会话的当前状态快照
+    """
+    if _is_async_mode():
+        return await get_async_interview_graph().aget_state(config)
+    return await asyncio.to_thread(get_interview_graph().get_state, config)
+
+
+async def aupdate_interview_state(config: dict, values: dict) -> Any:
+    """
+    更新会话状态
+    """
+    if _is_async_mode():
+        return await get_async_interview_graph().aupdate_state(config, values)
+    return await asyncio.to_thread(get_interview_graph().update_state, config, values)
+
+
+async def ahas_interview_session(config: dict) -> bool:
+    """
+    会话是否存在（只读取最新 checkpoint，不构建状态快照）
+    """
+    if _is_async_mode():
+        return await get_async_checkpointer().aget_tuple(config) is not None
+    return await asyncio.to_thread(get_checkpointer().get_tuple, config) is not None
+
+
+def answer_command(answer: str) -> Command:
+    """
+    构建提交回答的恢复指令：answer 节点通过 interrupt() 取得回答
+    """
+    return Command(resume=answer)
+
+
+async def ainvoke_answer(answer: str, config: dict) -> Any:
+    """
+    提交回答并推进工作流：从 answer 中断点恢复，执行到下一个中断点（下一题）或结束（报告）
+
+    调用前请用 ahas_interview_session 确认会话存在，否则工作流会从头执行
+    """
+    return await ainvoke_interview(answer_command(answer), config)
+
+
+# 流式执行时各节点的状态提示（answer / check_finish 只修改状态，不提示）
+NODE_STATUS_MESSAGES = {
+    "parse_resume": "📄 正在解析简历...",
+    "interviewer_agent": "🤔 面试官正在出题...",
+    "feedback_agent": "📚 正在分析薄弱点并搜索学习资源...",
+    "generate_report": "📝 正在生成面试报告..."
+}
+
+# 工具调用的状态提示
+TOOL_STATUS_MESSAGES = {
+    "search_interview_questions": "🌐 正在联网搜索面试题...",
+    "search_learning_resources": "🌐 正在搜索学习资源..."
+}
+
+# 需要逐 token 输出的节点：{节点名: token 类型}
+TOKEN_TARGETS = {
+    "interviewer_agent": "question",
+    "generate_report": "report"
+}
+
+
+def _top_level_node(event: dict) -> str:
+    """
+    获取事件所属的工作流节点（Agent 内部的子节点归属到外层节点）
+    """
+    metadata = event.get("metadata", {})
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    if checkpoint_ns:
+        return checkpoint_ns.split(":", 1)[0]
+    return metadata.get("langgraph_node", "")
+
+
+def _final_text(target: str, output: Any) -> str:
+    """
+    从节点输出中取出最终的问题 / 报告文本
+    """
+    if not isinstance(output, dict):
+        return ""
+    if target == "report":
+        return output.get("report", "") or ""
+    history = output.get("history") or []
+    return history[-1].get("question", "") if history else ""
+
+
+async def astream_interview(graph_input: Union[dict, Command, None], config: dict) -> AsyncIterator[dict]:
+    """
+    流式执行面试工作流直到下一个中断点或结束
+
+    astream_events 需要异步 checkpointer，因此两种执行模式都使用异步编译图
+    （异步 checkpointer 与同步 checkpointer 读写同一个数据库）
+
+    Yields:
+        {"type": "status", "node": 节点名, "content": 提示文本}（工具结束时 content 为空）
+        {"type": "token", "target": "question" | "report", "content": 文本片段}
+        {"type": "result", "content": 执行结束时的状态}（最后一个事件，不需要再读取状态快照）
+    """
+    streamed = {target: False for target in TOKEN_TARGETS.values()}
+
+    result = None
+    async for event in get_async_interview_graph().astream_events(graph_input, config, version="v2"):
+        kind = event["event"]
+        name = event.get("name", "")
+        metadata = event.get("metadata", {})
+
+        # 根图结束：输出即为执行结束时的状态
+        if kind == "on_chain_end" and not event.get("parent_ids"):
+            result = event["data"].get("output")
+            continue
+
+        # 工作流节点开始 / 结束（Agent 内部的同名子节点不计入）
+        if kind in ("on_chain_start", "on_chain_end") and name in NODE_STATUS_MESSAGES and metadata.get("langgraph_node") == name:
+            if kind == "on_chain_start":
+                yield {"type": "status", "node": name, "content": NODE_STATUS_MESSAGES[name]}
+            elif name in TOKEN_TARGETS and not streamed[TOKEN_TARGETS[name]]:
+                # LLM 缓存命中或降级处理时没有流式 token，整段输出
+                target = TOKEN_TARGETS[name]
+                text = _final_text(target, event["data"].get("output"))
+                if text:
+                    yield {"type": "token", "target": target, "content": text}
+
+        elif kind == "on_tool_start":
+            status = TOOL_STATUS_MESSAGES.get(name, f"🛠️ 正在使用工具: {name}")
+            yield {"type": "status", "node": _top_level_node(event), "content": status}
+
+        elif kind == "on_tool_end":
+            yield {"type": "status", "node": _top_level_node(event), "content": ""}
+
+        elif kind == "on_chat_model_stream":
+            node = _top_level_node(event)
+            target = TOKEN_TARGETS.get(node)
+            # 跳过 ReAct Agent 工具内部的 LLM 调用（如搜索结果提炼）
+            if target is None or metadata.get("langgraph_node") == "tools":
+                continue
+            chunk = event["data"]["chunk"]
+            if chunk.content and not getattr(chunk, "tool_call_chunks", None):
+                streamed[target] = True
+                yield {"type": "token", "target": target, "content": chunk.content}
+
+    if CHECKPOINT_COMPACTION_MODE == "inline":
+        await acompact_thread(config["configurable"]["thread_id"])
+    yield {"type": "result", "content": result or {}}
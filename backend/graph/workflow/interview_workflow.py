@@ -4,40 +4,50 @@
 用于定义面试系统的整体流程和节点间的流转逻辑
 """
 from langgraph.graph import StateGraph, END, START
-import sqlite3
-from langgraph.checkpoint.sqlite import SqliteSaver
+from langchain_core.runnables import RunnableLambda
 from backend.graph.state import InterviewState
+from backend.graph.checkpoint import get_checkpointer
 from backend.graph.nodes import (
     parse_resume_node,       # 解析简历节点
     ask_question_node,       # 出题节点
     answer_node,             # 回答节点（中断点）
     check_finish_node,       # 检查是否结束节点
     feedback_node,           # 反馈节点（Feedback Agent）
-    generate_report_node     # 生成报告节点
+    generate_report_node,    # 生成报告节点
+    aparse_resume_node,      # 以下为对应的异步版本
+    aask_question_node,
+    afeedback_node,
+    agenerate_report_node
 )
 
-# 全局 checkpointer 实例，确保所有请求共享同一个状态存储 (使用 SQLite 持久化)
-# check_same_thread=False 允许在多线程环境(FastAPI)中使用同一个连接
-# 将数据库文件存放在 checkpoints-sqlite 目录下
-_global_db_connection = sqlite3.connect("checkpoints-sqlite/checkpoints.sqlite", check_same_thread=False)
-_global_checkpointer = SqliteSaver(_global_db_connection)
+# 工作流定义版本号：修改节点、边或中断点后需递增，使已缓存的编译图失效
+GRAPH_DEFINITION_VERSION = 3
 
 
-def create_interview_graph():
+def create_interview_graph(checkpointer=None):
     """
     创建面试工作流图
+    
+    注意：每次调用都会重新构建 StateGraph 并执行 compile()，开销较大。
+    请求路径上请使用 graph_registry.get_interview_graph() 获取缓存的编译图。
+    
+    每个节点同时注册同步和异步实现：invoke() 走同步版本，ainvoke() 走异步版本，
+    因此同一份定义既可以配合同步 checkpointer，也可以配合异步 checkpointer 编译。
+    
+    Args:
+        checkpointer: 可选的 checkpointer，默认使用全局 checkpointer（由 CHECKPOINTER_BACKEND 配置）
     """
     # 创建状态图：基于 InterviewState 数据模型
     workflow = StateGraph(InterviewState)
     
     # ========== 添加节点 ==========
     # 每个节点对应一个业务功能，接收 state 并返回更新后的 state
-    workflow.add_node("parse_resume", parse_resume_node)             # 简历解析节点
-    workflow.add_node("interviewer_agent", ask_question_node)        # 面试官 Agent
-    workflow.add_node("answer", answer_node)                         # 用户回答节点
-    workflow.add_node("check_finish", check_finish_node)             # 检查是否完成所有轮次
-    workflow.add_node("feedback_agent", feedback_node)               # 搜索学习资源节点（Feedback Agent）
-    workflow.add_node("generate_report", generate_report_node)       # 生成最终报告节点
+    workflow.add_node("parse_resume", RunnableLambda(parse_resume_node, afunc=aparse_resume_node))            # 简历解析节点
+    workflow.add_node("interviewer_agent", RunnableLambda(ask_question_node, afunc=aask_question_node))       # 面试官 Agent
+    workflow.add_node("answer", answer_node)                                                                  # 用户回答节点
+    workflow.add_node("check_finish", check_finish_node)                                                      # 检查是否完成所有轮次
+    workflow.add_node("feedback_agent", RunnableLambda(feedback_node, afunc=afeedback_node))                  # 搜索学习资源节点（Feedback Agent）
+    workflow.add_node("generate_report", RunnableLambda(generate_report_node, afunc=agenerate_report_node))   # 生成最终报告节点
         
 
     # ========== 添加固定边（确定性流转）==========
@@ -77,6 +87,6 @@ def create_interview_graph():
     
     # 将定义好的工作流编译成可执行的图对象，并设置中断点
     return workflow.compile(
-        checkpointer=_global_checkpointer,
+        checkpointer=checkpointer or get_checkpointer(),
         interrupt_before=["answer"]  # 中断点：在用户回答前中断，等待用户提交答案
     )
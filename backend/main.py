@@ -14,6 +14,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from backend.routes import interview_router, auth_router
 from backend.routes.consultant_routes import router as customer_service_router
 from backend.config import init_db
+from backend.graph.workflow import warm_up_graphs, awarm_up_graphs
+from backend.graph.checkpoint import (
+    aclose_async_checkpointer,
+    start_background_compaction,
+    stop_background_compaction,
+    start_background_gc,
+    stop_background_gc
+)
+from backend.graph.tools import shutdown_speculative_search, close_search_gateway
+from backend.utils.pdf_service import shutdown_pdf_service
+from backend.utils.consultant_memory import stop_summary_updates
 
 # 创建 FastAPI 应用
 app = FastAPI(
@@ -42,6 +53,29 @@ app.include_router(customer_service_router)  # 新增：智能客服路由
 # 初始化数据库（确保用户表存在）
 init_db()
 
+# 预编译面试工作流（进程内缓存，后续请求直接复用）
+warm_up_graphs()
+
+
+@app.on_event("startup")
+async def on_startup():
+    """应用启动：在事件循环中预编译异步工作流，按配置启动 checkpoint 后台压缩和孤儿回收"""
+    await awarm_up_graphs()
+    start_background_compaction()
+    start_background_gc()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """应用关闭：停止后台任务，释放异步 checkpointer 和搜索网关连接"""
+    await stop_background_compaction()
+    await stop_background_gc()
+    await stop_summary_updates()
+    shutdown_speculative_search()
+    close_search_gateway()
+    await aclose_async_checkpointer()
+    shutdown_pdf_service()
+
 # 挂载前端静态文件目录 (放在最后，确保不遮挡 API 路由)
 frontend_path = project_root / "frontend"
 app.mount("/", StaticFiles(directory=str(frontend_path), html=True), name="frontend")
@@ -5,6 +5,10 @@
 from .user import User
 from .interview_record import InterviewRecord
 from .consultant_record import ConsultantRecord
+from .consultant_message import ConsultantMessage
+from .consultant_memory import ConsultantMemory
+from .checkpoint_record import CheckpointRecord, CheckpointWriteRecord
+from .resume_cache import ResumeCache
 from .schemas import (
     SubmitAnswerRequest,
     StartInterviewResponse,
@@ -18,6 +22,11 @@ __all__ = [
     "User",
     "InterviewRecord",
     "ConsultantRecord",
+    "ConsultantMessage",
+    "ConsultantMemory",
+    "CheckpointRecord",
+    "CheckpointWriteRecord",
+    "ResumeCache",
     "SubmitAnswerRequest",
     "StartInterviewResponse",
     "InterviewStatusResponse",
@@ -0,0 +1,64 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+LangGraph Checkpoint 模型（数据库存储版本）
+供 SQLAlchemyCheckpointSaver 使用，使多个 worker / 多台主机共享面试工作流状态
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, LargeBinary, DateTime
+from sqlalchemy.dialects.mysql import LONGBLOB
+
+from backend.config import Base
+
+# MySQL 的 BLOB 最大 64KB，checkpoint 包含完整简历和问答记录，需使用 LONGBLOB
+BlobType = LargeBinary().with_variant(LONGBLOB(), "mysql")
+
+
+class CheckpointRecord(Base):
+    """
+    Checkpoint 表（每个 superstep 的完整状态快照）
+    联合主键 (thread_id, checkpoint_ns, checkpoint_id) 同时作为"按会话取最新 checkpoint"的索引
+
+    字段：
+        thread_id / checkpoint_ns / checkpoint_id: 联合主键
+        parent_checkpoint_id: 父 checkpoint ID
+        type: 序列化类型
+        checkpoint: 序列化后的 checkpoint
+        checkpoint_metadata: checkpoint 元数据（JSON）
+        created_at: 创建时间
+    """
+
+    __tablename__ = "checkpoints"
+
+    thread_id = Column(String(64), primary_key=True, nullable=False, comment="会话ID")
+    checkpoint_ns = Column(String(255), primary_key=True, nullable=False, default="", comment="命名空间（子图）")
+    checkpoint_id = Column(String(64), primary_key=True, nullable=False, comment="Checkpoint ID（单调递增）")
+    parent_checkpoint_id = Column(String(64), nullable=True, comment="父 Checkpoint ID")
+    type = Column(String(32), nullable=True, comment="序列化类型")
+    checkpoint = Column(BlobType, nullable=True, comment="序列化后的 checkpoint")
+    checkpoint_metadata = Column("metadata", BlobType, nullable=True, comment="元数据（JSON）")
+    created_at = Column(DateTime, default=datetime.now, nullable=False, comment="创建时间")
+
+
+class CheckpointWriteRecord(Base):
+    """
+    Checkpoint 中间写入表（pending writes）
+    联合主键前缀 (thread_id, checkpoint_ns, checkpoint_id) 用于按 checkpoint 批量加载
+
+    字段：
+        thread_id / checkpoint_ns / checkpoint_id / task_id / idx: 联合主键
+        task_path: 任务路径
+        channel: 写入的通道
+        type / value: 序列化类型与内容
+    """
+
+    __tablename__ = "checkpoint_writes"
+
+    thread_id = Column(String(64), primary_key=True, nullable=False, comment="会话ID")
+    checkpoint_ns = Column(String(255), primary_key=True, nullable=False, default="", comment="命名空间（子图）")
+    checkpoint_id = Column(String(64), primary_key=True, nullable=False, comment="Checkpoint ID")
+    task_id = Column(String(64), primary_key=True, nullable=False, comment="任务ID")
+    idx = Column(Integer, primary_key=True, nullable=False, comment="写入序号")
+    task_path = Column(String(255), nullable=False, default="", comment="任务路径")
+    channel = Column(String(255), nullable=False, comment="通道名称")
+    type = Column(String(32), nullable=True, comment="序列化类型")
+    value = Column(BlobType, nullable=True, comment="序列化后的值")
@@ -0,0 +1,34 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话记忆模型
+每个会话一行（与 consultant_records 一对一），保存较早对话的滚动摘要
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey
+
+from backend.config import Base
+
+
+class ConsultantMemory(Base):
+    """
+    顾问对话记忆表
+
+    字段：
+        thread_id: 主键，外键（关联 consultant_records 表）
+        summary: 较早对话的滚动摘要
+        summarized_seq: 摘要已覆盖的消息序号上界（seq < summarized_seq 的消息已并入摘要）
+        updated_at: 更新时间
+    """
+
+    __tablename__ = "consultant_memories"
+
+    thread_id = Column(
+        String(64),
+        ForeignKey("consultant_records.thread_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        comment="会话ID（外键）"
+    )
+    summary = Column(Text, nullable=False, default="", comment="较早对话的滚动摘要")
+    summarized_seq = Column(Integer, nullable=False, default=0, comment="摘要已覆盖的消息序号上界")
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False, comment="更新时间")
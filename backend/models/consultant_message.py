@@ -0,0 +1,42 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话消息模型
+每条消息一行，追加写入；联合主键 (thread_id, seq) 同时作为"按会话取最近 K 条消息"的索引
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, JSON
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+
+from backend.config import Base
+
+# MySQL 的 TEXT 最大 64KB，AI 的长回答需使用 MEDIUMTEXT
+ContentType = Text().with_variant(MEDIUMTEXT(), "mysql")
+
+
+class ConsultantMessage(Base):
+    """
+    顾问对话消息表
+
+    字段：
+        thread_id: 联合主键，外键（关联 consultant_records 表）
+        seq: 联合主键，消息在会话中的序号（从 0 开始递增）
+        role: 角色（human / ai）
+        content: 消息内容
+        tools_used: 本轮使用的工具（只有 AI 消息记录，JSON 格式）
+        created_at: 创建时间
+    """
+
+    __tablename__ = "consultant_messages"
+
+    thread_id = Column(
+        String(64),
+        ForeignKey("consultant_records.thread_id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+        comment="会话ID（外键）"
+    )
+    seq = Column(Integer, primary_key=True, nullable=False, autoincrement=False, comment="消息序号")
+    role = Column(String(16), nullable=False, comment="角色（human / ai）")
+    content = Column(ContentType, nullable=False, comment="消息内容")
+    tools_used = Column(JSON, nullable=True, comment="使用的工具（JSON格式）")
+    created_at = Column(DateTime, default=datetime.now, nullable=False, comment="创建时间")
@@ -17,7 +17,8 @@ class ConsultantRecord(Base):
         thread_id: 主键，会话ID（与面试记录保持一致的命名）
         user_name: 外键，用户名（关联 users 表）
         title: 会话标题（从第一条用户消息提取）
-        messages: 对话历史（JSON格式）
+        messages: 旧版对话历史（JSON格式），新消息写入 consultant_messages 表，
+                  旧记录由 migrate_consultant_messages.py 迁移（或第一次访问时自动迁移）后清空
         created_at: 创建时间
         updated_at: 更新时间
     """
@@ -33,7 +34,7 @@ class ConsultantRecord(Base):
     # 会话标题
     title = Column(String(100), nullable=False, default="新咨询会话", comment="会话标题")
     
-    # 对话历史（JSON格式）
+    # 旧版对话历史（JSON格式，迁移后为空列表）
     # 格式: [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}, ...]
     messages = Column(JSON, nullable=False, default=list, comment="对话历史（JSON格式）")
     
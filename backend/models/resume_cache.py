@@ -0,0 +1,34 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+简历解析结果缓存模型
+按简历文件内容哈希保存 LLM 提取结果，相同文件再次上传时直接复用
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, Integer, BigInteger
+
+from backend.config import Base
+
+
+class ResumeCache(Base):
+    """
+    简历解析结果表
+
+    字段：
+        content_hash: 主键，简历文件内容的 SHA-256
+        resume_text: LLM 提取的简历关键信息
+        target_position: LLM 提取的目标岗位
+        file_size: 文件大小（字节）
+        hit_count: 命中次数
+        created_at: 创建时间
+        last_used_at: 最近使用时间
+    """
+
+    __tablename__ = "resume_cache"
+
+    content_hash = Column(String(64), primary_key=True, nullable=False, comment="文件内容哈希（SHA-256）")
+    resume_text = Column(Text, nullable=False, comment="简历关键信息")
+    target_position = Column(String(255), nullable=False, comment="目标岗位")
+    file_size = Column(BigInteger, nullable=False, default=0, comment="文件大小（字节）")
+    hit_count = Column(Integer, nullable=False, default=0, comment="命中次数")
+    created_at = Column(DateTime, default=datetime.now, nullable=False, comment="创建时间")
+    last_used_at = Column(DateTime, default=datetime.now, nullable=False, comment="最近使用时间")
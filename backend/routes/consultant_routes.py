@@ -4,25 +4,44 @@
 支持对话记忆和历史记录存储
 """
 import uuid
+import asyncio
 from fastapi import APIRouter, HTTPException, Header, Depends
 from sqlalchemy.orm import Session
 from typing import Optional
-from backend.graph.agents.consultant_agent import get_consultant_agent
-from langchain_core.messages import HumanMessage, AIMessage
+from backend.graph.agents.consultant_agent import (
+    get_consultant_agent,
+    retrieve_fast_path_context,
+    astream_grounded_answer,
+    lookup_cached_answer,
+    store_cached_answer
+)
+from langchain_core.messages import HumanMessage
 from backend.models.schemas import (
     ChatRequest, 
     ChatResponse,
     ConsultantRecordListResponse,
     ConsultantRecordDetailResponse
 )
-from backend.config import SessionLocal
+from backend.config import SessionLocal, CONSULTANT_FAST_PATH_ENABLED
 from backend.models import ConsultantRecord
+from backend.utils.consultant_store import (
+    load_messages,
+    append_messages,
+    delete_messages
+)
+from backend.utils.consultant_memory import (
+    load_history_messages,
+    schedule_summary_update,
+    delete_memory
+)
 from fastapi.responses import StreamingResponse
 import json
-from datetime import datetime
 
 router = APIRouter(prefix="/api/customer-service", tags=["customer-service"])
 
+# 回放缓存答案时每个 token 事件的字符数（与模型流式输出的粒度接近）
+ANSWER_REPLAY_CHUNK_SIZE = 4
+
 
 def get_db():
     """获取数据库会话"""
@@ -76,10 +95,7 @@ async def chat_with_agent_stream(
     async def event_generator():
         db = SessionLocal()
         try:
-            # 获取 Agent（无记忆版本）
-            agent = await get_consultant_agent()
-            
-            # 手动记忆管理：从数据库加载最近2轮对话作为上下文
+            # 手动记忆管理：从数据库加载较早对话的摘要 + token 预算内的最近消息作为上下文
             history_messages = []
             
             if request.thread_id:
@@ -90,16 +106,9 @@ async def chat_with_agent_stream(
                         ConsultantRecord.user_name == user_name
                     ).first()
                     
-                    if record and record.messages:
-                        # 取最后2轮对话（4条消息：用户+AI+用户+AI）
-                        recent_messages = record.messages[-4:] if len(record.messages) > 4 else record.messages
-                        
-                        # 转换为 LangChain 消息格式
-                        for msg in recent_messages:
-                            if msg['role'] == 'human':
-                                history_messages.append(HumanMessage(content=msg['content']))
-                            elif msg['role'] == 'ai':
-                                history_messages.append(AIMessage(content=msg['content']))
+                    if record:
+                        # 已转换为 LangChain 消息格式（摘要为 SystemMessage），总长度不超过 token 预算
+                        history_messages = load_history_messages(db, record)
                         
                         print(f"[Consultant] 加载历史上下文: {len(history_messages)} 条消息")
                 except Exception as e:
@@ -122,54 +131,81 @@ async def chat_with_agent_stream(
             tools_used = []  # 记录本轮对话使用的工具
             event_count = 0
             
-            # 使用 astream_events 监听流式事件（不传 config，无自动记忆）
-            async for event in agent.astream_events(
-                {"messages": full_messages},  # 手动传入完整消息历史
-                version="v2"
-            ):
-                kind = event["event"]
-                event_count += 1
+            # 语义答案缓存：只用于没有历史上下文的问题（有上下文时同一句话可能指代不同的内容）
+            use_answer_cache = not history_messages
+            cached_answer = await lookup_cached_answer(request.message) if use_answer_cache else None
+            
+            # 快速路径：先直接检索知识库，高置信命中时只调用一次 LLM 生成回答，省去 Agent 决定调用工具的那一轮
+            fast_path_context = None
+            if cached_answer is None and CONSULTANT_FAST_PATH_ENABLED:
+                fast_path_context = await retrieve_fast_path_context(request.message)
+            
+            if cached_answer is not None:
+                # 把缓存的答案按 token 事件分段回放，前端与实时生成的回答没有区别
+                tools_used = cached_answer["tools_used"]
+                answer = cached_answer["answer"]
+                for i in range(0, len(answer), ANSWER_REPLAY_CHUNK_SIZE):
+                    content = answer[i:i + ANSWER_REPLAY_CHUNK_SIZE]
+                    full_response += content
+                    yield f"data: {json.dumps({'type': 'token', 'content': content}, ensure_ascii=False)}\n\n"
+                    await asyncio.sleep(0)
+            elif fast_path_context is not None:
+                tools_used.append("knowledge_base")
+                async for content in astream_grounded_answer(full_messages, fast_path_context):
+                    full_response += content
+                    yield f"data: {json.dumps({'type': 'token', 'content': content}, ensure_ascii=False)}\n\n"
+            else:
+                # 检索结果不够可信：使用完整 Agent（无记忆版本）
+                agent = await get_consultant_agent()
+                
+                # 使用 astream_events 监听流式事件（不传 config，无自动记忆）
+                async for event in agent.astream_events(
+                    {"messages": full_messages},  # 手动传入完整消息历史
+                    version="v2"
+                ):
+                    kind = event["event"]
+                    event_count += 1
                 
-                # 监听 LLM 的流式输出
-                if kind == "on_chat_model_stream":
-                    chunk = event["data"]["chunk"]
-                    if chunk.content:
-                        content = chunk.content
-                        # 过滤工具调用相关的内容
-                        is_tool_marker = (
-                            '<tool_call>' in content or 
-                            '</tool_call>' in content or
-                            (len(content.strip()) == 1 and content.strip() in ['}', '<', '>', '/'])
-                        )
+                    # 监听 LLM 的流式输出
+                    if kind == "on_chat_model_stream":
+                        chunk = event["data"]["chunk"]
+                        if chunk.content:
+                            content = chunk.content
+                            # 过滤工具调用相关的内容
+                            is_tool_marker = (
+                                '<tool_call>' in content or 
+                                '</tool_call>' in content or
+                                (len(content.strip()) == 1 and content.strip() in ['}', '<', '>', '/'])
+                            )
                         
-                        if not is_tool_marker:
-                            full_response += content
-                            yield f"data: {json.dumps({'type': 'token', 'content': content}, ensure_ascii=False)}\n\n"
+                            if not is_tool_marker:
+                                full_response += content
+                                yield f"data: {json.dumps({'type': 'token', 'content': content}, ensure_ascii=False)}\n\n"
                 
-                # 监听工具调用开始
-                elif kind == "on_tool_start":
-                    tool_name = event["name"]
-                    print(f"[Consultant] 🛠️ Consultant Agent 正在调用工具: {tool_name}")
+                    # 监听工具调用开始
+                    elif kind == "on_tool_start":
+                        tool_name = event["name"]
+                        print(f"[Consultant] 🛠️ Consultant Agent 正在调用工具: {tool_name}")
                     
-                    # 记录工具使用
-                    if "knowledge" in tool_name.lower():
-                        if "knowledge_base" not in tools_used:
-                            tools_used.append("knowledge_base")
-                        status_msg = "🔍 正在搜索知识库..."
-                    elif "tavily" in tool_name.lower() or "search" in tool_name.lower():
-                        if "tavily_search" not in tools_used:
-                            tools_used.append("tavily_search")
-                        status_msg = "🌐 正在联网搜索..."
-                    else:
-                        if tool_name not in tools_used:
-                            tools_used.append(tool_name)
-                        status_msg = f"🛠️ 正在使用工具: {tool_name}"
+                        # 记录工具使用
+                        if "knowledge" in tool_name.lower():
+                            if "knowledge_base" not in tools_used:
+                                tools_used.append("knowledge_base")
+                            status_msg = "🔍 正在搜索知识库..."
+                        elif "tavily" in tool_name.lower() or "search" in tool_name.lower():
+                            if "tavily_search" not in tools_used:
+                                tools_used.append("tavily_search")
+                            status_msg = "🌐 正在联网搜索..."
+                        else:
+                            if tool_name not in tools_used:
+                                tools_used.append(tool_name)
+                            status_msg = f"🛠️ 正在使用工具: {tool_name}"
                     
-                    yield f"data: {json.dumps({'type': 'status', 'content': status_msg}, ensure_ascii=False)}\n\n"
+                        yield f"data: {json.dumps({'type': 'status', 'content': status_msg}, ensure_ascii=False)}\n\n"
                 
-                # 监听工具调用结束
-                elif kind == "on_tool_end":
-                    yield f"data: {json.dumps({'type': 'status', 'content': ''}, ensure_ascii=False)}\n\n"
+                    # 监听工具调用结束
+                    elif kind == "on_tool_end":
+                        yield f"data: {json.dumps({'type': 'status', 'content': ''}, ensure_ascii=False)}\n\n"
             
             print(f"[Consultant] 🤖 回答生成完毕 (长度: {len(full_response)} 字符)")
             
@@ -178,60 +214,33 @@ async def chat_with_agent_stream(
             
             # 3. 只有在真正成功生成回复后才保存到数据库（不保存空响应）
             if full_response.strip():
+                # 基于知识库的回答写入语义答案缓存（联网搜索的内容有时效性，不缓存）
+                if (
+                    use_answer_cache and cached_answer is None
+                    and "knowledge_base" in tools_used and "tavily_search" not in tools_used
+                ):
+                    await store_cached_answer(request.message, full_response, tools_used)
+                
                 print(f"[Consultant] 流式输出完成，开始保存数据库")
                 
                 try:
-                    # 构建要保存的消息
-                    messages_to_save = []
-                    
-                    # 查询已有记录
-                    record = db.query(ConsultantRecord).filter(
-                        ConsultantRecord.thread_id == thread_id,
-                        ConsultantRecord.user_name == user_name
-                    ).first()
-                    
-                    # 如果有已有记录，保留历史消息
-                    if record and record.messages:
-                        messages_to_save = record.messages.copy()
-                    
-                    # 添加当前对话
-                    messages_to_save.append({
-                        "role": "human",
-                        "content": request.message
-                    })
-                    
-                    messages_to_save.append({
-                        "role": "ai",
-                        "content": full_response,
-                        "tools_used": tools_used
-                    })
-                    
+                    # 本轮对话的两条消息（一次批量 INSERT 追加，不再读取并写回完整的历史消息）
+                    messages_to_save = [
+                        {"role": "human", "content": request.message},
+                        {"role": "ai", "content": full_response, "tools_used": tools_used}
+                    ]
                     print(f"[Consultant] 准备保存 {len(messages_to_save)} 条消息，工具使用: {tools_used}")
                     
-                    # 查询或创建记录
-                    if record:
-                        # 更新已有记录
-                        record.messages = messages_to_save
-                        record.updated_at = datetime.now()
-                    else:
-                        # 生成标题
-                        title = "新咨询会话"
-                        if messages_to_save:
-                            first_user_msg = next((m for m in messages_to_save if m['role'] == 'human'), None)
-                            if first_user_msg and first_user_msg['content']:
-                                content = first_user_msg['content'].strip()
-                                title = content[:20] + ('...' if len(content) > 20 else '')
-                        
-                        record = ConsultantRecord(
-                            thread_id=thread_id,
-                            user_name=user_name,
-                            title=title,
-                            messages=messages_to_save
-                        )
-                        db.add(record)
+                    # 新会话的标题取第一条用户消息
+                    content = request.message.strip()
+                    title = content[:20] + ('...' if len(content) > 20 else '')
+                    append_messages(db, thread_id, user_name, messages_to_save, title=title)
                     
                     db.commit()
                     print(f"[Consultant] 数据库保存成功")
+                    
+                    # 后台把超出预算的旧消息合并进对话摘要（不阻塞本次响应）
+                    schedule_summary_update(thread_id)
                 except Exception as db_error:
                     print(f"[Consultant] 数据库保存失败: {db_error}")
                     import traceback
@@ -313,7 +322,7 @@ async def get_consultant_record_detail(
             thread_id=record.thread_id,
             user_name=record.user_name,
             title=record.title if hasattr(record, 'title') else "新咨询会话",
-            messages=record.messages if record.messages else [],
+            messages=load_messages(db, record),
             created_at=record.created_at.strftime("%Y-%m-%d %H:%M:%S"),
             updated_at=record.updated_at.strftime("%Y-%m-%d %H:%M:%S")
         )
@@ -347,7 +356,9 @@ async def delete_consultant_record(
             raise HTTPException(status_code=404, detail="对话记录不存在或无权删除")
         
         
-        # 2. 删除数据库记录 (MySQL)
+        # 2. 删除数据库记录 (MySQL)：先删除消息和对话摘要，再删除会话记录
+        delete_messages(db, thread_id)
+        delete_memory(db, thread_id)
         db.delete(record)
         db.commit()
         
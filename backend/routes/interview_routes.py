@@ -5,10 +5,9 @@
 """
 import os
 import uuid
-import shutil
 import tempfile
 import json
-import sqlite3
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Header, Depends
 from fastapi.responses import StreamingResponse, FileResponse
 from pathlib import Path
@@ -22,20 +21,33 @@ from backend.models.schemas import (
     InterviewRecordDetailResponse,
     InterviewStatusResponse
 )
-from backend.graph.workflow import create_interview_graph
+from backend.graph.checkpoint import get_checkpointer
+from backend.graph.tools import cancel_speculative_search
+from backend.graph.workflow import (
+    ainvoke_interview,
+    ainvoke_answer,
+    ahas_interview_session,
+    answer_command,
+    astream_interview
+)
 from backend.config import SessionLocal
 from backend.models import InterviewRecord
+from backend.utils.resume_store import (
+    UPLOADS_DIR,
+    UploadRejectedError,
+    asave_resume_upload,
+    get_resume_extraction,
+    save_resume_extraction,
+    release_resume_file,
+    unpin_resume_file,
+    UNRECOGNIZED_POSITION
+)
 
 router = APIRouter(prefix="/api/interview", tags=["interview"])
 
 # PDF文件存储目录
-UPLOADS_DIR = Path(__file__).parent.parent.parent / "uploads"
 UPLOADS_DIR.mkdir(exist_ok=True)
 
-# LangGraph checkpoints 数据库路径
-CHECKPOINTS_DIR = Path(__file__).parent.parent.parent / "checkpoints-sqlite"
-CHECKPOINT_DB = CHECKPOINTS_DIR / "checkpoints.sqlite"
-
 
 def get_db():
     """获取数据库会话"""
@@ -46,6 +58,137 @@ def get_db():
         db.close()
 
 
+def _sse(event_type: str, content="", **extra) -> str:
+    """格式化一条 SSE 事件"""
+    return f"data: {json.dumps({'type': event_type, 'content': content, **extra}, ensure_ascii=False)}\n\n"
+
+
+def _sse_from_stream_event(event: dict) -> str:
+    """将 astream_interview 产生的事件格式化为 SSE"""
+    event_type = event.pop("type")
+    return _sse(event_type, event.pop("content", ""), **event)
+
+
+def _build_initial_state(pdf_file_path, max_rounds: int, cached_resume) -> InterviewState:
+    """构建面试初始状态（简历解析结果命中缓存时 parse_resume 节点直接跳过）"""
+    return {
+        "round": 0,
+        "max_rounds": max_rounds,
+        "resume_path": str(pdf_file_path),
+        "resume_text": cached_resume.resume_text if cached_resume else "",
+        "target_position": cached_resume.target_position if cached_resume else "",
+        "history": [],
+        "report": "",
+        "is_finished": False
+    }
+
+
+def _rollback_start(db: Session, pdf_file_path, thread_id: str, db_record_created: bool) -> None:
+    """
+    开始面试失败时回滚：删除无人引用的 PDF 文件、LangGraph 会话记录和数据库事务
+    """
+    # 1. 删除 PDF 文件（没有其他面试记录引用时）
+    if pdf_file_path:
+        try:
+            if release_resume_file(db, str(pdf_file_path), thread_id):
+                print(f"[start_interview] 已删除 PDF 文件: {pdf_file_path}")
+        except Exception as del_e:
+            print(f"[start_interview] 删除 PDF 文件失败: {del_e}")
+    
+    # 2. 删除 LangGraph 会话记录（同时取消下一轮的搜索预取）
+    if thread_id:
+        cancel_speculative_search(thread_id)
+        try:
+            get_checkpointer().delete_thread(thread_id)
+            print(f"[start_interview] 已删除会话记录: thread_id={thread_id}")
+        except Exception as cp_e:
+            print(f"[start_interview] 删除会话记录失败: {cp_e}")
+    
+    # 3. 删除数据库记录（如果已创建）
+    if db_record_created:
+        try:
+            db.rollback()
+            print(f"[start_interview] 已回滚数据库事务")
+        except Exception as db_e:
+            print(f"[start_interview] 回滚数据库失败: {db_e}")
+
+
+def _save_started_interview(
+    db: Session,
+    thread_id: str,
+    user_name: str,
+    file_name: str,
+    pdf_file_path,
+    content_hash: str,
+    file_size: int,
+    cached_resume,
+    result: dict
+) -> StartInterviewResponse:
+    """
+    保存简历解析结果，创建面试记录，返回第一个问题
+    """
+    history = result.get('history', [])
+    question = history[-1].get('question', '') if history else ''
+    resume_text = result.get('resume_text', '')
+    if not cached_resume:
+        # 简历缓存只是优化，写入失败不能影响面试记录的创建
+        try:
+            save_resume_extraction(db, content_hash, resume_text, result.get('target_position', ''), file_size)
+        except Exception as e:
+            db.rollback()
+            print(f"[start_interview] 保存简历提取结果失败（忽略）: {e}")
+    
+    new_record = InterviewRecord(
+        thread_id=thread_id,
+        user_name=user_name,
+        resume_text=resume_text,
+        resume_file_path=str(pdf_file_path),
+        resume_file_name=file_name,
+        history=history,
+        report="",
+        is_finished=False
+    )
+    db.add(new_record)
+    db.commit()
+    print(f"[start_interview] 数据库记录已创建: thread_id={thread_id}")
+
+    return StartInterviewResponse(
+        thread_id=thread_id,
+        resume_text=resume_text,
+        target_position=result.get('target_position', UNRECOGNIZED_POSITION),
+        question=question,
+        round=result.get('round', 0),
+        resume_file_url=f"/api/interview/resume/{thread_id}"  # PDF文件的访问URL
+    )
+
+
+def _sync_interview_record(db: Session, thread_id: str, user_name: Optional[str], result: dict) -> None:
+    """
+    将工作流的最新状态同步到面试记录（找不到记录时补建）
+    """
+    try:
+        record = db.query(InterviewRecord).filter(InterviewRecord.thread_id == thread_id).first()
+        if record:
+            record.history = result.get('history', [])
+            record.is_finished = result.get('is_finished', False)
+            if record.is_finished:
+                record.report = result.get('report', '')
+            record.updated_at = datetime.now()
+        elif user_name:
+            db.add(InterviewRecord(
+                thread_id=thread_id,
+                user_name=user_name,
+                resume_text=result.get('resume_text', ''),
+                history=result.get('history', []),
+                report=result.get('report', ''),
+                is_finished=result.get('is_finished', False)
+            ))
+        db.commit()
+    except Exception as db_e:
+        db.rollback()
+        print(f"更新面试记录失败: {db_e}")
+
+
 @router.post("/start", response_model=StartInterviewResponse)
 async def start_interview(
     file: UploadFile = File(...),
@@ -66,116 +209,148 @@ async def start_interview(
          # 若前端未改，可能需要 permissive 一点，但为了记录关联，必须要有用户名
          raise HTTPException(status_code=401, detail="需要登录")
 
+    # 1. 生成会话 ID
+    thread_id = str(uuid.uuid4())
     pdf_file_path = None
+    pinned = False
     db_record_created = False
     try:
-        # 1. 生成会话 ID
-        thread_id = str(uuid.uuid4())
-        
-        # 2. 保存PDF文件到持久化目录
+        # 2. 保存PDF文件到持久化目录（按内容哈希存储，相同文件只保存一次；分块写入，不阻塞事件循环）
+        #    创建面试记录之前持有文件引用，其他请求回滚时不会删除该文件
         file_ext = os.path.splitext(file.filename)[1] or ".pdf"
-        pdf_file_path = UPLOADS_DIR / f"{thread_id}{file_ext}"
-        
-        with open(pdf_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        pdf_file_path, content_hash, file_size, _ = await asave_resume_upload(file, file_ext)
+        pinned = True
         
         print(f"[start_interview] PDF 已保存: {pdf_file_path}")
         
-        # 3. 初始化状态
-        initial_state: InterviewState = {
-            "round": 0,
-            "max_rounds": max_rounds,
-            "resume_path": str(pdf_file_path),
-            "resume_text": "",
-            "target_position": "",
-            "history": [],
-            "report": "",
-            "is_finished": False
-        }
+        # 3. 查询相同简历的解析结果，命中时 parse_resume 节点直接跳过
+        cached_resume = get_resume_extraction(db, content_hash)
+        if cached_resume:
+            print(f"[start_interview] 简历解析结果命中缓存: {content_hash[:12]}")
         
-        # 4. 启动工作流执行
-        workflow = create_interview_graph()
-        config = {"configurable": {"thread_id": thread_id}}
-        result = workflow.invoke(initial_state, config)
+        # 4. 初始化状态
+        initial_state = _build_initial_state(pdf_file_path, max_rounds, cached_resume)
         
-        # 5. 获取结果
-        history = result.get('history', [])
-        question = history[-1].get('question', '') if history else ''
-        resume_text = result.get('resume_text', '')
+        # 5. 启动工作流执行（异步执行，不阻塞事件循环）
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await ainvoke_interview(initial_state, config)
         
-        # 6. 创建数据库记录
-        new_record = InterviewRecord(
-            thread_id=thread_id,
-            user_name=user_name,
-            resume_text=resume_text,
-            resume_file_path=str(pdf_file_path),
-            resume_file_name=file.filename,
-            history=history,
-            report="",
-            is_finished=False
+        # 6. 保存简历解析结果并创建数据库记录
+        response = _save_started_interview(
+            db, thread_id, user_name, file.filename, pdf_file_path, content_hash, file_size, cached_resume, result
         )
-        db.add(new_record)
-        db.commit()
         db_record_created = True
-        print(f"[start_interview] 数据库记录已创建: thread_id={thread_id}")
-
-        # 构建PDF文件的访问URL
-        resume_file_url = f"/api/interview/resume/{thread_id}"
-        
-        return StartInterviewResponse(
-            thread_id=thread_id,
-            resume_text=resume_text,
-            target_position=result.get('target_position', '未识别'),
-            question=question,
-            round=result.get('round', 0),
-            resume_file_url=resume_file_url
-        )
+        return response
     
+    except UploadRejectedError as e:
+        # 文件校验失败：此时还没有保存文件或启动工作流，直接返回
+        print(f"[start_interview] 上传文件被拒绝: {e}")
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
     except Exception as e:
         # 回滚所有操作
         import traceback
         print(f"[start_interview] 发生异常: {e}")
         print(traceback.format_exc())
         
-        # 1. 删除 PDF 文件
-        if pdf_file_path and pdf_file_path.exists():
-            try:
-                pdf_file_path.unlink()
-                print(f"[start_interview] 已删除 PDF 文件: {pdf_file_path}")
-            except Exception as del_e:
-                print(f"[start_interview] 删除 PDF 文件失败: {del_e}")
-        
-        # 2. 删除 LangGraph 会话记录
-        if 'thread_id' in locals():
-            try:
-                if CHECKPOINT_DB.exists():
-                    conn = sqlite3.connect(str(CHECKPOINT_DB))
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
-                    cursor.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
-                    conn.commit()
-                    conn.close()
-                    print(f"[start_interview] 已删除会话记录: thread_id={thread_id}")
-            except Exception as cp_e:
-                print(f"[start_interview] 删除会话记录失败: {cp_e}")
-        
-        # 3. 删除数据库记录（如果已创建）
-        if db_record_created:
-            try:
-                db.rollback()
-                print(f"[start_interview] 已回滚数据库事务")
-            except Exception as db_e:
-                print(f"[start_interview] 回滚数据库失败: {db_e}")
+        # 先释放本请求的文件引用，再判断文件是否还被其他记录 / 请求引用
+        if pinned:
+            unpin_resume_file(pdf_file_path)
+            pinned = False
+        _rollback_start(db, pdf_file_path, thread_id, db_record_created)
         
         raise HTTPException(status_code=500, detail=f"开始面试失败: {str(e)}")
 
+    finally:
+        if pinned:
+            unpin_resume_file(pdf_file_path)
+
+
+# 流式输出
+@router.post("/start/stream")
+async def start_interview_stream(
+    file: UploadFile = File(...),
+    max_rounds: int = Form(3),
+    user_name: Optional[str] = Header(None, alias="X-User-Name")
+):
+    """
+    开始面试（流式输出版本）
+    文件校验和保存在返回响应前完成（校验失败直接返回 400 / 413），
+    之后以 SSE 推送工作流进度和第一个问题的 token
+
+    SSE 事件类型:
+        - thread_id: 返回会话ID
+        - status: 节点 / 工具状态提示（node 为所在节点，工具结束时 content 为空）
+        - token: 流式文本内容（target 为 question）
+        - done: 完成标记，data 与非流式接口的响应相同
+        - error: 错误信息
+    """
+    if not user_name:
+        raise HTTPException(status_code=401, detail="需要登录")
+
+    thread_id = str(uuid.uuid4())
+    file_name = file.filename
+    try:
+        file_ext = os.path.splitext(file_name)[1] or ".pdf"
+        pdf_file_path, content_hash, file_size, _ = await asave_resume_upload(file, file_ext)
+        print(f"[start_interview] PDF 已保存: {pdf_file_path}")
+    except UploadRejectedError as e:
+        print(f"[start_interview] 上传文件被拒绝: {e}")
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    async def event_generator():
+        db = SessionLocal()
+        pinned = True
+        db_record_created = False
+        try:
+            yield _sse('thread_id', thread_id)
+
+            cached_resume = get_resume_extraction(db, content_hash)
+            if cached_resume:
+                print(f"[start_interview] 简历解析结果命中缓存: {content_hash[:12]}")
+
+            initial_state = _build_initial_state(pdf_file_path, max_rounds, cached_resume)
+            config = {"configurable": {"thread_id": thread_id}}
+            result = {}
+            async for event in astream_interview(initial_state, config):
+                if event["type"] == "result":
+                    result = event["content"]
+                else:
+                    yield _sse_from_stream_event(event)
+
+            response = _save_started_interview(
+                db, thread_id, user_name, file_name, pdf_file_path, content_hash, file_size, cached_resume, result
+            )
+            db_record_created = True
+            yield _sse('done', data=response.model_dump())
+
+        except Exception as e:
+            import traceback
+            print(f"[start_interview] 流式执行发生异常: {e}")
+            print(traceback.format_exc())
+            unpin_resume_file(pdf_file_path)
+            pinned = False
+            _rollback_start(db, pdf_file_path, thread_id, db_record_created)
+            yield _sse('error', f"开始面试失败: {str(e)}")
+        finally:
+            if pinned:
+                unpin_resume_file(pdf_file_path)
+            db.close()
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
 
 @router.get("/resume/{thread_id}")
-async def get_resume_pdf(thread_id: str):
+async def get_resume_pdf(thread_id: str, db: Session = Depends(get_db)):
     """
     获取简历PDF文件
     """
-    pdf_file_path = UPLOADS_DIR / f"{thread_id}.pdf"
+    record = db.query(InterviewRecord.resume_file_path).filter(InterviewRecord.thread_id == thread_id).first()
+    if record and record.resume_file_path:
+        pdf_file_path = Path(record.resume_file_path)
+    else:
+        # 兼容旧版本按 thread_id 保存的文件
+        pdf_file_path = UPLOADS_DIR / f"{thread_id}.pdf"
     
     if not pdf_file_path.exists():
         raise HTTPException(status_code=404, detail="简历文件不存在")
@@ -188,6 +363,28 @@ async def get_resume_pdf(thread_id: str):
     )
 
 
+# 会话不存在时的提示
+SESSION_EXPIRED_DETAIL = "会话已过期（服务端重启导致旧内存数据丢失），请点击左侧'开启新对话'重新开始。"
+
+
+def _build_status_response(thread_id: str, result: dict) -> InterviewStatusResponse:
+    """
+    根据工作流结果构建面试状态响应：结束时返回报告，否则返回下一个问题
+    """
+    is_finished = result.get('is_finished', False)
+    response = InterviewStatusResponse(
+        thread_id=thread_id,
+        is_finished=is_finished,
+        round=result.get('round', 0)
+    )
+    if is_finished:
+        response.report = result.get('report', '')
+    else:
+        history = result.get('history', [])
+        response.question = history[-1].get('question', '') if history else ''
+    return response
+
+
 # 非流式输出
 @router.post("/submit", response_model=InterviewStatusResponse)
 async def submit_answer(
@@ -196,107 +393,77 @@ async def submit_answer(
 ):
     """
     第三阶段：提交回答
-    处理用户回答，评分，并决定下一步
+    以回答为恢复值从 answer 中断点继续执行，一次执行完成评估是否结束、出下一题或生成报告，
+    最后一次性更新数据库记录
     """
     try:
-        workflow = create_interview_graph()
         config = {"configurable": {"thread_id": request.thread_id}}
         
-        # 1. 获取当前状态
-        current_state = workflow.get_state(config)
-        
-        # 关键检查：如果状态为空，说明该 thread_id 在数据库中找不到（可能是重启前的内存数据丢失了）
-        if not current_state.values:
-             raise HTTPException(
-                 status_code=410,
-                 detail="会话已过期（服务端重启导致旧内存数据丢失），请点击左侧'开启新对话'重新开始。"
-             )
-
-        if current_state.values:
-            history = current_state.values.get('history', [])
-            if history:
-                history[-1]['answer'] = request.answer
-                workflow.update_state(config, {"history": history})
+        # 1. 确认会话存在（找不到说明 checkpoint 已丢失，例如服务端重启前使用的是内存存储）
+        if not await ahas_interview_session(config):
+            raise HTTPException(status_code=410, detail=SESSION_EXPIRED_DETAIL)
         
-        # 2. 恢复工作流执行
-        result = workflow.invoke(None, config)
+        # 2. 提交回答并推进工作流，直到下一个问题或面试结束
+        result = await ainvoke_answer(request.answer, config)
         
-        # 3. 获取最新状态数据
-        is_finished = result.get('is_finished', False)
-        history = result.get('history', [])
-        report = result.get('report', '')
+        # 3. 更新数据库记录（只提交一次）
+        _sync_interview_record(db, request.thread_id, request.user_name, result)
         
-        # 4. 【新增】实时更新数据库
-        try:
-            record = db.query(InterviewRecord).filter(
-                InterviewRecord.thread_id == request.thread_id
-            ).first()
-            
-            if record:
-                record.history = history # 更新完整历史
-                record.is_finished = is_finished # 直接同步状态
-                if is_finished:
-                    record.report = report
-                
-                # 手动更新时间戳
-                from datetime import datetime
-                record.updated_at = datetime.now()
-                
-                # 即使没结束也保存 history
-                db.commit()
-            else:
-                # 理论上不应该进这里，除非 start 时保存失败
-                # 如果找不到记录，尝试新建（补救措施）
-                if request.user_name:
-                     new_record = InterviewRecord(
-                        thread_id=request.thread_id,
-                        user_name=request.user_name,
-                        resume_text=result.get('resume_text', ''),
-                        history=history,
-                        report=report,
-                        is_finished=is_finished
-                    )
-                     db.add(new_record)
-                     db.commit()
+        return _build_status_response(request.thread_id, result)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"提交回答失败: {str(e)}")
 
-        except Exception as db_e:
-            db.rollback()
-            print(f"更新面试记录失败: {db_e}")
 
-        # 5. 构建响应
-        response = InterviewStatusResponse(
-            thread_id=request.thread_id,
-            is_finished=is_finished,
-            round=result.get('round', 0)
-        )
-        
-        if is_finished:
-            response.report = report
-        else:
-            state_info = workflow.get_state(config)
-            if state_info.next and "interviewer_agent" in state_info.next:
-                continue_result = workflow.invoke(None, config)
-                continue_history = continue_result.get('history', [])
-                response.question = continue_history[-1].get('question', '') if continue_history else ''
-                # 再次更新数据库以保存新生成的问题
-                try:
-                     if record:
-                        record.history = continue_history
-                        from datetime import datetime
-                        record.updated_at = datetime.now()
-                        db.commit()
-                except:
-                    pass
-            else:
-                result_history = result.get('history', [])
-                response.question = result_history[-1].get('question', '') if result_history else ''
-            
-        return response
-    
+# 流式输出
+@router.post("/submit/stream")
+async def submit_answer_stream(request: SubmitAnswerRequest):
+    """
+    提交回答（流式输出版本）
+    以 SSE 推送工作流进度：未结束时输出下一个问题的 token，
+    最后一轮输出学习资源搜索进度和面试报告的 token
+
+    SSE 事件类型:
+        - status: 节点 / 工具状态提示（node 为所在节点，工具结束时 content 为空）
+        - token: 流式文本内容（target 为 question 或 report）
+        - done: 完成标记，data 与非流式接口的响应相同
+        - error: 错误信息
+    """
+    config = {"configurable": {"thread_id": request.thread_id}}
+    try:
+        session_exists = await ahas_interview_session(config)
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"提交回答失败: {str(e)}")
+    if not session_exists:
+        raise HTTPException(status_code=410, detail=SESSION_EXPIRED_DETAIL)
+
+    async def event_generator():
+        db = SessionLocal()
+        try:
+            result = {}
+            async for event in astream_interview(answer_command(request.answer), config):
+                if event["type"] == "result":
+                    result = event["content"]
+                else:
+                    yield _sse_from_stream_event(event)
+
+            _sync_interview_record(db, request.thread_id, request.user_name, result)
+            yield _sse('done', data=_build_status_response(request.thread_id, result).model_dump())
+
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            yield _sse('error', f"提交回答失败: {str(e)}")
+        finally:
+            db.close()
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
 @router.get("/records", response_model=InterviewRecordListResponse)
@@ -406,26 +573,19 @@ async def delete_interview_record(
         if not record:
             raise HTTPException(status_code=404, detail="面试记录不存在或无权删除")
         
-        # 2. 删除 PDF 文件
+        # 2. 删除 PDF 文件（同一文件可能被多条记录引用，没有其他引用时才删除）
         if record.resume_file_path:
-            pdf_path = Path(record.resume_file_path)
-            if pdf_path.exists():
-                try:
-                    pdf_path.unlink()
-                    print(f"[删除文件] 成功删除 PDF: {pdf_path}")
-                except Exception as e:
-                    print(f"[删除文件] 删除 PDF 失败: {e}")
+            try:
+                if release_resume_file(db, record.resume_file_path, thread_id):
+                    print(f"[删除文件] 成功删除 PDF: {record.resume_file_path}")
+            except Exception as e:
+                print(f"[删除文件] 删除 PDF 失败: {e}")
         
-        # 3. 删除 LangGraph 会话记录
+        # 3. 删除 LangGraph 会话记录（同时取消下一轮的搜索预取）
+        cancel_speculative_search(thread_id)
         try:
-            if CHECKPOINT_DB.exists():
-                conn = sqlite3.connect(str(CHECKPOINT_DB))
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
-                cursor.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
-                conn.commit()
-                conn.close()
-                print(f"[删除检查点] 成功删除 thread_id={thread_id} 的会话记录")
+            get_checkpointer().delete_thread(thread_id)
+            print(f"[删除检查点] 成功删除 thread_id={thread_id} 的会话记录")
         except Exception as e:
             print(f"[删除检查点] 删除会话记录失败: {e}")
         
@@ -0,0 +1,178 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问语义答案缓存基准测试
+使用本地假 LLM 服务（call_tools=True，模拟 Agent 的工具调用轮），在临时目录中建立知识库索引，
+按 Zipf 分布从评估集的知识库内问题中抽样（少数热门问题占大部分流量），每个请求作为新会话调用
+/api/customer-service/chat 的路由函数并读取 SSE 流，对比关闭 / 开启语义答案缓存时：
+- 缓存命中率、每个请求的 LLM 调用次数
+- 第一个 token 的时间和总耗时
+
+需要 .env 中配置好数据库；测试结束后删除产生的顾问对话记录
+
+用法：
+    python backend/utils/benchmark_answer_cache.py --requests 100 --latency 0.5
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 评估集（取其中的知识库内问题）
+EVAL_SET_PATH = project_root / "backend" / "graph" / "rag" / "kb_eval_queries.json"
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    from backend.config import SessionLocal
+    from backend.models import User
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _delete_records(thread_ids: list) -> None:
+    from backend.config import SessionLocal
+    from backend.models import ConsultantRecord, ConsultantMessage
+    db = SessionLocal()
+    try:
+        db.query(ConsultantMessage).filter(ConsultantMessage.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.query(ConsultantRecord).filter(ConsultantRecord.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def make_workload(questions: list, requests: int, seed: int) -> list:
+    """按 Zipf 分布（第 i 个问题的权重为 1/i）抽样请求"""
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(questions))]
+    return rng.choices(questions, weights=weights, k=requests)
+
+
+async def _timed_chat(message: str) -> dict:
+    """
+    调用顾问对话路由并读取 SSE 流
+
+    Returns:
+        {"thread_id", "first_token", "total", "answer"}
+    """
+    from backend.models.schemas import ChatRequest
+    routes = sys.modules["backend.routes.consultant_routes"]
+
+    start = time.perf_counter()
+    response = await routes.chat_with_agent_stream(ChatRequest(message=message), user_name=BENCHMARK_USER)
+    result = {"thread_id": None, "first_token": None, "total": None, "answer": ""}
+    async for chunk in response.body_iterator:
+        event = json.loads(chunk[len("data: "):])
+        if event["type"] == "thread_id":
+            result["thread_id"] = event["content"]
+        elif event["type"] == "token":
+            if result["first_token"] is None:
+                result["first_token"] = time.perf_counter() - start
+            result["answer"] += event["content"]
+        elif event["type"] == "error":
+            raise RuntimeError(event["content"])
+    result["total"] = time.perf_counter() - start
+    return result
+
+
+async def run_benchmark(server, workload: list) -> None:
+    import backend.routes.consultant_routes  # noqa: F401
+    tools = sys.modules["backend.graph.tools.consultant_tools"]
+
+    _ensure_user()
+    results = {}
+    thread_ids = []
+    try:
+        for mode in ("no_cache", "answer_cache"):
+            tools.ANSWER_CACHE_ENABLED = mode == "answer_cache"
+            stats = {"llm_calls": [], "first_token": [], "total": [], "answers": {}}
+            for question in workload:
+                before = server.request_count
+                result = await _timed_chat(question)
+                thread_ids.append(result["thread_id"])
+                stats["llm_calls"].append(server.request_count - before)
+                stats["first_token"].append(result["first_token"])
+                stats["total"].append(result["total"])
+                stats["answers"].setdefault(question, set()).add(result["answer"])
+            cache = tools.get_answer_cache()
+            stats["hit_rate"] = cache.stats()["hit_rate"] if cache is not None and mode == "answer_cache" else 0.0
+            results[mode] = stats
+    finally:
+        _delete_records(thread_ids)
+
+    print("\n" + "=" * 84)
+    print(f"📊 顾问语义答案缓存基准测试（{len(workload)} 个请求，{len(set(workload))} 个不同问题）")
+    print("=" * 84)
+    print(f"{'模式':<14}{'缓存命中率':>12}{'LLM 调用/请求':>14}{'首 token':>12}{'P50 首 token':>14}{'总耗时':>12}")
+    print("-" * 84)
+    for mode, s in results.items():
+        print(
+            f"{mode:<14}{s['hit_rate']:>14.1%}{statistics.mean(s['llm_calls']):>14.2f}"
+            f"{statistics.mean(s['first_token']) * 1000:>12.0f}ms{statistics.median(s['first_token']) * 1000:>12.0f}ms"
+            f"{statistics.mean(s['total']) * 1000:>12.0f}ms"
+        )
+    print("-" * 84)
+    # 回放的答案与第一次生成的答案应当完全一致
+    replay_ok = all(len(answers) == 1 for answers in results["answer_cache"]["answers"].values())
+    print(f"回放答案与生成答案一致: {'是' if replay_ok else '否'}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--eval-set", type=Path, default=EVAL_SET_PATH, help="评估集 JSON 文件")
+    parser.add_argument("--requests", type=int, default=100, help="请求数量")
+    parser.add_argument("--seed", type=int, default=42, help="抽样随机种子")
+    parser.add_argument("--latency", type=float, default=0.5, help="假 LLM 的首 token 延迟（秒）")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="假 LLM 每个 token 的间隔（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    from backend.utils.fake_llm_server import FakeLLMServer
+
+    server = FakeLLMServer(
+        latency=args.latency, port=args.port, token_delay=args.token_delay, embedding_latency=0.0, call_tools=True
+    )
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假服务；不联网搜索，Embedding 缓存和答案缓存只使用内存
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.environ["EMBEDDING_CACHE_DB_PATH"] = ""
+    os.environ["ANSWER_CACHE_DB_PATH"] = ""
+    os.chdir(project_root)
+
+    with open(args.eval_set, "r", encoding="utf-8") as f:
+        questions = [case["query"] for case in json.load(f) if case["expected"] is not None]
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            from backend.graph.llm import raw_openai_embeddings
+            from backend.graph.rag.init_vectorstore import sync_knowledge_base
+            import backend.graph.tools.consultant_tools  # noqa: F401
+
+            # 离线环境无法下载 tiktoken 分词表，直接发送原文
+            raw_openai_embeddings.check_embedding_ctx_length = False
+            sync_knowledge_base(db_path=Path(tmp))
+            sys.modules["backend.graph.tools.consultant_tools"].CHROMA_DB_PATH = Path(tmp)
+
+            asyncio.run(run_benchmark(server, make_workload(questions, args.requests, args.seed)))
+    finally:
+        server.stop()
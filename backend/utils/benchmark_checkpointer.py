@@ -0,0 +1,116 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Checkpointer 写入吞吐基准测试
+对比不同 checkpointer 后端在 1 / 8 / 64 并发下的 checkpoint 写入速度（writes/s）：
+- sqlite：单连接 SqliteSaver（旧实现）
+- sqlite_pool：连接池 + WAL + pragma
+- aiosqlite：TunedAsyncSqliteSaver（并发协程）
+
+每次写入 = put(checkpoint) + put_writes(1 条 pending write)，与工作流每个 superstep 的写入一致
+
+用法：
+    python backend/utils/benchmark_checkpointer.py --writes 200 --concurrency 1 8 64
+"""
+import sys
+import time
+import uuid
+import asyncio
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langgraph.checkpoint.base import empty_checkpoint
+from backend.graph.checkpoint import create_checkpointer, create_async_checkpointer, PooledSqliteSaver
+
+# 模拟一份典型的面试状态（简历摘要 + 3 轮问答）
+SAMPLE_STATE = {
+    "round": 3,
+    "max_rounds": 3,
+    "resume_text": "### 目标岗位\nJava开发工程师\n" + "项目经历描述。" * 200,
+    "history": [{"question": "请介绍一下你的项目" * 10, "answer": "我负责了……" * 50}] * 3,
+}
+
+
+def _make_checkpoint(step: int):
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = dict(SAMPLE_STATE, step=step)
+    return checkpoint
+
+
+def _write_thread(saver, writes: int) -> None:
+    """单个线程：在独立的 thread_id 下连续写入"""
+    config = {"configurable": {"thread_id": f"bench-{uuid.uuid4()}", "checkpoint_ns": ""}}
+    for step in range(writes):
+        config = saver.put(config, _make_checkpoint(step), {"source": "loop", "step": step}, {})
+        saver.put_writes(config, [("history", SAMPLE_STATE["history"])], str(uuid.uuid4()))
+
+
+async def _write_coroutine(saver, writes: int) -> None:
+    config = {"configurable": {"thread_id": f"bench-{uuid.uuid4()}", "checkpoint_ns": ""}}
+    for step in range(writes):
+        config = await saver.aput(config, _make_checkpoint(step), {"source": "loop", "step": step}, {})
+        await saver.aput_writes(config, [("history", SAMPLE_STATE["history"])], str(uuid.uuid4()))
+
+
+def bench_sync(backend: str, concurrency: int, writes: int, db_path: str) -> float:
+    saver = create_checkpointer(backend, db_path)
+    saver.setup()
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(_write_thread, saver, writes) for _ in range(concurrency)]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - start
+    finally:
+        if isinstance(saver, PooledSqliteSaver):
+            saver.close()
+        else:
+            saver.conn.close()
+    return concurrency * writes / elapsed
+
+
+async def bench_async(concurrency: int, writes: int, db_path: str) -> float:
+    saver = create_async_checkpointer("aiosqlite", db_path)
+    await saver.setup()
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(_write_coroutine(saver, writes) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await saver.aclose()
+    return concurrency * writes / elapsed
+
+
+def run_benchmark(levels, writes: int) -> None:
+    print("=" * 80)
+    print(f"📊 Checkpointer 写入吞吐基准测试 (每个线程/协程写入 {writes} 次)")
+    print("=" * 80)
+    print(f"{'后端':<14}" + "".join(f"{f'{c} 并发':>16}" for c in levels))
+    print("-" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend in ("sqlite", "sqlite_pool", "aiosqlite"):
+            row = f"{backend:<14}"
+            for concurrency in levels:
+                db_path = str(Path(tmp_dir) / f"{backend}-{concurrency}.sqlite")
+                if backend == "aiosqlite":
+                    rate = asyncio.run(bench_async(concurrency, writes, db_path))
+                else:
+                    rate = bench_sync(backend, concurrency, writes, db_path)
+                row += f"{rate:>12.0f} w/s"
+            print(row)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writes", type=int, default=200, help="每个线程/协程的写入次数")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64], help="并发线程数")
+    args = parser.parse_args()
+
+    run_benchmark(args.concurrency, args.writes)
@@ -0,0 +1,162 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问快速路径基准测试
+使用本地假 LLM 服务（call_tools=True，带工具的请求先返回一次知识库工具调用，模拟 ReAct Agent 的两轮 LLM 调用），
+在临时目录中建立知识库索引，对评估集 backend/graph/rag/kb_eval_queries.json 中的每个问题直接调用
+/api/customer-service/chat 的路由函数并读取 SSE 流，对比：
+- agent：关闭快速路径（CONSULTANT_FAST_PATH_ENABLED=false），每个问题都走完整 Agent
+- fast_path：知识库高置信命中时只调用一次 LLM，否则走完整 Agent
+
+统计走快速路径的比例、每个问题的 LLM 调用次数、第一个 token 的时间和总耗时
+需要 .env 中配置好数据库；测试结束后删除产生的顾问对话记录
+
+用法：
+    python backend/utils/benchmark_consultant_fast_path.py --latency 0.5
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 评估集（知识库内 / 知识库外的问题）
+EVAL_SET_PATH = project_root / "backend" / "graph" / "rag" / "kb_eval_queries.json"
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    from backend.config import SessionLocal
+    from backend.models import User
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _delete_records(thread_ids: list) -> None:
+    from backend.config import SessionLocal
+    from backend.models import ConsultantRecord, ConsultantMessage
+    db = SessionLocal()
+    try:
+        db.query(ConsultantMessage).filter(ConsultantMessage.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.query(ConsultantRecord).filter(ConsultantRecord.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _timed_chat(message: str) -> dict:
+    """
+    调用顾问对话路由并读取 SSE 流
+
+    Returns:
+        {"thread_id", "first_token", "total", "tools_used"}
+    """
+    from backend.models.schemas import ChatRequest
+    routes = sys.modules["backend.routes.consultant_routes"]
+
+    start = time.perf_counter()
+    response = await routes.chat_with_agent_stream(ChatRequest(message=message), user_name=BENCHMARK_USER)
+    result = {"thread_id": None, "first_token": None, "total": None, "tools_used": []}
+    async for chunk in response.body_iterator:
+        event = json.loads(chunk[len("data: "):])
+        if event["type"] == "thread_id":
+            result["thread_id"] = event["content"]
+        elif event["type"] == "token" and result["first_token"] is None:
+            result["first_token"] = time.perf_counter() - start
+        elif event["type"] == "done":
+            result["tools_used"] = event["tools_used"]
+        elif event["type"] == "error":
+            raise RuntimeError(event["content"])
+    result["total"] = time.perf_counter() - start
+    return result
+
+
+async def run_benchmark(server, cases: list) -> None:
+    import backend.routes.consultant_routes  # noqa: F401
+    routes = sys.modules["backend.routes.consultant_routes"]
+
+    _ensure_user()
+    results = {}
+    thread_ids = []
+    try:
+        for mode in ("agent", "fast_path"):
+            routes.CONSULTANT_FAST_PATH_ENABLED = mode == "fast_path"
+            stats = {"fast": 0, "llm_calls": [], "first_token": [], "total": []}
+            for case in cases:
+                before, tool_calls_before = server.request_count, server.tool_call_count
+                result = await _timed_chat(case["query"])
+                thread_ids.append(result["thread_id"])
+                stats["fast"] += server.tool_call_count == tool_calls_before
+                stats["llm_calls"].append(server.request_count - before)
+                stats["first_token"].append(result["first_token"])
+                stats["total"].append(result["total"])
+            results[mode] = stats
+    finally:
+        _delete_records(thread_ids)
+
+    print("\n" + "=" * 80)
+    print(f"📊 顾问快速路径基准测试（{len(cases)} 个问题）")
+    print("=" * 80)
+    print(f"{'模式':<12}{'快速路径比例':>12}{'LLM 调用/问题':>14}{'首 token':>12}{'总耗时':>12}")
+    print("-" * 80)
+    for mode, s in results.items():
+        print(
+            f"{mode:<12}{s['fast'] / len(cases):>14.1%}{statistics.mean(s['llm_calls']):>14.2f}"
+            f"{statistics.mean(s['first_token']) * 1000:>12.0f}ms{statistics.mean(s['total']) * 1000:>12.0f}ms"
+        )
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--eval-set", type=Path, default=EVAL_SET_PATH, help="评估集 JSON 文件")
+    parser.add_argument("--latency", type=float, default=0.5, help="假 LLM 的首 token 延迟（秒）")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="假 LLM 每个 token 的间隔（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    from backend.utils.fake_llm_server import FakeLLMServer
+
+    server = FakeLLMServer(
+        latency=args.latency, port=args.port, token_delay=args.token_delay, embedding_latency=0.0, call_tools=True
+    )
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假服务；不联网搜索，Embedding 缓存只使用内存
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.environ["EMBEDDING_CACHE_DB_PATH"] = ""
+    os.chdir(project_root)
+
+    with open(args.eval_set, "r", encoding="utf-8") as f:
+        eval_cases = json.load(f)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            from backend.graph.llm import raw_openai_embeddings
+            from backend.graph.rag.init_vectorstore import sync_knowledge_base
+            import backend.graph.tools.consultant_tools  # noqa: F401
+
+            # 离线环境无法下载 tiktoken 分词表，直接发送原文
+            raw_openai_embeddings.check_embedding_ctx_length = False
+            sync_knowledge_base(db_path=Path(tmp))
+            sys.modules["backend.graph.tools.consultant_tools"].CHROMA_DB_PATH = Path(tmp)
+
+            asyncio.run(run_benchmark(server, eval_cases))
+    finally:
+        server.stop()
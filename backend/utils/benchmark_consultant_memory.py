@@ -0,0 +1,190 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话记忆基准测试
+使用本地假 LLM 服务生成摘要，模拟一个会话连续进行多轮对话（每隔若干轮出现一个超长回答），
+每轮执行"加载历史上下文 + 保存本轮两条消息"，对比：
+- last4：旧实现，固定取最近 4 条消息（较早的对话全部丢失，超长回答原样进入上下文）
+- memory：滚动摘要 + token 预算内的最近消息，每轮保存后后台更新摘要
+
+统计不同会话长度下每轮历史上下文的估算 token 数（平均 / 最大）和加载耗时，
+以及后台摘要的 LLM 调用次数和耗时（不计入每轮耗时）
+需要 .env 中配置好数据库；测试结束后删除产生的顾问对话记录
+
+用法：
+    python backend/utils/benchmark_consultant_memory.py --turns 100 --long-every 10
+"""
+import os
+import sys
+import time
+import uuid
+import asyncio
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    from backend.config import SessionLocal
+    from backend.models import User
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _delete_records(thread_ids: list) -> None:
+    from backend.config import SessionLocal
+    from backend.models import ConsultantRecord, ConsultantMessage, ConsultantMemory
+    db = SessionLocal()
+    try:
+        db.query(ConsultantMemory).filter(ConsultantMemory.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.query(ConsultantMessage).filter(ConsultantMessage.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.query(ConsultantRecord).filter(ConsultantRecord.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _turn_messages(turn: int, answer_chars: int) -> list:
+    return [
+        {"role": "human", "content": f"第 {turn} 个问题：面试中如何介绍自己的项目经历？"},
+        {"role": "ai", "content": "回" * answer_chars, "tools_used": ["knowledge_base"]}
+    ]
+
+
+def _history_tokens(history: list) -> int:
+    from backend.utils.consultant_memory import estimate_tokens, MESSAGE_TOKEN_OVERHEAD
+    return sum(estimate_tokens(m.content) + MESSAGE_TOKEN_OVERHEAD for m in history)
+
+
+def _load_history(mode: str, thread_id: str) -> list:
+    """按模式加载历史上下文（LangChain 消息）"""
+    from langchain_core.messages import HumanMessage, AIMessage
+    from backend.config import SessionLocal
+    from backend.models import ConsultantRecord
+    from backend.utils.consultant_store import load_recent_messages
+    from backend.utils.consultant_memory import load_history_messages
+
+    db = SessionLocal()
+    try:
+        record = db.query(ConsultantRecord).filter(ConsultantRecord.thread_id == thread_id).first()
+        if record is None:
+            return []
+        if mode == "memory":
+            return load_history_messages(db, record)
+        return [
+            HumanMessage(content=m["content"]) if m["role"] == "human" else AIMessage(content=m["content"])
+            for m in load_recent_messages(db, record, 4)
+        ]
+    finally:
+        db.close()
+
+
+def _save_turn(thread_id: str, messages: list) -> None:
+    from backend.config import SessionLocal
+    from backend.utils.consultant_store import append_messages
+    db = SessionLocal()
+    try:
+        append_messages(db, thread_id, BENCHMARK_USER, messages, title="benchmark")
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_benchmark(server, turns: int, answer_chars: int, long_chars: int, long_every: int, checkpoints: list) -> None:
+    from backend.config import init_db, CONSULTANT_MEMORY_TOKEN_BUDGET
+    from backend.utils.consultant_memory import schedule_summary_update, wait_summary_updates
+
+    init_db()
+    _ensure_user()
+    thread_ids = {"last4": f"benchmark-last4-{uuid.uuid4()}", "memory": f"benchmark-memory-{uuid.uuid4()}"}
+    # {模式: {会话长度（轮）: [(历史 token 数, 历史消息数, 加载耗时)]}}
+    results = {mode: {} for mode in thread_ids}
+    summary = {"calls": 0, "seconds": []}
+
+    try:
+        for mode, thread_id in thread_ids.items():
+            window = []
+            for turn in range(1, turns + 1):
+                start = time.perf_counter()
+                history = _load_history(mode, thread_id)
+                load_seconds = time.perf_counter() - start
+                window.append((_history_tokens(history), len(history), load_seconds))
+
+                chars = long_chars if long_every and turn % long_every == 0 else answer_chars
+                _save_turn(thread_id, _turn_messages(turn, chars))
+                if mode == "memory":
+                    before = server.request_count
+                    start = time.perf_counter()
+                    schedule_summary_update(thread_id)
+                    await wait_summary_updates()
+                    if server.request_count > before:
+                        summary["calls"] += server.request_count - before
+                        summary["seconds"].append(time.perf_counter() - start)
+                if turn in checkpoints:
+                    results[mode][turn] = window
+                    window = []
+    finally:
+        _delete_records(list(thread_ids.values()))
+
+    print("\n" + "=" * 88)
+    print(
+        f"📊 顾问对话记忆基准测试（{turns} 轮，回答 {answer_chars} 字，每 {long_every} 轮一个 {long_chars} 字的回答，"
+        f"预算 {CONSULTANT_MEMORY_TOKEN_BUDGET} tokens）"
+    )
+    print("=" * 88)
+    print(f"{'会话长度':<12}{'实现':<10}{'平均历史 tokens':>16}{'最大历史 tokens':>16}{'平均加载耗时':>14}")
+    print("-" * 88)
+    for turn in checkpoints:
+        for mode in thread_ids:
+            window = results[mode].get(turn)
+            if not window:
+                continue
+            print(
+                f"{'≤' + str(turn) + ' 轮':<12}{mode:<10}"
+                f"{statistics.mean(t for t, _, _ in window):>16.0f}{max(t for t, _, _ in window):>16}"
+                f"{statistics.mean(s for _, _, s in window) * 1000:>12.2f}ms"
+            )
+    print("-" * 88)
+    if summary["seconds"]:
+        print(
+            f"后台摘要：{summary['calls']} 次 LLM 调用（{summary['calls'] / turns:.2f} 次/轮），"
+            f"平均 {statistics.mean(summary['seconds']) * 1000:.0f}ms（不阻塞对话）"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=100, help="对话轮数")
+    parser.add_argument("--answer-chars", type=int, default=300, help="普通 AI 回答的字数")
+    parser.add_argument("--long-chars", type=int, default=6000, help="超长 AI 回答的字数")
+    parser.add_argument("--long-every", type=int, default=10, help="每隔多少轮出现一个超长回答（0 表示没有）")
+    parser.add_argument("--latency", type=float, default=0.2, help="假 LLM 的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    from backend.utils.fake_llm_server import FakeLLMServer
+
+    server = FakeLLMServer(latency=args.latency, port=args.port, token_delay=0.0)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假服务
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.chdir(project_root)
+
+    marks = sorted({t for t in (10, 20, 50, 100, 200, 500) if t < args.turns} | {args.turns})
+    try:
+        asyncio.run(run_benchmark(server, args.turns, args.answer_chars, args.long_chars, args.long_every, marks))
+    finally:
+        server.stop()
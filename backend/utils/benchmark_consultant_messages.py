@@ -0,0 +1,145 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话消息存储基准测试
+模拟一个会话连续进行多轮对话，每轮执行"加载最近 4 条消息作为上下文 + 保存本轮两条消息"，对比：
+- json：旧实现，读取 consultant_records.messages 整个 JSON 数组，复制、追加两条后整体写回
+- append：consultant_messages 表，按 (thread_id, seq) 倒序取 4 条 + 一次批量 INSERT 追加
+
+统计不同会话长度下每轮的平均耗时和每轮写入的字节数（JSON 实现每轮写回完整历史）
+需要 .env 中配置好数据库；测试结束后删除产生的顾问对话记录
+
+用法：
+    python backend/utils/benchmark_consultant_messages.py --turns 500 --answer-chars 1500
+"""
+import sys
+import json
+import time
+import uuid
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config import SessionLocal, init_db
+from backend.models import User, ConsultantRecord, ConsultantMessage
+from backend.utils.consultant_store import load_recent_messages, append_messages
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _turn_messages(turn: int, answer_chars: int) -> list:
+    return [
+        {"role": "human", "content": f"第 {turn} 个问题：面试中如何介绍自己的项目经历？"},
+        {"role": "ai", "content": "回" * answer_chars, "tools_used": ["knowledge_base"]}
+    ]
+
+
+def json_turn(thread_id: str, turn: int, answer_chars: int) -> int:
+    """旧实现：读取整个 JSON 数组，追加后整体写回；返回写入的字节数"""
+    db = SessionLocal()
+    try:
+        record = db.query(ConsultantRecord).filter(
+            ConsultantRecord.thread_id == thread_id,
+            ConsultantRecord.user_name == BENCHMARK_USER
+        ).first()
+        if record and record.messages:
+            _ = record.messages[-4:]
+
+        messages = record.messages.copy() if record and record.messages else []
+        messages.extend(_turn_messages(turn, answer_chars))
+        if record:
+            record.messages = messages
+        else:
+            db.add(ConsultantRecord(thread_id=thread_id, user_name=BENCHMARK_USER, title="benchmark", messages=messages))
+        db.commit()
+        return len(json.dumps(messages, ensure_ascii=False).encode("utf-8"))
+    finally:
+        db.close()
+
+
+def append_turn(thread_id: str, turn: int, answer_chars: int) -> int:
+    """追加写入：倒序取最近 4 条 + 批量 INSERT 两条；返回写入的字节数"""
+    db = SessionLocal()
+    try:
+        record = db.query(ConsultantRecord).filter(
+            ConsultantRecord.thread_id == thread_id,
+            ConsultantRecord.user_name == BENCHMARK_USER
+        ).first()
+        if record:
+            load_recent_messages(db, record, 4)
+
+        messages = _turn_messages(turn, answer_chars)
+        append_messages(db, thread_id, BENCHMARK_USER, messages, title="benchmark")
+        db.commit()
+        return len(json.dumps(messages, ensure_ascii=False).encode("utf-8"))
+    finally:
+        db.close()
+
+
+def run_benchmark(turns: int, answer_chars: int, checkpoints: list) -> None:
+    init_db()
+    _ensure_user()
+    thread_ids = {"json": f"benchmark-json-{uuid.uuid4()}", "append": f"benchmark-append-{uuid.uuid4()}"}
+    functions = {"json": json_turn, "append": append_turn}
+    # {实现: {会话长度（轮）: [(耗时, 写入字节数)]}}
+    results = {name: {} for name in functions}
+
+    try:
+        for name, turn_fn in functions.items():
+            window = []
+            for turn in range(1, turns + 1):
+                start = time.perf_counter()
+                written = turn_fn(thread_ids[name], turn, answer_chars)
+                window.append((time.perf_counter() - start, written))
+                if turn in checkpoints:
+                    results[name][turn] = window
+                    window = []
+    finally:
+        db = SessionLocal()
+        try:
+            ids = list(thread_ids.values())
+            db.query(ConsultantMessage).filter(ConsultantMessage.thread_id.in_(ids)).delete(synchronize_session=False)
+            db.query(ConsultantRecord).filter(ConsultantRecord.thread_id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    print("\n" + "=" * 80)
+    print(f"📊 顾问对话消息存储基准测试（{turns} 轮，每个回答 {answer_chars} 字）")
+    print("=" * 80)
+    print(f"{'会话长度':<12}{'实现':<10}{'每轮耗时':>14}{'每轮写入':>16}")
+    print("-" * 80)
+    for turn in checkpoints:
+        for name in functions:
+            window = results[name].get(turn)
+            if not window:
+                continue
+            print(
+                f"{'≤' + str(turn) + ' 轮':<12}{name:<10}"
+                f"{statistics.mean(t for t, _ in window) * 1000:>12.2f}ms"
+                f"{statistics.mean(b for _, b in window) / 1024:>14.1f}KB"
+            )
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=500, help="对话轮数")
+    parser.add_argument("--answer-chars", type=int, default=1500, help="每个 AI 回答的字数")
+    args = parser.parse_args()
+
+    marks = sorted({t for t in (10, 50, 100, 200, 500, 1000, 2000) if t < args.turns} | {args.turns})
+    run_benchmark(args.turns, args.answer_chars, marks)
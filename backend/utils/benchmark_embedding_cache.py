@@ -0,0 +1,117 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Embedding 缓存基准测试
+使用本地假 LLM 服务（含 Embedding 接口），在临时目录中建立知识库索引和 Embedding 缓存，统计：
+- 知识库索引：首次构建 / 全量重建（--rebuild）各自的 Embedding 请求数和耗时
+- 知识库检索：对一批常见问题重复执行 search_knowledge_base，对比不带缓存和带缓存的平均耗时与 Embedding 请求数
+
+用法：
+    python backend/utils/benchmark_embedding_cache.py --repeat 5 --embedding-latency 0.15
+"""
+import os
+import sys
+import time
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+
+# 顾问对话中的常见问题
+QUERIES = [
+    "如何谈薪资",
+    "简历怎么写",
+    "STAR法则是什么",
+    "面试紧张怎么办",
+    "职业空窗期怎么解释",
+    "离职原因怎么回答"
+]
+
+
+def run_queries(repeat: int) -> list:
+    from backend.graph.tools.consultant_tools import search_knowledge_base
+    latencies = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            search_knowledge_base.invoke(query)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_benchmark(server: FakeLLMServer, db_path: Path, repeat: int) -> None:
+    from backend.graph.llm import openai_embeddings, raw_openai_embeddings, embedding_cache
+    from backend.graph.rag.init_vectorstore import sync_knowledge_base
+    import backend.graph.tools.consultant_tools  # noqa: F401
+    consultant_tools = sys.modules["backend.graph.tools.consultant_tools"]
+
+    # 离线环境无法下载 tiktoken 分词表，直接发送原文
+    raw_openai_embeddings.check_embedding_ctx_length = False
+
+    index_results = []
+    for name, rebuild in (("首次构建", False), ("全量重建", True)):
+        before = server.embedding_request_count
+        stats = sync_knowledge_base(db_path=db_path, rebuild=rebuild)
+        index_results.append((name, stats, server.embedding_request_count - before))
+
+    consultant_tools.CHROMA_DB_PATH = db_path
+    query_results = {}
+    for name, embeddings in (("不带缓存", raw_openai_embeddings), ("带缓存", openai_embeddings)):
+        consultant_tools.openai_embeddings = embeddings
+        consultant_tools._vectorstore = None
+        before = server.embedding_request_count
+        latencies = run_queries(repeat)
+        query_results[name] = {
+            "mean": statistics.mean(latencies),
+            "embedding": server.embedding_request_count - before,
+            "calls": len(latencies)
+        }
+
+    print("\n" + "=" * 72)
+    print(f"📊 Embedding 缓存基准测试（{len(QUERIES)} 个问题 x {repeat} 次）")
+    print("=" * 72)
+    print(f"{'知识库索引':<12}{'向量化文档块':>12}{'缓存命中':>10}{'Embedding 请求':>16}{'耗时':>10}")
+    print("-" * 72)
+    for name, stats, requests in index_results:
+        print(f"{name:<14}{stats['added']:>14}{stats['cache_hits']:>12}{requests:>14}{stats['timings']['total']:>12.2f}s")
+    print("-" * 72)
+    print(f"{'知识库检索':<12}{'检索次数':>12}{'平均耗时':>12}{'Embedding 请求':>16}")
+    print("-" * 72)
+    for name, r in query_results.items():
+        print(f"{name:<14}{r['calls']:>14}{r['mean'] * 1000:>12.0f}ms{r['embedding']:>14}")
+    print("-" * 72)
+    cache_stats = embedding_cache.stats()
+    print(
+        f"Embedding 缓存：内存命中 {cache_stats['memory_hits']}，SQLite 命中 {cache_stats['db_hits']}，"
+        f"未命中 {cache_stats['misses']}，命中率 {cache_stats['hit_rate']:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5, help="每个问题的检索次数")
+    parser.add_argument("--embedding-latency", type=float, default=0.15, help="假 Embedding 接口每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=0.0, port=args.port, embedding_latency=args.embedding_latency)
+    base_url = server.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 在导入 backend 配置之前指向假服务，Embedding 缓存写入临时目录
+        os.environ["OPENAI_API_BASE"] = base_url
+        os.environ["OPENAI_API_KEY"] = "fake-key"
+        os.environ["MODEL_NAME"] = "fake-llm"
+        os.environ["EMBEDDING_CACHE_ENABLED"] = "true"
+        os.environ["EMBEDDING_CACHE_DB_PATH"] = str(Path(tmp) / "embedding_cache.sqlite")
+        os.chdir(project_root)
+
+        try:
+            run_benchmark(server, Path(tmp) / "chroma_db", args.repeat)
+        finally:
+            server.stop()
@@ -0,0 +1,169 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+面试流式接口基准测试
+使用本地假 LLM 服务和真实的 uvicorn 服务（TestClient 会缓冲整个响应，无法测量首字节时间），对比：
+- 非流式接口：/api/interview/start、/api/interview/submit，客户端拿到第一个字节就是完整响应
+- 流式接口：/api/interview/start/stream、/api/interview/submit/stream
+
+统计首字节时间（TTFB）、第一个问题 / 报告 token 的时间和总耗时
+需要 .env 中配置好数据库；测试结束后删除产生的面试记录
+
+用法：
+    python backend/utils/benchmark_interview_stream.py --sessions 3 --latency 1.0
+"""
+import os
+import sys
+import json
+import time
+import threading
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+from backend.utils.synthetic_pdf import make_resume_pdf
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    from backend.config import SessionLocal
+    from backend.models import User
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _timed_request(client, path: str, **kwargs) -> dict:
+    """
+    发送请求并记录首字节时间、第一个 token 的时间和总耗时
+
+    Returns:
+        {"ttfb", "first_token", "total", "body"}（流式接口的 body 为 done 事件的 data）
+    """
+    start = time.perf_counter()
+    ttfb = first_token = None
+    body = None
+    chunks = []
+    with client.stream("POST", path, **kwargs) as response:
+        response.raise_for_status()
+        for chunk in response.iter_text():
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+            chunks.append(chunk)
+            if first_token is None and '"type": "token"' in chunk:
+                first_token = time.perf_counter() - start
+    total = time.perf_counter() - start
+
+    text = "".join(chunks)
+    if path.endswith("/stream"):
+        for line in text.splitlines():
+            if line.startswith("data: "):
+                event = json.loads(line[len("data: "):])
+                if event["type"] == "done":
+                    body = event["data"]
+                elif event["type"] == "error":
+                    raise RuntimeError(event["content"])
+    else:
+        body = json.loads(text)
+        first_token = total
+    return {"ttfb": ttfb, "first_token": first_token, "total": total, "body": body}
+
+
+def run_benchmark(base_url: str, sessions: int, rounds: int) -> None:
+    import httpx
+
+    _ensure_user()
+    headers = {"X-User-Name": BENCHMARK_USER}
+    results = {}
+    thread_ids = []
+
+    with httpx.Client(base_url=base_url, timeout=300) as client:
+        try:
+            for streaming in (False, True):
+                suffix = "/stream" if streaming else ""
+                for i in range(sessions):
+                    # 每次使用不同的简历，避免命中简历解析缓存
+                    pdf = make_resume_pdf(pages=1, seed=int(time.time() * 1000) % 100000 + i)
+                    start = _timed_request(
+                        client, f"/api/interview/start{suffix}",
+                        files={"file": (f"resume_{i}.pdf", pdf, "application/pdf")},
+                        data={"max_rounds": str(rounds)},
+                        headers=headers
+                    )
+                    thread_id = start["body"]["thread_id"]
+                    thread_ids.append(thread_id)
+                    results.setdefault((streaming, "start"), []).append(start)
+
+                    for round_index in range(rounds):
+                        submit = _timed_request(
+                            client, f"/api/interview/submit{suffix}",
+                            json={"thread_id": thread_id, "answer": "我不太清楚", "user_name": BENCHMARK_USER}
+                        )
+                        stage = "submit(报告)" if round_index == rounds - 1 else "submit(出题)"
+                        results.setdefault((streaming, stage), []).append(submit)
+        finally:
+            for thread_id in thread_ids:
+                client.delete(f"/api/interview/records/{thread_id}", headers=headers)
+
+    print("\n" + "=" * 86)
+    print(f"📊 面试流式接口基准测试 ({sessions} 场面试 x {rounds} 轮)")
+    print("=" * 86)
+    print(f"{'接口':<16}{'模式':<10}{'首字节':>14}{'首个 token':>16}{'总耗时':>14}")
+    print("-" * 86)
+    for stage in ("start", "submit(出题)", "submit(报告)"):
+        for streaming in (False, True):
+            samples = results.get((streaming, stage))
+            if not samples:
+                continue
+            ttfb = statistics.mean(s["ttfb"] for s in samples) * 1000
+            first_token = statistics.mean(s["first_token"] for s in samples) * 1000
+            total = statistics.mean(s["total"] for s in samples) * 1000
+            print(f"{stage:<16}{'流式' if streaming else '非流式':<10}{ttfb:>12.0f}ms{first_token:>14.0f}ms{total:>12.0f}ms")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=3, help="每种模式的面试场数")
+    parser.add_argument("--rounds", type=int, default=2, help="每场面试的轮数")
+    parser.add_argument("--latency", type=float, default=1.0, help="假 LLM 每次请求的首 token 延迟（秒）")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="假 LLM 每个 token 的生成间隔（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    parser.add_argument("--app-port", type=int, default=18000, help="后端服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=args.latency, port=args.port, token_delay=args.token_delay)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假 LLM 服务，关闭联网搜索和 LLM 响应缓存（每次都真实调用 LLM）
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+    (project_root / "checkpoints-sqlite").mkdir(exist_ok=True)
+
+    import uvicorn
+    from backend.main import app
+
+    app_server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.app_port, log_level="warning"))
+    app_thread = threading.Thread(target=app_server.run, daemon=True)
+    app_thread.start()
+    while not app_server.started:
+        time.sleep(0.05)
+
+    try:
+        run_benchmark(f"http://127.0.0.1:{args.app_port}", args.sessions, args.rounds)
+    finally:
+        app_server.should_exit = True
+        app_thread.join(timeout=10)
+        server.stop()
@@ -0,0 +1,93 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+PDF 解析基准测试
+使用合成多页 PDF 对比：
+- 旧实现：在事件循环中直接调用 parse_pdf（不限页数）
+- 新实现：PDFParseService.aparse（进程池 + 页数/文本上限 + 超时）
+
+统计每种页数下的解析耗时、提取的文本长度，以及并发解析期间事件循环的最大卡顿时间
+
+用法：
+    python backend/utils/benchmark_pdf_parser.py --pages 1 20 200 --concurrency 4
+"""
+import sys
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.pdf_parser import parse_pdf
+from backend.utils.pdf_service import PDFParseService
+from backend.utils.synthetic_pdf import make_resume_pdf
+
+
+async def _monitor_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """每 interval 秒唤醒一次，返回最大的唤醒延迟（秒）"""
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - start - interval)
+    return max_lag
+
+
+async def _run(parse_coro_factory, paths) -> tuple:
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_loop_lag(stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    texts = await asyncio.gather(*(parse_coro_factory(path) for path in paths))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    max_lag = await monitor
+    return elapsed, max_lag, sum(len(text) for text in texts) // len(texts)
+
+
+async def run_benchmark(page_levels, concurrency: int, workers: int) -> None:
+    service = PDFParseService(max_workers=workers)
+
+    async def blocking_parse(path):
+        # 旧实现：同步解析，直接阻塞事件循环
+        return parse_pdf(path)
+
+    print("=" * 96)
+    print(f"📊 PDF 解析基准测试 (每种页数并发解析 {concurrency} 份，进程池 {workers} 个进程，"
+          f"最多 {service.max_pages} 页 / {service.max_chars} 字符)")
+    print("=" * 96)
+    print(f"{'页数':<8}{'实现':<10}{'文件大小':>12}{'总耗时':>12}{'事件循环最大卡顿':>20}{'平均文本长度':>16}")
+    print("-" * 96)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 预热进程池，避免把进程启动时间计入第一组结果
+        warm_path = Path(tmp_dir) / "warm.pdf"
+        warm_path.write_bytes(make_resume_pdf(pages=1))
+        await service.aparse(str(warm_path))
+
+        for pages in page_levels:
+            paths = []
+            for i in range(concurrency):
+                path = Path(tmp_dir) / f"resume-{pages}-{i}.pdf"
+                path.write_bytes(make_resume_pdf(pages=pages, seed=i))
+                paths.append(str(path))
+            size_kb = Path(paths[0]).stat().st_size / 1024
+
+            for name, factory in (("旧实现", blocking_parse), ("进程池", service.aparse)):
+                elapsed, max_lag, avg_len = await _run(factory, paths)
+                print(f"{pages:<8}{name:<10}{size_kb:>10.1f}KB{elapsed * 1000:>10.0f}ms{max_lag * 1000:>18.0f}ms{avg_len:>16}")
+
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 20, 200], help="合成 PDF 的页数")
+    parser.add_argument("--concurrency", type=int, default=4, help="每种页数并发解析的文件数")
+    parser.add_argument("--workers", type=int, default=2, help="进程池大小")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.pages, args.concurrency, args.workers))
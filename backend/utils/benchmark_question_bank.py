@@ -0,0 +1,123 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+面试题库基准测试
+使用本地假 LLM 服务（含 Embedding 接口）和假搜索服务，在临时目录中建立题库索引，
+对同一批出题话题执行 search_interview_questions，对比：
+- 只联网搜索：每次都要一次 Tavily 搜索 + 一次提炼 LLM 调用
+- 题库优先：先检索本地题库，未命中才联网搜索（提炼结果写入题库）
+
+统计每次出题搜索的平均耗时、Tavily 请求数、LLM 调用数、Embedding 请求数和题库命中率
+
+用法：
+    python backend/utils/benchmark_question_bank.py --repeat 3 --latency 0.8 --search-latency 0.5
+"""
+import os
+import sys
+import time
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+from backend.utils.fake_search_server import FakeSearchServer
+
+# 出题时常见的搜索话题（前几个在精选题库中有对应的岗位 / 话题）
+TOPICS = [
+    "Java开发工程师 面试题",
+    "Java开发工程师 Redis 缓存",
+    "Java开发工程师 并发编程",
+    "前端开发工程师 性能优化",
+    "Python后端开发工程师 异步编程",
+    "项目难点 面试题",
+    "Go开发工程师 面试题",
+    "产品经理 面试题"
+]
+
+
+def run_topics(repeat: int) -> list:
+    from backend.graph.tools.interviewer_tools import search_interview_questions
+    latencies = []
+    for _ in range(repeat):
+        for topic in TOPICS:
+            start = time.perf_counter()
+            search_interview_questions.invoke(topic)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_benchmark(llm_server: FakeLLMServer, search_server: FakeSearchServer, repeat: int) -> None:
+    from backend.graph.llm import raw_openai_embeddings
+    from backend.graph.rag import question_bank
+    from backend.graph.rag.init_question_bank import init_question_bank
+
+    # 离线环境无法下载 tiktoken 分词表，直接发送原文
+    raw_openai_embeddings.check_embedding_ctx_length = False
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        question_bank.CHROMA_DB_PATH = Path(tmp)
+        init_question_bank()
+
+        for name, enabled in (("只联网搜索", False), ("题库优先", True)):
+            question_bank.QUESTION_BANK_ENABLED = enabled
+            before = (llm_server.request_count, llm_server.embedding_request_count, search_server.request_count)
+            latencies = run_topics(repeat)
+            # 等待后台写入题库完成
+            question_bank._learn_executor.submit(lambda: None).result()
+            results[name] = {
+                "mean": statistics.mean(latencies),
+                "llm": llm_server.request_count - before[0],
+                "embedding": llm_server.embedding_request_count - before[1],
+                "search": search_server.request_count - before[2],
+                "calls": len(latencies)
+            }
+        metrics = question_bank.get_question_bank_metrics()
+        question_bank._question_bank = None
+
+    print("\n" + "=" * 86)
+    print(f"📊 面试题库基准测试 ({len(TOPICS)} 个话题 x {repeat} 次)")
+    print("=" * 86)
+    print(f"{'实现':<12}{'出题搜索次数':>12}{'平均耗时':>12}{'Tavily 请求':>14}{'LLM 调用':>12}{'Embedding':>12}")
+    print("-" * 86)
+    for name, r in results.items():
+        print(f"{name:<12}{r['calls']:>14}{r['mean'] * 1000:>12.0f}ms{r['search']:>12}{r['llm']:>12}{r['embedding']:>12}")
+    print("-" * 86)
+    print(f"题库优先：检索 {metrics['lookups']} 次，命中率 {metrics['hit_rate']:.1%}，联网补充写入 {metrics['learned']} 个话题")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3, help="每个话题的出题次数")
+    parser.add_argument("--latency", type=float, default=0.8, help="假 LLM 每次请求的延迟（秒）")
+    parser.add_argument("--embedding-latency", type=float, default=0.05, help="假 Embedding 接口的延迟（秒）")
+    parser.add_argument("--search-latency", type=float, default=0.5, help="假搜索服务每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    parser.add_argument("--search-port", type=int, default=18090, help="假搜索服务端口")
+    args = parser.parse_args()
+
+    llm_server = FakeLLMServer(latency=args.latency, port=args.port, embedding_latency=args.embedding_latency)
+    search_server = FakeSearchServer(latency=args.search_latency, port=args.search_port)
+    base_url = llm_server.start()
+    search_url = search_server.start()
+
+    # 在导入 backend 配置之前指向假服务，关闭 LLM 响应缓存、搜索结果缓存和 Embedding 缓存（每次都真实请求）
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = "fake-key"
+    os.environ["TAVILY_API_BASE"] = search_url
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["SEARCH_CACHE_ENABLED"] = "false"
+    os.environ["EMBEDDING_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+
+    try:
+        run_benchmark(llm_server, search_server, args.repeat)
+    finally:
+        search_server.stop()
+        llm_server.stop()
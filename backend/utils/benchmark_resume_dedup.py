@@ -0,0 +1,128 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+简历去重基准测试
+使用合成 PDF 和本地假 LLM 服务，通过 /api/interview/start 接口重复上传相同简历，统计：
+- 首次上传与重复上传的接口耗时（重复上传跳过 PDF 解析和 LLM 提取）
+- 按内容寻址存储节省的磁盘空间
+- LLM 请求次数
+
+需要 .env 中配置好数据库；测试结束后删除产生的面试记录和简历缓存
+
+用法：
+    python backend/utils/benchmark_resume_dedup.py --distinct 3 --repeats 5 --latency 0.5
+"""
+import os
+import sys
+import time
+import hashlib
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+from backend.utils.synthetic_pdf import make_resume_pdf
+
+BENCHMARK_USER = "benchmark_user"
+
+
+def _ensure_user() -> None:
+    from backend.config import SessionLocal
+    from backend.models import User
+    db = SessionLocal()
+    try:
+        if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+            db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup(client, thread_ids, content_hashes) -> None:
+    from backend.config import SessionLocal
+    from backend.models import ResumeCache
+    for thread_id in thread_ids:
+        client.delete(f"/api/interview/records/{thread_id}", headers={"X-User-Name": BENCHMARK_USER})
+    db = SessionLocal()
+    try:
+        db.query(ResumeCache).filter(ResumeCache.content_hash.in_(list(content_hashes))).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_benchmark(server: FakeLLMServer, distinct: int, repeats: int, pages: int) -> None:
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    _ensure_user()
+    resumes = [make_resume_pdf(pages=pages, seed=1000 + i) for i in range(distinct)]
+    content_hashes = {hashlib.sha256(data).hexdigest() for data in resumes}
+
+    first_latencies, repeat_latencies = [], []
+    thread_ids = []
+    uploaded_bytes = 0
+
+    with TestClient(app) as client:
+        try:
+            for round_index in range(repeats):
+                for i, data in enumerate(resumes):
+                    requests_before = server.request_count
+                    start = time.perf_counter()
+                    response = client.post(
+                        "/api/interview/start",
+                        files={"file": (f"resume_{i}.pdf", data, "application/pdf")},
+                        data={"max_rounds": "3"},
+                        headers={"X-User-Name": BENCHMARK_USER}
+                    )
+                    elapsed = time.perf_counter() - start
+                    response.raise_for_status()
+                    thread_ids.append(response.json()["thread_id"])
+                    uploaded_bytes += len(data)
+
+                    (first_latencies if round_index == 0 else repeat_latencies).append(elapsed)
+                    if round_index < 2 and i == 0:
+                        print(f"   上传 #{round_index + 1}: {elapsed * 1000:.0f} ms, LLM 请求 {server.request_count - requests_before} 次")
+        finally:
+            _cleanup(client, thread_ids, content_hashes)
+
+    stored_bytes = sum(len(data) for data in resumes)
+    print("\n" + "=" * 80)
+    print(f"📊 简历去重基准测试 ({distinct} 份简历 x {repeats} 次上传, 每份 {pages} 页)")
+    print("=" * 80)
+    print(f"首次上传平均耗时:   {statistics.mean(first_latencies) * 1000:>8.0f} ms")
+    if repeat_latencies:
+        print(f"重复上传平均耗时:   {statistics.mean(repeat_latencies) * 1000:>8.0f} ms")
+    print(f"上传总量:           {uploaded_bytes / 1024:>8.1f} KB (旧实现按 thread_id 每次保存一份)")
+    print(f"实际存储:           {stored_bytes / 1024:>8.1f} KB (节省 {(1 - stored_bytes / uploaded_bytes) * 100:.0f}%)")
+    print(f"LLM 请求总数:       {server.request_count:>8}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--distinct", type=int, default=3, help="不同简历的数量")
+    parser.add_argument("--repeats", type=int, default=5, help="每份简历上传次数")
+    parser.add_argument("--pages", type=int, default=2, help="每份简历页数")
+    parser.add_argument("--latency", type=float, default=0.5, help="假 LLM 每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=args.latency, port=args.port)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假 LLM 服务，关闭联网搜索和 LLM 响应缓存（只测量简历去重的效果）
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+    (project_root / "checkpoints-sqlite").mkdir(exist_ok=True)
+
+    try:
+        run_benchmark(server, args.distinct, args.repeats, args.pages)
+    finally:
+        server.stop()
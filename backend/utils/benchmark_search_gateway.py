@@ -0,0 +1,137 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+搜索网关基准测试
+使用本地假搜索服务，模拟多名候选人并发面试时的搜索请求（同一岗位的查询几乎相同，只有大小写、空格、标点不同），对比：
+- 直接调用：每次搜索创建新的 TavilyClient（旧实现）
+- 搜索网关：共享连接池 + 规范化查询缓存 + 相同查询请求合并
+
+统计实际发往搜索服务的请求数、缓存命中率和每次搜索的耗时
+
+用法：
+    python backend/utils/benchmark_search_gateway.py --candidates 40 --concurrency 8 --latency 0.3
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_search_server import FakeSearchServer
+
+POSITIONS = ["Java开发工程师", "Python后端工程师", "前端开发工程师"]
+ROUND_TOPICS = ["{position} 面试题", "{position} 项目难点 面试题", "{position} 软技能 HR 面试题"]
+WEAK_TOPICS = ["Redis 持久化机制", "MySQL 索引优化", "分布式事务", "JVM 垃圾回收", "消息队列可靠性"]
+
+
+def _variant(query: str, rng: random.Random) -> str:
+    """生成查询的近似写法（大小写、多余空格、结尾标点）"""
+    if rng.random() < 0.3:
+        query = query.lower()
+    if rng.random() < 0.3:
+        query = query.replace(" ", "  ")
+    if rng.random() < 0.3:
+        query += "？"
+    return query
+
+
+def build_workload(candidates: int, seed: int = 42) -> list:
+    """
+    生成每名候选人的搜索列表：[(查询, 搜索深度, 结果数), ...]
+    """
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(candidates):
+        position = rng.choice(POSITIONS)
+        searches = [(_variant(t.format(position=position), rng), "advanced", 3) for t in ROUND_TOPICS]
+        searches += [(_variant(t, rng), "advanced", 2) for t in rng.sample(WEAK_TOPICS, 2)]
+        workload.append(searches)
+    return workload
+
+
+def run_candidate(search, searches: list) -> list:
+    latencies = []
+    for query, depth, max_results in searches:
+        start = time.perf_counter()
+        search(query, depth, max_results)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_benchmark(server: FakeSearchServer, candidates: int, concurrency: int) -> None:
+    from tavily import TavilyClient
+    from backend.config import TAVILY_API_KEY, TAVILY_API_BASE
+    from backend.graph.tools.search_gateway import SearchCache, SearchGateway
+
+    def direct_search(query, depth, max_results):
+        return TavilyClient(api_key=TAVILY_API_KEY, api_base_url=TAVILY_API_BASE).search(
+            query=query, search_depth=depth, max_results=max_results
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        gateway = SearchGateway(
+            api_key=TAVILY_API_KEY,
+            api_base_url=TAVILY_API_BASE,
+            pool_size=concurrency,
+            cache=SearchCache(db_path=str(Path(tmp) / "search_cache.sqlite"))
+        )
+
+        def gateway_search(query, depth, max_results):
+            return gateway.search(query, search_depth=depth, max_results=max_results)
+
+        workload = build_workload(candidates)
+        results = {}
+        for name, search in (("直接调用", direct_search), ("搜索网关", gateway_search)):
+            requests_before = server.request_count
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                latencies = [l for ls in executor.map(lambda s: run_candidate(search, s), workload) for l in ls]
+            results[name] = {
+                "backend_requests": server.request_count - requests_before,
+                "searches": len(latencies),
+                "mean": statistics.mean(latencies),
+                "p95": statistics.quantiles(latencies, n=20)[-1],
+                "total": time.perf_counter() - start
+            }
+        metrics = gateway.metrics()
+        gateway.close()
+
+    print("\n" + "=" * 86)
+    print(f"📊 搜索网关基准测试 ({candidates} 名候选人，并发 {concurrency})")
+    print("=" * 86)
+    print(f"{'实现':<10}{'搜索次数':>10}{'实际请求':>10}{'平均耗时':>14}{'P95':>14}{'总耗时':>12}")
+    print("-" * 86)
+    for name, r in results.items():
+        print(f"{name:<10}{r['searches']:>12}{r['backend_requests']:>12}"
+              f"{r['mean'] * 1000:>14.0f}ms{r['p95'] * 1000:>12.0f}ms{r['total']:>11.2f}s")
+    print("-" * 86)
+    print(f"搜索网关：缓存命中率 {metrics['hit_rate']:.1%}，合并请求 {metrics['coalesced']} 次，"
+          f"节省率 {metrics['saved_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=40, help="候选人数")
+    parser.add_argument("--concurrency", type=int, default=8, help="同时面试的候选人数")
+    parser.add_argument("--latency", type=float, default=0.3, help="假搜索服务每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18090, help="假搜索服务端口")
+    args = parser.parse_args()
+
+    server = FakeSearchServer(latency=args.latency, port=args.port)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假搜索服务
+    os.environ["TAVILY_API_KEY"] = "fake-key"
+    os.environ["TAVILY_API_BASE"] = base_url
+
+    try:
+        run_benchmark(server, args.candidates, args.concurrency)
+    finally:
+        server.stop()
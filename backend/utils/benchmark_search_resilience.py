@@ -0,0 +1,132 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+搜索重试 / 熔断基准测试
+使用本地假搜索服务模拟搜索后端故障（全部返回 503），在同一个事件循环中并发执行顾问的 tavily_search，对比：
+- 旧实现：同步工具在事件循环中重试（每次失败 time.sleep(1)，最多 3 次）
+- 新实现：tavily_search.ainvoke（指数退避 + 抖动、截止时间、熔断，等待不阻塞事件循环）
+
+统计每次搜索的耗时、事件循环的最大卡顿时间（心跳协程的最大延迟）和实际发往搜索服务的请求数
+
+用法：
+    python backend/utils/benchmark_search_resilience.py --requests 20 --concurrency 5
+"""
+import os
+import sys
+import time
+import asyncio
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_search_server import FakeSearchServer
+
+
+def legacy_tavily_search(query: str) -> str:
+    """旧版 tavily_search：每次创建客户端，失败后 time.sleep(1) 重试"""
+    from tavily import TavilyClient
+    from backend.config import TAVILY_API_KEY, TAVILY_API_BASE
+
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            tavily = TavilyClient(api_key=TAVILY_API_KEY, api_base_url=TAVILY_API_BASE)
+            return str(tavily.search(query=query, search_depth="basic", max_results=3))
+        except Exception:
+            if attempt < max_retries - 1:
+                time.sleep(1)
+                continue
+            return "联网搜索暂时不可用，请稍后再试"
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list, interval: float = 0.05) -> None:
+    """每 interval 秒醒来一次，记录实际唤醒的延迟（事件循环被阻塞的时间）"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_scenario(call, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call(f"2026 年 Java 面试趋势 {i % 4}")
+            latencies.append(time.perf_counter() - start)
+
+    stop = asyncio.Event()
+    lags = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    total = time.perf_counter() - start
+    stop.set()
+    await heartbeat
+    return {
+        "mean": statistics.mean(latencies),
+        "max": max(latencies),
+        "max_lag": max(lags) if lags else 0.0,
+        "total": total
+    }
+
+
+async def run_benchmark(server: FakeSearchServer, requests: int, concurrency: int) -> None:
+    from backend.graph.tools.consultant_tools import tavily_search
+    from backend.graph.tools.search_gateway import get_search_metrics, close_search_gateway
+
+    async def legacy(query: str) -> str:
+        # 旧实现的同步工具直接在事件循环中执行
+        return legacy_tavily_search(query)
+
+    async def new(query: str) -> str:
+        return await tavily_search.ainvoke(query)
+
+    results = {}
+    for name, call in (("旧实现", legacy), ("新实现", new)):
+        before = server.request_count
+        results[name] = await run_scenario(call, requests, concurrency)
+        results[name]["backend_requests"] = server.request_count - before
+    metrics = get_search_metrics()
+    close_search_gateway()
+
+    print("\n" + "=" * 86)
+    print(f"📊 搜索故障基准测试 ({requests} 次搜索，并发 {concurrency}，搜索服务全部返回 503)")
+    print("=" * 86)
+    print(f"{'实现':<10}{'平均耗时':>12}{'最大耗时':>12}{'事件循环最大卡顿':>18}{'总耗时':>10}{'实际请求':>10}")
+    print("-" * 86)
+    for name, r in results.items():
+        print(f"{name:<10}{r['mean'] * 1000:>12.0f}ms{r['max'] * 1000:>10.0f}ms"
+              f"{r['max_lag'] * 1000:>18.0f}ms{r['total']:>10.2f}s{r['backend_requests']:>10}")
+    print("-" * 86)
+    print(f"新实现：重试 {metrics['retries']} 次，熔断直接失败 {metrics['short_circuited']} 次，"
+          f"超过截止时间 {metrics['deadline_exceeded']} 次，熔断器状态 {metrics['breaker_state']}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20, help="每种实现的搜索次数")
+    parser.add_argument("--concurrency", type=int, default=5, help="并发搜索数")
+    parser.add_argument("--latency", type=float, default=0.1, help="假搜索服务每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18090, help="假搜索服务端口")
+    args = parser.parse_args()
+
+    server = FakeSearchServer(latency=args.latency, port=args.port, error_rate=1.0)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假搜索服务，关闭搜索缓存（失败结果本来也不会缓存）
+    os.environ["TAVILY_API_KEY"] = "fake-key"
+    os.environ["TAVILY_API_BASE"] = base_url
+    os.environ["SEARCH_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+
+    try:
+        asyncio.run(run_benchmark(server, args.requests, args.concurrency))
+    finally:
+        server.stop()
@@ -0,0 +1,206 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+提交回答基准测试
+使用本地假 LLM 服务，统计每次提交回答的 checkpoint 读写次数、数据库提交次数和耗时，对比：
+- 旧实现：get_state -> update_state -> invoke(None) -> 提交记录 -> get_state -> （需要时）invoke(None) -> 再次提交
+- 新实现：submit_answer 接口（确认会话存在 -> Command(resume=回答) 一次执行 -> 提交一次记录）
+
+需要 .env 中配置好数据库；测试结束后删除产生的面试记录和会话
+
+用法：
+    python backend/utils/benchmark_submit_answer.py --sessions 5 --rounds 3
+"""
+import os
+import sys
+import time
+import uuid
+import asyncio
+import statistics
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+
+BENCHMARK_USER = "benchmark_user"
+
+# 简历信息已预先填充，parse_resume 节点会直接跳过 PDF 解析
+SAMPLE_RESUME = """### 目标岗位
+Java开发工程师
+
+### 核心技能
+- Java / Spring Boot
+- MySQL / Redis
+"""
+
+# checkpointer 上需要计数的方法：{方法名: 读 / 写}
+CHECKPOINT_METHODS = {
+    "get_tuple": "reads", "list": "reads", "put": "writes", "put_writes": "writes",
+    "aget_tuple": "reads", "alist": "reads", "aput": "writes", "aput_writes": "writes"
+}
+
+
+def _instrument_checkpointer(checkpointer, counter: Counter) -> None:
+    """在 checkpointer 实例上包装读写方法，按读 / 写计数"""
+    for name, kind in CHECKPOINT_METHODS.items():
+        original = getattr(checkpointer, name, None)
+        if original is None:
+            continue
+        if name in ("list", "alist"):
+            def wrapper(*args, _original=original, _kind=kind, **kwargs):
+                counter[f"checkpoint_{_kind}"] += 1
+                return _original(*args, **kwargs)
+        elif name.startswith("a"):
+            async def wrapper(*args, _original=original, _kind=kind, **kwargs):
+                counter[f"checkpoint_{_kind}"] += 1
+                return await _original(*args, **kwargs)
+        else:
+            def wrapper(*args, _original=original, _kind=kind, **kwargs):
+                counter[f"checkpoint_{_kind}"] += 1
+                return _original(*args, **kwargs)
+        setattr(checkpointer, name, wrapper)
+
+
+async def legacy_submit(db, thread_id: str, answer: str) -> dict:
+    """旧版 submit_answer 的执行流程（不含 HTTP 层）"""
+    from backend.graph.workflow import ainvoke_interview, aget_interview_state, aupdate_interview_state
+    from backend.models import InterviewRecord
+
+    config = {"configurable": {"thread_id": thread_id}}
+    current_state = await aget_interview_state(config)
+    history = current_state.values.get('history', [])
+    if history:
+        history[-1]['answer'] = answer
+        await aupdate_interview_state(config, {"history": history})
+
+    result = await ainvoke_interview(None, config)
+    record = db.query(InterviewRecord).filter(InterviewRecord.thread_id == thread_id).first()
+    record.history = result.get('history', [])
+    record.is_finished = result.get('is_finished', False)
+    if record.is_finished:
+        record.report = result.get('report', '')
+    record.updated_at = datetime.now()
+    db.commit()
+
+    if not result.get('is_finished', False):
+        state_info = await aget_interview_state(config)
+        if state_info.next and "interviewer_agent" in state_info.next:
+            result = await ainvoke_interview(None, config)
+            record.history = result.get('history', [])
+            record.updated_at = datetime.now()
+            db.commit()
+    return result
+
+
+async def new_submit(db, thread_id: str, answer: str) -> dict:
+    """新版 submit_answer 接口"""
+    from backend.models.schemas import SubmitAnswerRequest
+    from backend.routes.interview_routes import submit_answer
+    response = await submit_answer(SubmitAnswerRequest(thread_id=thread_id, answer=answer), db)
+    return response.model_dump()
+
+
+async def run_benchmark(sessions: int, rounds: int) -> None:
+    from sqlalchemy import event
+    from backend.config import SessionLocal
+    from backend.config.database import engine
+    from backend.graph.checkpoint import get_checkpointer, get_async_checkpointer, aclose_async_checkpointer
+    from backend.graph.workflow import ainvoke_interview
+    from backend.models import InterviewRecord, User
+
+    counter = Counter()
+    _instrument_checkpointer(get_checkpointer(), counter)
+    async_checkpointer = get_async_checkpointer()
+    if async_checkpointer is not get_checkpointer():
+        _instrument_checkpointer(async_checkpointer, counter)
+    event.listen(engine, "commit", lambda conn: counter.update(["db_commits"]))
+
+    db = SessionLocal()
+    if not db.query(User.user_name).filter(User.user_name == BENCHMARK_USER).first():
+        db.add(User(user_name=BENCHMARK_USER, password="benchmark"))
+        db.commit()
+
+    results = {}
+    thread_ids = []
+    try:
+        for name, submit in (("旧实现", legacy_submit), ("新实现", new_submit)):
+            samples = []
+            for _ in range(sessions):
+                thread_id = f"benchmark-submit-{uuid.uuid4()}"
+                thread_ids.append(thread_id)
+                state = await ainvoke_interview({
+                    "round": 0,
+                    "max_rounds": rounds,
+                    "resume_path": "",
+                    "resume_text": SAMPLE_RESUME,
+                    "target_position": "Java开发工程师",
+                    "history": [],
+                    "report": "",
+                    "is_finished": False
+                }, {"configurable": {"thread_id": thread_id}})
+                db.add(InterviewRecord(
+                    thread_id=thread_id,
+                    user_name=BENCHMARK_USER,
+                    resume_text=SAMPLE_RESUME,
+                    history=state.get('history', []),
+                    report="",
+                    is_finished=False
+                ))
+                db.commit()
+
+                for round_index in range(rounds):
+                    counter.clear()
+                    start = time.perf_counter()
+                    await submit(db, thread_id, f"第 {round_index + 1} 轮回答")
+                    samples.append({**counter, "elapsed": time.perf_counter() - start})
+            results[name] = samples
+    finally:
+        for thread_id in thread_ids:
+            get_checkpointer().delete_thread(thread_id)
+        db.query(InterviewRecord).filter(InterviewRecord.thread_id.in_(thread_ids)).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+        await aclose_async_checkpointer()
+
+    print("\n" + "=" * 86)
+    print(f"📊 提交回答基准测试 ({sessions} 场面试 x {rounds} 轮，每次提交的平均值)")
+    print("=" * 86)
+    print(f"{'实现':<10}{'checkpoint 读':>16}{'checkpoint 写':>16}{'数据库提交':>14}{'耗时':>14}")
+    print("-" * 86)
+    for name, samples in results.items():
+        reads = statistics.mean(s.get("checkpoint_reads", 0) for s in samples)
+        writes = statistics.mean(s.get("checkpoint_writes", 0) for s in samples)
+        commits = statistics.mean(s.get("db_commits", 0) for s in samples)
+        elapsed = statistics.mean(s["elapsed"] for s in samples) * 1000
+        print(f"{name:<10}{reads:>16.1f}{writes:>16.1f}{commits:>14.1f}{elapsed:>12.0f}ms")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=5, help="每种实现的面试场数")
+    parser.add_argument("--rounds", type=int, default=3, help="每场面试的轮数")
+    parser.add_argument("--latency", type=float, default=0.05, help="假 LLM 每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=args.latency, port=args.port)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假 LLM 服务，关闭联网搜索和 LLM 响应缓存
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+    (project_root / "checkpoints-sqlite").mkdir(exist_ok=True)
+
+    try:
+        asyncio.run(run_benchmark(args.sessions, args.rounds))
+    finally:
+        server.stop()
@@ -0,0 +1,163 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+向量检索后端基准测试（Chroma vs NumPy）
+使用本地假 LLM 服务（含 Embedding 接口），在临时目录中为知识库（可追加合成文档块）建立 Chroma 索引并导出 NumPy 索引，统计：
+- 冷启动：在新进程中加载索引并完成第一次查询的耗时（模块导入在应用启动时完成，不计入）
+- 单次查询：预先计算好查询向量，只统计向量检索本身的耗时（平均 / P50 / P99）
+- 结果重合率：两种后端 top-k 文档块的平均重合比例（Chroma 的 HNSW 是近似检索，NumPy 是精确检索）
+
+用法：
+    python backend/utils/benchmark_vector_index.py --synthetic 0 --repeat 200
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+QUERIES = [
+    "如何谈薪资",
+    "简历怎么写",
+    "STAR法则是什么",
+    "面试紧张怎么办",
+    "职业空窗期怎么解释",
+    "离职原因怎么回答",
+    "视频面试要注意什么",
+    "3-5年职业规划"
+]
+
+
+def cold_start(backend: str, db_path: Path, vector: list, k: int) -> float:
+    """子进程中执行：加载索引并完成第一次查询"""
+    from langchain_chroma import Chroma
+    from backend.graph.rag.numpy_index import NumpyVectorIndex
+
+    start = time.perf_counter()
+    if backend == "chroma":
+        store = Chroma(persist_directory=str(db_path), collection_name="interview_knowledge")
+        store.similarity_search_by_vector_with_relevance_scores(vector, k=k)
+    else:
+        store = NumpyVectorIndex(db_path / "numpy_index", embedding_function=None)
+        store.similarity_search_by_vector_with_score(vector, k=k)
+    return time.perf_counter() - start
+
+
+def search_functions(db_path: Path) -> dict:
+    from langchain_chroma import Chroma
+    from backend.graph.rag.numpy_index import NumpyVectorIndex
+
+    chroma = Chroma(persist_directory=str(db_path), collection_name="interview_knowledge")
+    numpy_index = NumpyVectorIndex(db_path / "numpy_index", embedding_function=None)
+    return {
+        "chroma": lambda vector, k: chroma.similarity_search_by_vector_with_relevance_scores(vector, k=k),
+        "numpy": lambda vector, k: numpy_index.similarity_search_by_vector_with_score(vector, k=k)
+    }
+
+
+def write_synthetic(source_dir: Path, sections: int) -> None:
+    lines = ["# 合成知识库", ""]
+    for s in range(sections):
+        lines += [f"## 合成模块 {s}", "", f"### 合成知识点 {s}", f"第 {s} 个合成知识点，介绍面试准备中的常见问题和回答策略。" * 3, ""]
+    (source_dir / "synthetic.md").write_text("\n".join(lines), encoding="utf-8")
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def run_benchmark(synthetic: int, repeat: int, k: int) -> None:
+    import shutil
+    from backend.graph.llm import raw_openai_embeddings
+    from backend.graph.rag.init_vectorstore import sync_knowledge_base, KNOWLEDGE_BASE_DIR
+
+    # 离线环境无法下载 tiktoken 分词表，直接发送原文
+    raw_openai_embeddings.check_embedding_ctx_length = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "knowledge_base"
+        db_path = Path(tmp) / "chroma_db"
+        shutil.copytree(KNOWLEDGE_BASE_DIR, source_dir)
+        if synthetic:
+            write_synthetic(source_dir, synthetic)
+        stats = sync_knowledge_base(source_dir, db_path)
+        vectors = raw_openai_embeddings.embed_documents(QUERIES)
+
+        # 冷启动（每个后端在独立进程中执行）
+        cold = {}
+        for backend in ("chroma", "numpy"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", backend, "--db-path", str(db_path), "--k", str(k)],
+                input=json.dumps(vectors[0]), capture_output=True, text=True, check=True
+            ).stdout
+            cold[backend] = json.loads(output.strip().splitlines()[-1])
+
+        # 单次查询延迟
+        functions = search_functions(db_path)
+        latencies = {name: [] for name in functions}
+        top_ids = {name: [] for name in functions}
+        for name, search in functions.items():
+            for vector in vectors:
+                top_ids[name].append([doc.id for doc, _ in search(vector, k)])
+            for _ in range(repeat):
+                for vector in vectors:
+                    start = time.perf_counter()
+                    search(vector, k)
+                    latencies[name].append(time.perf_counter() - start)
+        overlap = statistics.mean(
+            len(set(a) & set(b)) / max(len(b), 1) for a, b in zip(top_ids["chroma"], top_ids["numpy"])
+        )
+
+    print("\n" + "=" * 88)
+    print(f"📊 向量检索后端基准测试（{stats['total']} 个文档块，top_k={k}，{len(QUERIES)} 个查询 x {repeat} 次）")
+    print("=" * 88)
+    print(f"{'后端':<10}{'加载+首次查询':>16}{'平均查询':>14}{'P50':>12}{'P99':>12}")
+    print("-" * 88)
+    for name in functions:
+        values = latencies[name]
+        print(
+            f"{name:<10}{cold[name] * 1000:>16.1f}ms"
+            f"{statistics.mean(values) * 1e6:>12.1f}µs{percentile(values, 0.5) * 1e6:>10.1f}µs{percentile(values, 0.99) * 1e6:>10.1f}µs"
+        )
+    print("-" * 88)
+    print(f"top-{k} 结果重合率: {overlap:.1%}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=0, help="追加的合成文档块数量")
+    parser.add_argument("--repeat", type=int, default=200, help="每个查询的检索次数")
+    parser.add_argument("--k", type=int, default=8, help="每次检索返回的文档块数量")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    parser.add_argument("--child", choices=["chroma", "numpy"], help=argparse.SUPPRESS)
+    parser.add_argument("--db-path", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(cold_start(args.child, args.db_path, json.loads(sys.stdin.read()), args.k)))
+        sys.exit(0)
+
+    from backend.utils.fake_llm_server import FakeLLMServer
+
+    server = FakeLLMServer(latency=0.0, port=args.port, embedding_latency=0.0)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假服务，Embedding 缓存只使用内存
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["EMBEDDING_CACHE_DB_PATH"] = ""
+    os.chdir(project_root)
+
+    try:
+        run_benchmark(args.synthetic, args.repeat, args.k)
+    finally:
+        server.stop()
@@ -0,0 +1,115 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+知识库增量索引基准测试
+使用本地假 LLM 服务（含 Embedding 接口），在临时目录中生成由多个 Markdown 文件组成的合成知识库，
+依次执行以下构建并统计耗时、向量化的文档块数量和 Embedding 请求数：
+- 首次构建：全部文档块都需要向量化
+- 全量重建：清空 collection 后重新向量化全部文档块（旧实现每次修改知识库后的做法）
+- 无修改：内容不变，直接跳过
+- 少量修改：修改一个知识点、新增一个知识点、删除一个文件后增量更新
+
+用法：
+    python backend/utils/benchmark_vectorstore_index.py --files 10 --sections 50 --batch-size 64
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+
+
+def write_knowledge_base(source_dir: Path, files: int, sections: int) -> None:
+    """生成合成知识库：每个文件若干 ## 模块，每个模块 3 个 ### 知识点"""
+    for f in range(files):
+        lines = [f"# 合成知识库 {f}", ""]
+        for s in range(sections):
+            lines += [f"## 模块 {f}-{s}", ""]
+            for k in range(3):
+                lines += [
+                    f"### 知识点 {f}-{s}-{k}",
+                    f"这是第 {f} 个文件第 {s} 个模块的第 {k} 个知识点，介绍面试准备中的常见问题和回答策略。" * 3,
+                    ""
+                ]
+        (source_dir / f"kb_{f:03d}.md").write_text("\n".join(lines), encoding="utf-8")
+
+
+def modify_knowledge_base(source_dir: Path, files: int) -> None:
+    """修改一个知识点、新增一个知识点、删除最后一个文件"""
+    first = source_dir / "kb_000.md"
+    text = first.read_text(encoding="utf-8")
+    text = text.replace("这是第 0 个文件第 0 个模块的第 0 个知识点", "这是第 0 个文件第 0 个模块的第 0 个知识点（已更新）", 1)
+    text += "\n### 新增知识点\n新增的面试技巧说明。\n"
+    first.write_text(text, encoding="utf-8")
+    if files > 1:
+        (source_dir / f"kb_{files - 1:03d}.md").unlink()
+
+
+def run_benchmark(server: FakeLLMServer, files: int, sections: int, batch_size: int) -> None:
+    from backend.graph.llm import raw_openai_embeddings
+    from backend.graph.rag.init_vectorstore import sync_knowledge_base
+
+    # 离线环境无法下载 tiktoken 分词表，直接发送原文
+    raw_openai_embeddings.check_embedding_ctx_length = False
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "knowledge_base"
+        db_path = Path(tmp) / "chroma_db"
+        source_dir.mkdir()
+        write_knowledge_base(source_dir, files, sections)
+
+        steps = [
+            ("首次构建", False, None),
+            ("全量重建", True, None),
+            ("无修改", False, None),
+            ("少量修改", False, lambda: modify_knowledge_base(source_dir, files))
+        ]
+        for name, rebuild, prepare in steps:
+            if prepare:
+                prepare()
+            before = (server.embedding_request_count, server.embedding_input_count)
+            stats = sync_knowledge_base(source_dir, db_path, batch_size=batch_size, rebuild=rebuild)
+            results.append((name, stats, server.embedding_request_count - before[0], server.embedding_input_count - before[1]))
+
+    print("\n" + "=" * 96)
+    print(f"📊 知识库增量索引基准测试 ({files} 个文件 x {sections} 个模块，每批 {batch_size} 个)")
+    print("=" * 96)
+    print(f"{'构建':<10}{'文档块':>8}{'新增/修改':>10}{'删除':>8}{'未变化':>8}{'向量化':>10}{'Embedding 请求':>16}{'总耗时':>10}")
+    print("-" * 96)
+    for name, stats, requests, inputs in results:
+        print(
+            f"{name:<10}{stats['total']:>10}{stats['added']:>12}{stats['removed']:>10}{stats['unchanged']:>10}"
+            f"{inputs:>12}{requests:>14}{stats['timings']['total']:>12.2f}s"
+        )
+    print("-" * 96)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=10, help="知识库文件数")
+    parser.add_argument("--sections", type=int, default=50, help="每个文件的模块数（每个模块 3 个知识点）")
+    parser.add_argument("--batch-size", type=int, default=64, help="每批向量化的文档块数量")
+    parser.add_argument("--embedding-latency", type=float, default=0.2, help="假 Embedding 接口每次请求的延迟（秒）")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=0.0, port=args.port, embedding_latency=args.embedding_latency)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假服务，关闭 Embedding 缓存（全量重建时真实向量化全部文档块）
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["EMBEDDING_CACHE_ENABLED"] = "false"
+    os.chdir(project_root)
+
+    try:
+        run_benchmark(server, args.files, args.sections, args.batch_size)
+    finally:
+        server.stop()
@@ -0,0 +1,122 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+Checkpoint 压缩工具
+只保留每个会话最新的 N 个 checkpoint，并报告：
+- 删除的 checkpoint / writes 数量和序列化数据字节数
+- SQLite 数据库文件大小变化（配合 --vacuum 回收磁盘空间）
+- 压缩前后 get_state 的平均耗时
+
+用法：
+    python -m backend.utils.compact_checkpoints --keep 1 --vacuum
+    python -m backend.utils.compact_checkpoints --keep 3 --dry-run
+    python -m backend.utils.compact_checkpoints --thread <thread_id>
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config import CHECKPOINT_DB_PATH, CHECKPOINT_KEEP_LAST
+from backend.graph.checkpoint import (
+    get_checkpointer,
+    compact_thread,
+    compact_all,
+    list_compactable_threads,
+    vacuum
+)
+from backend.graph.checkpoint.sql_saver import SQLAlchemyCheckpointSaver
+from backend.graph.workflow import get_interview_graph
+
+
+def _db_file_size() -> int:
+    """SQLite 数据库文件（含 WAL）的总大小"""
+    return sum(
+        path.stat().st_size
+        for path in (Path(CHECKPOINT_DB_PATH), Path(f"{CHECKPOINT_DB_PATH}-wal"))
+        if path.exists()
+    )
+
+
+def _measure_get_state(thread_ids, repeat: int) -> float:
+    """对抽样会话执行 get_state，返回平均耗时（毫秒）"""
+    if not thread_ids:
+        return 0.0
+    graph = get_interview_graph()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for thread_id in thread_ids:
+            graph.get_state({"configurable": {"thread_id": thread_id}})
+    return (time.perf_counter() - start) * 1000 / (repeat * len(thread_ids))
+
+
+def _format_kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def main(keep_last: int, thread_id: str = None, dry_run: bool = False, run_vacuum: bool = False,
+         sample: int = 20, repeat: int = 5) -> None:
+    saver = get_checkpointer()
+    is_sqlite = not isinstance(saver, SQLAlchemyCheckpointSaver)
+
+    print("=" * 80)
+    print(f"🗜️  Checkpoint 压缩 (每个会话保留最新 {keep_last} 个{'，仅统计' if dry_run else ''})")
+    print("=" * 80)
+
+    # 1. 压缩前：文件大小与 get_state 耗时
+    thread_ids = [thread_id] if thread_id else list_compactable_threads(saver, keep_last)
+    sample_ids = thread_ids[:sample]
+    size_before = _db_file_size() if is_sqlite else 0
+    latency_before = _measure_get_state(sample_ids, repeat)
+    print(f"\n📊 需要压缩的会话: {len(thread_ids)} 个")
+
+    # 2. 压缩
+    start = time.perf_counter()
+    if thread_id:
+        stats = compact_thread(saver, thread_id, keep_last, dry_run=dry_run)
+    else:
+        stats = compact_all(saver, keep_last, dry_run=dry_run)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'将删除' if dry_run else '✅ 已删除'} (耗时 {elapsed:.2f}s):")
+    print(f"   - {stats['checkpoints']} 条 checkpoint 记录")
+    print(f"   - {stats['writes']} 条 writes 记录")
+    print(f"   - 序列化数据 {_format_kb(stats['bytes'])}")
+
+    if dry_run:
+        return
+
+    # 3. 回收磁盘空间
+    if run_vacuum:
+        if vacuum(saver):
+            print("\n🧹 已执行 VACUUM")
+        else:
+            print("\n⚠️  当前后端不支持 VACUUM，跳过")
+
+    # 4. 压缩后：文件大小与 get_state 耗时
+    latency_after = _measure_get_state(sample_ids, repeat)
+    if is_sqlite:
+        size_after = _db_file_size()
+        print(f"\n💾 数据库文件: {_format_kb(size_before)} -> {_format_kb(size_after)} "
+              f"(回收 {_format_kb(size_before - size_after)})")
+        if not run_vacuum:
+            print("   提示：SQLite 删除记录后文件不会变小，使用 --vacuum 回收磁盘空间")
+    if sample_ids:
+        print(f"⏱️  get_state 平均耗时 ({len(sample_ids)} 个会话 x {repeat} 次): "
+              f"{latency_before:.2f} ms -> {latency_after:.2f} ms")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keep", type=int, default=CHECKPOINT_KEEP_LAST, help="每个会话保留的 checkpoint 数量")
+    parser.add_argument("--thread", default=None, help="只压缩指定会话")
+    parser.add_argument("--dry-run", action="store_true", help="只统计，不删除")
+    parser.add_argument("--vacuum", action="store_true", help="压缩后执行 VACUUM 回收 SQLite 文件空间")
+    parser.add_argument("--sample", type=int, default=20, help="测量 get_state 耗时的会话数量")
+    parser.add_argument("--repeat", type=int, default=5, help="每个会话 get_state 的测量次数")
+    args = parser.parse_args()
+
+    main(args.keep, args.thread, args.dry_run, args.vacuum, args.sample, args.repeat)
@@ -0,0 +1,333 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话记忆管理（滚动摘要 + token 预算）
+每次对话注入的历史上下文 = 较早对话的滚动摘要 + 从新到旧在 token 预算内选取的最近消息，
+无论会话多长、单条回答多长，历史部分的 token 数都不超过 CONSULTANT_MEMORY_TOKEN_BUDGET
+
+- 摘要保存在 consultant_memories 表（每个会话一行），summarized_seq 之前的消息已并入摘要，
+  加载上下文时只读取 summarized_seq 之后的消息
+- 预算中固定为摘要预留 SUMMARY_CONTEXT_PREFIX + CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS，其余给最近消息；
+  加载上下文和规划摘要更新使用同一个最近消息预算（recent_message_budget），两边的窗口一致
+- 每轮对话保存后在后台任务中增量更新摘要：超出最近消息预算的旧消息分批交给 LLM 与旧摘要合并，
+  不阻塞当前请求；同一会话同时只有一个更新任务，写入时按 summarized_seq 比较后更新，多进程也不会互相覆盖
+- token 数按字符估算（中文字符约 1 token，其他字符约 4 个 1 token），不依赖在线下载的分词表
+"""
+import re
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.config import (
+    SessionLocal,
+    CONSULTANT_MEMORY_TOKEN_BUDGET,
+    CONSULTANT_MEMORY_SUMMARY_ENABLED,
+    CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS
+)
+from backend.graph.llm import openai_llm
+from backend.models import ConsultantRecord, ConsultantMessage, ConsultantMemory
+from backend.utils.consultant_store import load_recent_messages
+
+# 每条消息的格式开销（角色标记等）
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# 加载上下文时最多读取的未摘要消息数（摘要落后或关闭时也只读取这么多行）
+RECENT_SCAN_LIMIT = 40
+
+# 截断的消息至少保留的 token 数（剩余预算更少时不再放入截断的消息）
+MIN_TRUNCATED_TOKENS = 100
+
+# 每次摘要更新最多合并的消息 token 数，单条消息交给摘要模型前截断到的 token 数
+SUMMARY_BATCH_TOKENS = 3000
+SUMMARY_MESSAGE_MAX_TOKENS = 800
+
+TRUNCATED_MARK = "……（内容过长，已截断）"
+
+SUMMARY_PROMPT = """你是面试顾问的对话记忆助手。请把"已有摘要"和"新增对话"合并为一份新的对话摘要，供顾问在后续对话中理解上下文。
+
+要求：
+- 保留用户的背景信息（目标岗位、工作年限、技术栈、求职阶段等）、咨询过的问题、顾问给出的关键结论和建议、用户尚未解决的疑问
+- 删除寒暄和重复内容，不要保留长篇示例和 Markdown 格式
+- 使用第三人称陈述（"用户……，顾问建议……"），不超过 {max_chars} 字
+- 只输出摘要正文"""
+
+SUMMARY_CONTEXT_PREFIX = "以下是本次咨询中较早对话的摘要（原始消息不再提供），用于理解上下文：\n"
+
+_CJK_PATTERN = re.compile(r"[\u2e80-\u9fff\uf900-\ufaff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """估算文本的 token 数（中文字符计 1，其他字符每 4 个计 1）"""
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _message_tokens(message: dict) -> int:
+    return estimate_tokens(message["content"]) + MESSAGE_TOKEN_OVERHEAD
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """保留文本开头不超过 max_tokens 的部分"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    budget = max(max_tokens - estimate_tokens(TRUNCATED_MARK), 0) * 4
+    used = 0
+    for i, char in enumerate(text):
+        used += 4 if _CJK_PATTERN.match(char) else 1
+        if used > budget:
+            return text[:i] + TRUNCATED_MARK
+    return text
+
+
+def recent_message_budget(has_summary: bool = True) -> int:
+    """
+    最近消息的 token 预算：总预算减去摘要预留（前缀 + 摘要上限 + 消息开销）
+    没有摘要且摘要功能关闭时不预留
+    """
+    if not has_summary and not CONSULTANT_MEMORY_SUMMARY_ENABLED:
+        return CONSULTANT_MEMORY_TOKEN_BUDGET
+    reserved = estimate_tokens(SUMMARY_CONTEXT_PREFIX) + CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS + MESSAGE_TOKEN_OVERHEAD
+    return max(CONSULTANT_MEMORY_TOKEN_BUDGET - reserved, 0)
+
+
+def select_recent_messages(messages: List[dict], budget: int) -> List[dict]:
+    """
+    从新到旧选取 token 预算内的消息（返回按时间正序），估算 token 数不超过 budget
+    放不下的消息（包括超长的最新消息）在剩余预算不少于 MIN_TRUNCATED_TOKENS 时截断后放入，然后停止
+    """
+    selected = []
+    remaining = budget
+    for message in reversed(messages):
+        tokens = _message_tokens(message)
+        if tokens <= remaining:
+            selected.append(message)
+            remaining -= tokens
+            continue
+        content_budget = remaining - MESSAGE_TOKEN_OVERHEAD
+        if content_budget >= MIN_TRUNCATED_TOKENS:
+            truncated = dict(message)
+            truncated["content"] = truncate_to_tokens(message["content"], content_budget)
+            selected.append(truncated)
+        break
+    selected.reverse()
+    return selected
+
+
+def _to_langchain(message: dict) -> Optional[BaseMessage]:
+    if message["role"] == "human":
+        return HumanMessage(content=message["content"])
+    if message["role"] == "ai":
+        return AIMessage(content=message["content"])
+    return None
+
+
+def _get_memory(db: Session, thread_id: str) -> Tuple[str, int]:
+    """会话的 (摘要, summarized_seq)，还没有摘要时为 ("", 0)"""
+    memory = db.query(ConsultantMemory).filter(ConsultantMemory.thread_id == thread_id).first()
+    if memory is None:
+        return "", 0
+    return memory.summary or "", memory.summarized_seq
+
+
+def load_history_messages(db: Session, record: ConsultantRecord) -> List[BaseMessage]:
+    """
+    加载作为上下文的历史消息：滚动摘要（SystemMessage） + token 预算内的最近消息
+
+    Returns:
+        LangChain 消息列表，估算 token 数不超过 CONSULTANT_MEMORY_TOKEN_BUDGET
+    """
+    summary, summarized_seq = _get_memory(db, record.thread_id)
+    history = []
+    if summary:
+        # 摘要上限调小后，旧摘要也截断到预留的大小内
+        summary = truncate_to_tokens(summary, CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS)
+        history.append(SystemMessage(content=SUMMARY_CONTEXT_PREFIX + summary))
+
+    recent = load_recent_messages(db, record, RECENT_SCAN_LIMIT, min_seq=summarized_seq)
+    for message in select_recent_messages(recent, recent_message_budget(bool(summary))):
+        converted = _to_langchain(message)
+        if converted is not None:
+            history.append(converted)
+    return history
+
+
+def delete_memory(db: Session, thread_id: str) -> int:
+    """删除会话的对话摘要（不提交事务），返回删除的行数"""
+    return db.query(ConsultantMemory).filter(
+        ConsultantMemory.thread_id == thread_id
+    ).delete(synchronize_session=False)
+
+
+# ---------- 摘要增量更新 ----------
+
+def _plan_summary_update(thread_id: str) -> Optional[dict]:
+    """
+    找出需要并入摘要的消息：未摘要的消息中，超出最近消息预算（与加载上下文相同）的较早部分
+
+    Returns:
+        {"summary", "summarized_seq", "messages", "next_seq"}；没有需要合并的消息时返回 None
+    """
+    db = SessionLocal()
+    try:
+        summary, summarized_seq = _get_memory(db, thread_id)
+        rows = (
+            db.query(ConsultantMessage)
+            .filter(ConsultantMessage.thread_id == thread_id, ConsultantMessage.seq >= summarized_seq)
+            .order_by(ConsultantMessage.seq.desc())
+            .limit(RECENT_SCAN_LIMIT)
+            .all()
+        )
+        if not rows:
+            return None
+        rows.reverse()
+        kept = select_recent_messages([{"role": r.role, "content": r.content} for r in rows], recent_message_budget())
+        # 最近消息窗口的起始序号，之前的消息都需要并入摘要（预算过小、一条都放不下时全部并入）
+        window_start = rows[len(rows) - len(kept)].seq if kept else rows[-1].seq + 1
+        if window_start <= summarized_seq:
+            return None
+
+        # 按时间顺序分批合并（积压较多时由后续循环继续处理）
+        to_fold = (
+            db.query(ConsultantMessage)
+            .filter(
+                ConsultantMessage.thread_id == thread_id,
+                ConsultantMessage.seq >= summarized_seq,
+                ConsultantMessage.seq < window_start
+            )
+            .order_by(ConsultantMessage.seq)
+            .all()
+        )
+        messages = []
+        used = 0
+        next_seq = summarized_seq
+        for row in to_fold:
+            content = truncate_to_tokens(row.content, SUMMARY_MESSAGE_MAX_TOKENS)
+            tokens = estimate_tokens(content) + MESSAGE_TOKEN_OVERHEAD
+            if messages and used + tokens > SUMMARY_BATCH_TOKENS:
+                break
+            messages.append({"role": row.role, "content": content})
+            used += tokens
+            next_seq = row.seq + 1
+        return {"summary": summary, "summarized_seq": summarized_seq, "messages": messages, "next_seq": next_seq}
+    finally:
+        db.close()
+
+
+def _save_summary(thread_id: str, summarized_seq: int, next_seq: int, summary: str) -> bool:
+    """
+    写入新摘要（仅当 summarized_seq 未被其他任务更新时），返回是否写入
+    """
+    db = SessionLocal()
+    try:
+        if summarized_seq == 0:
+            exists = db.query(ConsultantMemory.thread_id).filter(ConsultantMemory.thread_id == thread_id).first()
+            if exists is None:
+                db.add(ConsultantMemory(thread_id=thread_id, summary=summary, summarized_seq=next_seq))
+                db.commit()
+                return True
+        updated = db.query(ConsultantMemory).filter(
+            ConsultantMemory.thread_id == thread_id,
+            ConsultantMemory.summarized_seq == summarized_seq
+        ).update({"summary": summary, "summarized_seq": next_seq}, synchronize_session=False)
+        db.commit()
+        return updated > 0
+    except IntegrityError:
+        # 其他进程刚写入了摘要，或会话已被删除
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def _format_conversation(messages: List[dict]) -> str:
+    names = {"human": "用户", "ai": "顾问"}
+    return "\n\n".join(f"{names.get(m['role'], m['role'])}：{m['content']}" for m in messages)
+
+
+async def update_summary(thread_id: str) -> bool:
+    """
+    把超出最近消息预算的旧消息合并进摘要（一次 LLM 调用）
+
+    Returns:
+        是否更新了摘要
+    """
+    try:
+        plan = await asyncio.to_thread(_plan_summary_update, thread_id)
+        if plan is None:
+            return False
+
+        prompt = [
+            SystemMessage(content=SUMMARY_PROMPT.format(max_chars=CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS)),
+            HumanMessage(content=(
+                f"## 已有摘要\n{plan['summary'] or '（无）'}\n\n"
+                f"## 新增对话\n{_format_conversation(plan['messages'])}"
+            ))
+        ]
+        response = await openai_llm.ainvoke(prompt)
+        summary = truncate_to_tokens(str(response.content).strip(), CONSULTANT_MEMORY_SUMMARY_MAX_TOKENS)
+        if not summary:
+            return False
+
+        saved = await asyncio.to_thread(
+            _save_summary, thread_id, plan["summarized_seq"], plan["next_seq"], summary
+        )
+        if saved:
+            print(
+                f"[consultant_memory] 会话 {thread_id} 合并 {len(plan['messages'])} 条消息到摘要"
+                f"（摘要约 {estimate_tokens(summary)} tokens）"
+            )
+        return saved
+    except Exception as e:
+        print(f"[consultant_memory] 摘要更新失败 (thread_id={thread_id}): {e}")
+        return False
+
+
+# {thread_id: 更新任务}；_dirty 记录任务运行期间又有新消息写入的会话
+_update_tasks: Dict[str, asyncio.Task] = {}
+_dirty: Set[str] = set()
+
+
+async def _run_updates(thread_id: str) -> None:
+    try:
+        while True:
+            _dirty.discard(thread_id)
+            updated = await update_summary(thread_id)
+            if not updated and thread_id not in _dirty:
+                break
+    finally:
+        _update_tasks.pop(thread_id, None)
+        _dirty.discard(thread_id)
+
+
+def schedule_summary_update(thread_id: str) -> bool:
+    """
+    在后台更新会话摘要（每轮对话保存后调用，需在事件循环中调用）
+
+    Returns:
+        是否创建了新任务（同一会话已有任务时只标记，由该任务继续处理）
+    """
+    if not CONSULTANT_MEMORY_SUMMARY_ENABLED:
+        return False
+    if thread_id in _update_tasks:
+        _dirty.add(thread_id)
+        return False
+    _update_tasks[thread_id] = asyncio.create_task(_run_updates(thread_id))
+    return True
+
+
+async def wait_summary_updates() -> None:
+    """等待所有进行中的摘要更新任务完成"""
+    while _update_tasks:
+        await asyncio.gather(*list(_update_tasks.values()), return_exceptions=True)
+
+
+async def stop_summary_updates() -> None:
+    """取消进行中的摘要更新任务（应用关闭时调用，未合并的消息在下一轮对话后继续合并）"""
+    tasks = list(_update_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
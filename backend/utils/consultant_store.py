@@ -0,0 +1,217 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+顾问对话消息存储（追加写入）
+- 每条消息是 consultant_messages 表中的一行，按 (thread_id, seq) 排序；
+  每轮对话一次批量 INSERT 追加两条消息，不再读取、复制并整体写回 JSON 数组
+- 加载最近 K 条消息是一次走主键索引的 ORDER BY seq DESC LIMIT K 查询，与会话长度无关
+- 旧记录的 consultant_records.messages（JSON）由 migrate_consultant_messages.py 批量迁移；
+  尚未迁移的记录在第一次加载 / 追加时自动迁移
+"""
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from backend.config import SessionLocal
+from backend.models import ConsultantRecord, ConsultantMessage
+
+
+def _to_dict(message: ConsultantMessage) -> dict:
+    item = {"role": message.role, "content": message.content}
+    if message.tools_used is not None:
+        item["tools_used"] = message.tools_used
+    return item
+
+
+def _next_seq(db: Session, thread_id: str, lock: bool = False) -> int:
+    """
+    会话中下一条消息的序号（主键索引上的 MAX 查询）
+
+    Args:
+        lock: 使用加锁读（MySQL 读取最新提交的数据，而不是事务开始时的快照）
+    """
+    query = db.query(func.max(ConsultantMessage.seq)).filter(ConsultantMessage.thread_id == thread_id)
+    if lock:
+        query = query.with_for_update()
+    last = query.scalar()
+    return 0 if last is None else last + 1
+
+
+def _insert_messages(db: Session, thread_id: str, messages: List[dict], start_seq: int) -> None:
+    """一条 INSERT 语句批量写入"""
+    if not messages:
+        return
+    now = datetime.now()
+    db.execute(insert(ConsultantMessage), [
+        {
+            "thread_id": thread_id,
+            "seq": start_seq + i,
+            "role": message["role"],
+            "content": message["content"],
+            "tools_used": message.get("tools_used"),
+            "created_at": now
+        }
+        for i, message in enumerate(messages)
+    ])
+
+
+def migrate_record_messages(db: Session, record: ConsultantRecord) -> int:
+    """
+    把记录的旧版 JSON 消息迁移到 consultant_messages 表并清空 JSON 列（不提交事务）
+
+    Returns:
+        迁移的消息数量（已迁移或没有旧消息时为 0）
+    """
+    if not record.messages:
+        return 0
+    legacy = [m for m in record.messages if m.get("role") and m.get("content") is not None]
+    # 已有消息行时说明已经迁移过，只清空 JSON 列
+    migrated = 0
+    if _next_seq(db, record.thread_id, lock=True) == 0:
+        _insert_messages(db, record.thread_id, legacy, 0)
+        migrated = len(legacy)
+    record.messages = []
+    return migrated
+
+
+def load_recent_messages(db: Session, record: ConsultantRecord, limit: int, min_seq: int = 0) -> List[dict]:
+    """
+    加载会话最近 limit 条消息（按时间正序）
+
+    Args:
+        min_seq: 只加载序号不小于该值的消息（更早的消息已并入对话摘要）
+    """
+    if record.messages:
+        migrate_record_messages(db, record)
+        db.commit()
+    rows = (
+        db.query(ConsultantMessage)
+        .filter(ConsultantMessage.thread_id == record.thread_id, ConsultantMessage.seq >= min_seq)
+        .order_by(ConsultantMessage.seq.desc())
+        .limit(limit)
+        .all()
+    )
+    return [_to_dict(row) for row in reversed(rows)]
+
+
+def load_messages(db: Session, record: ConsultantRecord) -> List[dict]:
+    """
+    加载会话全部消息（查看对话记录详情用）
+    """
+    if record.messages:
+        migrate_record_messages(db, record)
+        db.commit()
+    rows = (
+        db.query(ConsultantMessage)
+        .filter(ConsultantMessage.thread_id == record.thread_id)
+        .order_by(ConsultantMessage.seq)
+        .all()
+    )
+    return [_to_dict(row) for row in rows]
+
+
+def append_messages(
+    db: Session,
+    thread_id: str,
+    user_name: str,
+    messages: List[dict],
+    title: Optional[str] = None
+) -> ConsultantRecord:
+    """
+    追加一轮对话的消息，记录不存在时创建（不提交事务）
+
+    Args:
+        thread_id: 会话ID
+        user_name: 用户名
+        messages: [{"role", "content", "tools_used"(可选)}]
+        title: 新建记录时使用的标题
+
+    Returns:
+        顾问对话记录
+    """
+    # 锁定记录行（MySQL），同一会话的并发追加按顺序分配序号
+    record = db.query(ConsultantRecord).filter(
+        ConsultantRecord.thread_id == thread_id,
+        ConsultantRecord.user_name == user_name
+    ).with_for_update().first()
+
+    if record is None:
+        record = ConsultantRecord(
+            thread_id=thread_id,
+            user_name=user_name,
+            title=title or "新咨询会话",
+            messages=[]
+        )
+        db.add(record)
+        db.flush()
+    else:
+        migrate_record_messages(db, record)
+        record.updated_at = datetime.now()
+
+    _insert_messages(db, thread_id, messages, _next_seq(db, thread_id, lock=True))
+    return record
+
+
+def delete_messages(db: Session, thread_id: str) -> int:
+    """删除会话的全部消息（不提交事务），返回删除的行数"""
+    return db.query(ConsultantMessage).filter(
+        ConsultantMessage.thread_id == thread_id
+    ).delete(synchronize_session=False)
+
+
+def migrate_legacy_messages(batch_size: int = 200, dry_run: bool = False) -> dict:
+    """
+    批量迁移所有记录的旧版 JSON 消息（按 thread_id 分页，每批一个事务，可重复执行）
+
+    Args:
+        batch_size: 每批处理的记录数量
+        dry_run: 只统计，不写入
+
+    Returns:
+        {"scanned_records", "migrated_records", "migrated_messages", "batches", "seconds"}
+    """
+    start = time.perf_counter()
+    stats = {"scanned_records": 0, "migrated_records": 0, "migrated_messages": 0, "batches": 0}
+    last_thread_id = ""
+    db = SessionLocal()
+    try:
+        while True:
+            records = (
+                db.query(ConsultantRecord)
+                .filter(ConsultantRecord.thread_id > last_thread_id)
+                .order_by(ConsultantRecord.thread_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not records:
+                break
+            last_thread_id = records[-1].thread_id
+            stats["batches"] += 1
+            stats["scanned_records"] += len(records)
+
+            for record in records:
+                if not record.messages:
+                    continue
+                if dry_run:
+                    stats["migrated_records"] += 1
+                    stats["migrated_messages"] += len(record.messages)
+                    continue
+                migrated = migrate_record_messages(db, record)
+                stats["migrated_records"] += 1 if migrated else 0
+                stats["migrated_messages"] += migrated
+            if dry_run:
+                db.rollback()
+            else:
+                db.commit()
+            # 释放本批记录（旧版 JSON 可能很大）
+            db.expunge_all()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
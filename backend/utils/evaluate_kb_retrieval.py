@@ -0,0 +1,139 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+知识库检索离线评估
+对评估集 backend/graph/rag/kb_eval_queries.json 中的每个问题执行 retrieve_knowledge，对比 vector / hybrid 两种检索方式：
+- 命中率：知识库内问题（expected 为知识点标题）的返回结果中包含该知识点的比例
+- 联网兜底率：知识库内问题没有返回任何结果（顾问 Agent 会转去联网搜索）的比例
+- 误命中率：知识库外问题（expected 为 null）返回了知识库内容的比例（应联网搜索却没有）
+- 平均检索耗时
+
+检索参数（KB_TOP_K / KB_VECTOR_THRESHOLD / KB_LEXICAL_MIN_COVERAGE 等）可以通过命令行覆盖，用于调参。
+
+用法：
+    # 使用 .env 中配置的 Embedding 接口和已建立的知识库索引
+    python backend/utils/evaluate_kb_retrieval.py
+    # 使用本地假 Embedding 服务，在临时目录中建立索引（离线检查评估流程）
+    python backend/utils/evaluate_kb_retrieval.py --fake
+    # 调参
+    python backend/utils/evaluate_kb_retrieval.py --vector-threshold 0.7 --lexical-min-coverage 0.5 --verbose
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 默认评估集
+EVAL_SET_PATH = project_root / "backend" / "graph" / "rag" / "kb_eval_queries.json"
+
+
+def evaluate(mode: str, cases: list, verbose: bool) -> dict:
+    from backend.graph.tools.consultant_tools import retrieve_knowledge
+
+    stats = {"in_domain": 0, "hits": 0, "fallbacks": 0, "out_of_domain": 0, "false_hits": 0, "latencies": []}
+    for case in cases:
+        start = time.perf_counter()
+        results = retrieve_knowledge(case["query"], mode=mode)
+        stats["latencies"].append(time.perf_counter() - start)
+        subsections = [doc.metadata.get("subsection", "") for doc, _ in results]
+
+        if case["expected"] is None:
+            stats["out_of_domain"] += 1
+            ok = not results
+            stats["false_hits"] += not ok
+        else:
+            stats["in_domain"] += 1
+            ok = case["expected"] in subsections
+            stats["hits"] += ok
+            stats["fallbacks"] += not results
+        if verbose and not ok:
+            print(f"  [{mode}] ✗ {case['query']} -> 期望 {case['expected']}，实际 {subsections or '联网兜底'}")
+    return stats
+
+
+def run_evaluation(eval_set: Path, modes: list, verbose: bool) -> None:
+    from backend.config import KB_TOP_K, KB_VECTOR_THRESHOLD, KB_LEXICAL_MIN_COVERAGE, KB_RRF_K
+
+    with open(eval_set, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+
+    results = {mode: evaluate(mode, cases, verbose) for mode in modes}
+
+    print("\n" + "=" * 80)
+    print(
+        f"📊 知识库检索评估（{len(cases)} 个问题，top_k={KB_TOP_K}，向量阈值={KB_VECTOR_THRESHOLD}，"
+        f"关键词覆盖率={KB_LEXICAL_MIN_COVERAGE}，rrf_k={KB_RRF_K}）"
+    )
+    print("=" * 80)
+    print(f"{'检索方式':<10}{'命中率':>10}{'联网兜底率':>12}{'误命中率':>10}{'平均耗时':>12}")
+    print("-" * 80)
+    for mode, s in results.items():
+        hit_rate = s["hits"] / s["in_domain"] if s["in_domain"] else 0.0
+        fallback_rate = s["fallbacks"] / s["in_domain"] if s["in_domain"] else 0.0
+        false_hit_rate = s["false_hits"] / s["out_of_domain"] if s["out_of_domain"] else 0.0
+        print(
+            f"{mode:<12}{hit_rate:>12.1%}{fallback_rate:>12.1%}{false_hit_rate:>12.1%}"
+            f"{statistics.mean(s['latencies']) * 1000:>12.1f}ms"
+        )
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--eval-set", type=Path, default=EVAL_SET_PATH, help="评估集 JSON 文件")
+    parser.add_argument("--modes", default="vector,hybrid", help="参与对比的检索方式（逗号分隔）")
+    parser.add_argument("--top-k", type=int, help="覆盖 KB_TOP_K")
+    parser.add_argument("--vector-threshold", type=float, help="覆盖 KB_VECTOR_THRESHOLD")
+    parser.add_argument("--lexical-min-coverage", type=float, help="覆盖 KB_LEXICAL_MIN_COVERAGE")
+    parser.add_argument("--rrf-k", type=int, help="覆盖 KB_RRF_K")
+    parser.add_argument("--fake", action="store_true", help="使用本地假 Embedding 服务并在临时目录中建立索引")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    parser.add_argument("--verbose", action="store_true", help="打印未命中 / 误命中的问题")
+    args = parser.parse_args()
+
+    # 在导入 backend 配置之前覆盖检索参数
+    overrides = {
+        "KB_TOP_K": args.top_k,
+        "KB_VECTOR_THRESHOLD": args.vector_threshold,
+        "KB_LEXICAL_MIN_COVERAGE": args.lexical_min_coverage,
+        "KB_RRF_K": args.rrf_k
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            os.environ[name] = str(value)
+    os.chdir(project_root)
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+
+    if not args.fake:
+        run_evaluation(args.eval_set, modes, args.verbose)
+        sys.exit(0)
+
+    from backend.utils.fake_llm_server import FakeLLMServer
+
+    server = FakeLLMServer(latency=0.0, port=args.port, embedding_latency=0.0)
+    os.environ["OPENAI_API_BASE"] = server.start()
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["EMBEDDING_CACHE_DB_PATH"] = ""
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            from backend.graph.llm import raw_openai_embeddings
+            from backend.graph.rag.init_vectorstore import sync_knowledge_base
+            import backend.graph.tools.consultant_tools  # noqa: F401
+
+            # 离线环境无法下载 tiktoken 分词表，直接发送原文
+            raw_openai_embeddings.check_embedding_ctx_length = False
+            sync_knowledge_base(db_path=Path(tmp))
+            sys.modules["backend.graph.tools.consultant_tools"].CHROMA_DB_PATH = Path(tmp)
+
+            run_evaluation(args.eval_set, modes, args.verbose)
+    finally:
+        server.stop()
@@ -0,0 +1,249 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+本地假 LLM 服务（OpenAI 兼容接口）
+用于压测和基准测试：模拟固定延迟的 /v1/chat/completions，不消耗真实 API 额度
+非流式请求同样等待完整的生成时间（首 token 延迟 + 每个 token 的间隔），与真实服务一致
+/v1/embeddings 按字符二元组哈希生成确定的归一化向量（文本越相似向量越接近），等待 embedding_latency
+call_tools=True 时模拟 ReAct Agent：请求带有工具且还没有工具结果时，先返回一次对第一个工具的调用（参数为最后一条用户消息）
+
+用法：
+    server = FakeLLMServer(latency=0.5)
+    base_url = server.start()   # 例如 http://127.0.0.1:18080/v1
+    ...
+    server.stop()
+"""
+import json
+import math
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+# 默认回复内容（面试官 Agent 会直接把它当作问题输出）
+DEFAULT_REPLY = "请结合你在项目中的实践，谈谈你是如何设计并优化系统缓存策略的？"
+
+# 假 Embedding 的维度
+EMBEDDING_DIM = 256
+
+
+def fake_embedding(item) -> list:
+    """
+    生成确定的归一化向量：文本按字符一元 / 二元组哈希到各维度（token id 列表按 id 处理）
+    """
+    if isinstance(item, str):
+        units = [c for c in item.lower() if not c.isspace()]
+    else:
+        units = [str(t) for t in item]
+    features = units + [a + b for a, b in zip(units, units[1:])]
+
+    vector = [0.0] * EMBEDDING_DIM
+    for feature in features:
+        digest = hashlib.md5(feature.encode("utf-8")).digest()
+        index = int.from_bytes(digest[:4], "little") % EMBEDDING_DIM
+        vector[index] += 1.0 if digest[4] % 2 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def create_fake_llm_app(
+    latency: float = 0.5,
+    reply: str = DEFAULT_REPLY,
+    token_delay: float = 0.01,
+    embedding_latency: Optional[float] = None,
+    call_tools: bool = False
+) -> FastAPI:
+    """
+    创建假 LLM 服务应用
+
+    Args:
+        latency: 每次请求的首 token 延迟（秒）
+        reply: 固定回复内容
+        token_delay: 流式输出时每个 token 的间隔（秒）
+        embedding_latency: Embedding 请求的延迟（秒），为 None 时与 latency 相同
+        call_tools: 请求带有工具且消息中还没有工具结果时，先返回一次工具调用
+    """
+    if embedding_latency is None:
+        embedding_latency = latency
+
+    app = FastAPI()
+    app.state.request_count = 0
+    app.state.embedding_request_count = 0
+    app.state.embedding_input_count = 0
+    app.state.tool_call_count = 0
+
+    def _tool_call(body: dict) -> Optional[dict]:
+        """需要模拟工具调用时返回 tool_call，否则返回 None"""
+        messages = body.get("messages", [])
+        if not call_tools or not body.get("tools") or any(m.get("role") == "tool" for m in messages):
+            return None
+        query = next((m.get("content") for m in reversed(messages) if m.get("role") == "user"), "")
+        app.state.tool_call_count += 1
+        return {
+            "id": f"call_fake_{app.state.tool_call_count}",
+            "type": "function",
+            "function": {
+                "name": body["tools"][0]["function"]["name"],
+                "arguments": json.dumps({"query": query}, ensure_ascii=False)
+            }
+        }
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body.get("input", [])
+        # 单条输入可能是字符串或 token id 列表
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        app.state.embedding_request_count += 1
+        app.state.embedding_input_count += len(inputs)
+        await asyncio.sleep(embedding_latency)
+        return JSONResponse({
+            "object": "list",
+            "data": [{"object": "embedding", "index": i, "embedding": fake_embedding(item)} for i, item in enumerate(inputs)],
+            "model": body.get("model", "fake-embedding"),
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}
+        })
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.request_count += 1
+        await asyncio.sleep(latency)
+
+        completion_id = f"chatcmpl-fake-{app.state.request_count}"
+        model = body.get("model", "fake-llm")
+        tool_call = _tool_call(body)
+
+        if tool_call is not None:
+            await asyncio.sleep(token_delay * len(tool_call["function"]["arguments"]))
+            if not body.get("stream"):
+                return JSONResponse({
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": None, "tool_calls": [tool_call]},
+                        "finish_reason": "tool_calls"
+                    }],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+                })
+
+            async def tool_call_stream():
+                for delta, finish_reason in (({"tool_calls": [dict(tool_call, index=0)]}, None), ({}, "tool_calls")):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                    }
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(tool_call_stream(), media_type="text/event-stream")
+
+        if not body.get("stream"):
+            await asyncio.sleep(token_delay * len(reply))
+            return JSONResponse({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 1, "completion_tokens": len(reply), "total_tokens": len(reply) + 1}
+            })
+
+        async def stream():
+            for char in reply:
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": char}, "finish_reason": None}]
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                await asyncio.sleep(token_delay)
+            final = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+class FakeLLMServer:
+    """
+    在后台线程中运行的假 LLM 服务
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        reply: str = DEFAULT_REPLY,
+        host: str = "127.0.0.1",
+        port: int = 18080,
+        token_delay: float = 0.01,
+        embedding_latency: Optional[float] = None,
+        call_tools: bool = False
+    ):
+        self.app = create_fake_llm_app(
+            latency=latency, reply=reply, token_delay=token_delay, embedding_latency=embedding_latency,
+            call_tools=call_tools
+        )
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port, log_level="warning"))
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    @property
+    def request_count(self) -> int:
+        return self.app.state.request_count
+
+    @property
+    def tool_call_count(self) -> int:
+        return self.app.state.tool_call_count
+
+    @property
+    def embedding_request_count(self) -> int:
+        return self.app.state.embedding_request_count
+
+    @property
+    def embedding_input_count(self) -> int:
+        return self.app.state.embedding_input_count
+
+    def start(self) -> str:
+        """启动服务并等待就绪，返回 OpenAI 兼容的 base_url"""
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.05)
+        return self.base_url
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=5)
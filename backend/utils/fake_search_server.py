@@ -0,0 +1,110 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+本地假搜索服务（Tavily 兼容接口）
+用于压测和基准测试：模拟固定延迟的 /search，按查询生成确定的结果，不消耗真实 API 额度
+可以按比例返回 503，或通过 set_error_rate() 在运行中切换故障状态（测试重试和熔断）
+
+用法：
+    server = FakeSearchServer(latency=0.3)
+    base_url = server.start()   # 例如 http://127.0.0.1:18090，设置为 TAVILY_API_BASE
+    ...
+    server.stop()
+"""
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from collections import Counter
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def create_fake_search_app(latency: float = 0.3, error_rate: float = 0.0) -> FastAPI:
+    """
+    创建假搜索服务应用
+
+    Args:
+        latency: 每次请求的延迟（秒）
+        error_rate: 返回 503 的概率（0-1）
+    """
+    app = FastAPI()
+    app.state.request_count = 0
+    app.state.error_count = 0
+    app.state.error_rate = error_rate
+    app.state.queries = Counter()
+
+    @app.post("/search")
+    async def search(request: Request):
+        body = await request.json()
+        app.state.request_count += 1
+        query = body.get("query", "")
+        app.state.queries[query] += 1
+        await asyncio.sleep(latency)
+
+        if random.random() < app.state.error_rate:
+            app.state.error_count += 1
+            return JSONResponse({"detail": {"error": "Service Unavailable"}}, status_code=503)
+
+        digest = hashlib.md5(query.encode("utf-8")).hexdigest()[:8]
+        results = [
+            {
+                "title": f"{query} 学习指南 {i + 1}",
+                "url": f"https://example.com/{digest}/{i + 1}",
+                "content": f"关于 {query} 的第 {i + 1} 篇资料：核心概念、常见面试题和实践经验总结。",
+                "score": round(0.9 - i * 0.1, 2)
+            }
+            for i in range(int(body.get("max_results", 5)))
+        ]
+        return JSONResponse({
+            "query": query,
+            "results": results,
+            "response_time": latency,
+            "request_id": f"fake-search-{app.state.request_count}"
+        })
+
+    return app
+
+
+class FakeSearchServer:
+    """
+    在后台线程中运行的假搜索服务
+    """
+
+    def __init__(self, latency: float = 0.3, host: str = "127.0.0.1", port: int = 18090, error_rate: float = 0.0):
+        self.app = create_fake_search_app(latency=latency, error_rate=error_rate)
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port, log_level="warning"))
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def request_count(self) -> int:
+        return self.app.state.request_count
+
+    @property
+    def error_count(self) -> int:
+        return self.app.state.error_count
+
+    def set_error_rate(self, error_rate: float) -> None:
+        """运行中修改故障比例（1.0 表示服务完全不可用）"""
+        self.app.state.error_rate = error_rate
+
+    def start(self) -> str:
+        """启动服务并等待就绪，返回可用作 TAVILY_API_BASE 的地址"""
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.05)
+        return self.base_url
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=5)
@@ -0,0 +1,123 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+异步面试执行路径压测脚本
+使用本地假 LLM 服务（固定延迟）模拟并发面试，对比：
+- 阻塞模式：在事件循环中直接调用同步 invoke（旧实现）
+- 异步模式：ainvoke + 异步 checkpointer
+
+用法：
+    python backend/utils/loadtest_async_interview.py --latency 0.5 --concurrency 1 10 50 200
+"""
+import os
+import sys
+import time
+import uuid
+import asyncio
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.utils.fake_llm_server import FakeLLMServer
+
+# 简历信息已预先填充，parse_resume 节点会直接跳过 PDF 解析
+SAMPLE_RESUME = """### 目标岗位
+Java开发工程师
+
+### 核心技能
+- Java / Spring Boot
+- MySQL / Redis
+- Kafka
+
+### 项目经历亮点
+- 项目1：电商秒杀系统，负责库存扣减与缓存设计
+"""
+
+
+def _initial_state() -> dict:
+    return {
+        "round": 0,
+        "max_rounds": 3,
+        "resume_path": "",
+        "resume_text": SAMPLE_RESUME,
+        "target_position": "Java开发工程师",
+        "history": [],
+        "report": "",
+        "is_finished": False
+    }
+
+
+async def _run_blocking(thread_id: str) -> None:
+    """旧实现：在协程中直接调用同步 invoke，会阻塞事件循环"""
+    from backend.graph.workflow import get_interview_graph
+    get_interview_graph().invoke(_initial_state(), {"configurable": {"thread_id": thread_id}})
+
+
+async def _run_async(thread_id: str) -> None:
+    """新实现：ainvoke + 异步 checkpointer"""
+    from backend.graph.workflow import get_async_interview_graph
+    await get_async_interview_graph().ainvoke(_initial_state(), {"configurable": {"thread_id": thread_id}})
+
+
+async def _run_level(runner, concurrency: int) -> float:
+    """并发启动 concurrency 场面试，返回总耗时（秒）"""
+    thread_ids = [f"loadtest-{uuid.uuid4()}" for _ in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(runner(tid) for tid in thread_ids))
+    elapsed = time.perf_counter() - start
+
+    # 清理压测产生的 checkpoint（两种模式写入的是同一个数据库文件）
+    from backend.graph.checkpoint import get_checkpointer
+    checkpointer = get_checkpointer()
+    for tid in thread_ids:
+        checkpointer.delete_thread(tid)
+    return elapsed
+
+
+async def run_loadtest(levels, latency: float, blocking_limit: int) -> None:
+    from backend.graph.checkpoint import aclose_async_checkpointer
+
+    print("=" * 80)
+    print(f"🚀 异步面试执行压测 (假 LLM 延迟 {latency}s，每场面试 = 启动 + 第一道题)")
+    print("=" * 80)
+    print(f"{'模式':<10} {'并发':>6} {'总耗时(s)':>12} {'吞吐(场/s)':>12} {'理想耗时(s)':>12}")
+    print("-" * 80)
+
+    try:
+        for concurrency in levels:
+            for name, runner in (("blocking", _run_blocking), ("async", _run_async)):
+                # 阻塞模式是串行的，高并发时耗时过长，只测到 blocking_limit
+                if name == "blocking" and concurrency > blocking_limit:
+                    continue
+                elapsed = await _run_level(runner, concurrency)
+                print(f"{name:<10} {concurrency:>6} {elapsed:>12.2f} {concurrency / elapsed:>12.1f} {latency:>12.2f}")
+    finally:
+        await aclose_async_checkpointer()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5, help="假 LLM 每次请求的延迟（秒）")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200], help="并发面试数")
+    parser.add_argument("--blocking-limit", type=int, default=10, help="阻塞模式最多测试的并发数")
+    parser.add_argument("--port", type=int, default=18080, help="假 LLM 服务端口")
+    args = parser.parse_args()
+
+    server = FakeLLMServer(latency=args.latency, port=args.port)
+    base_url = server.start()
+
+    # 在导入 backend 配置之前指向假 LLM 服务，并关闭联网搜索
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["MODEL_NAME"] = "fake-llm"
+    os.environ["TAVILY_API_KEY"] = ""
+    os.chdir(project_root)
+    (project_root / "checkpoints-sqlite").mkdir(exist_ok=True)
+
+    try:
+        asyncio.run(run_loadtest(args.concurrency, args.latency, args.blocking_limit))
+    finally:
+        print(f"\n假 LLM 服务共处理 {server.request_count} 次请求")
+        server.stop()
@@ -0,0 +1,58 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+迁移顾问对话消息
+把 consultant_records.messages（JSON 数组）中的旧消息逐条写入 consultant_messages 表，并清空 JSON 列。
+按 thread_id 分页，每批一个事务；已迁移的记录会跳过，可以重复执行。
+未迁移的记录在第一次加载 / 追加消息时也会自动迁移，该脚本用于一次性完成全部迁移。
+
+用法：
+    python -m backend.utils.migrate_consultant_messages --dry-run
+    python -m backend.utils.migrate_consultant_messages --batch-size 200
+"""
+import sys
+import json
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+from backend.config import init_db
+from backend.utils.consultant_store import migrate_legacy_messages
+
+
+def main(batch_size: int, dry_run: bool, as_json: bool) -> int:
+    try:
+        # 创建 consultant_messages 表（已存在时跳过）
+        init_db()
+        stats = migrate_legacy_messages(batch_size=batch_size, dry_run=dry_run)
+    except Exception as e:
+        print(f"\n❌ 错误: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    if as_json:
+        print(json.dumps(dict(stats, dry_run=dry_run), ensure_ascii=False))
+        return 0
+
+    print("=" * 80)
+    print(f"🔄 迁移顾问对话消息{'（仅统计）' if dry_run else ''}")
+    print("=" * 80)
+    print(f"\n📊 扫描 {stats['scanned_records']} 条记录，共 {stats['batches']} 批，耗时 {stats['seconds']}s")
+    if dry_run:
+        print(f"   - 待迁移: {stats['migrated_records']} 条记录，{stats['migrated_messages']} 条消息")
+        print("\n⚠️  dry-run 模式，未写入任何数据")
+    else:
+        print(f"\n✅ 已迁移: {stats['migrated_records']} 条记录，{stats['migrated_messages']} 条消息")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="只统计待迁移的记录，不写入")
+    parser.add_argument("--batch-size", type=int, default=200, help="每批处理的记录数量")
+    parser.add_argument("--json", action="store_true", help="以 JSON 输出统计信息")
+    args = parser.parse_args()
+
+    sys.exit(main(args.batch_size, args.dry_run, args.json))
@@ -4,6 +4,7 @@ PDF 解析模块
 提供 PDF 文件的文本提取功能
 """
 import os
+from typing import Optional
 
 try:
     import PyPDF2
@@ -11,12 +12,14 @@ except ImportError:
     PyPDF2 = None
 
 
-def parse_pdf(file_path: str) -> str:
+def parse_pdf(file_path: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
     """
     解析 PDF 文件并提取文本内容
     
     Args:
         file_path: 文件路径
+        max_pages: 最多解析的页数（None 表示不限制）
+        max_chars: 提取到足够的文本后提前结束（None 表示不限制）
         
     Returns:
         str: 提取的文本内容，如果失败返回错误信息
@@ -34,15 +37,23 @@ def parse_pdf(file_path: str) -> str:
         with open(file_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
             
-            # 提取所有页面的文本
+            # 提取页面文本（超过页数上限或文本已足够时提前结束）
             text_content = []
-            for page in pdf_reader.pages:
+            collected = 0
+            for index, page in enumerate(pdf_reader.pages):
+                if max_pages is not None and index >= max_pages:
+                    break
                 text = page.extract_text()
                 if text:
                     text_content.append(text)
+                    collected += len(text)
+                if max_chars is not None and collected >= max_chars:
+                    break
             
             # 合并所有文本
             full_text = "\n".join(text_content)
+            if max_chars is not None:
+                full_text = full_text[:max_chars]
             
             if full_text:
                 return full_text.strip()
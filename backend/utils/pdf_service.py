@@ -0,0 +1,208 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+PDF 解析服务
+将 PyPDF2 解析放到独立的工作进程中执行，避免大文件或异常文件占满 CPU、阻塞事件循环：
+- 工作进程数量有上限，并发解析请求排队执行；每个进程同时只解析一个文档
+- 工作进程以 spawn 方式启动：进程在线程池线程中按需创建，多线程进程中 fork 可能让子进程继承永远不会释放的锁
+- 每个文档有超时时间，超时后只终止并替换解析该文档的进程，其他进程中的解析不受影响
+- 文件大小 / 页数上限，文本足够生成简历摘要后提前结束
+- 同时提供同步接口 parse() 和异步接口 aparse()；任何失败都返回 "错误：..." 字符串，不抛出异常
+"""
+import os
+import queue
+import asyncio
+import threading
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Optional
+
+from backend.config import (
+    PDF_PARSE_WORKERS,
+    PDF_PARSE_TIMEOUT,
+    PDF_MAX_BYTES,
+    PDF_MAX_PAGES,
+    PDF_MAX_CHARS
+)
+from backend.utils.pdf_parser import parse_pdf
+
+# 不使用平台默认的 fork（Linux），避免子进程继承父进程其他线程持有的锁（日志、连接池、HTTP 客户端等）
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def _worker_main(conn: Connection) -> None:
+    """工作进程：循环接收 (file_path, max_pages, max_chars)，返回解析结果"""
+    while True:
+        try:
+            args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = parse_pdf(*args)
+        except Exception as e:
+            result = f"错误：PDF 解析失败 - {e}"
+        conn.send(result)
+
+
+class _Worker:
+    """一个常驻的解析进程（通过管道收发任务）"""
+
+    def __init__(self):
+        self.conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def run(self, args: tuple, timeout: float) -> Optional[str]:
+        """执行一个任务，超时返回 None（进程失败时抛出 EOFError / OSError）"""
+        self.conn.send(args)
+        if not self.conn.poll(timeout):
+            return None
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        # 解析进程没有需要清理的状态，直接 SIGKILL
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class PDFParseService:
+    """
+    基于常驻工作进程的 PDF 解析服务
+
+    Args:
+        max_workers: 工作进程数量
+        timeout: 单个文档的解析超时（秒）
+        max_bytes: 文件大小上限（字节）
+        max_pages: 最多解析的页数
+        max_chars: 提取到该长度的文本后提前结束
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        timeout: float = 20,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_pages: int = 20,
+        max_chars: int = 20000
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        # 空闲槽位：None 表示该槽位的进程尚未创建（第一次使用时才启动）
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(max_workers):
+            self._idle.put(None)
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _new_worker(self) -> _Worker:
+        worker = _Worker()
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _discard_worker(self, worker: _Worker) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+        worker.kill()
+
+    def _check_file(self, file_path: str) -> Optional[str]:
+        """提交前检查文件，返回错误信息或 None"""
+        if not file_path:
+            return "错误：未提供文件路径"
+        if not os.path.exists(file_path):
+            return f"错误：文件不存在 - {file_path}"
+        size = os.path.getsize(file_path)
+        if size > self.max_bytes:
+            return f"错误：PDF 文件过大 - {size / 1024 / 1024:.1f} MB，最大 {self.max_bytes / 1024 / 1024:.1f} MB"
+        return None
+
+    def _timeout_message(self) -> str:
+        return f"错误：PDF 解析超时（超过 {self.timeout} 秒）"
+
+    def parse(self, file_path: str) -> str:
+        """
+        同步解析 PDF（阻塞当前线程，不占用当前进程的 CPU）
+        """
+        error = self._check_file(file_path)
+        if error:
+            return error
+        if self._closed:
+            return "错误：PDF 解析服务已关闭"
+
+        # 等待空闲的工作进程（排队时间不计入解析超时）
+        worker = self._idle.get()
+        try:
+            if self._closed:
+                return "错误：PDF 解析服务已关闭"
+            if worker is None or not worker.process.is_alive():
+                if worker is not None:
+                    self._discard_worker(worker)
+                worker = self._new_worker()
+            result = worker.run((file_path, self.max_pages, self.max_chars), self.timeout)
+            if result is None:
+                # 只终止解析该文档的进程，槽位下次使用时重新创建进程
+                print(f"[pdf_service] 解析超时，终止工作进程: {file_path}")
+                self._discard_worker(worker)
+                worker = None
+                return self._timeout_message()
+            return result
+        except Exception as e:
+            # 工作进程崩溃（管道断开）或无法创建：替换该进程，返回节点已处理的错误字符串
+            reason = "工作进程异常退出" if isinstance(e, (EOFError, OSError)) else str(e)
+            print(f"[pdf_service] 解析失败，替换工作进程: {reason}")
+            if worker is not None:
+                self._discard_worker(worker)
+                worker = None
+            return f"错误：PDF 解析失败 - {reason}"
+        finally:
+            self._idle.put(worker)
+
+    async def aparse(self, file_path: str) -> str:
+        """
+        异步解析 PDF（在线程中等待工作进程的结果，不阻塞事件循环）
+        """
+        return await asyncio.to_thread(self.parse, file_path)
+
+    def shutdown(self) -> None:
+        """终止所有工作进程"""
+        self._closed = True
+        with self._lock:
+            workers, self._workers = list(self._workers), set()
+        for worker in workers:
+            worker.kill()
+
+
+# 全局实例（懒加载，第一次解析时才创建进程池）
+_pdf_service: Optional[PDFParseService] = None
+_service_lock = threading.Lock()
+
+
+def get_pdf_service() -> PDFParseService:
+    """
+    获取全局 PDF 解析服务
+    """
+    global _pdf_service
+    if _pdf_service is None:
+        with _service_lock:
+            if _pdf_service is None:
+                _pdf_service = PDFParseService(
+                    max_workers=PDF_PARSE_WORKERS,
+                    timeout=PDF_PARSE_TIMEOUT,
+                    max_bytes=PDF_MAX_BYTES,
+                    max_pages=PDF_MAX_PAGES,
+                    max_chars=PDF_MAX_CHARS
+                )
+    return _pdf_service
+
+
+def shutdown_pdf_service() -> None:
+    """
+    关闭全局 PDF 解析服务（在应用关闭时调用）
+    """
+    if _pdf_service is not None:
+        _pdf_service.shutdown()
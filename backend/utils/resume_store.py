@@ -0,0 +1,194 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+简历文件存储（按内容寻址）
+- 上传时分块边写入边计算 SHA-256，同一份文件只保存一次：uploads/resumes/{hash}.pdf
+- 第一块校验 PDF 文件头，超过大小上限立即中止；先写临时文件，完成后原子重命名
+- 异步接口 asave_resume_upload 在线程池中执行磁盘 I/O，不阻塞事件循环
+- LLM 提取的 resume_text / target_position 按哈希保存到 resume_cache 表，
+  同一份简历再次上传时跳过 PDF 解析和 LLM 提取，直接生成第一个问题
+- 多条面试记录可以引用同一个文件，删除时只有没有其他记录引用才删除文件；
+  正在开始面试（还没有创建记录）的请求在进程内持有文件的引用计数，期间不会被删除
+"""
+import os
+import asyncio
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.config import PDF_MAX_BYTES
+from backend.models import InterviewRecord, ResumeCache
+
+# PDF文件存储目录
+UPLOADS_DIR = Path(__file__).parent.parent.parent / "uploads"
+RESUME_STORE_DIR = UPLOADS_DIR / "resumes"
+
+# 每次读取的块大小
+CHUNK_SIZE = 1024 * 1024
+
+# PDF 文件头（规范允许文件头出现在前 1024 字节内）
+PDF_MAGIC = b"%PDF-"
+PDF_MAGIC_WINDOW = 1024
+
+# 简历解析节点未能识别目标岗位时使用的占位值（不缓存，下次上传重新提取）
+UNRECOGNIZED_POSITION = "未识别"
+
+# 进行中的开始面试请求对文件的引用计数 {文件路径: 引用数}；
+# 文件的存在检查 / 重命名 / 删除都在同一把锁内完成
+_file_pins: Dict[str, int] = {}
+_pins_lock = threading.Lock()
+
+
+class UploadRejectedError(ValueError):
+    """上传文件校验失败（status_code 为对应的 HTTP 状态码）"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def save_resume_upload(fileobj: BinaryIO, file_ext: str = ".pdf", max_bytes: int = PDF_MAX_BYTES) -> Tuple[Path, str, int, bool]:
+    """
+    流式保存上传文件：写入临时文件的同时计算哈希，完成后原子重命名为 {hash}{ext}
+    返回的文件已被引用（pin），调用方用完后必须调用 unpin_resume_file
+
+    Args:
+        fileobj: 上传文件对象
+        file_ext: 文件扩展名
+        max_bytes: 文件大小上限（字节）
+
+    Returns:
+        (文件路径, 内容哈希, 文件大小, 是否为新文件)
+
+    Raises:
+        UploadRejectedError: 不是 PDF 文件或文件过大
+    """
+    RESUME_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    size = 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=RESUME_STORE_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while True:
+                chunk = fileobj.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                if size == 0 and PDF_MAGIC not in chunk[:PDF_MAGIC_WINDOW]:
+                    raise UploadRejectedError("文件不是有效的 PDF")
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadRejectedError(f"文件过大，最大 {max_bytes / 1024 / 1024:.1f} MB", status_code=413)
+                hasher.update(chunk)
+                buffer.write(chunk)
+
+        if size == 0:
+            raise UploadRejectedError("上传的文件为空")
+
+        content_hash = hasher.hexdigest()
+        file_path = RESUME_STORE_DIR / f"{content_hash}{file_ext.lower()}"
+        with _pins_lock:
+            is_new = not file_path.exists()
+            if is_new:
+                os.replace(tmp_path, file_path)
+            else:
+                # 相同内容已存在，丢弃本次写入
+                os.unlink(tmp_path)
+            _file_pins[str(file_path)] = _file_pins.get(str(file_path), 0) + 1
+        return file_path, content_hash, size, is_new
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+async def asave_resume_upload(upload, file_ext: str = ".pdf", max_bytes: int = PDF_MAX_BYTES) -> Tuple[Path, str, int, bool]:
+    """
+    异步保存上传文件（FastAPI UploadFile），读取、哈希和写盘都在线程池中执行
+
+    已知文件大小（UploadFile.size）超过上限时直接拒绝，不读取文件内容
+    """
+    if getattr(upload, "size", None) is not None and upload.size > max_bytes:
+        raise UploadRejectedError(f"文件过大，最大 {max_bytes / 1024 / 1024:.1f} MB", status_code=413)
+    return await asyncio.to_thread(save_resume_upload, upload.file, file_ext, max_bytes)
+
+
+def unpin_resume_file(file_path) -> None:
+    """
+    释放 save_resume_upload 持有的文件引用（面试记录已创建或开始面试失败后调用）
+    """
+    key = str(file_path)
+    with _pins_lock:
+        count = _file_pins.get(key, 0) - 1
+        if count > 0:
+            _file_pins[key] = count
+        else:
+            _file_pins.pop(key, None)
+
+
+def get_resume_extraction(db: Session, content_hash: str) -> Optional[ResumeCache]:
+    """
+    查询已保存的简历提取结果（命中时更新命中次数）
+    """
+    cached = db.query(ResumeCache).filter(ResumeCache.content_hash == content_hash).first()
+    if cached is not None:
+        cached.hit_count += 1
+        cached.last_used_at = datetime.now()
+        db.commit()
+    return cached
+
+
+def save_resume_extraction(db: Session, content_hash: str, resume_text: str, target_position: str, file_size: int) -> None:
+    """
+    保存简历提取结果（已存在或没有识别出目标岗位时跳过）
+    同一份简历被并发首次上传时，后提交的请求遇到主键冲突直接回滚，保留先写入的结果
+    """
+    if not resume_text or not target_position or target_position == UNRECOGNIZED_POSITION:
+        return
+    if db.query(ResumeCache.content_hash).filter(ResumeCache.content_hash == content_hash).first():
+        return
+    db.add(ResumeCache(
+        content_hash=content_hash,
+        resume_text=resume_text,
+        target_position=target_position,
+        file_size=file_size
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        print(f"[resume_store] 简历提取结果已被其他请求写入: {content_hash[:12]}")
+
+
+def release_resume_file(db: Session, file_path: Optional[str], thread_id: Optional[str] = None) -> bool:
+    """
+    删除不再被任何面试记录引用、也没有进行中的开始面试请求引用的简历文件
+
+    Args:
+        file_path: 简历文件路径
+        thread_id: 正在删除的面试记录（不计入引用）
+
+    Returns:
+        是否删除了文件
+    """
+    if not file_path:
+        return False
+    query = db.query(InterviewRecord.thread_id).filter(InterviewRecord.resume_file_path == str(file_path))
+    if thread_id:
+        query = query.filter(InterviewRecord.thread_id != thread_id)
+    if query.first() is not None:
+        return False
+
+    path = Path(file_path)
+    with _pins_lock:
+        if _file_pins.get(str(file_path)):
+            return False
+        if path.exists():
+            path.unlink()
+            return True
+    return False
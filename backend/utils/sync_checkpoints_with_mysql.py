@@ -1,120 +1,57 @@
 """
 同步 SQLite checkpoint 和 MySQL 记录
-删除 MySQL 中不存在的 checkpoint
+删除 MySQL 中不存在的 checkpoint（非交互式，可用于定时任务）
+
+用法：
+    python -m backend.utils.sync_checkpoints_with_mysql --dry-run
+    python -m backend.utils.sync_checkpoints_with_mysql --batch-size 1000 --min-age 3600
 """
-import sqlite3
 import sys
+import json
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
-from backend.config import SessionLocal
-from backend.models import InterviewRecord, ConsultantRecord
-
-# SQLite 数据库路径
-CHECKPOINT_DB = Path("checkpoints-sqlite/checkpoints.sqlite")
-
-if not CHECKPOINT_DB.exists():
-    print(f"❌ 数据库文件不存在: {CHECKPOINT_DB}")
-    exit(1)
-
-# 连接数据库
-sqlite_conn = sqlite3.connect(str(CHECKPOINT_DB))
-sqlite_cursor = sqlite_conn.cursor()
-mysql_db = SessionLocal()
-
-print("=" * 80)
-print("🔄 同步 SQLite Checkpoint 和 MySQL 记录")
-print("=" * 80)
-
-try:
-    # 1. 获取 SQLite 中的所有 thread_id
-    sqlite_cursor.execute("SELECT DISTINCT thread_id FROM checkpoints")
-    sqlite_thread_ids = set(row[0] for row in sqlite_cursor.fetchall())
-    print(f"\n📊 SQLite 中有 {len(sqlite_thread_ids)} 个 thread_id")
-    
-    # 2. 获取 MySQL 中的所有 thread_id
-    interview_ids = set(record.thread_id for record in mysql_db.query(InterviewRecord).all())
-    consultant_ids = set(record.thread_id for record in mysql_db.query(ConsultantRecord).all())
-    mysql_thread_ids = interview_ids | consultant_ids
-    print(f"📊 MySQL 中有 {len(mysql_thread_ids)} 个 thread_id")
-    print(f"   - 面试记录: {len(interview_ids)} 个")
-    print(f"   - 顾问记录: {len(consultant_ids)} 个")
-    
-    # 3. 找出孤儿 checkpoint（在 SQLite 但不在 MySQL）
-    orphan_thread_ids = sqlite_thread_ids - mysql_thread_ids
-    
-    if not orphan_thread_ids:
-        print("\n✅ 没有孤儿 checkpoint，数据已同步")
+from backend.config import CHECKPOINT_GC_BATCH_SIZE, CHECKPOINT_GC_MIN_AGE
+from backend.graph.checkpoint import collect_orphan_checkpoints
+
+
+def main(batch_size: int, min_age: int, dry_run: bool, as_json: bool) -> int:
+    try:
+        stats = collect_orphan_checkpoints(batch_size=batch_size, min_age=min_age, dry_run=dry_run)
+    except Exception as e:
+        print(f"\n❌ 错误: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    if as_json:
+        print(json.dumps(dict(stats, dry_run=dry_run), ensure_ascii=False))
+        return 0
+
+    print("=" * 80)
+    print(f"🔄 同步 SQLite Checkpoint 和 MySQL 记录{'（仅统计）' if dry_run else ''}")
+    print("=" * 80)
+    print(f"\n📊 扫描 {stats['scanned_threads']} 个会话，共 {stats['batches']} 批，耗时 {stats['seconds']}s")
+    print(f"   - 孤儿会话: {stats['orphan_threads']} 个")
+    print(f"   - 最近活跃而跳过: {stats['skipped_recent']} 个 (不足 {min_age}s)")
+    if dry_run:
+        print("\n⚠️  dry-run 模式，未删除任何记录")
     else:
-        print(f"\n⚠️  发现 {len(orphan_thread_ids)} 个孤儿 checkpoint:")
-        for thread_id in orphan_thread_ids:
-            # 统计该 thread_id 的 checkpoint 数量
-            sqlite_cursor.execute("SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?", (thread_id,))
-            count = sqlite_cursor.fetchone()[0]
-            print(f"   - {thread_id}: {count} 个 checkpoint")
-        
-        # 4. 询问是否删除
-        confirm = input("\n是否删除这些孤儿 checkpoint? (y/n): ").strip().lower()
-        
-        if confirm == 'y':
-            deleted_checkpoints = 0
-            deleted_writes = 0
-            
-            for thread_id in orphan_thread_ids:
-                # 删除 checkpoints
-                sqlite_cursor.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
-                deleted_checkpoints += sqlite_cursor.rowcount
-                
-                # 删除 writes
-                sqlite_cursor.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
-                deleted_writes += sqlite_cursor.rowcount
-            
-            sqlite_conn.commit()
-            print(f"\n✅ 已删除:")
-            print(f"   - {deleted_checkpoints} 条 checkpoint 记录")
-            print(f"   - {deleted_writes} 条 writes 记录")
-        else:
-            print("\n❌ 已取消删除")
-    
-    # 5. 显示最终状态
-    sqlite_cursor.execute("SELECT COUNT(*) FROM checkpoints")
-    final_count = sqlite_cursor.fetchone()[0]
-    print(f"\n📊 当前 SQLite 中有 {final_count} 条 checkpoint 记录")
-    
-    # 6. 显示剩余的 thread_id 列表
-    sqlite_cursor.execute("""
-        SELECT thread_id, COUNT(*) as count 
-        FROM checkpoints 
-        GROUP BY thread_id 
-        ORDER BY count DESC
-    """)
-    remaining_threads = sqlite_cursor.fetchall()
-    
-    print(f"\n📋 剩余的 Thread ID 列表 (共 {len(remaining_threads)} 个):")
-    print(f"{'Thread ID':<50} {'Checkpoint 数量':<20} {'类型':<20}")
-    print("-" * 90)
-    
-    for thread_id, count in remaining_threads:
-        # 判断类型
-        if thread_id in interview_ids:
-            record_type = "面试记录 ✅"
-        elif thread_id in consultant_ids:
-            record_type = "顾问记录 ✅"
-        else:
-            record_type = "⚠️  未找到记录"
-        
-        print(f"{thread_id:<50} {count:<20} {record_type:<20}")
-
-except Exception as e:
-    print(f"\n❌ 错误: {e}")
-    import traceback
-    traceback.print_exc()
-finally:
-    sqlite_conn.close()
-    mysql_db.close()
-
-print("\n" + "=" * 80)
-print("✅ 完成")
-print("=" * 80)
+        print(f"\n✅ 已删除:")
+        print(f"   - {stats['deleted_checkpoints']} 条 checkpoint 记录")
+        print(f"   - {stats['deleted_writes']} 条 writes 记录")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="只统计孤儿会话，不删除")
+    parser.add_argument("--batch-size", type=int, default=CHECKPOINT_GC_BATCH_SIZE, help="每批扫描的会话数量")
+    parser.add_argument("--min-age", type=int, default=CHECKPOINT_GC_MIN_AGE, help="最新 checkpoint 距今不足该秒数的会话不删除")
+    parser.add_argument("--json", action="store_true", help="以 JSON 输出统计信息")
+    args = parser.parse_args()
+
+    sys.exit(main(args.batch_size, args.min_age, args.dry_run, args.json))
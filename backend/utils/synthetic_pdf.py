@@ -0,0 +1,71 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+合成 PDF 生成器
+不依赖第三方库，直接生成可被 PyPDF2 提取文本的简单 PDF，用于基准测试
+
+用法：
+    data = make_resume_pdf(pages=3, seed=1)
+"""
+import random
+from typing import List
+
+_SKILLS = ["Java", "Spring Boot", "MySQL", "Redis", "Kafka", "Docker", "Kubernetes", "Python", "Go", "Elasticsearch"]
+_PROJECTS = ["order service", "payment gateway", "seckill system", "search platform", "recommendation engine", "IM service"]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _resume_lines(rng: random.Random, count: int) -> List[str]:
+    lines = ["Target Position: Backend Engineer", f"Candidate #{rng.randint(1000, 9999)}"]
+    while len(lines) < count:
+        skills = ", ".join(rng.sample(_SKILLS, 3))
+        project = rng.choice(_PROJECTS)
+        lines.append(f"- Built the {project} with {skills}; QPS {rng.randint(1, 50) * 1000}.")
+    return lines[:count]
+
+
+def make_resume_pdf(pages: int = 1, lines_per_page: int = 40, seed: int = 0) -> bytes:
+    """
+    生成一份合成简历 PDF
+
+    Args:
+        pages: 页数
+        lines_per_page: 每页文本行数
+        seed: 随机种子（相同参数生成的文件内容完全相同）
+    """
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+
+    # 1: Catalog, 2: Pages, 3: Font，之后每页占用 Page + Content 两个对象
+    page_ids = [4 + i * 2 for i in range(pages)]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for page_id in page_ids:
+        text_ops = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"]
+        for line in _resume_lines(rng, lines_per_page):
+            text_ops.append(f"({_escape(line)}) Tj T*")
+        text_ops.append("ET")
+        stream = "\n".join(text_ops).encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for index, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{index} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(output)
@@ -0,0 +1,26 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+pytest 公共配置
+- 把项目根目录加入 Python 路径（与 backend/utils 下的脚本相同）
+- 为 backend.config 的必需环境变量提供默认值，测试不依赖 .env 和 MySQL
+"""
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+for key, value in {
+    "OPENAI_API_KEY": "test-key",
+    "OPENAI_API_BASE": "http://127.0.0.1:18080/v1",
+    "MODEL_NAME": "test-model",
+    "TEMPERATURE": "0",
+    "DB_HOST": "localhost",
+    "DB_PORT": "3306",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_NAME": "test",
+    "DATABASE_URL": "sqlite://",
+}.items():
+    os.environ.setdefault(key, value)
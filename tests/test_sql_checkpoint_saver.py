@@ -0,0 +1,239 @@
+# AI智能面试辅助系统V1.0，作者刘梦畅
+"""
+SQLAlchemyCheckpointSaver 测试
+使用内存 SQLite（StaticPool，所有连接共享同一个数据库）代替 MySQL
+"""
+import asyncio
+from typing import TypedDict
+
+import pytest
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.pool import StaticPool
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Command, interrupt
+
+from backend.graph.checkpoint.sql_saver import SQLAlchemyCheckpointSaver, _checkpoints, _writes
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def saver(engine):
+    return SQLAlchemyCheckpointSaver(engine)
+
+
+def _config(thread_id: str = "thread-1", checkpoint_id: str = None) -> dict:
+    configurable = {"thread_id": thread_id, "checkpoint_ns": ""}
+    if checkpoint_id is not None:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _checkpoint(checkpoint_id: str, value=None) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["id"] = checkpoint_id
+    if value is not None:
+        checkpoint["channel_values"] = {"value": value}
+    return checkpoint
+
+
+def _put_chain(saver, thread_id: str, ids) -> dict:
+    """按顺序写入一串 checkpoint（每个的父节点是前一个），返回最后一个的 config"""
+    config = _config(thread_id)
+    for i, checkpoint_id in enumerate(ids):
+        config = saver.put(config, _checkpoint(checkpoint_id, i), {"source": "loop", "step": i}, {})
+    return config
+
+
+def _count(engine, table, thread_id: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(table).where(table.c.thread_id == thread_id)).scalar()
+
+
+# ---------- put / get_tuple ----------
+
+def test_get_tuple_missing_thread(saver):
+    assert saver.get_tuple(_config("missing")) is None
+
+
+def test_put_and_get_latest(saver):
+    saver.put(_config(), _checkpoint("0001", "a"), {"source": "input", "step": -1}, {})
+    saver.put(_config(checkpoint_id="0001"), _checkpoint("0002", "b"), {"source": "loop", "step": 0}, {})
+
+    latest = saver.get_tuple(_config())
+    assert latest.config["configurable"]["checkpoint_id"] == "0002"
+    assert latest.checkpoint["channel_values"] == {"value": "b"}
+    assert latest.metadata["source"] == "loop"
+    assert latest.metadata["step"] == 0
+    assert latest.parent_config["configurable"]["checkpoint_id"] == "0001"
+    assert latest.pending_writes == []
+
+    first = saver.get_tuple(_config(checkpoint_id="0001"))
+    assert first.checkpoint["channel_values"] == {"value": "a"}
+    assert first.parent_config is None
+
+
+def test_put_same_id_replaces_row(saver, engine):
+    saver.put(_config(), _checkpoint("0001", "old"), {"step": 0}, {})
+    saver.put(_config(), _checkpoint("0001", "new"), {"step": 1}, {})
+
+    assert _count(engine, _checkpoints, "thread-1") == 1
+    tup = saver.get_tuple(_config())
+    assert tup.checkpoint["channel_values"] == {"value": "new"}
+    assert tup.metadata["step"] == 1
+
+
+# ---------- list ----------
+
+def test_list_newest_first(saver):
+    _put_chain(saver, "thread-1", ["0001", "0002", "0003"])
+    _put_chain(saver, "thread-2", ["0001"])
+
+    ids = [t.config["configurable"]["checkpoint_id"] for t in saver.list(_config())]
+    assert ids == ["0003", "0002", "0001"]
+
+
+def test_list_before_and_limit(saver):
+    _put_chain(saver, "thread-1", ["0001", "0002", "0003", "0004"])
+
+    before = _config(checkpoint_id="0003")
+    assert [t.config["configurable"]["checkpoint_id"] for t in saver.list(_config(), before=before)] == ["0002", "0001"]
+    assert [t.config["configurable"]["checkpoint_id"] for t in saver.list(_config(), limit=2)] == ["0004", "0003"]
+    assert [
+        t.config["configurable"]["checkpoint_id"] for t in saver.list(_config(), before=before, limit=1)
+    ] == ["0002"]
+
+
+def test_list_filter_applies_limit_after_filtering(saver):
+    _put_chain(saver, "thread-1", ["0001", "0002", "0003", "0004"])
+
+    tuples = list(saver.list(_config(), filter={"step": 1}, limit=1))
+    assert [t.config["configurable"]["checkpoint_id"] for t in tuples] == ["0002"]
+
+
+def test_list_loads_pending_writes_per_checkpoint(saver):
+    _put_chain(saver, "thread-1", ["0001", "0002"])
+    saver.put_writes(_config(checkpoint_id="0001"), [("value", 1)], "task-a")
+    saver.put_writes(_config(checkpoint_id="0002"), [("value", 2)], "task-b")
+
+    writes = {t.config["configurable"]["checkpoint_id"]: t.pending_writes for t in saver.list(_config())}
+    assert writes == {"0002": [("task-b", "value", 2)], "0001": [("task-a", "value", 1)]}
+
+
+# ---------- put_writes ----------
+
+def test_put_writes_keeps_first_value_for_normal_channels(saver, engine):
+    _put_chain(saver, "thread-1", ["0001"])
+    config = _config(checkpoint_id="0001")
+    saver.put_writes(config, [("question", "q1"), ("round", 1)], "task-a")
+    # 同一任务重复提交普通写入（例如重试）不覆盖已有记录
+    saver.put_writes(config, [("question", "q2"), ("round", 2)], "task-a")
+
+    tup = saver.get_tuple(_config())
+    assert tup.pending_writes == [("task-a", "question", "q1"), ("task-a", "round", 1)]
+    assert _count(engine, _writes, "thread-1") == 2
+
+
+def test_put_writes_overwrites_special_channels(saver, engine):
+    _put_chain(saver, "thread-1", ["0001"])
+    config = _config(checkpoint_id="0001")
+    saver.put_writes(config, [("__error__", "first")], "task-a")
+    saver.put_writes(config, [("__error__", "second")], "task-a")
+
+    tup = saver.get_tuple(_config())
+    assert tup.pending_writes == [("task-a", "__error__", "second")]
+    with engine.connect() as conn:
+        idx = conn.execute(select(_writes.c.idx).where(_writes.c.thread_id == "thread-1")).scalar_one()
+    assert idx == -1
+
+
+def test_put_writes_empty_is_noop(saver, engine):
+    _put_chain(saver, "thread-1", ["0001"])
+    saver.put_writes(_config(checkpoint_id="0001"), [], "task-a")
+    assert _count(engine, _writes, "thread-1") == 0
+
+
+# ---------- delete_thread ----------
+
+def test_delete_thread_only_removes_that_thread(saver, engine):
+    _put_chain(saver, "thread-1", ["0001", "0002"])
+    _put_chain(saver, "thread-2", ["0001"])
+    saver.put_writes(_config("thread-1", "0002"), [("value", 1)], "task-a")
+    saver.put_writes(_config("thread-2", "0001"), [("value", 2)], "task-b")
+
+    saver.delete_thread("thread-1")
+
+    assert saver.get_tuple(_config("thread-1")) is None
+    assert _count(engine, _checkpoints, "thread-1") == 0
+    assert _count(engine, _writes, "thread-1") == 0
+    other = saver.get_tuple(_config("thread-2"))
+    assert other.pending_writes == [("task-b", "value", 2)]
+
+
+def test_async_interface(saver):
+    async def run():
+        await saver.aput(_config(), _checkpoint("0001", "a"), {"step": 0}, {})
+        tup = await saver.aget_tuple(_config())
+        listed = [t async for t in saver.alist(_config())]
+        await saver.adelete_thread("thread-1")
+        return tup, listed, await saver.aget_tuple(_config())
+
+    tup, listed, deleted = asyncio.run(run())
+    assert tup.checkpoint["channel_values"] == {"value": "a"}
+    assert len(listed) == 1
+    assert deleted is None
+
+
+# ---------- 编译后的工作流：中断 / 恢复 ----------
+
+class _InterviewState(TypedDict, total=False):
+    question: str
+    user_answer: str
+
+
+def _build_graph(checkpointer):
+    def ask(state: _InterviewState) -> dict:
+        return {"question": "介绍一下你的项目"}
+
+    def answer(state: _InterviewState) -> dict:
+        return {"user_answer": interrupt(state["question"])}
+
+    builder = StateGraph(_InterviewState)
+    builder.add_node("ask", ask)
+    builder.add_node("answer", answer)
+    builder.add_edge(START, "ask")
+    builder.add_edge("ask", "answer")
+    builder.add_edge("answer", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def test_graph_interrupt_and_resume_across_savers(engine):
+    config = {"configurable": {"thread_id": "interview-1"}}
+    graph = _build_graph(SQLAlchemyCheckpointSaver(engine))
+
+    result = graph.invoke({"question": ""}, config)
+    assert result["question"] == "介绍一下你的项目"
+    state = graph.get_state(config)
+    assert state.next == ("answer",)
+    assert state.tasks[0].interrupts[0].value == "介绍一下你的项目"
+
+    # 另一个 worker（新的 saver 实例，同一个数据库）从中断点恢复
+    other = _build_graph(SQLAlchemyCheckpointSaver(engine))
+    assert other.get_state(config).next == ("answer",)
+    result = other.invoke(Command(resume="负责订单系统重构"), config)
+    assert result["user_answer"] == "负责订单系统重构"
+
+    state = graph.get_state(config)
+    assert state.next == ()
+    assert state.values == {"question": "介绍一下你的项目", "user_answer": "负责订单系统重构"}
+    assert len(list(graph.get_state_history(config))) >= 3